@@ -15,15 +15,15 @@
 import sys
 import pygame
 import copy
-import random
 import os
+import time
 
 from base_settings import Settings, resource_path #import Settings module before other custom - because custom modules are referencing base_settings through the main file's code,-->
                                    #-->not directly from the base_settings module.
 from ship import Ship, Lifepod_Squadron
-from bullet import Bullet, NyancatBullet, VictoryFireworkShell, VictoryFireworkShellSmall
+from bullet import Bullet, NyancatBullet, VictoryFireworkShell, VictoryFireworkShellSmall, BulletGroup, owner_bit
 from alien import Alien, Minion, Laserminion, LaserminionBomb
-from shield import Shield  # orbital shield sprite
+from shield import Shield, shield_blocks  # orbital shield sprite (+ the player bullet vs. shield layer check)
 from menu_main import MenuMain
 from powerups import PowerUpPickup, SquadronShip, Nanite, Shockwave, choose_powerup_type, DadShip, DadShockwave, MomShip, MomBullet
 from bonus_wave import BonusWaveEnemy, BonusWaveFirework  # bonus wave - custom secret wave enemies
@@ -31,6 +31,25 @@ import math  # bonus wave - for firework angle calculations
 
 from death_animations import LazertankerDeathAnimation, CruiserDeathAnimation, DestroyerDeathAnimation
 from sound_manager import AudioManager
+from frame_profiler import FrameProfiler
+from alloc_tracker import AllocationTracker
+from wave_profiler import WaveProfiler
+import game_clock  # shared gameplay clock (real time normally, simulated time in headless runs)
+import game_rng  # seedable RNG shared by all gameplay code
+from game_rng import rng
+import replay  # input recording for deterministic replays
+import quality_governor  # sheds cosmetic work when frames run over budget
+from spatial_hash import SpatialHash  # grid broad phase shared by the collision queries of a pass
+import numpy_collide  # optional numpy collision backend (settings.collision_backend = "numpy")
+from sweep_prune import SweepPruneCollider  # sorted-x-axis collision backend for column fire (collision_backend = "sweep")
+from hitbox import collide_hitbox  # compound hitboxes (cruisers, destroyers, ninja kitty, nyan cat) as a collided= check
+from collision_rules import build_collision_rules, bullet_kind  # (source, target kind) -> what a hit does
+from bullet_specs import build_bullet_specs  # owner -> bullet size/color/speed/blink palette, built once per game
+from swept_collision import SweptCollisions  # optional swept rects for fast projectiles (settings.swept_collisions)
+from collision_stats import CollisionStats, InstrumentedCollider  # per-query pair counters (settings.collision_stats_enabled)
+from entity import EntityGroup  # group for the slotted projectile/particle entities (fireworks, dad shockwaves, mom bullets)
+import sprite_pool  # dead bullets, bombs, sparks, pickups and fleet aliens get re-used instead of rebuilt
+from game_events import GameEventBus, STAT, SCORE, POWERUP_DROP, DEATH_ANIMATION, SOUND  # per-tick batched gameplay side effects
 
 #create the game class
 class AlienInvasion:
@@ -46,12 +65,56 @@ class AlienInvasion:
         pygame.display.set_caption("Alien Invasion!") # set the title for the game
         
         self.clock = pygame.time.Clock() #this lets pygame automatically handle the frame rate correction. It creates a clock that ticks one on each pass through the main loop.
+        self.frame_time_ms = 0 # length of the last frame in ms (set by the main loop from clock.tick, or by headless_sim.py for simulated runs)
+        self.fixed_timestep = False # set from settings by _start_sim_clock() when a game starts
+        self.render_interpolation = False
+        self._sim_accumulator_ms = 0.0 # real time not yet simulated (fixed-timestep loop)
+        self._interp_prev = {} # sprite -> rect.topleft before the latest simulation step
+        self._interp_restore = [] # (rect, x, y) to put back after an interpolated draw
+        self.sim_tick = 0 # simulation steps since the current game started (replays are keyed on this)
+        self.rng_seed = None # game_rng seed of the current game
+        self.replay_recorder = None # replay.ReplayRecorder while settings.record_replays is on
+        self.present_frames = True # when False, _draw_screen renders off-screen only and skips display.flip() (headless runs)
         self.settings = Settings() # import settings from base_settings.py and assign them to an attribute of the __init__ function.
 
         # Audio manager (loaded early so sounds are available for menus)
         self.audio = AudioManager(self.settings)
         self.audio.load_sounds()
 
+        # Per-phase frame profiler (toggle overlay with settings.profiler_hotkey; CSV is written on exit)
+        self.profiler = FrameProfiler(self.settings)
+        # Debug: per-phase allocation / Surface churn tracking (slow - see alloc_tracker.py), rides on the profiler's phase markers
+        self.alloc_tracker = AllocationTracker(self.settings)
+        self.profiler.alloc_tracker = self.alloc_tracker
+        if getattr(self.settings, "alloc_tracker_enabled", False):
+            self.alloc_tracker.enable()
+        # Adaptive cosmetic quality (fireworks, beam/background effects, blinking) - see quality_governor.py
+        self.quality = quality_governor.QualityGovernor(self.settings)
+        # Collision broad phase: each sprite group kept sorted along x from pass to pass (sweep_prune.py), so a bullet is only
+        # checked against the targets in its column (or the uniform grid / numpy backend, see settings.collision_backend)
+        # Debug counters per collision query (pairs tested, hits, hitbox rejections, time) - see collision_stats.py
+        self.collision_stats = CollisionStats(self.settings)
+        self.collision_stats.name_groups(self)
+        self.collision_grid = self._make_collision_backend()
+        # Optional swept collisions: projectiles are checked over the whole distance they moved this tick, not just where
+        # they ended up, so lower simulation rates don't let them tunnel through thin targets (swept_collision.py)
+        self.swept = SweptCollisions(self.settings)
+        # What each kind of hit does (damage, sounds, death animations, score) - compiled per game by _full_game_initialization
+        self.collision_rules = {}
+        self.nyancat_color_offset = 0  # bonus wave - nyan cat hit fireworks cycle through the rainbow
+        # Gameplay events (hits, kills, damage...) collected during a tick and handled together at its end - see game_events.py
+        self.events = GameEventBus(self.settings)
+        self.events.subscribe(STAT, self._apply_stat_events)
+        self.events.subscribe(SCORE, self._apply_score_events)
+        self.events.subscribe(POWERUP_DROP, self._apply_powerup_drop_events)
+        self.events.subscribe(DEATH_ANIMATION, self._apply_death_animation_events)
+        self.events.subscribe(SOUND, self._apply_sound_events)
+        # Debug: cProfile per wave / bonus-wave minute (wave_profiler.py) - set up by --profile-waves or settings.wave_profiler_enabled
+        self.wave_profiler = None
+        if getattr(self.settings, "wave_profiler_enabled", False):
+            self.wave_profiler = WaveProfiler(getattr(self.settings, "wave_profile_dir", "profiles"),
+                                              getattr(self.settings, "wave_profile_format", "pstats"))
+
 #basic visuals setup:
     #Initialize HUD elements
         self._update_hud_font_size()  # Scale HUD font based on resolution
@@ -85,11 +148,11 @@ class AlienInvasion:
         self.aliens = pygame.sprite.Group()
         self.minions = pygame.sprite.Group()  # Sprite group for minion entities
     #Then bullet sprite groups:
-        self.player_bullets = pygame.sprite.Group()#create a pygame Group object including all player bullets
-        self.alien_bullets = pygame.sprite.Group()# "" "" all alien bullets.
+        self.player_bullets = BulletGroup()#create a pygame Group object including all player bullets (counts shots per shooter - bullet.py)
+        self.alien_bullets = BulletGroup()# "" "" all alien bullets.
         
         # Victory fireworks (normal mode only): cosmetic spark blooms
-        self.victory_fireworks = pygame.sprite.Group()
+        self.victory_fireworks = EntityGroup()  # shells' sparks and bursts (slotted entities, see entity.py)
         self.victory_fireworks_active = False
         
         # Bonus wave sprite groups #bonus wave - custom secret wave enemies
@@ -101,9 +164,9 @@ class AlienInvasion:
         
         # Bonus wave powerup sprite groups
         self.dad_ships = pygame.sprite.Group()  # bonus wave - dad ships
-        self.dad_shockwaves = pygame.sprite.Group()  # bonus wave - dad shockwaves
+        self.dad_shockwaves = EntityGroup()  # bonus wave - dad shockwaves
         self.mom_ships = pygame.sprite.Group()  # bonus wave - mom ships
-        self.mom_bullets = pygame.sprite.Group()  # bonus wave - mom bullets
+        self.mom_bullets = EntityGroup()  # bonus wave - mom bullets
         self.player_shields = {}  # bonus wave - track shields created by mom bullets per player {player_id: Shield}
 
         # Escape pod sprite group
@@ -407,10 +470,14 @@ class AlienInvasion:
        # self.settings.gunship_bullet_width
        # self.settings.interceptor_bullet_width
        # self.settings.interceptor_bullet_height
+        # Bullet archetypes for this game, now that the bullet sizes are scaled - bullet_specs.py (every Bullet looks itself up here)
+        self.settings.bullet_specs = build_bullet_specs(self.settings)
 
         # Load all the sounds to pygame.mixer objects, and images to pygame surfaces for quicker rendering.
         self._load_images()
         # Sounds are loaded during __init__ via AudioManager.
+        # Collision rule table for this game's settings (needs the damage frames loaded just above) - collision_rules.py
+        self.collision_rules = build_collision_rules(self.settings)
 
         # Set the wave index correctly, ready a new wave, now that the gamesetup() function has gotten everything ready:
         # Skip _new_alien_wave for bonus wave (it has its own initialization)
@@ -420,7 +487,7 @@ class AlienInvasion:
         # NOW start countdown timer after all initialization is complete
         # This ensures the countdown is visible from the first frame
         self.game_state = "countdown"
-        self.countdown_start_time = pygame.time.get_ticks()
+        self.countdown_start_time = game_clock.get_ticks()
         # Play countdown sound synchronized with "3" display
         self.audio.play("countdown")
 
@@ -436,7 +503,7 @@ class AlienInvasion:
         # - Always allow fade for defeat/victory transitions (these are true background swaps).
         # - For non-bonus normal gameplay, allow fade on wave-based swaps.
         # - Keep bonus-wave in-wave backgrounds (bonus/nyancat) snap-only for now.
-        fade_enabled = bool(getattr(self.settings, "bg_fade_enabled", True))
+        fade_enabled = bool(getattr(self.settings, "bg_fade_enabled", True)) and quality_governor.background_crossfade_enabled()
         duration_ms = int(getattr(self.settings, "bg_fade_duration_ms", 800))
         allow_fade = False
         if fade_enabled and duration_ms > 0:
@@ -447,9 +514,9 @@ class AlienInvasion:
 
         # If a fade is active, continue it (even if desired_bg changed again, we snap to the latest)
         if self._bg_fade_active and self._bg_fade_old is not None and self._bg_fade_new is not None:
-            now = pygame.time.get_ticks()
+            now = game_clock.get_ticks()
             t = (now - self._bg_fade_start_ms) / float(max(1, self._bg_fade_duration_ms))
-            if t >= 1.0:
+            if t >= 1.0 or not fade_enabled:  # done (or quality_governor switched fades off mid-fade: snap)
                 self._bg_fade_active = False
                 self._bg_last_ref = self._bg_fade_new_ref
                 self._bg_fade_old = None
@@ -469,7 +536,7 @@ class AlienInvasion:
         # Start a new fade if background changed
         if allow_fade and self._bg_last_ref is not None and desired_bg is not self._bg_last_ref:
             self._bg_fade_active = True
-            self._bg_fade_start_ms = pygame.time.get_ticks()
+            self._bg_fade_start_ms = game_clock.get_ticks()
             self._bg_fade_duration_ms = duration_ms
             # Use copies so we don't mutate the original background surfaces' alpha
             self._bg_fade_old = self._bg_last_ref.copy()
@@ -500,6 +567,7 @@ class AlienInvasion:
             setup = self._run_menu() #run the menu, and store all its output in the "setup" variable   
        
         # Perform full game initialization with the menu configuration
+        self._begin_session(setup)
         self._full_game_initialization(setup, Ship)
 
 
@@ -509,17 +577,232 @@ class AlienInvasion:
         while True: # this means the event loop is always running. It will be what the program uses to watch for keyboard input and other game changes.
             # Handle menu state - menu manages its own drawing and events
             if self.game_state == "start_menu":
+                self._finish_replay_recording()
+                self._finish_event_log()
+                if self.wave_profiler is not None:
+                    self.wave_profiler.finish()
                 config = self._run_menu()
                 if config is None:
+                    self._write_profiler_report()
                     pygame.quit()
                     sys.exit()
                 # Perform full game initialization with the menu configuration
+                self._begin_session(config)
                 self._full_game_initialization(config, Ship)
-            else:
+            elif not self.fixed_timestep:
+                # Old-style loop: one update per drawn frame, gameplay speed tied to the frame rate
+                self._wave_profile_tick()
+                frame_start = time.perf_counter()
+                self.profiler.begin_frame()
+                self.profiler.start("events")
                 self._check_keystroke_events() # reads player input from the pygame.event.get() function, and sets booleans for movement, firing, etc
+                self.profiler.stop("events")
+                self.profiler.start("update")
                 self._update_game() # moves ship and game elements based on booleans -
+                self.profiler.stop("update")
+                self.profiler.start("draw")
                 self._draw_screen() # draws the result
-                self.clock.tick(60) # keeps the clock created above ticking 60 times per second.
+                self.profiler.stop("draw")
+                self.profiler.end_frame(self._sprite_group_counts() if self.profiler.enabled else None)
+                self.quality.frame((time.perf_counter() - frame_start) * 1000.0)
+                self.frame_time_ms = self.clock.tick(60) # keeps the clock created above ticking 60 times per second.
+            else:
+                # Fixed-timestep loop: real time piles up in the accumulator, and the game is simulated in whole
+                # steps of game_clock.step_ms until it catches up. Drawing happens once per frame at whatever rate
+                # the display manages, with moving sprites interpolated between their last two simulated positions.
+                step_ms = game_clock.step_ms
+                self._wave_profile_tick()
+                frame_start = time.perf_counter()
+                self.profiler.begin_frame()
+                self.profiler.start("events")
+                self._check_keystroke_events() # input is read once per drawn frame; the booleans it sets hold for every step below
+                self.profiler.stop("events")
+                self.profiler.start("update")
+                steps = 0
+                while self._sim_accumulator_ms >= step_ms and steps < self.settings.max_sim_steps_per_frame:
+                    if self.render_interpolation:
+                        self._snapshot_positions()
+                    game_clock.advance(step_ms)
+                    self.frame_time_ms = step_ms
+                    self._update_game()
+                    self._sim_accumulator_ms -= step_ms
+                    steps += 1
+                    self.sim_tick += 1
+                    if self.replay_recorder is not None:
+                        self.replay_recorder.after_step(self.sim_tick, self)
+                    if self.game_state == "start_menu":
+                        break
+                if self.game_state == "start_menu":
+                    self._interp_prev = {}  # back at the menu - the next game starts with nothing to blend from
+                if self._sim_accumulator_ms >= step_ms:
+                    # Too far behind (window drag, breakpoint, huge hitch) - drop the backlog so the game slows down
+                    # for a moment instead of spiralling into ever longer catch-up frames
+                    self._sim_accumulator_ms %= step_ms
+                self.profiler.stop("update")
+                self.profiler.start("draw")
+                # Every frame is drawn alpha = (leftover time / step) of the way from the previous step's positions to
+                # the latest ones - also the frames that ran no step at all (most of them on a 120/144 Hz display), so
+                # the picture moves forward smoothly instead of jumping between "one step behind" and "latest"
+                if self.render_interpolation and self._interp_prev and self.game_state != "start_menu":
+                    self._apply_interpolation(self._sim_accumulator_ms / step_ms)
+                    self._draw_screen()
+                    self._restore_positions()
+                else:
+                    self._draw_screen()
+                self.profiler.stop("draw")
+                self.profiler.end_frame(self._sprite_group_counts() if self.profiler.enabled else None)
+                self.quality.frame((time.perf_counter() - frame_start) * 1000.0)  # work time only, not the tick() wait
+                self._sim_accumulator_ms += self.clock.tick(self.settings.render_fps_cap)
+
+    def _begin_session(self, config):
+        """Right before _full_game_initialization: restart the sim clock, seed the RNG and (optionally) start recording inputs."""
+        self._start_sim_clock()
+        self.quality.reset()
+        sprite_pool.configure(self.settings)  # fresh pools and hit/miss counters per game
+        self.rng_seed = game_rng.seed(getattr(self.settings, "rng_seed", None))  # None = a new random game every time
+        self.sim_tick = 0
+        self.events.clear()
+        self.replay_recorder = None
+        if config is not None and getattr(self.settings, "record_replays", False):
+            if self.fixed_timestep:
+                self.replay_recorder = replay.ReplayRecorder(
+                    config, self.settings, self.rng_seed, game_clock.get_ticks(), game_clock.step_ms,
+                    getattr(self.settings, "replay_checksum_interval", 60))
+            else:
+                print("record_replays needs settings.fixed_timestep - not recording this game")
+
+    def _finish_event_log(self):
+        """Write out the current game's gameplay event log (only with settings.event_log_enabled)."""
+        path = self.events.write_log()
+        if path:
+            print("event log written to", path)
+
+    def _finish_replay_recording(self):
+        """Write out the current game's replay file (if one is being recorded)."""
+        if self.replay_recorder is None:
+            return
+        path = self.replay_recorder.save(getattr(self.settings, "replay_path", None))
+        self.replay_recorder = None
+        if path:
+            print(f"replay written to {path} (seed {self.rng_seed})")
+
+    def _start_sim_clock(self):
+        """(Re)start the fixed-timestep clock - called before each game starts, so menu time never piles up in the accumulator."""
+        self.fixed_timestep = bool(getattr(self.settings, "fixed_timestep", True))
+        self.render_interpolation = self.fixed_timestep and bool(getattr(self.settings, "render_interpolation", True))
+        self._sim_accumulator_ms = 0.0
+        self._interp_prev = {}
+        self._interp_restore = []
+        if self.fixed_timestep:
+            game_clock.set_step_ms(1000.0 / getattr(self.settings, "sim_hz", 60))
+            game_clock.use_simulated_time()  # gameplay timers follow the simulated steps, picking up from the real clock
+        else:
+            game_clock.set_step_ms(game_clock.BASE_FRAME_MS)
+            game_clock.use_real_time()
+
+    def _interpolated_groups(self):
+        """Sprite groups whose rects get interpolated at draw time (anything that moves smoothly every step)."""
+        return (self.players, self.aliens, self.minions, self.player_bullets, self.alien_bullets, self.powerups,
+                self.squadrons, self.nanites, self.lifepods, self.bonus_wave_enemies, self.mom_bullets)
+
+    def _snapshot_positions(self):
+        """Remember every moving sprite's rect position before a simulation step."""
+        self._interp_prev = {sprite: sprite.rect.topleft for group in self._interpolated_groups() for sprite in group}
+
+    def _apply_interpolation(self, alpha):
+        """Move rects alpha (0..1) of the way from their previous to their current simulated position, for drawing only."""
+        prev_positions = self._interp_prev
+        max_jump = getattr(self.settings, "render_interp_max_jump", 64)
+        restore = self._interp_restore
+        for group in self._interpolated_groups():
+            for sprite in group:
+                prev = prev_positions.get(sprite)
+                if prev is None:
+                    continue  # spawned during the last step - nothing to blend from
+                rect = sprite.rect
+                x, y = rect.topleft
+                dx, dy = x - prev[0], y - prev[1]
+                if (dx == 0 and dy == 0) or abs(dx) > max_jump or abs(dy) > max_jump:
+                    continue  # standing still, or teleported (respawn, wave reset) - draw where it really is
+                restore.append((rect, x, y))
+                rect.topleft = (round(prev[0] + dx * alpha), round(prev[1] + dy * alpha))
+
+    def _restore_positions(self):
+        """Put rects back to their real simulated positions after drawing."""
+        for rect, x, y in self._interp_restore:
+            rect.topleft = (x, y)
+        self._interp_restore.clear()
+
+    def _sprite_group_counts(self):
+        """Entity counts per sprite group, for the frame profiler."""
+        return {
+            "players": len(self.players),
+            "aliens": len(self.aliens),
+            "minions": len(self.minions),
+            "player_bullets": len(self.player_bullets),
+            "alien_bullets": len(self.alien_bullets),
+            "shields": len(self.shields),
+            "powerups": len(self.powerups),
+            "squadrons": len(self.squadrons),
+            "nanites": len(self.nanites),
+            "shockwaves": len(self.shockwaves),
+            "lifepods": len(self.lifepods),
+            "victory_fireworks": len(self.victory_fireworks),
+            "bonus_wave_enemies": len(self.bonus_wave_enemies),
+            "bonus_wave_fireworks": len(self.bonus_wave_fireworks),
+            "dad_shockwaves": len(self.dad_shockwaves),
+            "mom_bullets": len(self.mom_bullets),
+            "death_animations": len(self.lazertanker_death_animations) + len(self.cruiser_death_animations) + len(self.destroyer_death_animations),
+        }
+
+    def _make_collision_backend(self):
+        """The object the collision passes run their groupcollide/spritecollide queries through (settings.collision_backend)."""
+        backend = getattr(self.settings, "collision_backend", "sweep")
+        collider = None
+        if backend == "numpy":
+            if numpy_collide.available():
+                collider = numpy_collide.NumpyCollider(self.settings)
+            else:
+                print("collision_backend is 'numpy' but numpy isn't installed - using the grid instead")
+        elif backend == "sweep":
+            collider = SweepPruneCollider(self.settings)
+        if collider is None:
+            collider = SpatialHash(self.settings)
+        if self.collision_stats.enabled:
+            collider = InstrumentedCollider(collider, self.collision_stats)  # counts and times every query
+        return collider
+
+    def _wave_profile_segment(self):
+        """Name of the game segment being played, for the per-wave profiles: wave03, bonus_min07, victory, defeat."""
+        if self.game_state in ("victory", "defeat"):
+            return self.game_state
+        if self.is_bonus_wave:
+            elapsed = 0 if self.bonus_wave_start_time is None else game_clock.get_ticks() - self.bonus_wave_start_time
+            return f"bonus_min{max(0, elapsed) // 60000:02d}"
+        return f"wave{(self.current_wave_num or 0) + 1:02d}"
+
+    def _wave_profile_tick(self):
+        """Once per frame: move the wave profiler on to the next wave / bonus minute when the game gets there."""
+        if self.wave_profiler is None:
+            return
+        if self.wave_profiler.game_tag is None:
+            difficulty = getattr(self.settings, "difficulty_mode", "easy").lower()
+            self.wave_profiler.new_game(difficulty, len(self.players))  # everybody is still alive on the first frame
+        self.wave_profiler.switch_to(self._wave_profile_segment())
+
+    def _write_profiler_report(self):
+        """Dump the profiler's session stats to CSV (only if the profiler was switched on this session)."""
+        if self.wave_profiler is not None:
+            self.wave_profiler.finish()
+        path = self.profiler.write_csv()
+        if path:
+            print("frame profile written to", path)
+        path = self.alloc_tracker.write_reports()
+        if path:
+            print("allocation report written to", path)
+        path = self.collision_stats.write_csv()
+        if path:
+            print("collision stats written to", path)
 
     #define all helper functions referenced above in the main loop:
 
@@ -527,10 +810,19 @@ class AlienInvasion:
     def _check_keystroke_events(self):
         """helper function for Main_Game_Loop() that checks for keystrokes for the main game loop"""
         for event in pygame.event.get(): # this is the event loop, which moves the game along by using the pygame 'get' function for the pygame 'event' class.
+            if self.replay_recorder is not None:
+                self.replay_recorder.record_event(self.sim_tick, event)
             if event.type == pygame.QUIT: #his if loop is to correlate closing window with the pygame event type 'quit'.
+                self._finish_replay_recording()
+                self._finish_event_log()
+                self._write_profiler_report()
                 sys.exit()
             #these elifs direct the _check_event function to its own helper functions, _check_keydown_events and _check_keyup_events.
             elif event.type == pygame.KEYDOWN:
+                # Debug: profiler overlay hotkey works in every state (including pause)
+                if event.key == getattr(self.settings, "profiler_hotkey", None):
+                    self.profiler.toggle_overlay()
+                    continue
                 #first check if need to pause (can only pause during gameplay):
                 if event.key == pygame.K_ESCAPE:
                     # Only allow pausing during gameplay states (not during menus)
@@ -695,12 +987,8 @@ class AlienInvasion:
                     
                     self.ship = ship #pass the ship parameter to a variable in the scope of this helper function
                     
-                    bullet_count = [] # Initialize an empty list to count bullets: 
-
-                    #Next, the for loop to count bullets (exclude squadron bullets):
-                    for b in self.player_bullets: #for every sprite found in the player_bullets group 
-                        if b.owner_ref is ship and getattr(b, "squadron_ref", None) is None: #if its owner parameter is the ship in question AND it's not a squadron bullet
-                            bullet_count.append(b)
+                    #Next, count the ship's own bullets in flight (squadron bullets are counted separately) - kept live by the group, see BulletGroup in bullet.py
+                    bullet_count = self.player_bullets.count_owned(ship)
                     
                     # after player fires, resolve any of its squadrons that need to fire:
                     squadron_fired = False  # Track if any squadron fired to play sound only once
@@ -726,7 +1014,7 @@ class AlienInvasion:
                     max_bullets = getattr(self.settings, f"lvl{level}_bullet_max", 0)
                     
                     #finally, an if statement to enforce the max bullet cap:
-                    if len(bullet_count) >= max_bullets: #if the sprite under iteration has its proper max bullets attributed to it:
+                    if bullet_count >= max_bullets: #if the sprite under iteration has its proper max bullets attributed to it:
                         return #limit the function to not fire another bullet, but end here.
                     
                     #otherwise:
@@ -740,7 +1028,7 @@ class AlienInvasion:
                             owner_ref=ship
                         )
                     else:
-                        bullet = Bullet( settings=self.settings, screen=self.screen, 
+                        bullet = Bullet.acquire( settings=self.settings, screen=self.screen, 
                                         x=ship.rect.centerx, y=ship.rect.top, direction=-1,
                                         owner_type="player", owner_level=ship.player_level, owner_ref=ship) #create a bullet object and pass it the right parameters
                     # Play sound: player shot (has files 1-4)
@@ -764,7 +1052,7 @@ class AlienInvasion:
                 owner_ref=lifepod
             )
         else:
-            bullet = Bullet(settings=self.settings, screen=self.screen,
+            bullet = Bullet.acquire(settings=self.settings, screen=self.screen,
                            x=lifepod.rect.centerx, y=lifepod.rect.top, direction=-1,
                            owner_type="player", owner_level=1, owner_ref=lifepod)  # Use level 1, reference lifepod
         self.player_bullets.add(bullet)
@@ -954,7 +1242,21 @@ class AlienInvasion:
     
 #------GAME UPDATE FUNCTION:-----------------------     
     def _update_game(self):
-        """helper function for Main_Game_Loop() to update player and alien sprites and bullets, & check wave state.  """
+        """helper function for Main_Game_Loop() - one simulation tick: all the gameplay updates, then the tick's batched events."""
+        sprite_pool.recycle()  # sprites that died last tick can be handed out again from now on
+        self.swept.snapshot(self._swept_groups())  # where the projectiles start this tick (only if swept collisions are on)
+        self._update_game_state()
+        self.profiler.start("game_events")
+        self.events.end_tick()  # scores, stats, sounds, death animations and powerup drops from this tick's collisions
+        self.profiler.stop("game_events")
+        self.collision_stats.end_tick()  # only counts anything with settings.collision_stats_enabled
+
+    def _swept_groups(self):
+        """helper for _update_game(): the fast projectiles that get swept rects when settings.swept_collisions is on."""
+        return (self.player_bullets, self.alien_bullets, self.shockwaves, self.dad_shockwaves)
+
+    def _update_game_state(self):
+        """helper function for _update_game() to update player and alien sprites and bullets, & check wave state.  """
         
 
         if self.game_state == "paused":
@@ -988,7 +1290,7 @@ class AlienInvasion:
                 return
 
             # Normal-mode victory: allow movement + cosmetic fireworks firing; skip gameplay collisions/scoring.
-            now = pygame.time.get_ticks()
+            now = game_clock.get_ticks()
             self.players.update()
             self.squadrons.update()
             self.lifepods.update()
@@ -1003,15 +1305,9 @@ class AlienInvasion:
                         ship.next_fire_time = now + self.settings.player_fire_speed
 
             # Lifepod firing during victory: cap at 1 bullet at a time; fireworks use small shell
-            lifepod_bullet_counts = {}
-            for bullet in self.player_bullets:
-                if hasattr(bullet, 'owner_ref') and bullet.owner_ref in self.lifepods:
-                    lifepod = bullet.owner_ref
-                    lifepod_bullet_counts[lifepod] = lifepod_bullet_counts.get(lifepod, 0) + 1
-
             for lifepod in self.lifepods:
                 if lifepod.firing and lifepod.state == "normal":
-                    if lifepod_bullet_counts.get(lifepod, 0) < 1:
+                    if self.player_bullets.count_owned(lifepod) < 1:
                         if now >= getattr(lifepod, "next_fire_time", 0):
                             self._fire_lifepod_bullet(lifepod)
                             lifepod.next_fire_time = now + self.settings.player_fire_speed
@@ -1027,25 +1323,18 @@ class AlienInvasion:
         # Note: stored under historical key name 'time_in_top_30_percent' for credits compatibility.
         if self.game_state == "playing":
             top_33_percent_y = self.settings.play_height * 0.33
-            frame_time_ms = self.clock.get_time()
+            frame_time_ms = self.frame_time_ms
             for player in self.players.sprites():
                 if player.player_state == "alive" and player.player_id in self.player_stats:
                     if player.rect.top <= top_33_percent_y:
                         self.player_stats[player.player_id]["time_in_top_30_percent"] += frame_time_ms
 
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         # Lifepod firing (works in both normal and bonus wave modes)
-        # Count all lifepod bullets once per frame (more efficient than counting per lifepod)
-        lifepod_bullet_counts = {}
-        for bullet in self.player_bullets:
-            if hasattr(bullet, 'owner_ref') and bullet.owner_ref in self.lifepods:
-                lifepod = bullet.owner_ref
-                lifepod_bullet_counts[lifepod] = lifepod_bullet_counts.get(lifepod, 0) + 1
-        
         for lifepod in self.lifepods:
           if lifepod.firing and lifepod.state == "normal":
-              # Get bullet count from pre-calculated dictionary
-              lifepod_bullet_count = lifepod_bullet_counts.get(lifepod, 0)
+              # Bullets in flight, counted live by the group (BulletGroup, bullet.py)
+              lifepod_bullet_count = self.player_bullets.count_owned(lifepod)
               if lifepod_bullet_count < 2:  # Max 2 bullets
                   # Check firing rate timing
                   if now >= getattr(lifepod, "next_fire_time", 0):
@@ -1087,136 +1376,24 @@ class AlienInvasion:
             self._update_between_waves()
             return
         #Rest of instructions in this function are for normal gameplay. First, check for aliens that need to be spawned, whether rows or individuals
+        self.profiler.start("spawning")
         self._update_wave_spawning()
+        self.profiler.stop("spawning")
         #functions for moving player sprites:
+        self.profiler.start("sprite_updates")
         self.players.update()
         self.lifepods.update()
         self.squadrons.update()
         self.nanites.update()
         self.shockwaves.update()
+        self.profiler.stop("sprite_updates")
 
-        for sw in self.shockwaves.sprites():
-            # Get collisions, then filter for cruisers
-            hits = pygame.sprite.spritecollide(sw, self.aliens, dokill=False)
-            for alien in hits:
-                # Skip if this shockwave has already hit this alien
-                if alien in sw.hit_aliens:
-                    continue
-
-                lvl = getattr(alien, "level", 1)
-                if lvl <= self.settings.shockwave_kill_max_alien_level:
-                        # Instakill level 1-4 aliens (no cruiser collision check needed - cruisers are level 6)
-                        # Play death sound based on alien level
-                        #if lvl in (1, 2, 3): #this is currently commented out to see if sound works better this way. If you comment it back in, the if statement below for level 4 aliens has to be changed back to an 
-                            #self.audio.play("alien_lvl1to3_death")  # Levels 1-3 killed by shockwave
-                        if lvl == 4:
-                            self.audio.play("alien_lvl1to3_death")  # Level 4 killed by shockwave (not collision)
-                            # Stop level 4 hum sound if this alien was playing it
-                            if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                                alien.hum_sound_channel.stop()
-                                alien.hum_sound_channel = None
-                        
-                        # Award points to shockwave owner (skip lifepods - they don't earn score)
-                        if hasattr(sw, 'owner') and sw.owner and hasattr(sw.owner, 'player_score'):
-                            sw.owner.player_score += alien.level * ((alien.level * 1/2) * 20)
-                            # Track enemy destroyed by shockwave
-                            if hasattr(sw.owner, 'player_id') and sw.owner.player_id in self.player_stats:
-                                self.player_stats[sw.owner.player_id]['enemies_destroyed'] += 1
-                        
-                        alien.kill()
-                        self._maybe_spawn_powerup_from_alien(alien)
-                        sw.hit_aliens.add(alien)  # Mark as hit (though alien is now dead)
-                elif lvl in (5, 6, 7):  # Level 5-7: deal fixed damage
-                        # For cruisers, check if collision is valid (not in wing top area)
-                        if alien.level == 6:
-                            if not self._cruiser_collision_valid(alien, sw.rect):
-                                continue  # Skip this collision
-                        # For destroyers, exclude front-half outer quarters
-                        if alien.level == 5:
-                            if not self._destroyer_collision_valid(alien, sw.rect):
-                                continue  # Skip this collision
-
-                        # Mark as hit before applying damage to prevent multiple hits
-                        sw.hit_aliens.add(alien)
-
-                        # Apply shockwave damage
-                        alien.damage_stage += self.settings.shockwave_damage_amount
-
-                        # Get damage frames for this alien type
-                        if alien.level == 5:
-                            frames = self.settings.destroyer_hitframes
-                        elif alien.level == 6:
-                            frames = self.settings.cruiser_hitframes
-                        elif alien.level == 7:
-                            frames = self.settings.laztanker_hitframes
-                        else:
-                            frames = None
-
-                        # Check if alien is destroyed
-                        if frames and alien.damage_stage > len(frames):
-                            # Alien is destroyed - create death animation
-                            if alien.level == 7:
-                                death_anim = LazertankerDeathAnimation(
-                                    self.settings,
-                                    self.screen,
-                                    alien.rect.center,
-                                    alien.rect.size
-                                )
-                                self.lazertanker_death_animations.add(death_anim)
-                            elif alien.level == 6:
-                                death_anim = CruiserDeathAnimation(
-                                    self.settings,
-                                    self.screen,
-                                    alien.rect.center,
-                                    alien.rect.size
-                                )
-                                self.cruiser_death_animations.add(death_anim)
-                            elif alien.level == 5:
-                                death_anim = DestroyerDeathAnimation(
-                                    self.settings,
-                                    self.screen,
-                                    alien.rect.center,
-                                    alien.rect.size
-                                )
-                                self.destroyer_death_animations.add(death_anim)
-                            
-                            # Stop hum sound if this alien was playing it
-                            if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                                alien.hum_sound_channel.stop()
-                                alien.hum_sound_channel = None
-                            # Play death sound based on alien level
-                            if alien.level == 5:
-                                self.audio.play("alien_destroyer_death")  # Destroyer death
-                            elif alien.level == 6:
-                                self.audio.play("alien_cruiser_death")  # Cruiser death
-                            elif alien.level == 7:
-                                self.audio.play("alien_laztanker_death")  # Lasertanker death
-                                # Stop lasertanker firing sound
-                                if alien in self.audio.lasertanker_firing_sound_channels:
-                                    channel = self.audio.lasertanker_firing_sound_channels[alien]
-                                    if channel:
-                                        channel.stop()
-                                    del self.audio.lasertanker_firing_sound_channels[alien]
-                            # Track enemy destroyed by shockwave damage
-                            if hasattr(sw, 'owner') and sw.owner and hasattr(sw.owner, 'player_id'):
-                                if sw.owner.player_id in self.player_stats:
-                                    self.player_stats[sw.owner.player_id]['enemies_destroyed'] += 1
-                            
-                            alien.kill()
-                            self._maybe_spawn_powerup_from_alien(alien)
-                            
-                            # Award points to shockwave owner
-                            if hasattr(sw, 'owner') and sw.owner:
-                                try:
-                                    sw.owner.player_score += alien.level * ((alien.level * 1/2) * 20)
-                                except (TypeError, AttributeError):
-                                    pass  # Boss alien or other special case
-                        elif frames and alien.damage_stage > 0:
-                            # Update alien image to show damage
-                            frame_index = min(alien.damage_stage - 1, len(frames) - 1)
-                            alien.image = frames[frame_index]
-                            alien.rect = alien.image.get_rect(center=alien.rect.center)
+        self.profiler.start("shockwaves")
+        with self.swept(self.shockwaves):  # shockwave rects cover this tick's whole movement (if swept collisions are on)
+            self._shockwave_alien_hits()
+        self.profiler.stop("shockwaves")
 
+        self.profiler.start("sprite_updates")
         self.shields.update()  # tick shield regen/damage timers
         # Check for shield regen improvements and play sound
         for shield in self.shields:
@@ -1225,9 +1402,10 @@ class AlienInvasion:
         self.lazertanker_death_animations.update()  # Update lasertanker death animations
         self.cruiser_death_animations.update()  # Update cruiser death animations
         self.destroyer_death_animations.update()  # Update destroyer death animations
+        self.profiler.stop("sprite_updates")
                 #quick check, to enable 'hold down' fir
                 # e instead of endless button mashing:
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         for ship in self.players:
                 if ship.firing and now >= getattr(ship, "next_fire_time", 0): #this if statement allows the loop to check after every time it updates
                                                                             #-->the players, to see if they're still holding down the firing key.
@@ -1243,6 +1421,7 @@ class AlienInvasion:
                         self.audio.play("player_respawn")
                         ship.respawn_end_time = None 
 
+        self.profiler.start("sprite_updates")
         self.aliens.update()
         self.minions.update()
         self._handle_alien_breaches()
@@ -1250,12 +1429,19 @@ class AlienInvasion:
         self.alien_bullets.update()
         #after sprites and bullets are moved, check to see if anyone is on/past the edges, and correct:
         self._check_fleet_edges()
+        self.profiler.stop("sprite_updates")
         # allow aliens to execute firing logic
+        self.profiler.start("alien_firing")
         self._alien_firing_logic()
         self._minion_firing_logic()
+        self.profiler.stop("alien_firing")
         #parse collisions
-        self._do_collisions()
+        self.profiler.start("collisions")
+        with self.swept(self.player_bullets, self.alien_bullets, self.shockwaves):  # swept rects, if they're on
+            self._do_collisions()
+        self.profiler.stop("collisions")
         #update powerups
+        self.profiler.start("powerup_pickup")
         self.powerups.update()
             #add to player inventory
         # Determine inventory cap based on difficulty (Hard mode: 6, others: 3)
@@ -1277,6 +1463,7 @@ class AlienInvasion:
                         powerup.kill()  # Remove powerup only if picked up
                 if powerup_grabbed:
                     self.audio.play("powerup_grab")  # Play sound once per frame, even if multiple powerups grabbed
+        self.profiler.stop("powerup_pickup")
 
 
         #If the alien sprite group is empty, and no more are needing to spawn, start a between-wave-pause
@@ -1602,28 +1789,32 @@ class AlienInvasion:
         if self.countdown_start_time is None:
             return
         
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         elapsed = now - self.countdown_start_time
         
         # After 4 seconds, start the game
         if elapsed >= self.countdown_duration_ms:
-            self.game_state = "playing"
-            self.countdown_start_time = None
-            # For bonus wave, reset spawn timers to start after countdown
-            if self.is_bonus_wave:
-                self.bonus_wave_start_time = now  # Reset start time to now
-                self.bonus_loaf_next_spawn = now + self.settings.loafkitty_spawn_delay
-                self.bonus_centurion_next_spawn = now + self.settings.centurionkitty_spawn_delay
-                self.bonus_emperor_next_spawn = now + self.settings.emperorkitty_spawn_delay
-                self.bonus_bluewhale_next_spawn = now + self.settings.bluewhalekitty_spawn_delay
-                self.bonus_nyancat_next_spawn = now + self.settings.nyancat_spawn_delay
+            self._end_countdown(now)
+
+    def _end_countdown(self, now):
+        """Switch from countdown to playing. Also used by headless_sim.py to skip the countdown."""
+        self.game_state = "playing"
+        self.countdown_start_time = None
+        # For bonus wave, reset spawn timers to start after countdown
+        if self.is_bonus_wave:
+            self.bonus_wave_start_time = now  # Reset start time to now
+            self.bonus_loaf_next_spawn = now + self.settings.loafkitty_spawn_delay
+            self.bonus_centurion_next_spawn = now + self.settings.centurionkitty_spawn_delay
+            self.bonus_emperor_next_spawn = now + self.settings.emperorkitty_spawn_delay
+            self.bonus_bluewhale_next_spawn = now + self.settings.bluewhalekitty_spawn_delay
+            self.bonus_nyancat_next_spawn = now + self.settings.nyancat_spawn_delay
     
     def _draw_countdown(self):
         """Draw countdown timer with colored backgrounds"""
         if self.countdown_start_time is None:
             return
         
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         elapsed = now - self.countdown_start_time
         
         # Determine current countdown text and colors
@@ -1688,7 +1879,7 @@ class AlienInvasion:
             self.audio.nyancat_music_channel = None
         
         # Set defeat screen start time for delayed music
-        self.defeat_screen_start_time = pygame.time.get_ticks()
+        self.defeat_screen_start_time = game_clock.get_ticks()
         
         #play defeat sound
         self.audio.play("announce_defeat")
@@ -1732,7 +1923,7 @@ class AlienInvasion:
             self.audio.nyancat_music_channel = None
         
         # Set victory screen start time for delayed music
-        self.victory_screen_start_time = pygame.time.get_ticks()
+        self.victory_screen_start_time = game_clock.get_ticks()
         
         #play victory sound
         self.audio.play("announce_victory")
@@ -1744,7 +1935,7 @@ class AlienInvasion:
             "YOU... WERE... VICTORIOUS!!!!! HUZZAH!!!!!!",
             "...AND THEY ALL LIVED... HAPPILY EVER AFTER."
         ]
-        self.victory_banner_text = random.choice(victory_messages)
+        self.victory_banner_text = rng.choice(victory_messages)
         # Victory banner scrolls right to left (left edge positioning)
         try:
             font_path = resource_path(os.path.join('assets', 'BAUHS93.ttf'))
@@ -1798,12 +1989,12 @@ class AlienInvasion:
 
     def _update_defeat_victory_screens(self):  # bonus wave - handles both normal and bonus wave defeat/victory
         """Update defeat/victory screen animations"""
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         
         if self.game_state == "defeat":
             # Update defeat banner - scrolls right to left (left edge positioning)
             if self.defeat_banner_active:
-                self.defeat_banner_x -= self.wave_banner_speed  # Move left (from right)
+                self.defeat_banner_x -= self.wave_banner_speed * game_clock.frame_scale  # Move left (from right)
                 # Use same font as drawing to calculate width correctly
                 try:
                     font_path = resource_path(os.path.join('assets', 'BAUHS93.ttf'))
@@ -1819,7 +2010,7 @@ class AlienInvasion:
             
             # Update credits scrolling - scrolls bottom to top at 1/4 speed
             if self.credits_active and not self.thanks_active:
-                self.credits_y -= (self.wave_banner_speed / 4.0) * 0.75  # Credits scroll 25% slower than before
+                self.credits_y -= (self.wave_banner_speed / 4.0) * 0.75 * game_clock.frame_scale  # Credits scroll 25% slower than before
             
             # Start defeat music 3 seconds after defeat screen displays
             if self.defeat_screen_start_time is not None and self.audio.defeat_music_channel is None:
@@ -1833,7 +2024,7 @@ class AlienInvasion:
         elif self.game_state == "victory":
             # Update victory banner - scrolls right to left (left edge positioning)
             if self.victory_banner_active:
-                self.victory_banner_x -= self.wave_banner_speed  # Move left (from right)
+                self.victory_banner_x -= self.wave_banner_speed * game_clock.frame_scale  # Move left (from right)
                 # Use same font as drawing to calculate width correctly
                 try:
                     font_path = resource_path(os.path.join('assets', 'BAUHS93.ttf'))
@@ -1848,7 +2039,7 @@ class AlienInvasion:
             
             # Update credits scrolling - scrolls bottom to top at 1/4 speed
             if self.credits_active and not self.thanks_active:
-                self.credits_y -= (self.wave_banner_speed / 4.0) * 0.75  # Credits scroll 25% slower than before
+                self.credits_y -= (self.wave_banner_speed / 4.0) * 0.75 * game_clock.frame_scale  # Credits scroll 25% slower than before
             
             # Start victory music 10 seconds after victory screen displays (to allow announce_victory_1.wav to finish)
             if self.victory_screen_start_time is not None and self.audio.victory_music_channel is None:
@@ -1918,7 +2109,7 @@ class AlienInvasion:
             
             # Draw password sequence or final message if applicable
             if self.thanks_active:
-                now = pygame.time.get_ticks()
+                now = game_clock.get_ticks()
                 
                 if self.password_phase == "transmission":
                     # Blink at 1 blink per second (500ms on/off)
@@ -1974,6 +2165,7 @@ class AlienInvasion:
     
     def _store_final_player_data(self):
         """Store player data for credits display (called before players are removed from sprite group)"""
+        self.events.process()  # make sure this tick's points/stats are counted before the credits are built
         # Build a fresh, full set of credit rows (avoid partial/duplicate records).
         self.final_player_data = []
         
@@ -2275,11 +2467,12 @@ class AlienInvasion:
                 if last_section_y < -100 and not self.thanks_active:
                     self.thanks_active = True
                     if self.password_phase == "transmission":
-                        self.password_start_time = pygame.time.get_ticks()
+                        self.password_start_time = game_clock.get_ticks()
 
 
     def _new_alien_wave(self, next_wave_num: int):
         """helper function for update_game() to spawn an new wave of aliens"""
+        self._interp_prev = {}  # everything gets placed from scratch - nothing to blend from until the next step
         # Skip wave setup for bonus wave (bonus wave has its own initialization)
         if self.is_bonus_wave:
             return
@@ -2377,7 +2570,7 @@ class AlienInvasion:
             self.destroyers_remaining = current_wave["count_destroyers"]
 
             #start alien spawning using pygame timer/clock:
-            now = pygame.time.get_ticks()
+            now = game_clock.get_ticks()
             self.next_level1_row_time = now #spawn a row of lvl 1 aliens immediately.
             self.next_level2_spawn_time = now + self.settings.alien2_spawn_delay #set a timer to spawn first lvl 2 alien in ~3 sec
             self.next_level3_spawn_time = now + self.settings.alien3_spawn_delay # " " lvl 3 " " 
@@ -2419,7 +2612,7 @@ class AlienInvasion:
             start_x = (self.settings.screen_width - total_row_width) // 2 # clever way of keeping the row centered: find the difference between the total row width and the screen width; split that effectively in two, and stick half of it as a buffer before the first alien.
             #use a for loop to place the aliens:
             for i in range(lvl1_aliens_per_row): 
-                fleet_alien_iter = Alien(self.settings, self.screen, level=1)
+                fleet_alien_iter = Alien.acquire(self.settings, self.screen, level=1) #recycled from dead fleet aliens when possible (sprite_pool.py)
                 x = start_x + i*(fleet_alien_iter.rect.width + spacing_x)
                 spawn_y = -fleet_alien_iter.rect.height if warp_in else row_y
                 fleet_alien_iter.spawn_pos(x, spawn_y) #call the spawn_pos() function from alien.py to help determine spawn positions.
@@ -2436,7 +2629,7 @@ class AlienInvasion:
                     # Safety check: ensure current_wave_num is valid
                     if self.current_wave_num is None or self.current_wave_num < 0 or self.current_wave_num >= len(self.settings.wave_master_index):
                         return
-                    now = pygame.time.get_ticks() #hook into the clock with a now variable to store get_ticks()
+                    now = game_clock.get_ticks() #hook into the clock with a now variable to store get_ticks()
                     
                     #spawning lvl 1 aliens
                     if self.level1_rows_remaining > 0 and now >=self.next_level1_row_time:
@@ -2462,7 +2655,7 @@ class AlienInvasion:
                     if self.settings.wave_master_index[self.current_wave_num]["count_level2"]>0 and self.level1_rows_remaining > 0 and now >= self.next_level2_spawn_time:
                          self._spawn_single_alien(level=2)
                          #self.level2_remaining -=1
-                         self.next_level2_spawn_time = (now + random.randint
+                         self.next_level2_spawn_time = (now + rng.randint
                                                         (self.level2_minspawntime, #as mentioned in the function descriptions, these adjusted max/minspawntimes are from menu_helpers gamesetup() function.
                                                         self.level2_maxspawntime)
                                                             )
@@ -2470,7 +2663,7 @@ class AlienInvasion:
                     if self.settings.wave_master_index[self.current_wave_num]["count_level3"]>0 and self.level1_rows_remaining > 0 and now>=self.next_level3_spawn_time:
                          self._spawn_single_alien(level=3)
                          #self.level3_remaining -= 1
-                         self.next_level3_spawn_time = (now + random.randint
+                         self.next_level3_spawn_time = (now + rng.randint
                                                         (self.level3_minspawntime, 
                                                          self.level3_maxspawntime)
                                                             )
@@ -2478,7 +2671,7 @@ class AlienInvasion:
                     if self.settings.wave_master_index[self.current_wave_num]["count_level4"]>0 and self.level1_rows_remaining > 0 and now>=self.next_level4_spawn_time:
                          self._spawn_single_alien(level=4)
                          #self.level4_remaining -= 1
-                         self.next_level4_spawn_time = (now + random.randint
+                         self.next_level4_spawn_time = (now + rng.randint
                                                         (self.level4_minspawntime, 
                                                          self.level4_maxspawntime)
                                                             )                      
@@ -2489,7 +2682,7 @@ class AlienInvasion:
                          
                          self._spawn_single_alien(level=5) #destroyer
                          #self.destroyers_remaining -= 1
-                         self.next_destroyer_spawn_time = (now + random.randint
+                         self.next_destroyer_spawn_time = (now + rng.randint
                                                         (self.destroyer_minspawntime, 
                                                          self.destroyer_maxspawntime)
                                                             )
@@ -2501,7 +2694,7 @@ class AlienInvasion:
                          
                          self._spawn_single_alien(level=6) #cruisers
                          #self.cruisers_remaining -= 1
-                         self.next_cruiser_spawn_time = (now + random.randint
+                         self.next_cruiser_spawn_time = (now + rng.randint
                                                         (self.cruiser_minspawntime, 
                                                          self.cruiser_maxspawntime)
                                                             )
@@ -2512,7 +2705,7 @@ class AlienInvasion:
                          
                          self._spawn_single_alien(level=7) #laser tanker
                          #self.cruisers_remaining -= 1
-                         self.next_laztanker_spawn_time = (now + random.randint
+                         self.next_laztanker_spawn_time = (now + rng.randint
                                                         (self.laztanker_minspawntime, 
                                                          self.laztanker_maxspawntime)
                                                             )
@@ -2542,7 +2735,7 @@ class AlienInvasion:
                         min_x = new_alien.rect.width
                         max_x = self.settings.screen_width - new_alien.rect.width
                     
-                    x = random.randint(min_x, max_x)
+                    x = rng.randint(min_x, max_x)
                     y = -new_alien.rect.height #start just off screen
                     new_alien.spawn_pos(x,y)
                     
@@ -2643,11 +2836,11 @@ class AlienInvasion:
         def _spawn_alien_interceptor (self, player_id): 
             """if players are choking toward the top of the screen, squadron members begin to spawn - level '30' aliens -  just needed a placeholder number."""
             self.player_id = player_id
-            now = pygame.time.get_ticks()
+            now = game_clock.get_ticks()
             if 0!= self.next_interceptor_spawn <= now:
                     new_alien = Alien(self.settings, self.screen, level=30)
                     y = int(player_id.rect.y) #starts even with the player
-                    #TODO: consider changing the x so that spawner selects the side of the screen farther from the player at time of spawn. Avoids invisible collisions. current code is random.choice(self.settings.screen_width+ new_alien.rect.width, -new_alien.rect.width) #start just off screen
+                    #TODO: consider changing the x so that spawner selects the side of the screen farther from the player at time of spawn. Avoids invisible collisions. current code is rng.choice(self.settings.screen_width+ new_alien.rect.width, -new_alien.rect.width) #start just off screen
                     if x == (self.settings.screen_width+ new_alien.rect.width):
                         new_alien.speed = self.settings.interceptor_speed
                     elif x == (-new_alien.rect.width):
@@ -2670,8 +2863,6 @@ class AlienInvasion:
     def fire_alien_bullet(self, alien, alien_level, level1_3_already_fired=False):
         """helper function  for update_game() to fire alien bullets.
         level1_3_already_fired: If True, a level 1-3 alien already fired this frame (prevents sound overlap).""" 
-        bullet_count = [] # Initialize an empty list to count bullets: 
-        
         if alien_level == 1:
             max_bullets = self.settings.alien1_bullet_max
             owner_type = "alien"
@@ -2705,12 +2896,10 @@ class AlienInvasion:
              max_bullets=self.settings.boss_bullet_max
              owner_type = "alien"
 
-        #The for loop to count bullets:
-        for b in self.alien_bullets: #for every sprite found in the alien_bullets group 
-            if hasattr(b, 'owner_ref') and b.owner_ref == alien: #if its owner parameter is the alien in question
-                bullet_count.append(b)
+        #count this alien's bullets still in flight (the group keeps the count up to date - BulletGroup, bullet.py)
+        bullet_count = self.alien_bullets.count_owned(alien)
         #if statement to enforce bullet cap:
-        if len(bullet_count) >= max_bullets: #if the sprite under iteration has its proper max bullets attributed to it:
+        if bullet_count >= max_bullets: #if the sprite under iteration has its proper max bullets attributed to it:
             # Stop lasertanker firing sound if bullet cap reached
             if alien_level == 7 and alien in self.audio.lasertanker_firing_sound_channels:
                 channel = self.audio.lasertanker_firing_sound_channels[alien]
@@ -2719,7 +2908,7 @@ class AlienInvasion:
                 del self.audio.lasertanker_firing_sound_channels[alien]
             return #limit the function to not fire another bullet, but end here.
         #otherwise, mmake a new bullet for that alien:
-        bullet = Bullet(settings=self.settings, screen=self.screen, 
+        bullet = Bullet.acquire(settings=self.settings, screen=self.screen, 
                         x=alien.rect.centerx, y=alien.rect.bottom, direction=1,
                         owner_type=owner_type, owner_level=alien_level, owner_ref=alien)
         self.alien_bullets.add(bullet) #add the bullet to the Alien Bullets sprite group.
@@ -2765,7 +2954,7 @@ class AlienInvasion:
 
     def _alien_firing_logic(self):
         """helper function for _update_game() - check if each alien is ready to fire, and if so, create a bullet object at the appropriate level."""
-        now = pygame.time.get_ticks() #get current time
+        now = game_clock.get_ticks() #get current time
         level1_3_fired_this_frame = False  # Track if any level 1-3 alien fired to limit sound overlap
         for alien in self.aliens:
              if alien.ready_to_fire(now): #is alien fire timer set to current time?
@@ -2780,7 +2969,7 @@ class AlienInvasion:
                      self._fire_cruiser_wing_bullets(alien, first_shot=True)  # Fire first shot immediately
                      # Schedule second shot 1 second (1000ms) later
                      alien.next_wing_second_shot_time = now + 1000
-                 alien.next_wing_fire_time = now + random.randint(self.settings.cruiser_wing_min_fire_interval, self.settings.cruiser_wing_max_fire_interval)
+                 alien.next_wing_fire_time = now + rng.randint(self.settings.cruiser_wing_min_fire_interval, self.settings.cruiser_wing_max_fire_interval)
              # Check for second wing shot (1 second after first)
              if alien.level == 6 and hasattr(alien, 'next_wing_second_shot_time') and alien.next_wing_second_shot_time is not None and now >= alien.next_wing_second_shot_time:
                  if alien.damage_stage < 13 and alien.alive():  # Only fire if cruiser still alive
@@ -2789,106 +2978,17 @@ class AlienInvasion:
     
     def _minion_firing_logic(self):
         """helper function for _update_game() - check if each minion is ready to fire, and if so, create appropriate projectiles."""
-        now = pygame.time.get_ticks() #get current time
+        now = game_clock.get_ticks() #get current time
         for minion in self.minions:
             if minion.ready_to_fire(now): #is minion fire timer set to current time?
                 if minion.minion_type == "laser":
                     # Play laserminion firing sound
                     self.audio.play("alien_laserminion_shot")
                     # Create LaserminionBomb
-                    bomb = LaserminionBomb(self.settings, self.screen,
+                    bomb = LaserminionBomb.acquire(self.settings, self.screen,
                                           minion.rect.centerx, minion.rect.bottom)
                     self.alien_bullets.add(bomb) #add to alien bullets group
 
-    def _cruiser_collision_valid(self, alien, bullet_rect):
-        """Check if a bullet's rect collision with a cruiser (level 6) is valid.
-        Returns False if bullet overlaps wing bottom area (left/right thirds, bottom half).
-        Returns True otherwise."""
-        if alien.level != 6:
-            return True  # Not a cruiser, always valid
-        
-        alien_left = alien.rect.left
-        alien_right = alien.rect.right
-        alien_width = alien.rect.width
-        alien_top = alien.rect.top
-        alien_height = alien.rect.height
-        
-        # Calculate thirds
-        left_third_end = alien_left + (alien_width / 3)
-        right_third_start = alien_right - (alien_width / 3)
-        wing_midpoint = alien_top + (alien_height / 2)  # Middle of sprite
-        
-        # Check if bullet rect overlaps with the invalid wing bottom areas
-        # Invalid areas: left third (bottom half) and right third (bottom half)
-        bullet_left = bullet_rect.left
-        bullet_right = bullet_rect.right
-        bullet_top = bullet_rect.top
-        bullet_bottom = bullet_rect.bottom
-        
-        # Check if other rect overlaps center third (valid area - any Y position)
-        overlaps_center = bullet_right > left_third_end and bullet_left < right_third_start
-        
-        # Check if other rect overlaps top half (valid area - any X position)
-        overlaps_top = bullet_bottom > alien_top and bullet_top < wing_midpoint
-        
-        # If overlaps center third OR top half, collision is valid
-        if overlaps_center or overlaps_top:
-            return True
-        
-        # Check if other rect overlaps left wing bottom area (invalid)
-        overlaps_left_wing_bottom = (
-            bullet_right > alien_left and 
-            bullet_left < left_third_end and
-            bullet_bottom > wing_midpoint and
-            bullet_top < alien.rect.bottom
-        )
-        
-        # Check if other rect overlaps right wing bottom area (invalid)
-        overlaps_right_wing_bottom = (
-            bullet_right > right_third_start and
-            bullet_left < alien_right and
-            bullet_bottom > wing_midpoint and
-            bullet_top < alien.rect.bottom
-        )
-        
-        # If only overlaps wing bottom areas, collision is invalid
-        if overlaps_left_wing_bottom or overlaps_right_wing_bottom:
-            return False
-        
-        # Default: valid (shouldn't reach here if rects overlap)
-        return True
-
-    def _destroyer_collision_valid(self, alien, other_rect):
-        """
-        Destroyer (level 5) custom hitbox filter.
-
-        Excludes collisions in the two outer 25% bands of the *front half* of the sprite.
-        (Aliens approach from top, so we treat \"front\" as the LOWER half of the sprite.)
-
-        Returns True if other_rect overlaps the *allowed* collision area.
-        Returns False if other_rect overlaps only the excluded zones.
-        """
-        if getattr(alien, "level", None) != 5:
-            return True
-
-        w = alien.rect.width
-        h = alien.rect.height
-        half_h = int(h * 0.5)
-        outer_w = int(w * 0.28)
-
-        # Allowed collision area:
-        # - Back half: full width
-        # - Front half: center 50% width (exclude outer 25% on each side)
-        back_half = pygame.Rect(alien.rect.left, alien.rect.top, w, half_h)
-        front_center = pygame.Rect(
-            alien.rect.left + outer_w,
-            alien.rect.top + half_h,
-            max(1, w - (2 * outer_w)),
-            max(1, h - half_h),
-        )
-
-        return other_rect.colliderect(back_half) or other_rect.colliderect(front_center)
-
     def _fire_cruiser_wing_bullets(self, alien, first_shot=True):
         """Fire small ordinary alien bullets from cruiser wing positions.
         Bullets originate from the forward (bottom) midpoints of each wing.
@@ -2913,7 +3013,7 @@ class AlienInvasion:
         wing_y = alien_top + (alien_height / 2) + (alien_height * 0.10)
         
         # Fire from left wing
-        left_bullet = Bullet(
+        left_bullet = Bullet.acquire(
             settings=self.settings, 
             screen=self.screen,
             x=left_wing_x, 
@@ -2926,7 +3026,7 @@ class AlienInvasion:
         self.alien_bullets.add(left_bullet)
         
         # Fire from right wing
-        right_bullet = Bullet(
+        right_bullet = Bullet.acquire(
             settings=self.settings,
             screen=self.screen,
             x=right_wing_x,
@@ -2940,45 +3040,56 @@ class AlienInvasion:
         # Play sound for each shot (both first and second)
         self.audio.play("alien_cruiser_wing_shot")  # Cruiser wing bullets 
 
+    def _shockwave_alien_hits(self):
+        """helper for _update_game_state(): shockwaves vs. aliens, once per alien per shockwave."""
+        self.collision_grid.begin_pass()
+        self.collision_grid.begin_area_pass()
+        rules = self.collision_rules
+
+        # What a shockwave does to each alien level comes from the collision rule table (collision_rules.py):
+        # levels up to settings.shockwave_kill_max_alien_level are instakilled, destroyers/cruisers/lasertankers take
+        # settings.shockwave_damage_amount damage stages (only if the wave touches their compound hitbox).
+        def shockwave_reaches(sw, alien):
+            rule = rules.get(("shockwave", alien.level))
+            if rule is None or not sw.rect.colliderect(alien.rect):
+                return False  # not touching, or shockwaves don't hurt this level
+            return not rule.exact_hitbox or alien.hitbox_collides(sw.rect)  # not through the space by a cruiser's wings
+
+        for sw in self.shockwaves.sprites():
+            # only the aliens this shockwave has just reached - the ones it's still passing over were hit already
+            for alien in self.collision_grid.spritecollide_entering(sw, self.aliens, shockwave_reaches):
+                # damage, and on a kill: sounds, animation, drop, score
+                self._resolve_alien_hit(alien, rules[("shockwave", alien.level)], sw.owner)
+
     def _do_collisions(self):
         """Helper for update_game() that handles collisions between shields, player bullets/alien ships, alien bullets/player ship, and alien ships/player ships, in that order."""
+        self.collision_grid.begin_pass()  # everything moved since the last pass - the grid re-buckets groups as they get queried
+        rules = self.collision_rules  # what each kind of hit does (collision_rules.py)
         # Shields absorb/regen if enabled
         if self.settings.orbital_shields_enabled and self.shields:
             # player bullets charge shields toward regen
             # Mobile shields: owner's bullets pass through, other players' bullets recharge
-            hits = pygame.sprite.groupcollide(self.player_bullets, self.shields, False, False)
+            # Owners' bullets vs. their own mobile shields are filtered out in the query (bitmask test, see shield_blocks) -
+            # only needed while there are mobile shields, the rest of the time it's a plain rect check
+            blocks = shield_blocks if self.player_shields else None
+            hits = self.collision_grid.groupcollide(self.player_bullets, self.shields, False, False, blocks)
             bullets_to_kill = []
             for bullet, shields_hit in hits.items():
                 hit_shield = False
                 for shield in shields_hit:
-                    # Check if this is a mobile shield (mom-created)
-                    if hasattr(shield, 'tracked_player') and shield.tracked_player:
-                        # Mobile shield: check if bullet owner matches shield owner
-                        if (hasattr(bullet, 'owner_ref') and bullet.owner_ref and 
-                            hasattr(bullet.owner_ref, 'player_id') and
-                            bullet.owner_ref.player_id == shield.tracked_player.player_id):
-                            # Owner's bullet passes through
-                            continue
-                        else:
-                            # Other player's bullet recharges the shield
-                            if shield.heal(1):  # Recharge by 1 stage, returns True if stage improved
-                                self.audio.play("shield_recharge")  # Play sound when shield stage improves
-                            # Track shield recharge shot
-                            if hasattr(bullet, 'owner_ref') and hasattr(bullet.owner_ref, 'player_id'):
-                                player_id = bullet.owner_ref.player_id
-                                if player_id in self.player_stats:
-                                    self.player_stats[player_id]['shield_recharge_shots'] += 1
-                            hit_shield = True
+                    if shield.pass_mask:
+                        # Mobile shield (mom-created): another player's bullet recharges it
+                        # (the owner's own bullets never get here - shield_blocks() leaves them out of the query)
+                        if shield.heal(1):  # Recharge by 1 stage, returns True if stage improved
+                            self.events.emit(SOUND, "shield_recharge")  # Play sound when shield stage improves
                     else:
                         # Stationary shield - recharge it
                         if shield.register_recharge_hit():  # Returns True if stage improved
-                            self.audio.play("shield_recharge")  # Play sound when shield stage improves
-                        # Track shield recharge shot
-                        if hasattr(bullet, 'owner_ref') and hasattr(bullet.owner_ref, 'player_id'):
-                            player_id = bullet.owner_ref.player_id
-                            if player_id in self.player_stats:
-                                self.player_stats[player_id]['shield_recharge_shots'] += 1
-                        hit_shield = True
+                            self.events.emit(SOUND, "shield_recharge")  # Play sound when shield stage improves
+                    # Track shield recharge shot
+                    if bullet.owner_id:
+                        self.events.emit(STAT, bullet.owner_id, 'shield_recharge_shots', 1)
+                    hit_shield = True
                 # Kill bullet if it hit a shield (and wasn't owner's bullet on mobile shield)
                 if hit_shield:
                     bullets_to_kill.append(bullet)
@@ -2986,281 +3097,61 @@ class AlienInvasion:
             for bullet in bullets_to_kill:
                 bullet.kill()
 
-            # alien bullets damage shields
-            hits = pygame.sprite.groupcollide(self.alien_bullets, self.shields, True, False)
+            # alien bullets damage shields (damage by bullet kind, sound by who fired it - collision_rules.py)
+            hits = self.collision_grid.groupcollide(self.alien_bullets, self.shields, True, False)
             for bullet, shields_hit in hits.items():
-                # Check for NyancatBullet (double damage to shields)
-                is_nyancat_bullet = isinstance(bullet, NyancatBullet)
-                is_laserminion_bomb = isinstance(bullet, LaserminionBomb)
-                
-                # Determine sound based on bullet owner level
-                bullet_owner_level = getattr(bullet, 'owner_level', 1)
-                bullet_owner_type = getattr(bullet, 'owner_type', 'alien')
-                if bullet_owner_type == "kitty":
-                    # Kitty bullets: bluewhale (13) is large, others are small
-                    if bullet_owner_level == 13:  # Bluewhalekitty
-                        self.audio.play("shield_hit_big_bullet")
-                    else:
-                        self.audio.play("shield_hit_small_bullet")  # Loafkitty, centurion, emperor
-                elif bullet_owner_level in (1, 2, 3):
-                    self.audio.play("shield_hit_small_bullet")  # Bullets from levels 1-3
-                elif bullet_owner_level in (5, 6):  # Destroyer (5) or cruiser wing/main (6)
-                    self.audio.play("shield_hit_big_bullet")  # Bullets from destroyer/cruiser
-                # Note: Cruiser center bullet (level 6 main) will use big_bullet sound
-                
-                # Determine damage (NyancatBullet does double damage)
-                damage = 2 if is_nyancat_bullet else 1
+                kind = bullet_kind(bullet)
+                sound = rules.get(("shield_sound", (getattr(bullet, 'owner_type', 'alien'), getattr(bullet, 'owner_level', 1))))
+                if sound:
+                    self.events.emit(SOUND, sound)
+                damage = rules[("alien_bullet", kind)].shield_damage  # NyancatBullet does double damage
                 for shield in shields_hit:
                     shield.take_damage(damage)
-                
                 # Kill bullet after impact (NyancatBullet and LaserminionBomb disappear after impact)
-                if (is_nyancat_bullet or is_laserminion_bomb) and bullet.alive():
+                if kind != "bullet" and bullet.alive():
                     bullet.kill()
                 # Note: Normal bullets are already killed by groupcollide (dokill=True)
 
-            # big aliens collide with shields
-            hits = pygame.sprite.groupcollide(self.aliens, self.shields, False, False)
+            # big aliens collide with shields (cruisers/destroyers only with their compound hitbox)
+            hits = self.collision_grid.groupcollide(self.aliens, self.shields, False, False, collide_hitbox)
             for alien, shields_hit in hits.items():
-                # For cruisers, check if collision is valid (not in wing top area)
-                if alien.level == 6:
-                    # Check collision using shield rect (use first shield's rect as approximation)
-                    if shields_hit:
-                        shield_rect = shields_hit[0].rect
-                        if not self._cruiser_collision_valid(alien, shield_rect):
-                            continue  # Skip this collision
-                    else:
-                        continue  # No shields, skip
-                # For destroyers, exclude front-half outer quarters
-                if alien.level == 5:
-                    if shields_hit:
-                        shield_rect = shields_hit[0].rect
-                        if not self._destroyer_collision_valid(alien, shield_rect):
-                            continue
-                    else:
-                        continue
-                
-                dmg = None  # level-based damage
-                if alien.level in (1, 2, 3):
-                    dmg = 1
-                elif alien.level == 4:
-                    dmg = 3
-                elif alien.level == 5:
-                    dmg = 4
-                elif alien.level == 6:
-                    dmg = 5
-                elif alien.level == 7:
-                    dmg = 100  # lazertankers obliterate shields completely
-
-                if dmg is not None:
-                    for shield in shields_hit:
-                        shield.take_damage(dmg)  # apply collision damage
-                    # Play appropriate collision sound based on alien level
-                    if alien.level in (1, 2, 3):
-                        self.audio.play("shield_collide_small_alien")  # Levels 1-3 collide with shield
-                    elif alien.level == 4:
-                        self.audio.play("alien_lvl4_collision")  # Level 4 collision sound
-                        # Stop level 4 hum sound if this alien was playing it
-                        if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                            alien.hum_sound_channel.stop()
-                            alien.hum_sound_channel = None
-                    elif alien.level == 5:
-                        self.audio.play("alien_destroyer_death")  # Destroyer death sound
-                        # Stop hum sound if this alien was playing it
-                        if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                            alien.hum_sound_channel.stop()
-                            alien.hum_sound_channel = None
-                    elif alien.level == 6:
-                        self.audio.play("alien_cruiser_death")  # Cruiser death sound
-                        # Stop hum sound if this alien was playing it
-                        if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                            alien.hum_sound_channel.stop()
-                            alien.hum_sound_channel = None
-                    elif alien.level == 7:
-                        self.audio.play("alien_laztanker_death")  # Lasertanker death sound
-                        # Stop hum sound if this alien was playing it
-                        if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                            alien.hum_sound_channel.stop()
-                            alien.hum_sound_channel = None
-                        # Stop lasertanker firing sound
-                        if alien in self.audio.lasertanker_firing_sound_channels:
-                            channel = self.audio.lasertanker_firing_sound_channels[alien]
-                            if channel:
-                                channel.stop()
-                            del self.audio.lasertanker_firing_sound_channels[alien]
-                    # Create death animations for big aliens
-                    if alien.level == 7:
-                        death_anim = LazertankerDeathAnimation(
-                            self.settings,
-                            self.screen,
-                            alien.rect.center,
-                            alien.rect.size
-                        )
-                        self.lazertanker_death_animations.add(death_anim)
-                    elif alien.level == 6:
-                        death_anim = CruiserDeathAnimation(
-                            self.settings,
-                            self.screen,
-                            alien.rect.center,
-                            alien.rect.size
-                        )
-                        self.cruiser_death_animations.add(death_anim)
-                    elif alien.level == 5:
-                        death_anim = DestroyerDeathAnimation(
-                            self.settings,
-                            self.screen,
-                            alien.rect.center,
-                            alien.rect.size
-                        )
-                        self.destroyer_death_animations.add(death_anim)
-                    # Stop level 4 hum sound if this alien was playing it
-                    if alien.level == 4 and hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                        alien.hum_sound_channel.stop()
-                        alien.hum_sound_channel = None
-                    alien.kill()  # shield collision destroys these alien types
+                rule = rules.get(("shield", alien.level))
+                if rule is None:
+                    continue
+                for shield in shields_hit:
+                    shield.take_damage(rule.shield_damage)  # apply collision damage (by alien size)
+                self.events.emit(SOUND, rule.sound)  # small crash for levels 1-3, the alien's death sound for the rest
+                self._resolve_alien_hit(alien, rule)  # shield collision destroys every alien type (no drop, no score)
 
         #-----Tracking collisions betweel PLAYER BULLETS and ALIEN SHIPS:
-        # For cruisers, we need custom collision checking, so we'll handle them separately
-        # First, get collisions without killing bullets yet
-        alien_is_hit = pygame.sprite.groupcollide(self.player_bullets, self.aliens, False, False)
-        for bullet, aliens_hit in alien_is_hit.items():
-                # Filter out invalid cruiser collisions before processing
-                valid_aliens = []
-                for alien in aliens_hit:
-                    # Custom collision check for cruisers (level 6) - wings only collide in bottom half
-                    if alien.level == 6:
-                        # Check if bullet rect collision is valid (not in wing top area)
-                        if not self._cruiser_collision_valid(alien, bullet.rect):
-                            continue  # Skip this collision - don't add to valid_aliens
-                    # Custom collision check for destroyers (level 5) - exclude front-half outer quarters
-                    if alien.level == 5:
-                        if not self._destroyer_collision_valid(alien, bullet.rect):
-                            continue
-                    valid_aliens.append(alien)
-                
-                # Only process collision if there are valid aliens
-                if not valid_aliens:
-                    continue  # No valid collisions, bullet continues
-                
+        # Cruisers and destroyers have compound hitboxes (hitbox.py) - collide_hitbox drops bullets that only pass
+        # through the empty space around their wings, so every alien listed here really got hit.
+        # Bullets aren't killed by groupcollide yet, that happens below.
+        alien_is_hit = self.collision_grid.groupcollide(self.player_bullets, self.aliens, False, False, collide_hitbox)
+        for bullet, valid_aliens in alien_is_hit.items():
                 # Track bullet hit (for accuracy calculation) - track once per bullet hit
-                if hasattr(bullet, 'owner_ref') and hasattr(bullet.owner_ref, 'player_id'):
-                    player_id = bullet.owner_ref.player_id
-                    if player_id in self.player_stats:
-                        self.player_stats[player_id]['bullets_hit'] += 1
+                if bullet.owner_id:  # the firing player's id, tagged on the bullet when it was made (0 = no player)
+                    self.events.emit(STAT, bullet.owner_id, 'bullets_hit', 1)
                 
                 # Play bullet hit sound
-                self.audio.play("bullet_hit")
+                self.events.emit(SOUND, "bullet_hit")
                 
                 # Now kill the bullet since we have valid collisions
                 bullet.kill()
                 
-                # Process collisions with valid aliens only
+                # Process collisions with valid aliens only: levels 1-4 die in one hit, levels 5-7 go through their
+                # damage frames (collision_rules.py); whoever fired the bullet gets the score
                 for alien in valid_aliens:
-                    destroyed = False
-                    if alien.level in (1,2,3,4): #aliens at levels 1-4 only need 1 hit to destroy them.
-                        #TODO: make this a menu option: remove level 2 aliens from the possibility of bullets hitting them; but make them cause 0 damage to players if players collide with them - meaning, you have to collide with them to kill them)
-                        destroyed = True
-                    elif alien.level in (5,6,7,8): #aliens at levels 5-8 need multiple hits; a function in the alien.py file allows variety based on class.
-                        destroyed = alien.check_destruction() #for aliens with hitpoints, the .destroyed() function in alien.py will return a True or False depending on -->
-                                                    #--> how many times the alien has been hit.
-                   #TODO: make level 2 aliens impervious to bullets, but deal 0 damage when colllided with - in effect, you ahve to mop them up. 
-                    #kill the alien, if the above code determines it has been destroyed. Play the appropriate sound for each kind of death:
-                    if destroyed:
-                        # Death by bullet (this section handles bullet kills)
-                        #if alien.level in (1, 2, 3): #commented out to see if sound runs better. If commented back in, 
-                            #self.audio.play("alien_lvl1to3_death")  # Levels 1-3 killed by bullet
-                        if alien.level == 4:
-                            self.audio.play("alien_lvl1to3_death")  # Level 4 killed by bullet (not collision)
-                            # Stop level 4 hum sound if this alien was playing it
-                            if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                                alien.hum_sound_channel.stop()
-                                alien.hum_sound_channel = None
-                        # Note: Level 4 collision deaths use alien_lvl4_collision (handled in collision section)
-                        elif alien.level == 5:
-                            self.audio.play("alien_destroyer_death")  # Destroyer death
-                            # Stop hum sound if this alien was playing it
-                            if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                                alien.hum_sound_channel.stop()
-                                alien.hum_sound_channel = None
-                        elif alien.level == 6:
-                            self.audio.play("alien_cruiser_death")  # Cruiser death
-                            # Stop hum sound if this alien was playing it
-                            if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                                alien.hum_sound_channel.stop()
-                                alien.hum_sound_channel = None
-                        elif alien.level == 7:
-                            self.audio.play("alien_laztanker_death")  # Lasertanker death
-                            # Stop hum sound if this alien was playing it
-                            if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                                alien.hum_sound_channel.stop()
-                                alien.hum_sound_channel = None
-                            # Stop lasertanker firing sound
-                            if alien in self.audio.lasertanker_firing_sound_channels:
-                                channel = self.audio.lasertanker_firing_sound_channels[alien]
-                                if channel:
-                                    channel.stop()
-                                del self.audio.lasertanker_firing_sound_channels[alien]
-                              # elif alien.level == 8:
-                              #   self.audio.play("gunship_explosion")
-                        # else:
-                        #   self.audio.play("boss_explosion")  # Commented out - sound not loaded
-
-                        # Create lasertanker death animation if it's a lasertanker
-                        if alien.level == 7:
-                            death_anim = LazertankerDeathAnimation(
-                                self.settings,
-                                self.screen,
-                                alien.rect.center,
-                                alien.rect.size
-                            )
-                            self.lazertanker_death_animations.add(death_anim)
-                        # Create cruiser death animation if it's a cruiser
-                        elif alien.level == 6:
-                            death_anim = CruiserDeathAnimation(
-                                self.settings,
-                                self.screen,
-                                alien.rect.center,
-                                alien.rect.size
-                            )
-                            self.cruiser_death_animations.add(death_anim)
-                        # Create destroyer death animation if it's a destroyer
-                        elif alien.level == 5:
-                            death_anim = DestroyerDeathAnimation(
-                                self.settings,
-                                self.screen,
-                                alien.rect.center,
-                                alien.rect.size
-                            )
-                            self.destroyer_death_animations.add(death_anim)
-
-                        alien.kill()
-                        self._maybe_spawn_powerup_from_alien(alien)
-
-                        #after the alien is killed, take care of incrementing player score up - in order to make "boss" level work, I use a try+except; the try requires-->
-                        # -->that the alien level be a number that can run through a scoring equation.        
-                        # Only award points if bullet has an owner_ref (player bullets should always have one, but check for safety)
-                        # Skip scoring for lifepod kills - lifepods don't earn points
-                        if bullet.owner_ref is not None and hasattr(bullet.owner_ref, 'player_score'):
-                            # Track enemy destroyed (works for both player bullets and squadron bullets)
-                            if hasattr(bullet.owner_ref, 'player_id') and bullet.owner_ref.player_id in self.player_stats:
-                                self.player_stats[bullet.owner_ref.player_id]['enemies_destroyed'] += 1
-                            try:
-                                bullet.owner_ref.player_score += alien.level * ((alien.level* 1/2)*20) #scoring equation - note it has to have an integer as the alien level.
-                            except (TypeError, AttributeError): #since "boss" level is a string, a try/except works well here to score the boss, without having to change the overall scoring equation above.
-                                #player who killed boss alien gets 50,000 points;
-                                bullet.owner_ref.player_score += 50000
-                                #other players get 10,000 points
-                                for player in self.players:
-                                    if player.player_id != bullet.owner_ref.player_id:
-                                        player.player_score += 10000
+                    rule = rules.get(("player_bullet", alien.level))
+                    if rule is not None:
+                        self._resolve_alien_hit(alien, rule, bullet.owner_ref)
 
         #-----Tracking collisions between PLAYER BULLETS and MINIONS:
-        minion_is_hit = pygame.sprite.groupcollide(self.player_bullets, self.minions, False, False)
+        minion_is_hit = self.collision_grid.groupcollide(self.player_bullets, self.minions, False, False)
         for bullet, minions_hit in minion_is_hit.items():
             # Track bullet hit (for accuracy calculation) - track once per bullet hit
-            if hasattr(bullet, 'owner_ref') and hasattr(bullet.owner_ref, 'player_id'):
-                player_id = bullet.owner_ref.player_id
-                if player_id in self.player_stats:
-                    self.player_stats[player_id]['bullets_hit'] += 1
+            if bullet.owner_id:
+                self.events.emit(STAT, bullet.owner_id, 'bullets_hit', 1)
             
             # Kill the bullet
             bullet.kill()
@@ -3269,12 +3160,9 @@ class AlienInvasion:
             for minion in minions_hit:
                 destroyed = minion.check_destruction()
                 if destroyed:
-                    # Score based on minion level
-                    if hasattr(bullet, 'owner_ref') and hasattr(bullet.owner_ref, 'player_score'):
-                        bullet.owner_ref.player_score += minion.level * 10  # 10 points per minion level
-                        # Track enemy destroyed (minion)
-                        if hasattr(bullet.owner_ref, 'player_id') and bullet.owner_ref.player_id in self.player_stats:
-                            self.player_stats[bullet.owner_ref.player_id]['enemies_destroyed'] += 1
+                    # Score based on minion level (10 points per level) and the enemies_destroyed stat - same as an
+                    # alien kill, so lifepods don't earn any
+                    self._credit_kill(bullet.owner_ref, minion.level * 10)
 
                     # Play explosion sound
                     # self.audio.play("medium_explosion")  # Commented out - no sound files available
@@ -3283,7 +3171,7 @@ class AlienInvasion:
                     minion.kill()
 
         # Lifepod-alien collisions (trigger respawn animation)
-        lifepod_hits = pygame.sprite.groupcollide(self.lifepods, self.aliens, False, False)
+        lifepod_hits = self.collision_grid.groupcollide(self.lifepods, self.aliens, False, False)
         for lifepod, aliens_hit in lifepod_hits.items():
             if lifepod.state == "normal":  # Only trigger if not already respawning
                 for alien in aliens_hit:
@@ -3292,7 +3180,7 @@ class AlienInvasion:
                     break  # Only trigger once per collision
 
         # Lifepod-alien bullet collisions (trigger respawn animation)
-        lifepod_bullet_hits = pygame.sprite.groupcollide(self.lifepods, self.alien_bullets, False, True)
+        lifepod_bullet_hits = self.collision_grid.groupcollide(self.lifepods, self.alien_bullets, False, True)
         for lifepod, bullets_hit in lifepod_bullet_hits.items():
             if lifepod.state == "normal" and bullets_hit:  # Only trigger if not already respawning
                 # Trigger lifepod respawn animation
@@ -3302,20 +3190,20 @@ class AlienInvasion:
         #laser_hits_alien = pygame.sprite.groupcollide(self.aliens, self.laser, True, False)
         #laser_hits_minion = pygame.sprite.groupcollide(self.minions, self.laser, True, False)
         #shockwave_hits_alien = pygame.sprite.groupcollide(self.aliens, self.shockwaves, True, False) #shockwaves tear through aliens.
-        shockwave_hits_minion = pygame.sprite.groupcollide(self.minions, self.shockwaves, True, False)  # shockwaves destroy minions 
+        shockwave_hits_minion = self.collision_grid.groupcollide(self.minions, self.shockwaves, True, False)  # shockwaves destroy minions 
 
     #-----Tracking collisions between ALIEN BULLETS and SQUADRONS:
-        squadron_is_hit = pygame.sprite.groupcollide(self.alien_bullets, self.squadrons, True, False)
+        squadron_is_hit = self.collision_grid.groupcollide(self.alien_bullets, self.squadrons, True, False)
         for bullet, squadrons_hit in squadron_is_hit.items():
             # Play bullet hit sound
-            self.audio.play("bullet_hit")
+            self.events.emit(SOUND, "bullet_hit")
             is_laserminion_bomb = isinstance(bullet, LaserminionBomb)
             for squadron in squadrons_hit:
                 was_alive = squadron.alive()  # Check if squadron was alive before taking hit
                 squadron.take_hit(1)
                 # Play death sound if squadron just died
                 if was_alive and not squadron.alive():
-                    self.audio.play("powerup_squadron_death")
+                    self.events.emit(SOUND, "powerup_squadron_death")
                 
                 # Apply LaserminionBomb knockback
                 if is_laserminion_bomb:
@@ -3340,195 +3228,74 @@ class AlienInvasion:
                 bullet.kill()
 
     #-----Tracking collisions between LEVEL 4 ALIENS and SQUADRONS:
+        stats = self.collision_stats
+        started, lvl4_pairs, lvl4_hits = stats.clock(), 0, 0
         for alien in self.aliens:
             if alien.level == 4:
+                lvl4_pairs += len(self.squadrons)
                 hits = pygame.sprite.spritecollide(alien, self.squadrons, dokill=False)
                 if hits:
-                    self.audio.play("alien_lvl4_collision")  # Level 4 collision sound
-                    # Stop level 4 hum sound if this alien was playing it
-                    if hasattr(alien, 'hum_sound_channel') and alien.hum_sound_channel:
-                        alien.hum_sound_channel.stop()
-                        alien.hum_sound_channel = None
+                    lvl4_hits += len(hits)
+                    self.events.emit(SOUND, "alien_lvl4_collision")  # Level 4 collision sound
+                    self._stop_alien_sounds(alien)  # Stop level 4 hum sound if this alien was playing it
                     for squadron in hits:
                         # Play death sound for each squadron killed
                         if squadron.alive():
-                            self.audio.play("powerup_squadron_death")
+                            self.events.emit(SOUND, "powerup_squadron_death")
                         squadron.kill()  # Level 4 aliens instantly kill squadrons
                     alien.kill()  # Level 4 aliens also die on collision
+        stats.record("level 4 aliens x squadrons (loop)", lvl4_pairs, lvl4_hits, started)
 
     #-----Tracking collisions between an ALIEN BULLETS and PLAYER SHIPS:
-        player_is_hit = pygame.sprite.groupcollide(self.alien_bullets, self.players, False, False)
+        player_is_hit = self.collision_grid.groupcollide(self.alien_bullets, self.players, False, False)
         if player_is_hit:
              # Play bullet hit sound
-             self.audio.play("bullet_hit")
+             self.events.emit(SOUND, "bullet_hit")
              for bullet, ships_hit in player_is_hit.items(): #note that in this for loop, the order of the two iterating variables has to match the -->
                                                             #--> Order of their corresponding parameter in the collision parameters.
-                # Check for special bullet types (once per bullet, not per ship)
-                is_nyancat_bullet = isinstance(bullet, NyancatBullet)
-                is_laserminion_bomb = isinstance(bullet, LaserminionBomb)
-             
+                # Damage and knockback depend on the kind of bullet (once per bullet, not per ship) - collision_rules.py
+                rule = rules[("alien_bullet", bullet_kind(bullet))]
                 for ship in ships_hit:
-                  #If ship is respawning:
-                  if ship.player_state in ("between_lives", "respawning"): 
-                        continue #skip that ship and continue to the next one if it's not alive. Respawning ships cannot fire bullets.
-                
-                  #otherwise, go through all the needed rigmarole to figure out if the player just died, adjust player health, announce, etc. 
-                  else: 
-                    # Determine damage
-                    if is_nyancat_bullet:
-                        damage = 2  # Double damage for NyancatBullet
-                    else:
-                        damage = 1  # Normal damage
-                    
-                    ship.player_health -= damage
-                    # Track damage taken
-                    if ship.player_id in self.player_stats:
-                        self.player_stats[ship.player_id]['damage_taken'] += damage
-                    self._trigger_hud_flash(ship, "hp")
-                    self.audio.play("bullet_hit")
-                    ship.trigger_hit_animation(350)  # Trigger hit animation (shorter than HUD flash duration)
-#                    print (f"PLAYER ID {ship.player_id}, your ship was just hit and you now have {ship.player_health} health left!") #print announcement in log
-                    
-                    # Apply knockback effects
-                    if is_nyancat_bullet:
-                        # NyancatBullet: knockback downward by ship height
-                        knockback_distance = ship.rect.height
-                        ship.rect.y += knockback_distance
-                        # Clamp to screen bounds
-                        if ship.rect.bottom > self.settings.play_height:
-                            ship.rect.bottom = self.settings.play_height
-                        ship.y = float(ship.rect.y)
-                    elif is_laserminion_bomb:
-                        # LaserminionBomb: sideways knockback (1/2 ship width)
-                        # Direction: if bomb hits LEFT of centerx, bump RIGHT; if RIGHT of centerx, bump LEFT
-                        if bullet.rect.centerx < ship.rect.centerx:
-                            direction = 1  # Bump right
-                        else:
-                            direction = -1  # Bump left
-                        bump_distance = ship.rect.width // 2
-                        ship.rect.x += direction * bump_distance
-                        # Clamp to screen bounds
-                        if ship.rect.left < 0:
-                            ship.rect.left = 0
-                        if ship.rect.right > self.settings.screen_width:
-                            ship.rect.right = self.settings.screen_width
-                        ship.x = float(ship.rect.x)
-                    
-                    #if that hit took your last health, you lose a life"
-                    if ship.player_health <= 0:
-                        ship.player_lives -= 1
-                        # Track lives lost
-                        if ship.player_id in self.player_stats:
-                            self.player_stats[ship.player_id]['lives_lost'] += 1
-                        self._trigger_hud_flash(ship, "lives")
-                        self.audio.play("player_life_lost")
-#                        print (f"Player {ship.player_id} has lost a life and now has {ship.player_lives} lives left!")
-                        
-                        ship.player_health = ship.current_max_health #reset player health.
-                        #if you've not lost your last life, respawn timer starts for you:
-                        if ship.player_lives >= 0:
-                             self._start_player_respawn_timer(ship) #takes care of the animation and timing of respawn
-                        #if you are out of lives, you die.
-                        elif ship.player_lives < 0:
-                            self._player_death(ship)
-                           # self.audio.play("player_dead") #commented this out for now, since we dont' ahve separate player death sounds. Using life lost for now.
-                            self.audio.play("player_life_lost")
-                            #TODO: get a way to do life_lost messages that vary based on player name.
-                # Kill bullet after processing all ships (NyancatBullet and LaserminionBomb disappear after impact)
-                if (is_nyancat_bullet or is_laserminion_bomb) and bullet.alive():
-                    bullet.kill()
-                elif bullet.alive():
-                    bullet.kill()  # Normal bullets also get killed        
+                  #If ship is respawning, skip it - respawning ships cannot be hit.
+                  if ship.player_state not in ("between_lives", "respawning"):
+                      self._bullet_hits_player(bullet, ship, rule)
+                bullet.kill()  # every kind of bullet disappears after impact
 
 
         #-----Tracking collisions between ALIEN SHIPS and PLAYER SHIPS
-        alien_collideswith_player = pygame.sprite.groupcollide(self.aliens, self.players, False, False)
+        # (cruisers/destroyers only with their compound hitbox)
+        alien_collideswith_player = self.collision_grid.groupcollide(self.aliens, self.players, False, False, collide_hitbox)
         if alien_collideswith_player:
              for collided_alien, collided_player in list(alien_collideswith_player.items()):  
-                  # For cruisers, check if collision is valid (not in wing top area)
-                  if collided_alien.level == 6:
-                      # Check collision using player rect
-                      if collided_player:
-                          player = collided_player[0]
-                          if not self._cruiser_collision_valid(collided_alien, player.rect):
-                              continue  # Skip this collision
-                      else:
-                          continue  # No player, skip
-                  # For destroyers, exclude front-half outer quarters
-                  if collided_alien.level == 5:
-                      if collided_player:
-                          player = collided_player[0]
-                          if not self._destroyer_collision_valid(collided_alien, player.rect):
-                              continue
-                      else:
-                          continue
                   self._player_alien_collision(collided_alien, collided_player)
 
     #helper:              
     def _player_alien_collision(self, collided_alien, collided_player):
-                """helper for _do_collisions() to resolve alien/player ship collisions"""
+                """helper for _do_collisions() to resolve alien/player ship collisions (what happens comes from the
+                "ram" rules in collision_rules.py: level 1-3 aliens just crash, level 4 crashes with a knockback and
+                300 points, big aliens bump the player aside and take 5 damage stages)"""
+                rule = self.collision_rules.get(("ram", collided_alien.level))
+                if rule is None:
+                    return
                 for player in collided_player:
-
                     #first check to see if they are respawning, and make collisions impossible:
-                  if player.player_state in ("respawning", "between_lives"):
-                         continue
-                  else:
-                    # Level 4 alien collision: 3 damage + knockback
-                    if collided_alien.level == 4:
-                        self.audio.play("alien_lvl4_collision")  # Level 4 collision sound
-                        # Stop level 4 hum sound if this alien was playing it
-                        if hasattr(collided_alien, 'hum_sound_channel') and collided_alien.hum_sound_channel:
-                            collided_alien.hum_sound_channel.stop()
-                            collided_alien.hum_sound_channel = None
-                        
-                        # Deal 3 damage
-                        damage = 3
-                        player.player_health -= damage
-                        # Track damage taken
-                        if player.player_id in self.player_stats:
-                            self.player_stats[player.player_id]['damage_taken'] += damage
-                        self._trigger_hud_flash(player, "hp")
-                        player.trigger_hit_animation(450)  # Trigger hit animation
-                        
-                        # Knockback: move player backwards by their own ship length
-                        ship_length = player.rect.height
-                        # Move backwards (down the screen, towards bottom)
-                        player.rect.y += ship_length
+                    if player.player_state in ("respawning", "between_lives"):
+                        continue
+                    player.player_health -= rule.player_damage
+                    self._trigger_hud_flash(player, "hp")
+                    player.trigger_hit_animation(450)  # Trigger hit animation (matches HUD flash duration)
+                    self.events.emit(SOUND, rule.sound)
+
+                    if rule.knockback == "down":
+                        # Level 4 crash: tracked as damage taken, and the player gets knocked backwards by their own ship length
+                        self.events.emit(STAT, player.player_id, 'damage_taken', rule.player_damage)
+                        player.rect.y += player.rect.height  # down the screen, towards the bottom
                         # Clamp to screen bounds
                         if player.rect.bottom > self.settings.play_height:
                             player.rect.bottom = self.settings.play_height
                         player.y = float(player.rect.y)
-                        
-                        # Level 4 alien dies on collision
-                        collided_alien.kill()
-                        # Track alien collision kill and enemy destroyed
-                        if player.player_id in self.player_stats:
-                            self.player_stats[player.player_id]['alien_collision_kills'] += 1
-                            self.player_stats[player.player_id]['enemies_destroyed'] += 1
-                        player.player_score += 300
-                        
-                        # Check if player died from this damage
-                        if player.player_health <= 0:
-                            player.player_lives -= 1
-                            # Track lives lost
-                            if player.player_id in self.player_stats:
-                                self.player_stats[player.player_id]['lives_lost'] += 1
-                            self._trigger_hud_flash(player, "lives")
-                            self.audio.play("player_life_lost")
-                            player.player_health = player.current_max_health  # Reset health
-                            if player.player_lives >= 0:
-                                self._start_player_respawn_timer(player)
-                            elif player.player_lives < 0:
-                                self._player_death(player)
-                        continue  # Skip to next player
-                    
-                    # Big alien collision handling (levels 5-7): damage + knockback, alien takes 5 damage
-                    if collided_alien.level in (5, 6, 7, 8):
-                        damage = 2 if collided_alien.level == 5 else 4
-                        player.player_health -= damage
-                        self._trigger_hud_flash(player, "hp")
-                        player.trigger_hit_animation(450)  # Trigger hit animation (matches HUD flash duration)
-                        self.audio.play("player_collide")
+                    elif rule.knockback == "bump":
+                        # Big aliens shove the player out to the side
                         bump_distance = (collided_alien.rect.width // 2) + (player.rect.width // 2) + 4
                         direction = -1 if player.rect.centerx < collided_alien.rect.centerx else 1
                         player.rect.x += direction * bump_distance
@@ -3538,117 +3305,111 @@ class AlienInvasion:
                         if player.rect.right > self.settings.screen_width:
                             player.rect.right = self.settings.screen_width
                         player.x = float(player.rect.x)
-                        
-                        # Apply 5 damage to the alien
-                        collided_alien.damage_stage += 5
-                        # Check if alien is destroyed
-                        if collided_alien.level == 5:
-                            frames = self.settings.destroyer_hitframes
-                        elif collided_alien.level == 6:
-                            frames = self.settings.cruiser_hitframes
-                        elif collided_alien.level == 7:
-                            frames = self.settings.laztanker_hitframes
-                        else:
-                            frames = None
-                        
-                        if frames and collided_alien.damage_stage > len(frames):
-                            # Alien is destroyed
-                            # Play death sound based on alien level
-                            if collided_alien.level == 5:
-                                self.audio.play("alien_destroyer_death")  # Destroyer death
-                            elif collided_alien.level == 6:
-                                self.audio.play("alien_cruiser_death")  # Cruiser death
-                            elif collided_alien.level == 7:
-                                self.audio.play("alien_laztanker_death")  # Lasertanker death
-                            # Stop hum sound if this alien was playing it
-                            if hasattr(collided_alien, 'hum_sound_channel') and collided_alien.hum_sound_channel:
-                                collided_alien.hum_sound_channel.stop()
-                                collided_alien.hum_sound_channel = None
-                            # Stop lasertanker firing sound
-                            if collided_alien in self.audio.lasertanker_firing_sound_channels:
-                                channel = self.audio.lasertanker_firing_sound_channels[collided_alien]
-                                if channel:
-                                    channel.stop()
-                                del self.audio.lasertanker_firing_sound_channels[collided_alien]
-                            # Create lasertanker death animation if it's a lasertanker
-                            if collided_alien.level == 7:
-                                death_anim = LazertankerDeathAnimation(
-                                    self.settings, 
-                                    self.screen, 
-                                    collided_alien.rect.center, 
-                                    collided_alien.rect.size
-                                )
-                                self.lazertanker_death_animations.add(death_anim)
-                            # Create cruiser death animation if it's a cruiser
-                            elif collided_alien.level == 6:
-                                death_anim = CruiserDeathAnimation(
-                                    self.settings,
-                                    self.screen,
-                                    collided_alien.rect.center,
-                                    collided_alien.rect.size
-                                )
-                                self.cruiser_death_animations.add(death_anim)
-                            # Create destroyer death animation if it's a destroyer
-                            elif collided_alien.level == 5:
-                                death_anim = DestroyerDeathAnimation(
-                                    self.settings,
-                                    self.screen,
-                                    collided_alien.rect.center,
-                                    collided_alien.rect.size
-                                )
-                                self.destroyer_death_animations.add(death_anim)
-                            collided_alien.kill()
-                            self._maybe_spawn_powerup_from_alien(collided_alien)
-                        elif frames and collided_alien.damage_stage > 0:
-                            # Update alien image to show damage
-                            frame_index = min(collided_alien.damage_stage - 1, len(frames) - 1)
-                            collided_alien.image = frames[frame_index]
-                            collided_alien.rect = collided_alien.image.get_rect(center=collided_alien.rect.center)
-                    else:
-                        player.player_health -= 1
-                        self._trigger_hud_flash(player, "hp")
-                        player.trigger_hit_animation(450)  # Trigger hit animation (matches HUD flash duration)
-#                        print (f"Player {player.player_id} and a level {collided_alien.level} alien collided! Player {player.player_id}'s health is now {player.player_health}")
-                        #self.audio.play("medium_explosion") 
-                        self.audio.play("bullet_hit")
-                        if collided_alien.level == 4:
-                            player.player_health -= 3
-                            player.player_score += 300
-                            # Track alien collision kill
-                            if player.player_id in self.player_stats:
-                                self.player_stats[player.player_id]['alien_collision_kills'] += 1
-                                self.player_stats[player.player_id]['enemies_destroyed'] += 1
-                            # Note: hit animation already triggered above, no need to trigger again
-#                            print (f"Player {player.player_id} used their ship as a shield, reducing them to {player.player_health} health. Their score is now {player.player_score}")
-
-                                
-
-              #handle any life losses or dead players..
-                    if player.player_health <= 0: #begin by checking player health
-                        player.player_lives -= 1 #drop a life if health is below zero.
-                        # Track lives lost
-                        if player.player_id in self.player_stats:
-                            self.player_stats[player.player_id]['lives_lost'] += 1
-                        self._trigger_hud_flash(player, "lives")
-                        self.audio.play("player_life_lost")
-#                        print (f"Player {player.player_id} has lost a life and now has {player.player_lives} lives left!")
-                        player.player_health = player.current_max_health #reset player health.
-
-                        #if the player still has lives left after colliding with an alien ship, start a respawn cycle
-                        if player.player_lives >= 0:
-                            self._start_player_respawn_timer(player)
-                        #if they have no lives left, they die:
-                        else:
-                            self._player_death(player)   
-                
-                #level 1-4 aliens are destroyed by impact; bigger ones are not.
-                    if collided_alien.level <= 4:
-                          #TODO: add loud explosion kill sound here
-                          collided_alien.kill()
-                      
+
+                    # The alien's side of it: level 1-4 aliens are destroyed by impact (level 4 crashes earn points),
+                    # bigger ones take damage stages
+                    if self._resolve_alien_hit(collided_alien, rule, player) and rule.points is not None:
+                        self.events.emit(STAT, player.player_id, 'alien_collision_kills', 1)
+
+                    #handle any life losses or dead players..
+                    self._check_player_life(player)
+
+    def _bullet_hits_player(self, bullet, ship, rule):
+        """helper for _do_collisions() and _do_bonus_wave_collisions(): an alien/kitty bullet hits a player ship
+        (damage and knockback from the bullet kind's rule in collision_rules.py)"""
+        damage = rule.player_damage
+        ship.player_health -= damage
+        # Track damage taken
+        self.events.emit(STAT, ship.player_id, 'damage_taken', damage)
+        self._trigger_hud_flash(ship, "hp")
+        self.events.emit(SOUND, "bullet_hit")
+        ship.trigger_hit_animation(350)  # Trigger hit animation (shorter than HUD flash duration)
+
+        # Apply knockback effects
+        if rule.knockback == "down":
+            # NyancatBullet: knockback downward by ship height
+            ship.rect.y += ship.rect.height
+            # Clamp to screen bounds
+            if ship.rect.bottom > self.settings.play_height:
+                ship.rect.bottom = self.settings.play_height
+            ship.y = float(ship.rect.y)
+        elif rule.knockback == "side":
+            # LaserminionBomb: sideways knockback (1/2 ship width)
+            # Direction: if bomb hits LEFT of centerx, bump RIGHT; if RIGHT of centerx, bump LEFT
+            direction = 1 if bullet.rect.centerx < ship.rect.centerx else -1
+            ship.rect.x += direction * (ship.rect.width // 2)
+            # Clamp to screen bounds
+            if ship.rect.left < 0:
+                ship.rect.left = 0
+            if ship.rect.right > self.settings.screen_width:
+                ship.rect.right = self.settings.screen_width
+            ship.x = float(ship.rect.x)
+
+        #if that hit took your last health, you lose a life
+        self._check_player_life(ship)
+
+    def _check_player_life(self, player):
+        """helper for the collision passes: if a hit took the player's last health, they lose a life (and respawn, or die
+        if that was their last one)"""
+        if player.player_health <= 0:
+            player.player_lives -= 1
+            # Track lives lost
+            self.events.emit(STAT, player.player_id, 'lives_lost', 1)
+            self._trigger_hud_flash(player, "lives")
+            self.events.emit(SOUND, "player_life_lost")
+            player.player_health = player.current_max_health #reset player health.
+            #if the player still has lives left, start a respawn cycle
+            if player.player_lives >= 0:
+                self._start_player_respawn_timer(player)
+            #if they have no lives left, they die:
+            else:
+                self._player_death(player)
+
+    def _credit_kill(self, owner, points):
+        """helper for _resolve_alien_hit(): score (and the enemies_destroyed stat) for whoever killed an alien.
+        Lifepods and squadrons don't earn score."""
+        if owner is not None and hasattr(owner, 'player_score'):
+            self.events.emit(STAT, owner.player_id, 'enemies_destroyed', 1)
+            self.events.emit(SCORE, owner, points)
+
+    def _stop_alien_sounds(self, alien, stop_laser_fire=False):
+        """Stop a dying alien's hum (levels 4-7) and, for lasertankers, its firing sound."""
+        channel = getattr(alien, 'hum_sound_channel', None)
+        if channel:
+            channel.stop()
+            alien.hum_sound_channel = None
+        if stop_laser_fire:
+            channel = self.audio.lasertanker_firing_sound_channels.pop(alien, None)
+            if channel:
+                channel.stop()
+
+    def _resolve_alien_hit(self, alien, rule, credit_to=None):
+        """One hit on an alien, as described by its collision rule (collision_rules.py): damage stages and damage frame,
+        and if that kills it: death sound, hum/laser sounds off, death animation, kill, powerup drop, score for
+        credit_to. Used by every collision pass, so a kill plays out the same whatever caused it. Returns True on a kill."""
+        if not rule.instakill:
+            alien.damage_stage += rule.damage
+            frames = rule.frames
+            if frames and alien.damage_stage <= len(frames):
+                # Still alive - show the damage frame for this stage
+                alien.image = frames[alien.damage_stage - 1]
+                alien.rect = alien.image.get_rect(center=alien.rect.center)
+                return False
+        if rule.death_sound:
+            self.events.emit(SOUND, rule.death_sound)
+        self._stop_alien_sounds(alien, rule.stop_laser_fire)
+        if rule.death_animation:
+            self.events.emit(DEATH_ANIMATION, alien.level, alien.rect.center, alien.rect.size)
+        alien.kill()
+        if rule.powerup_drop:
+            self.events.emit(POWERUP_DROP, alien)
+        if rule.points is not None:
+            self._credit_kill(credit_to, rule.points)
+        return True
+
     def _trigger_hud_flash(self, ship, kind: str) -> None:
         """Start a short HUD flash for hp or lives."""
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if kind == "hp":
             ship.hp_flash_until_ms = now + 450
         elif kind == "lives":
@@ -3658,6 +3419,7 @@ class AlienInvasion:
                         """Helper function for _do_collisions() and _player_alien_collisions() to execute player death tasks."""
                         player.player_state = "dead"
                         print(f"Player {player.player_id} has been killed!!!")
+                        self.events.process()  # hand out this tick's points/stats now, so the snapshot below includes them
                         #self.audio.play("player_dead") TODO: elifs to say which sound to pick depending on player Name (could add name field for Eli, Audrey, Jakey, Etc.)
                         self.audio.play("player_life_lost") # for now, just use life lost for player death. TODO: differentiate. 
                         # Snapshot this player's score/powerups before removing them from the sprite group.
@@ -3685,7 +3447,7 @@ class AlienInvasion:
     
     def _start_player_respawn_timer(self, player):
         """Helper method for _do_collisions(); Begin a respawn cycle for the player's ship. This will shunt them to the bottom of the screen, make their sprite transparent and unhittable, and keep them from firing"""
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
 
         player.player_state = "between_lives"
         player.respawn_end_time = now + self.settings.player_respawn_time_ms
@@ -3709,7 +3471,7 @@ class AlienInvasion:
         growing_pause = (self.current_wave_num + 1) * 1000
         pause_ms = max(base_pause, growing_pause) #call up the predetermined pause length from base_settings, compare to current wave number and pick larger. -->
                                                                 #-->This gives longer breaks at higher levels;  min break is 5 seconds.)
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         self.next_wave_start_time = None # handled by phase machine now
 
         self.current_wave_num += 1 # CRUCIAL: HERE WE INCREMENT THE WAVE NUMBER UP by ONE!
@@ -3735,11 +3497,11 @@ class AlienInvasion:
           """State machine to manage between-wave banners and progression."""
           if self.between_wave_phase is None:
                return
-          now = pygame.time.get_ticks()
+          now = game_clock.get_ticks()
 
           if self.between_wave_phase == "complete_banner":
                if self.wave_banner_active:
-                    self.wave_banner_x += self.wave_banner_speed
+                    self.wave_banner_x += self.wave_banner_speed * game_clock.frame_scale
                     if self.wave_banner_x > self.settings.screen_width:
                          self.wave_banner_active = False
                          self.between_wave_phase = "warp_banner"
@@ -4049,15 +3811,88 @@ class AlienInvasion:
         guaranteed = kind in (7,8)
 
         if not guaranteed:
-            if random.random() > self.settings.powerup_drop_chance:
+            if rng.random() > self.settings.powerup_drop_chance:
                     return
 
         ptype = choose_powerup_type(self.settings, is_bonus_wave=self.is_bonus_wave)
         if not ptype:
             return
 
-        pu = PowerUpPickup(self.settings, self.screen, ptype, alien.rect.centerx, alien.rect.centery)
+        pu = PowerUpPickup.acquire(self.settings, self.screen, ptype, alien.rect.centerx, alien.rect.centery)
         self.powerups.add(pu)
+
+    def _maybe_spawn_powerup_from_bonus_enemy(self, enemy):
+        """bonus wave - drop powerups on enemy death, using the bonus wave drop chance"""
+        # Nyancat always drops 3 powerups (left/center/right). Other enemies use normal chance.
+        enemy_type = enemy.enemy_type
+        should_drop = (enemy_type == "nyancat") or (rng.random() <= self.settings.bonus_wave_powerup_drop_chance)
+        if should_drop:
+            if enemy_type == "nyancat":
+                # Nyancat drops 3 powerups: left edge, center, right edge
+                ptype1 = choose_powerup_type(self.settings, is_bonus_wave=True)
+                ptype2 = choose_powerup_type(self.settings, is_bonus_wave=True)
+                ptype3 = choose_powerup_type(self.settings, is_bonus_wave=True)
+
+                powerup1 = PowerUpPickup.acquire(self.settings, self.screen, ptype1, enemy.rect.left, enemy.rect.centery)
+                powerup2 = PowerUpPickup.acquire(self.settings, self.screen, ptype2, enemy.rect.centerx, enemy.rect.centery)
+                powerup3 = PowerUpPickup.acquire(self.settings, self.screen, ptype3, enemy.rect.right, enemy.rect.centery)
+
+                self.powerups.add(powerup1, powerup2, powerup3)
+            else:
+                ptype = choose_powerup_type(self.settings, is_bonus_wave=True)  # bonus wave - choose dad or mom (50/50)
+                powerup = PowerUpPickup.acquire(self.settings, self.screen, ptype, enemy.rect.centerx, enemy.rect.centery)
+                self.powerups.add(powerup)
+
+#------GAME EVENT HANDLERS (game_events.py) - each one gets the whole tick's worth of one event type at once:
+    def _apply_stat_events(self, events):
+        """(player_id, stat, amount) -> player_stats, summed up first so each counter is touched once per tick"""
+        totals = {}
+        for player_id, stat, amount in events:
+            key = (player_id, stat)
+            totals[key] = totals.get(key, 0) + amount
+        for (player_id, stat), amount in totals.items():
+            stats = self.player_stats.get(player_id)
+            if stats is not None:  # lifepods/squadrons without a stats entry don't count
+                stats[stat] += amount
+
+    def _apply_score_events(self, events):
+        """(ship, points) -> ship.player_score"""
+        totals = {}
+        for ship, points in events:
+            totals[ship] = totals.get(ship, 0) + points
+        for ship, points in totals.items():
+            if hasattr(ship, 'player_score'):  # lifepods don't earn score
+                ship.player_score += points
+
+    def _apply_powerup_drop_events(self, events):
+        """(dead enemy,) -> powerup drop rolls, one by one in the order the enemies died (keeps the RNG sequence fixed)"""
+        for (enemy,) in events:
+            if hasattr(enemy, 'enemy_type'):
+                self._maybe_spawn_powerup_from_bonus_enemy(enemy)
+            else:
+                self._maybe_spawn_powerup_from_alien(enemy)
+
+    def _apply_death_animation_events(self, events):
+        """(alien level, center, size) -> lazertanker / cruiser / destroyer death animations"""
+        for level, center, size in events:
+            if level == 7:
+                self.lazertanker_death_animations.add(LazertankerDeathAnimation(self.settings, self.screen, center, size))
+            elif level == 6:
+                self.cruiser_death_animations.add(CruiserDeathAnimation(self.settings, self.screen, center, size))
+            elif level == 5:
+                self.destroyer_death_animations.add(DestroyerDeathAnimation(self.settings, self.screen, center, size))
+
+    def _apply_sound_events(self, events):
+        """(sound key,) -> audio.play. The same sound twelve times on one tick is just louder noise, so by default each plays once."""
+        if getattr(self.settings, "event_bus_merge_sounds", True):
+            played = set()
+            for (key,) in events:
+                if key not in played:
+                    played.add(key)
+                    self.audio.play(key)
+        else:
+            for (key,) in events:
+                self.audio.play(key)
     
 
 
@@ -4105,7 +3940,9 @@ class AlienInvasion:
             elif self.current_wave_num in range (9,11):
                 bg_ref = self.bg_9to10
         
+        self.profiler.start("draw_background")
         self._blit_background_with_fade(bg_ref)  # redraw the background (with optional crossfade)
+        self.profiler.stop("draw_background")
         
         
  
@@ -4122,6 +3959,7 @@ class AlienInvasion:
             lifepod.draw()
 
         #redraw aliens - first create reference lists, so that we can blit them in the right layers.
+        self.profiler.start("draw_aliens")
         laztankers = [alien for alien in self.aliens if alien.level == 7] #create list of lazertankers to be drawn, 
         # gunships = [alien for alien in self.aliens if alien.level == 8] #spawn gunships next, so they spawn above Laser tankers, but below other sprites. 
         fleet = [alien for alien in self.aliens if alien.level == 1]
@@ -4158,15 +3996,17 @@ class AlienInvasion:
                 minion.draw()
         for alien in comet_kazes: # level 4 aliens should always be on top of stack, so they are always visible. 
             alien.draw()
+        self.profiler.stop("draw_aliens")
 
 
 
         #redraw player and then alien bullets
-        for bullet in self.player_bullets:
-            bullet.draw()
-        for bullet in self.alien_bullets:
-            bullet.draw()
+        self.profiler.start("draw_bullets")
+        self.player_bullets.draw_all()
+        self.alien_bullets.draw_all()
+        self.profiler.stop("draw_bullets")
         
+        self.profiler.start("draw_effects")
         # powerup pickups (draw explicitly to ensure visibility)
         for powerup in self.powerups.sprites():
             self.screen.blit(powerup.image, powerup.rect)
@@ -4201,12 +4041,14 @@ class AlienInvasion:
                 firework.draw()
         # Draw normal-mode victory fireworks (cosmetic sparks) on top
         if (not self.is_bonus_wave) and self.game_state == "victory" and getattr(self, "victory_fireworks_active", False):
-            for spark in self.victory_fireworks.sprites():
-                spark.draw()
+            self.victory_fireworks.draw_all()
+        self.profiler.stop("draw_effects")
 
         #draw the Heads Up Display last, so it is on top of anything else
 
+        self.profiler.start("draw_hud")
         self._draw_hud() #note that _draw_hud_strip() is called as part of this function
+        self.profiler.stop("draw_hud")
 
         # Draw countdown timer (on top of everything except pause)
         if self.game_state == "countdown":
@@ -4231,12 +4073,15 @@ class AlienInvasion:
                 warp_text = f"Wave {upcoming_wave_display} Warping In!"
                 warp_surf = self.warping_font.render(warp_text, True, self.settings.hud_text_color)
                 warp_rect = warp_surf.get_rect(center=(self.settings.screen_width // 2, int(self.settings.screen_height * 0.12)))
-                blink_on = ((pygame.time.get_ticks() // self.warp_blink_period_ms) % 2) == 0
+                blink_on = ((game_clock.get_ticks() // self.warp_blink_period_ms) % 2) == 0
                 if blink_on:
                     pygame.draw.rect(self.screen, (255, 0, 0), warp_rect.inflate(20, 10))
                 self.screen.blit(warp_surf, warp_rect)
 
-        pygame.display.flip() #flip the display!!!
+        self.profiler.draw_overlay(self.screen)  # debug overlay, on top of everything (only when toggled on)
+
+        if self.present_frames: # headless runs draw to the off-screen surface only
+            pygame.display.flip() #flip the display!!!
     
     def _update_hud_font_size(self):
         """Update HUD font size based on current resolution - scales proportionally to screen size"""
@@ -4323,7 +4168,7 @@ class AlienInvasion:
         Uses ship.powerups keys: 'nanites', 'squadron', 'shockwave' (in that order)
         Uses ship.powerup_flash_until_ms[ptype] timers for flashing numbers.
         """
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         
         # Get player keys
         keys_dict = getattr(self.settings, f"player{player_id}_keys")
@@ -4469,7 +4314,7 @@ class AlienInvasion:
             wave_surf = self.wave_hud_font.render(current_wave_text, True, self.settings.hud_text_color)
             wave_rect = wave_surf.get_rect(center=(self.settings.screen_width // 2, 15))
             self.screen.blit(wave_surf, wave_rect)
-            now = pygame.time.get_ticks()
+            now = game_clock.get_ticks()
                 # Player info at bottom
             # Spread across the bottom of the screen
             if self.players:
@@ -4583,31 +4428,32 @@ class AlienInvasion:
     # ---------- Bonus Wave Methods ---------- #bonus wave - custom secret wave implementation
     def _start_bonus_wave(self):
         """Initialize bonus wave mode"""
+        self._interp_prev = {}  # new field - nothing to blend from until the next step
         # Don't set game_state here - countdown will handle transition to playing
-        self.bonus_wave_start_time = pygame.time.get_ticks()
+        self.bonus_wave_start_time = game_clock.get_ticks()
         self.bonus_wave_defense_strength = self.settings.bonus_wave_defense_strength
         self.bonus_wave_enemies.empty()
         self.bonus_wave_fireworks.empty()
         
         # Spawn timing variables (offset by countdown duration so they start after countdown)
         countdown_offset = self.countdown_duration_ms
-        self.bonus_loaf_next_spawn = pygame.time.get_ticks() + self.settings.loafkitty_spawn_delay + countdown_offset
-        self.bonus_centurion_next_spawn = pygame.time.get_ticks() + self.settings.centurionkitty_spawn_delay + countdown_offset
-        self.bonus_ninja_next_spawn = pygame.time.get_ticks() + self.settings.ninjakitty_spawn_delay + countdown_offset
-        self.bonus_emperor_next_spawn = pygame.time.get_ticks() + self.settings.emperorkitty_spawn_delay + countdown_offset
-        self.bonus_bluewhale_next_spawn = pygame.time.get_ticks() + self.settings.bluewhalekitty_spawn_delay + countdown_offset
-        self.bonus_nyancat_next_spawn = pygame.time.get_ticks() + self.settings.nyancat_spawn_delay + countdown_offset
+        self.bonus_loaf_next_spawn = game_clock.get_ticks() + self.settings.loafkitty_spawn_delay + countdown_offset
+        self.bonus_centurion_next_spawn = game_clock.get_ticks() + self.settings.centurionkitty_spawn_delay + countdown_offset
+        self.bonus_ninja_next_spawn = game_clock.get_ticks() + self.settings.ninjakitty_spawn_delay + countdown_offset
+        self.bonus_emperor_next_spawn = game_clock.get_ticks() + self.settings.emperorkitty_spawn_delay + countdown_offset
+        self.bonus_bluewhale_next_spawn = game_clock.get_ticks() + self.settings.bluewhalekitty_spawn_delay + countdown_offset
+        self.bonus_nyancat_next_spawn = game_clock.get_ticks() + self.settings.nyancat_spawn_delay + countdown_offset
     
     def _update_bonus_wave(self):
         """Update bonus wave enemies, spawning, and collisions"""
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         elapsed_ms = now - self.bonus_wave_start_time
         
         # Track time in top 33% of screen for each player (Power Forward award)
         # Note: stored under historical key name 'time_in_top_30_percent' for credits compatibility.
         if self.game_state == "playing":
             top_33_percent_y = self.settings.play_height * 0.33
-            frame_time_ms = self.clock.get_time()  # Get time since last frame in milliseconds
+            frame_time_ms = self.frame_time_ms  # Get time since last frame in milliseconds
             for player in self.players.sprites():
                 if player.player_state == "alive" and player.player_id in self.player_stats:
                     if player.rect.top <= top_33_percent_y:
@@ -4665,6 +4511,7 @@ class AlienInvasion:
             spawn_scale *= player_spawn_scale
         
         # Update players
+        self.profiler.start("sprite_updates")
         self.players.update()
         self.squadrons.update()
         self.nanites.update()
@@ -4742,25 +4589,29 @@ class AlienInvasion:
         self.player_bullets.update()
         self.alien_bullets.update()
         self.bonus_wave_fireworks.update()
+        self.profiler.stop("sprite_updates")
 
         # Spawn enemies
+        self.profiler.start("spawning")
         self._spawn_bonus_wave_enemies(now, elapsed_ms, spawn_scale)
+        self.profiler.stop("spawning")
         
-        # Update enemies
+        # Update enemies (movement and firing share this loop, so the profiler counts both under alien_firing)
+        self.profiler.start("alien_firing")
         for enemy in self.bonus_wave_enemies:
             enemy.update(elapsed_ms, speed_scale, self.players)
             
             # Assign target player for tracking enemies
             if enemy.enemy_type in ("emperor", "bluewhale") and enemy.target_player is None:
                 if len(self.players) > 0:
-                    enemy.set_target_player(random.choice(list(self.players)))
+                    enemy.set_target_player(rng.choice(list(self.players)))
             
             # Enemy firing
             # Pass alien_bullets group to ready_to_fire for different peculiar bullet specs, incl bullet caps and special class bullets for bonus wave, minions, etc.
             if enemy.ready_to_fire(now, self.alien_bullets):
                 if isinstance(enemy, Laserminion):
                     # Laserminion fires accelerating bomb from bottom center
-                    bomb = LaserminionBomb(self.settings, self.screen,
+                    bomb = LaserminionBomb.acquire(self.settings, self.screen,
                                          enemy.rect.centerx, enemy.rect.bottom)
                     self.alien_bullets.add(bomb)
                 elif enemy.enemy_type == "bluewhale":
@@ -4768,7 +4619,7 @@ class AlienInvasion:
                     self._fire_bluewhale_laser(enemy)
                 elif enemy.enemy_type == "emperor":
                     # Emperorkitty bullets - bright purple, fires every ~0.5s until cap of 3
-                    bullet = Bullet(
+                    bullet = Bullet.acquire(
                         self.settings, self.screen,
                         enemy.rect.centerx, enemy.rect.bottom,
                         direction=1,
@@ -4779,7 +4630,7 @@ class AlienInvasion:
                     self.alien_bullets.add(bullet)
                 elif enemy.enemy_type == "loaf":
                     # Loafkitty bullet - custom 15x2 size
-                    bullet = Bullet(
+                    bullet = Bullet.acquire(
                         self.settings, self.screen,
                         enemy.rect.centerx, enemy.rect.bottom,
                         direction=1,
@@ -4798,7 +4649,7 @@ class AlienInvasion:
                     fire_y = enemy.rect.bottom - int(enemy.rect.height * 0.30)
 
                     # Create special rainbow bullet
-                    bullet = NyancatBullet(
+                    bullet = NyancatBullet.acquire(
                         self.settings, self.screen,
                         fire_x, fire_y,
                         direction=1,
@@ -4807,7 +4658,7 @@ class AlienInvasion:
                     self.alien_bullets.add(bullet)
                 elif enemy.enemy_type == "centurion":
                     # Regular bullet (centurion)
-                    bullet = Bullet(
+                    bullet = Bullet.acquire(
                         self.settings, self.screen,
                         enemy.rect.centerx, enemy.rect.bottom,
                         direction=1,
@@ -4816,22 +4667,19 @@ class AlienInvasion:
                         owner_ref=None
                     )
                     self.alien_bullets.add(bullet)
+        self.profiler.stop("alien_firing")
         
         # Handle collisions
-        self._do_bonus_wave_collisions()
+        self.profiler.start("collisions")
+        with self.swept(*self._swept_groups()):  # swept rects, if they're on
+            self._do_bonus_wave_collisions()
+        self.profiler.stop("collisions")
 
         # Lifepod firing (max 2 bullets at a time) - bonus wave support
-        # Count all lifepod bullets once per frame (more efficient than counting per lifepod)
-        lifepod_bullet_counts = {}
-        for bullet in self.player_bullets:
-            if hasattr(bullet, 'owner_ref') and bullet.owner_ref in self.lifepods:
-                lifepod = bullet.owner_ref
-                lifepod_bullet_counts[lifepod] = lifepod_bullet_counts.get(lifepod, 0) + 1
-        
         for lifepod in self.lifepods:
             if lifepod.firing and lifepod.state == "normal":
-                # Get bullet count from pre-calculated dictionary
-                lifepod_bullet_count = lifepod_bullet_counts.get(lifepod, 0)
+                # Bullets in flight, counted live by the group (BulletGroup, bullet.py)
+                lifepod_bullet_count = self.player_bullets.count_owned(lifepod)
                 if lifepod_bullet_count < 2:  # Max 2 bullets
                     # Check firing rate timing
                     if now >= getattr(lifepod, "next_fire_time", 0):
@@ -4839,6 +4687,7 @@ class AlienInvasion:
                         lifepod.next_fire_time = now + self.settings.player_fire_speed
 
         # Update powerups
+        self.profiler.start("powerup_pickup")
         self.powerups.update()
         # Determine inventory cap based on difficulty (Hard mode: 6, others: 3)
         is_hard = getattr(self.settings, "difficulty_mode", "easy").lower() == "hard"
@@ -4858,6 +4707,7 @@ class AlienInvasion:
                         powerup_grabbed = True  # Mark that a powerup was grabbed
         if powerup_grabbed:
             self.audio.play("powerup_grab")  # Play sound once per frame, even if multiple powerups grabbed
+        self.profiler.stop("powerup_pickup")
 
 
     def _spawn_bonus_wave_enemies(self, now, elapsed_ms, spawn_scale):
@@ -4865,65 +4715,65 @@ class AlienInvasion:
         # Loafkitty (level 2 spawn rate)
         if elapsed_ms >= self.settings.loafkitty_spawn_delay:
             if now >= self.bonus_loaf_next_spawn:
-                interval = random.randint(
+                interval = rng.randint(
                     int(self.settings.loafkitty_min_spawn_interval / spawn_scale),
                     int(self.settings.loafkitty_max_spawn_interval / spawn_scale)
                 )
                 self.bonus_loaf_next_spawn = now + interval
                 enemy = BonusWaveEnemy(self.settings, self.screen, "loaf")
-                enemy.spawn_pos(random.randint(0, self.settings.screen_width - enemy.rect.width), -enemy.rect.height)
+                enemy.spawn_pos(rng.randint(0, self.settings.screen_width - enemy.rect.width), -enemy.rect.height)
                 self.bonus_wave_enemies.add(enemy)
         
         # Centurionkitty (level 3 spawn rate)
         if elapsed_ms >= self.settings.centurionkitty_spawn_delay:
             if now >= self.bonus_centurion_next_spawn:
-                interval = random.randint(
+                interval = rng.randint(
                     int(self.settings.centurionkitty_min_spawn_interval / spawn_scale),
                     int(self.settings.centurionkitty_max_spawn_interval / spawn_scale)
                 )
                 self.bonus_centurion_next_spawn = now + interval
                 enemy = BonusWaveEnemy(self.settings, self.screen, "centurion")
-                enemy.spawn_pos(random.randint(0, self.settings.screen_width - enemy.rect.width), -enemy.rect.height)
+                enemy.spawn_pos(rng.randint(0, self.settings.screen_width - enemy.rect.width), -enemy.rect.height)
                 self.bonus_wave_enemies.add(enemy)
         
         # Emperorkitty (cruiser spawn rate, after 2 minutes)
         if elapsed_ms >= self.settings.emperorkitty_spawn_delay:
             if now >= self.bonus_emperor_next_spawn:
-                interval = random.randint(
+                interval = rng.randint(
                     int(self.settings.emperorkitty_min_spawn_interval / spawn_scale),
                     int(self.settings.emperorkitty_max_spawn_interval / spawn_scale)
                 )
                 self.bonus_emperor_next_spawn = now + interval
                 enemy = BonusWaveEnemy(self.settings, self.screen, "emperor")
-                enemy.spawn_pos(random.randint(0, self.settings.screen_width - enemy.rect.width), -enemy.rect.height)
+                enemy.spawn_pos(rng.randint(0, self.settings.screen_width - enemy.rect.width), -enemy.rect.height)
                 if len(self.players) > 0:
-                    enemy.set_target_player(random.choice(list(self.players)))
+                    enemy.set_target_player(rng.choice(list(self.players)))
                 self.bonus_wave_enemies.add(enemy)
         
         # Ninjakitty (spawns after 7 seconds, more frequently than centurion)
         if elapsed_ms >= self.settings.ninjakitty_spawn_delay:
             if now >= self.bonus_ninja_next_spawn:
-                interval = random.randint(
+                interval = rng.randint(
                     int(self.settings.ninjakitty_min_spawn_interval / spawn_scale),
                     int(self.settings.ninjakitty_max_spawn_interval / spawn_scale)
                 )
                 self.bonus_ninja_next_spawn = now + interval
                 enemy = BonusWaveEnemy(self.settings, self.screen, "ninja")
-                enemy.spawn_pos(random.randint(0, self.settings.screen_width - enemy.rect.width), -enemy.rect.height)
+                enemy.spawn_pos(rng.randint(0, self.settings.screen_width - enemy.rect.width), -enemy.rect.height)
                 self.bonus_wave_enemies.add(enemy)
         
         # Bluewhalekitty (0.5x lazertanker spawn rate, after 4 minutes)
         if elapsed_ms >= self.settings.bluewhalekitty_spawn_delay:
             if now >= self.bonus_bluewhale_next_spawn:
-                interval = random.randint(
+                interval = rng.randint(
                     int(self.settings.bluewhalekitty_min_spawn_interval / spawn_scale),
                     int(self.settings.bluewhalekitty_max_spawn_interval / spawn_scale)
                 )
                 self.bonus_bluewhale_next_spawn = now + interval
                 enemy = BonusWaveEnemy(self.settings, self.screen, "bluewhale")
-                enemy.spawn_pos(random.randint(0, self.settings.screen_width - enemy.rect.width), -enemy.rect.height)
+                enemy.spawn_pos(rng.randint(0, self.settings.screen_width - enemy.rect.width), -enemy.rect.height)
                 if len(self.players) > 0:
-                    enemy.set_target_player(random.choice(list(self.players)))
+                    enemy.set_target_player(rng.choice(list(self.players)))
                 self.bonus_wave_enemies.add(enemy)
     
         # Nyancat (spawns on a schedule using bonus_nyancat_next_spawn)
@@ -4937,24 +4787,21 @@ class AlienInvasion:
 
             # Spawn nyancat
             if now >= self.bonus_nyancat_next_spawn:
-                interval = random.randint(
+                interval = rng.randint(
                     int(self.settings.nyancat_min_spawn_interval / spawn_scale),
                     int(self.settings.nyancat_max_spawn_interval / spawn_scale)
                 )
                 self.bonus_nyancat_next_spawn = now + interval
                 enemy = BonusWaveEnemy(self.settings, self.screen, "nyancat")
                 # Start off-screen to the left
-                enemy.spawn_pos(-enemy.rect.width, random.randint(50, 200))
+                enemy.spawn_pos(-enemy.rect.width, rng.randint(50, 200))
                 self.bonus_wave_enemies.add(enemy)
 
     def _fire_bluewhale_laser(self, enemy):
         """Fire continuous blue laser beams from bluewhalekitty - two streams at specific sprite positions"""
         # Check bullet cap (28 bullets max per bluewhale)
-        bullet_count = []
-        for b in self.alien_bullets:
-            if hasattr(b, 'owner_ref') and b.owner_ref == enemy:
-                bullet_count.append(b)
-        if len(bullet_count) >= 28:  # Cap of 28 (fixed value, not lazertanker_bullet_max)
+        bullet_count = self.alien_bullets.count_owned(enemy)
+        if bullet_count >= 28:  # Cap of 28 (fixed value, not lazertanker_bullet_max)
             return  # Don't fire if at cap
         
         # Calculate firing positions based on sprite dimensions
@@ -4967,7 +4814,7 @@ class AlienInvasion:
         fire_y2 = enemy.rect.top + (enemy.rect.height * 0.86)
         
         # Fire from position 1
-        bullet1 = Bullet(
+        bullet1 = Bullet.acquire(
             self.settings, self.screen,
             fire_x1, fire_y1,
             direction=1,
@@ -4978,8 +4825,8 @@ class AlienInvasion:
         self.alien_bullets.add(bullet1)
         
         # Fire from position 2 (only if we haven't hit the cap yet)
-        if len(bullet_count) + 1 < 28:  # Check if we can add another bullet
-            bullet2 = Bullet(
+        if bullet_count + 1 < 28:  # Check if we can add another bullet
+            bullet2 = Bullet.acquire(
                 self.settings, self.screen,
                 fire_x2, fire_y2,
                 direction=1,
@@ -4988,46 +4835,81 @@ class AlienInvasion:
                 owner_ref=enemy  # Set owner_ref so we can count bullets per enemy
             )
             self.alien_bullets.add(bullet2)
-    
+
+    def _resolve_kitty_hit(self, enemy, rule, credit_to=None):
+        """bonus wave - one hit on a kitty, as described by its collision rule (collision_rules.py): damage, fireworks,
+        and if that kills it: kill (nyancat music off with the last nyancat), score for credit_to, powerup drop.
+        Returns True on a kill."""
+        enemy.damage_stage += rule.damage
+        was_destroyed = rule.instakill or enemy.damage_stage >= enemy.max_damage
+        if rule.firework_colors:
+            self._kitty_hit_fireworks(enemy, rule)
+        if was_destroyed:
+            enemy.kill()
+            # Stop nyancat music if nyancat is destroyed and no other nyancats are alive
+            if enemy.enemy_type == "nyancat":
+                if not any(e.enemy_type == "nyancat" for e in self.bonus_wave_enemies) and self.audio.nyancat_music_channel:
+                    self.audio.stop_music_channel(self.audio.nyancat_music_channel)
+                    self.audio.nyancat_music_channel = None
+            # Award points to the player who killed the enemy #bonus wave - scoring
+            if rule.points is not None and credit_to is not None and hasattr(credit_to, 'player_score'):
+                self.events.emit(SCORE, credit_to, rule.points)
+            # Drop powerup using bonus wave probability (rolled at the end of the tick)
+            # Note: Defense strength is only reduced when enemies breach the bottom, not when killed
+            if rule.powerup_drop:
+                self.events.emit(POWERUP_DROP, enemy)
+        return was_destroyed
+
+    def _kitty_hit_fireworks(self, enemy, rule):
+        """bonus wave - 8 firework sparks flying out of a kitty that just got hit, in its rule's colors"""
+        colors = rule.firework_colors
+        if rule.rainbow:
+            # Cycle the rainbow by one per hit for visual variety
+            offset = self.nyancat_color_offset
+            colors = colors[offset:] + colors[:offset]
+            self.nyancat_color_offset = (offset + 1) % len(colors)
+            # Use hitbox center for nyancat (not the rainbow trail), sprite center for others
+            emanation_x, emanation_y = enemy.get_collision_rect().center
+        else:
+            emanation_x, emanation_y = enemy.rect.centerx, enemy.rect.centery
+        for i in range(8):
+            angle = (i * 45) * (math.pi / 180)
+            firework = BonusWaveFirework(
+                self.settings, self.screen,
+                emanation_x, emanation_y,
+                colors[i % len(colors)], angle
+            )
+            self.bonus_wave_fireworks.add(firework)
+
     def _do_bonus_wave_collisions(self):
         """Handle collisions in bonus wave"""
+        self.collision_grid.begin_pass()
+        rules = self.collision_rules  # what each kind of hit does (collision_rules.py)
         # Shields absorb/regen if enabled
         if self.settings.orbital_shields_enabled and self.shields:
             # Player bullets charge shields toward regen
             # Mobile shields: owner's bullets pass through, other players' bullets recharge
-            hits = pygame.sprite.groupcollide(self.player_bullets, self.shields, False, False)
+            # Owners' bullets vs. their own mobile shields are filtered out in the query (bitmask test, see shield_blocks) -
+            # only needed while there are mobile shields, the rest of the time it's a plain rect check
+            blocks = shield_blocks if self.player_shields else None
+            hits = self.collision_grid.groupcollide(self.player_bullets, self.shields, False, False, blocks)
             bullets_to_kill = []
             for bullet, shields_hit in hits.items():
                 hit_shield = False
                 for shield in shields_hit:
-                    # Check if this is a mobile shield (mom-created)
-                    if hasattr(shield, 'tracked_player') and shield.tracked_player:
-                        # Mobile shield: check if bullet owner matches shield owner
-                        if (hasattr(bullet, 'owner_ref') and bullet.owner_ref and 
-                            hasattr(bullet.owner_ref, 'player_id') and
-                            bullet.owner_ref.player_id == shield.tracked_player.player_id):
-                            # Owner's bullet passes through
-                            continue
-                        else:
-                            # Other player's bullet recharges the shield
-                            if shield.heal(1):  # Recharge by 1 stage, returns True if stage improved
-                                self.audio.play("shield_recharge")  # Play sound when shield stage improves
-                            # Track shield recharge shot
-                            if hasattr(bullet, 'owner_ref') and hasattr(bullet.owner_ref, 'player_id'):
-                                player_id = bullet.owner_ref.player_id
-                                if player_id in self.player_stats:
-                                    self.player_stats[player_id]['shield_recharge_shots'] += 1
-                            hit_shield = True
+                    if shield.pass_mask:
+                        # Mobile shield (mom-created): another player's bullet recharges it
+                        # (the owner's own bullets never get here - shield_blocks() leaves them out of the query)
+                        if shield.heal(1):  # Recharge by 1 stage, returns True if stage improved
+                            self.events.emit(SOUND, "shield_recharge")  # Play sound when shield stage improves
                     else:
                         # Stationary shield - recharge it
                         if shield.register_recharge_hit():  # Returns True if stage improved
-                            self.audio.play("shield_recharge")  # Play sound when shield stage improves
-                        # Track shield recharge shot
-                        if hasattr(bullet, 'owner_ref') and hasattr(bullet.owner_ref, 'player_id'):
-                            player_id = bullet.owner_ref.player_id
-                            if player_id in self.player_stats:
-                                self.player_stats[player_id]['shield_recharge_shots'] += 1
-                        hit_shield = True
+                            self.events.emit(SOUND, "shield_recharge")  # Play sound when shield stage improves
+                    # Track shield recharge shot
+                    if bullet.owner_id:
+                        self.events.emit(STAT, bullet.owner_id, 'shield_recharge_shots', 1)
+                    hit_shield = True
                 # Kill bullet if it hit a shield (and wasn't owner's bullet on mobile shield)
                 if hit_shield:
                     bullets_to_kill.append(bullet)
@@ -5035,361 +4917,62 @@ class AlienInvasion:
             for bullet in bullets_to_kill:
                 bullet.kill()
             
-            # Kitty bullets damage shields
-            hits = pygame.sprite.groupcollide(self.alien_bullets, self.shields, False, False)
+            # Kitty bullets damage shields: each kitty type's shots do their own damage (collision_rules.py),
+            # NyancatBullets double it. Bullets whose kitty is gone (or that aren't a kitty's) do 1 (2 for nyancat bullets).
+            hits = self.collision_grid.groupcollide(self.alien_bullets, self.shields, False, False)
             for bullet, shields_hit in hits.items():
-                # Check for NyancatBullet (double damage to shields)
-                is_nyancat_bullet = isinstance(bullet, NyancatBullet)
-                
-                # Determine damage based on bullet owner_ref (if it's a bonus wave enemy)
-                if hasattr(bullet, 'owner_ref') and bullet.owner_ref:
-                    enemy = bullet.owner_ref
-                    # Check if this is a bonus wave enemy by checking if it's in the bonus_wave_enemies group
-                    if enemy in self.bonus_wave_enemies and hasattr(enemy, 'enemy_type'):
-                        enemy_type = enemy.enemy_type
-                        damage_values = {
-                            "loaf": 4,
-                            "centurion": 4,
-                            "emperor": 6,
-                            "bluewhale": 8,
-                            "ninja": 5
-                        }
-                        dmg = damage_values.get(enemy_type, 1)
-                        # Double damage for NyancatBullet
-                        if is_nyancat_bullet:
-                            dmg *= 2
-                        for shield in shields_hit:
-                            shield.take_damage(dmg)
-                        bullet.kill()
-                    else:
-                        # Regular alien bullets
-                        dmg = 2 if is_nyancat_bullet else 1
-                        for shield in shields_hit:
-                            shield.take_damage(dmg)
-                        bullet.kill()
-                else:
-                    # Bullet without owner_ref (shouldn't happen, but handle it)
-                    dmg = 2 if is_nyancat_bullet else 1
-                    for shield in shields_hit:
-                        shield.take_damage(dmg)
-                    bullet.kill()
-            
-            # Kitty sprites collide with shields (use custom hitbox for ninjakitty)
-            for enemy in self.bonus_wave_enemies.sprites():
-                collision_rect = enemy.get_collision_rect() if hasattr(enemy, 'get_collision_rect') else enemy.rect
-                shields_hit = pygame.sprite.spritecollide(enemy, self.shields, dokill=False)
-                # Filter shields that actually collide with the hitbox
-                shields_hit = [s for s in shields_hit if s.rect.colliderect(collision_rect)]
+                dmg = rules[("kitty_bullet", bullet_kind(bullet))].shield_damage
+                enemy = getattr(bullet, 'owner_ref', None)
+                if enemy in self.bonus_wave_enemies:
+                    dmg *= rules[("kitty_shot", enemy.enemy_type)].shield_damage
+                for shield in shields_hit:
+                    shield.take_damage(dmg)
+                bullet.kill()
+
+            # Kitty sprites collide with shields (ninjakitty and nyancat only with their compound hitbox) - the shield
+            # takes damage by kitty type (ninja kitties destroy it instantly) and the kitty is destroyed
+            hits = self.collision_grid.groupcollide(self.bonus_wave_enemies, self.shields, False, False, collide_hitbox)
+            for enemy, shields_hit in hits.items():
+                # all pairs are found up front, so skip any shield an earlier kitty in this loop already destroyed
+                shields_hit = [shield for shield in shields_hit if shield.alive()]
                 if not shields_hit:
                     continue
-                # Process collisions for this enemy
-                damage_values = {
-                    "loaf": 4,
-                    "centurion": 4,
-                    "emperor": 6,
-                    "bluewhale": 8,
-                    "ninja": len(self.settings.shield_colors)  # Maximum damage - destroy shield instantly
-                }
-                dmg = damage_values.get(enemy.enemy_type, 1)
+                rule = rules[("shield", enemy.enemy_type)]
                 for shield in shields_hit:
-                    shield.take_damage(dmg)
-                # Stop nyancat music if nyancat is destroyed and no other nyancats are alive
-                if enemy.enemy_type == "nyancat":
-                    enemy.kill()  # Kill first, then check if any remain
-                    if not any(e.enemy_type == "nyancat" for e in self.bonus_wave_enemies) and self.audio.nyancat_music_channel:
-                        self.audio.stop_music_channel(self.audio.nyancat_music_channel)
-                        self.audio.nyancat_music_channel = None
-                else:
-                    # Enemies are destroyed by shield collision
-                    enemy.kill()
-        
-        # Player bullets vs enemies (with custom hitbox support for ninjakitty)
-        # Use pygame.sprite.groupcollide for efficient collision detection
-        # First pass: get potential collisions using default rects (fast)
-        potential_hits = pygame.sprite.groupcollide(
-            self.player_bullets, self.bonus_wave_enemies, False, False
+                    shield.take_damage(rule.shield_damage)
+                self._resolve_kitty_hit(enemy, rule)
+
+        # Player bullets vs enemies (ninjakitty and nyancat only get hit on their compound hitbox)
+        # Use the collision grid (same results as pygame.sprite.groupcollide) for efficient collision detection
+        bullet_hits = self.collision_grid.groupcollide(
+            self.player_bullets, self.bonus_wave_enemies, False, False, collide_hitbox
         )
-        
-        bullets_to_kill = []  # List of bullets to remove
-        bullets_processed = set()  # Track which bullets we've already added (using id for hashability)
-        # Second pass: verify collisions using custom hitboxes where needed
-        for bullet, enemies_hit in potential_hits.items():
-            for enemy in enemies_hit:
-                # Use custom hitbox if available, otherwise use default rect
-                collision_rect = enemy.get_collision_rect() if hasattr(enemy, 'get_collision_rect') else enemy.rect
-                if bullet.rect.colliderect(collision_rect):
-                    # Add bullet only once (even if it hits multiple enemies)
-                    bullet_id = id(bullet)
-                    if bullet_id not in bullets_processed:
-                        bullets_to_kill.append(bullet)
-                        bullets_processed.add(bullet_id)
-                    was_destroyed = enemy.take_hit()
-                    
-                    # Track bullet hit (for accuracy calculation)
-                    if hasattr(bullet, 'owner_ref') and hasattr(bullet.owner_ref, 'player_id'):
-                        player_id = bullet.owner_ref.player_id
-                        if player_id in self.player_stats:
-                            self.player_stats[player_id]['bullets_hit'] += 1
-                            # Track enemy destroyed (bonus wave enemy)
-                            if was_destroyed:
-                                self.player_stats[player_id]['enemies_destroyed'] += 1
-                    
-                    # Create firework effect on hit
-                    colors = []
-                    if enemy.enemy_type == "loaf":
-                        colors = [(255, 255, 0)] * 8  # Yellow
-                    elif enemy.enemy_type == "centurion":
-                        colors = [(255, 0, 0)] * 8  # Red
-                    elif enemy.enemy_type == "emperor":
-                        colors = [(200, 0, 255)] * 8  # Bright purple
-                    elif enemy.enemy_type == "bluewhale":
-                        colors = [(100, 190, 255)] * 8  # Light blue
-                    elif enemy.enemy_type == "ninja":
-                        colors = [(255, 255, 255)] * 8  # White for ninjakitty
-                    elif enemy.enemy_type == "nyancat":
-                        base_colors = [(255, 0, 0), (255, 192, 203), (255, 165, 0), (0, 255, 0),
-                                      (0, 255, 255), (0, 0, 255), (128, 0, 128), (255, 0, 0)]  # Rainbow for nyancat
-                        # Cycle colors per hit for visual variety
-                        if not hasattr(self, 'nyancat_color_offset'):
-                            self.nyancat_color_offset = 0
-                        colors = base_colors[self.nyancat_color_offset:] + base_colors[:self.nyancat_color_offset]
-                        self.nyancat_color_offset = (self.nyancat_color_offset + 1) % len(base_colors)
-                    
-                    # Create firework bullets
-                    for i in range(8):
-                        angle = (i * 45) * (math.pi / 180)
-                        # Use hitbox center for nyancat, sprite center for others
-                        if enemy.enemy_type == "nyancat" and hasattr(enemy, 'hitbox_rect') and enemy.hitbox_rect:
-                            emanation_x, emanation_y = enemy.hitbox_rect.centerx, enemy.hitbox_rect.centery
-                        else:
-                            emanation_x, emanation_y = enemy.rect.centerx, enemy.rect.centery
+        for bullet, enemies_hit in bullet_hits.items():
+            enemy = enemies_hit[0]  # Only process the first collision per bullet
+            was_destroyed = self._resolve_kitty_hit(enemy, rules[("player_bullet", enemy.enemy_type)], bullet.owner_ref)
+            # Track bullet hit (for accuracy calculation) and enemy destroyed (bonus wave enemy)
+            if bullet.owner_id:
+                self.events.emit(STAT, bullet.owner_id, 'bullets_hit', 1)
+                if was_destroyed:
+                    self.events.emit(STAT, bullet.owner_id, 'enemies_destroyed', 1)
+            bullet.kill()  # Remove bullets that hit enemies
 
-                        firework = BonusWaveFirework(
-                            self.settings, self.screen,
-                            emanation_x, emanation_y,
-                            colors[i % len(colors)], angle
-                        )
-                        self.bonus_wave_fireworks.add(firework)
-                    
-                    if was_destroyed:
-                        # Store enemy type before killing
-                        enemy_type = enemy.enemy_type
-                        
-                        # Stop nyancat music if nyancat is destroyed and no other nyancats are alive
-                        if enemy_type == "nyancat":
-                            enemy.kill()  # Kill first, then check if any remain
-                            if not any(e.enemy_type == "nyancat" for e in self.bonus_wave_enemies) and self.audio.nyancat_music_channel:
-                                self.audio.stop_music_channel(self.audio.nyancat_music_channel)
-                                self.audio.nyancat_music_channel = None
-                        else:
-                            enemy.kill()
-                        
-                        # Award points to player who killed the enemy #bonus wave - scoring
-                        if bullet.owner_ref is not None and hasattr(bullet.owner_ref, 'player_score'):
-                            score_values = {
-                                "loaf": 100,
-                                "centurion": 200,
-                                "emperor": 300,
-                                "bluewhale": 500,
-                                "ninja": 250,
-                                "nyancat": 1000
-                            }
-                            points = score_values.get(enemy_type, 0)
-                            bullet.owner_ref.player_score += points
-                        
-                        # Drop powerup using bonus wave probability #bonus wave - drop powerups on enemy death
-                        # Nyancat always drops 3 powerups (left/center/right). Other enemies use normal chance.
-                        should_drop = (enemy_type == "nyancat") or (random.random() <= self.settings.bonus_wave_powerup_drop_chance)
-                        if should_drop:
-                            if enemy_type == "nyancat":
-                                # Nyancat drops 3 powerups: left edge, center, right edge
-                                ptype1 = choose_powerup_type(self.settings, is_bonus_wave=True)
-                                ptype2 = choose_powerup_type(self.settings, is_bonus_wave=True)
-                                ptype3 = choose_powerup_type(self.settings, is_bonus_wave=True)
-
-                                powerup1 = PowerUpPickup(self.settings, self.screen, ptype1, enemy.rect.left, enemy.rect.centery)
-                                powerup2 = PowerUpPickup(self.settings, self.screen, ptype2, enemy.rect.centerx, enemy.rect.centery)
-                                powerup3 = PowerUpPickup(self.settings, self.screen, ptype3, enemy.rect.right, enemy.rect.centery)
-
-                                self.powerups.add(powerup1, powerup2, powerup3)
-                            else:
-                                ptype = choose_powerup_type(self.settings, is_bonus_wave=True)  # bonus wave - choose dad or mom (50/50)
-                                powerup = PowerUpPickup(self.settings, self.screen, ptype, enemy.rect.centerx, enemy.rect.centery)
-                                self.powerups.add(powerup)
-                        
-                        # Note: Defense strength is only reduced when enemies breach the bottom, not when killed
-                        enemy.kill()
-                    break  # Only process first collision per bullet
-        
-        # Remove bullets that hit enemies
-        for bullet in bullets_to_kill:
-            bullet.kill()
-        
-        # Shockwaves vs bonus wave enemies #bonus wave - shockwaves damage kitty sprites
+        # Shockwaves vs bonus wave enemies #bonus wave - shockwaves damage kitty sprites (2 damage, once per shockwave)
+        # Ninjakitty and nyancat only get hit on their compound hitbox; each kitty comes back once, when the shockwave reaches it
+        self.collision_grid.begin_area_pass()
         for sw in self.shockwaves.sprites():
-            # Use custom collision detection for enemies with custom hitboxes
-            for enemy in self.bonus_wave_enemies.sprites():
-                collision_rect = enemy.get_collision_rect() if hasattr(enemy, 'get_collision_rect') else enemy.rect
-                if not sw.rect.colliderect(collision_rect):
-                    continue
-                # Skip if this shockwave has already hit this enemy
-                if enemy in sw.hit_aliens:
-                    continue
-                
-                # Mark as hit before applying damage to prevent multiple hits
-                sw.hit_aliens.add(enemy)
-                
-                # Apply 2 damage to kitty sprites
-                enemy.damage_stage += 2
-                was_destroyed = enemy.damage_stage >= enemy.max_damage
-                
-                # Create firework effect on hit (same as bullet hits)
-                colors = []
-                if enemy.enemy_type == "loaf":
-                    colors = [self.settings.loafkitty_firework_color] * 8
-                elif enemy.enemy_type == "centurion":
-                    colors = [self.settings.centurionkitty_firework_color] * 8
-                elif enemy.enemy_type == "emperor":
-                    colors = [self.settings.emperorkitty_firework_color] * 8
-                elif enemy.enemy_type == "bluewhale":
-                    colors = [self.settings.bluewhalekitty_firework_color] * 8
-                elif enemy.enemy_type == "ninja":
-                    colors = [self.settings.ninjakitty_firework_color] * 8
-                elif enemy.enemy_type == "nyancat": # rainbow for nyancat
-                    base_colors = self.settings.nyancat_rainbow_colors
-                    # Cycle colors per hit for visual variety
-                    if not hasattr(self, 'nyancat_color_offset'):
-                        self.nyancat_color_offset = 0
-                    colors = base_colors[self.nyancat_color_offset:] + base_colors[:self.nyancat_color_offset]
-                    self.nyancat_color_offset = (self.nyancat_color_offset + 1) % len(base_colors)
-                
-                # Create firework bullets
-                for i in range(8):
-                    angle = (i * 45) * (math.pi / 180)
-                    # Use hitbox center for nyancat, sprite center for others
-                    if enemy.enemy_type == "nyancat" and hasattr(enemy, 'hitbox_rect') and enemy.hitbox_rect:
-                        emanation_x, emanation_y = enemy.hitbox_rect.centerx, enemy.hitbox_rect.centery
-                    else:
-                        emanation_x, emanation_y = enemy.rect.centerx, enemy.rect.centery
+            for enemy in self.collision_grid.spritecollide_entering(sw, self.bonus_wave_enemies, collide_hitbox):
+                self._resolve_kitty_hit(enemy, rules[("shockwave", enemy.enemy_type)], sw.owner)
 
-                    firework = BonusWaveFirework(
-                        self.settings, self.screen,
-                        emanation_x, emanation_y,
-                        colors[i % len(colors)], angle
-                    )
-                    self.bonus_wave_fireworks.add(firework)
-                
-                if was_destroyed:
-                    # Store enemy type before killing
-                    enemy_type = enemy.enemy_type
-                    
-                    # Stop nyancat music if nyancat is destroyed and no other nyancats are alive
-                    if enemy_type == "nyancat":
-                        enemy.kill()  # Kill first, then check if any remain
-                        if not any(e.enemy_type == "nyancat" for e in self.bonus_wave_enemies) and self.audio.nyancat_music_channel:
-                            self.audio.stop_music_channel(self.audio.nyancat_music_channel)
-                            self.audio.nyancat_music_channel = None
-                    else:
-                        enemy.kill()
-                    
-                    # Award points to shockwave owner #bonus wave - scoring
-                    if hasattr(sw, 'owner') and sw.owner and hasattr(sw.owner, 'player_score'):
-                        score_values = {
-                            "loaf": 100,
-                            "centurion": 200,
-                            "emperor": 300,
-                            "bluewhale": 500,
-                            "ninja": 250,
-                            "nyancat": 1000
-                        }
-                        points = score_values.get(enemy_type, 0)
-                        sw.owner.player_score += points
-                    
-                    # Drop powerup using bonus wave probability #bonus wave - drop powerups on enemy death
-                    # Nyancat always drops 3 powerups (left/center/right). Other enemies use normal chance.
-                    should_drop = (enemy_type == "nyancat") or (random.random() <= self.settings.bonus_wave_powerup_drop_chance)
-                    if should_drop:
-                        if enemy_type == "nyancat":
-                            # Nyancat drops 3 powerups: left edge, center, right edge
-                            ptype1 = choose_powerup_type(self.settings, is_bonus_wave=True)
-                            ptype2 = choose_powerup_type(self.settings, is_bonus_wave=True)
-                            ptype3 = choose_powerup_type(self.settings, is_bonus_wave=True)
-
-                            powerup1 = PowerUpPickup(self.settings, self.screen, ptype1, enemy.rect.left, enemy.rect.centery)
-                            powerup2 = PowerUpPickup(self.settings, self.screen, ptype2, enemy.rect.centerx, enemy.rect.centery)
-                            powerup3 = PowerUpPickup(self.settings, self.screen, ptype3, enemy.rect.right, enemy.rect.centery)
-
-                            self.powerups.add(powerup1, powerup2, powerup3)
-                        else:
-                            ptype = choose_powerup_type(self.settings, is_bonus_wave=True)  # bonus wave - choose dad or mom (50/50)
-                            powerup = PowerUpPickup(self.settings, self.screen, ptype, enemy.rect.centerx, enemy.rect.centery)
-                            self.powerups.add(powerup)
-                    
-                    enemy.kill()
-        
         # Dad shockwave collisions with kitties (hits every frame, 1 damage per hit)
-        # Use custom collision detection for enemies with custom hitboxes
+        # Ninjakitty and nyancat only get hit on their compound hitbox
+        # (dad shockwaves don't have an owner, so no scoring and no powerup drops)
         for shockwave in self.dad_shockwaves.sprites():
-            for enemy in self.bonus_wave_enemies.sprites():
-                collision_rect = enemy.get_collision_rect() if hasattr(enemy, 'get_collision_rect') else enemy.rect
-                if not shockwave.rect.colliderect(collision_rect):
-                    continue
-                # Apply damage (1 damage per frame collision)
-                was_destroyed = enemy.take_hit()  # Returns True if destroyed
-                
-                # Create firework effect on hit (every frame while colliding)
-                colors = []
-                if enemy.enemy_type == "loaf":
-                    colors = [self.settings.loafkitty_firework_color] * 8  # Yellow
-                elif enemy.enemy_type == "centurion":
-                    colors = [self.settings.centurionkitty_firework_color] * 8  # Red
-                elif enemy.enemy_type == "emperor":
-                    colors = [self.settings.emperorkitty_firework_color] * 8  # Bright purple
-                elif enemy.enemy_type == "bluewhale":
-                    colors = [self.settings.bluewhalekitty_firework_color] * 8  # Light blue
-                elif enemy.enemy_type == "ninja":
-                    colors = [(self.settings.ninjakitty_firework_color)] * 8  # White for ninjakitty
-                elif enemy.enemy_type == "nyancat":
-                    base_colors = self.settings.nyancat_rainbow_colors  # Rainbow for nyancat
-                    # Cycle colors per hit for visual variety
-                    if not hasattr(self, 'nyancat_color_offset'):
-                        self.nyancat_color_offset = 0
-                    colors = base_colors[self.nyancat_color_offset:] + base_colors[:self.nyancat_color_offset]
-                    self.nyancat_color_offset = (self.nyancat_color_offset + 1) % len(base_colors)
-                
-                # Create firework bullets
-                for i in range(8):
-                    angle = (i * 45) * (math.pi / 180)
-                    # Use hitbox center for nyancat, sprite center for others
-                    if enemy.enemy_type == "nyancat" and hasattr(enemy, 'hitbox_rect') and enemy.hitbox_rect:
-                        emanation_x, emanation_y = enemy.hitbox_rect.centerx, enemy.hitbox_rect.centery
-                    else:
-                        emanation_x, emanation_y = enemy.rect.centerx, enemy.rect.centery
+            for enemy in self.collision_grid.spritecollide(shockwave, self.bonus_wave_enemies, False, collide_hitbox):
+                self._resolve_kitty_hit(enemy, rules[("dad_shockwave", enemy.enemy_type)])
 
-                    firework = BonusWaveFirework(
-                        self.settings, self.screen,
-                        emanation_x, emanation_y,
-                        colors[i % len(colors)], angle
-                    )
-                    self.bonus_wave_fireworks.add(firework)
-                
-                # Kill enemy if destroyed
-                if was_destroyed:
-                    # Store enemy type before killing
-                    enemy_type = enemy.enemy_type
-                    
-                    # Stop nyancat music if nyancat is destroyed and no other nyancats are alive
-                    if enemy_type == "nyancat":
-                        enemy.kill()  # Kill first, then check if any remain
-                        if not any(e.enemy_type == "nyancat" for e in self.bonus_wave_enemies) and self.audio.nyancat_music_channel:
-                            self.audio.stop_music_channel(self.audio.nyancat_music_channel)
-                            self.audio.nyancat_music_channel = None
-                    else:
-                        # Award points if applicable (dad shockwaves don't have owner_ref, so no scoring)
-                        enemy.kill()
-        
         # Mom bullet collisions with players (heal players +1 health each AND create/charge mobile shields)
-        player_hits = pygame.sprite.groupcollide(self.mom_bullets, self.players, False, False)
+        player_hits = self.collision_grid.groupcollide(self.mom_bullets, self.players, False, False)
         bullets_hit_players = set()
         for bullet, players_hit in player_hits.items():
             for player in players_hit:
@@ -5405,6 +4988,7 @@ class AlienInvasion:
                         # Shield thickness is 1/2 of normal (10px instead of 20px)
                         shield = Shield(self.settings, pygame.Rect(player.rect.left, player.rect.top - 10, player.rect.width, 10))
                         shield.tracked_player = player  # bonus wave - store player reference for tracking
+                        shield.pass_mask = owner_bit(player)  # this player's own bullets fly through it
                         self.shields.add(shield)
                         self.player_shields[player.player_id] = shield
                     else:
@@ -5415,19 +4999,19 @@ class AlienInvasion:
         # Mom bullet collisions with stationary shields (respawn dead shields and charge alive ones)
         if self.settings.orbital_shields_enabled and hasattr(self, 'shield_slots') and self.shield_slots:
             # Check collisions with existing shields (alive shields)
-            shield_hits = pygame.sprite.groupcollide(self.mom_bullets, self.shields, False, False)
+            shield_hits = self.collision_grid.groupcollide(self.mom_bullets, self.shields, False, False)
             bullets_hit_shields = set()
             for bullet, shields_hit in shield_hits.items():
                 # Skip bullets that already hit players
                 if bullet in bullets_hit_players:
                     continue
                 for shield in shields_hit:
-                    # Skip mobile shields (mom-created shields with tracked_player)
-                    if hasattr(shield, 'tracked_player') and shield.tracked_player:
+                    # Skip mobile shields (mom-created shields - the only ones with a pass_mask)
+                    if shield.pass_mask:
                         continue
                     # This is a stationary shield - heal it by 1 stage
                     if shield.heal(1):  # Returns True if stage improved
-                        self.audio.play("shield_recharge")  # Play sound when shield stage improves
+                        self.events.emit(SOUND, "shield_recharge")  # Play sound when shield stage improves
                     bullets_hit_shields.add(bullet)
                     break  # Only process first shield hit per bullet
             
@@ -5443,7 +5027,7 @@ class AlienInvasion:
                         # Check if there's no shield at this slot (shield was killed)
                         shield_at_slot = None
                         for shield in self.shields:
-                            if not hasattr(shield, 'tracked_player') or not shield.tracked_player:
+                            if not shield.pass_mask:
                                 # This is a stationary shield
                                 if shield.rect.colliderect(slot_rect):
                                     shield_at_slot = shield
@@ -5469,123 +5053,66 @@ class AlienInvasion:
             bullet.kill()
         
         # Kitty bullets vs squadrons #bonus wave - kitty bullets damage squadrons
-        squadron_is_hit = pygame.sprite.groupcollide(self.alien_bullets, self.squadrons, False, False)
+        squadron_is_hit = self.collision_grid.groupcollide(self.alien_bullets, self.squadrons, False, False)
         for bullet, squadrons_hit in squadron_is_hit.items():
             is_laserminion_bomb = isinstance(bullet, LaserminionBomb)
-            # Only process collisions with kitty bullets (bonus wave enemy bullets)
-            # Check if bullet has owner_ref that's a bonus wave enemy
-            if hasattr(bullet, 'owner_ref') and bullet.owner_ref:
-                if bullet.owner_ref in self.bonus_wave_enemies:
-                    for squadron in squadrons_hit:
-                        was_alive = squadron.alive()  # Check if squadron was alive before taking hit
-                        squadron.take_hit(1)  # 1 damage per hit
-                        # Play death sound if squadron just died
-                        if was_alive and not squadron.alive():
-                            self.audio.play("powerup_squadron_death")
-                        
-                        # Apply LaserminionBomb knockback
-                        if is_laserminion_bomb:
-                            # LaserminionBomb: sideways knockback (1/2 squadron width)
-                            # Direction: if bomb hits LEFT of centerx, bump RIGHT; if RIGHT of centerx, bump LEFT
-                            if bullet.rect.centerx < squadron.rect.centerx:
-                                direction = 1  # Bump right
-                            else:
-                                direction = -1  # Bump left
-                            bump_distance = squadron.rect.width // 2
-                            squadron.rect.x += direction * bump_distance
-                            # Clamp to screen bounds
-                            if squadron.rect.left < 0:
-                                squadron.rect.left = 0
-                            if squadron.rect.right > self.settings.screen_width:
-                                squadron.rect.right = self.settings.screen_width
-                            # Update squadron's internal position if it has one
-                            if hasattr(squadron, 'x'):
-                                squadron.x = float(squadron.rect.x)
+            # Only process collisions with kitty bullets (bonus wave enemy bullets - tagged when they're fired)
+            if bullet.kitty_shot:
+                for squadron in squadrons_hit:
+                    was_alive = squadron.alive()  # Check if squadron was alive before taking hit
+                    squadron.take_hit(1)  # 1 damage per hit
+                    # Play death sound if squadron just died
+                    if was_alive and not squadron.alive():
+                        self.events.emit(SOUND, "powerup_squadron_death")
                     
-                    # Kill bullet after impact (LaserminionBomb disappears)
+                    # Apply LaserminionBomb knockback
                     if is_laserminion_bomb:
-                        bullet.kill()
-                    else:
-                        bullet.kill()  # Remove bullet after collision
-        
-        # Alien bullets vs players
-        player_is_hit = pygame.sprite.groupcollide(self.alien_bullets, self.players, False, False)
-        if player_is_hit:
-            for bullet, ships_hit in player_is_hit.items():
-                # Check for special bullet types (once per bullet, not per ship)
-                is_nyancat_bullet = isinstance(bullet, NyancatBullet)
-                is_laserminion_bomb = isinstance(bullet, LaserminionBomb)
-                
-                for ship in ships_hit:
-                    # If ship is respawning:
-                    if ship.player_state in ("between_lives", "respawning"):
-                        continue
-                    else:
-                        # Determine damage
-                        if is_nyancat_bullet:
-                            damage = 3  # Triple damage for NyancatBullet
+                        # LaserminionBomb: sideways knockback (1/2 squadron width)
+                        # Direction: if bomb hits LEFT of centerx, bump RIGHT; if RIGHT of centerx, bump LEFT
+                        if bullet.rect.centerx < squadron.rect.centerx:
+                            direction = 1  # Bump right
                         else:
-                            damage = 1  # Normal damage
-                        
-                        ship.player_health -= damage
-                        # Track damage taken
-                        if ship.player_id in self.player_stats:
-                            self.player_stats[ship.player_id]['damage_taken'] += damage
-                        self._trigger_hud_flash(ship, "hp")
-                        self.audio.play("bullet_hit")
-                        ship.trigger_hit_animation(350)  # Trigger hit animation (shorter than HUD flash duration)
-                        
-                        # Apply knockback effects
-                        if is_nyancat_bullet:
-                            # NyancatBullet: knockback downward by ship height
-                            knockback_distance = ship.rect.height
-                            ship.rect.y += knockback_distance
-                            # Clamp to screen bounds
-                            if ship.rect.bottom > self.settings.play_height:
-                                ship.rect.bottom = self.settings.play_height
-                            ship.y = float(ship.rect.y)
-                        elif is_laserminion_bomb:
-                            # LaserminionBomb: sideways knockback (1/2 ship width)
-                            # Direction: if bomb hits LEFT of centerx, bump RIGHT; if RIGHT of centerx, bump LEFT
-                            if bullet.rect.centerx < ship.rect.centerx:
-                                direction = 1  # Bump right
-                            else:
-                                direction = -1  # Bump left
-                            bump_distance = ship.rect.width // 2
-                            ship.rect.x += direction * bump_distance
-                            # Clamp to screen bounds
-                            if ship.rect.left < 0:
-                                ship.rect.left = 0
-                            if ship.rect.right > self.settings.screen_width:
-                                ship.rect.right = self.settings.screen_width
-                            ship.x = float(ship.rect.x)
-                        
-                        if ship.player_health <= 0:
-                            ship.player_lives -= 1
-                            # Track lives lost
-                            if ship.player_id in self.player_stats:
-                                self.player_stats[ship.player_id]['lives_lost'] += 1
-                            self._trigger_hud_flash(ship, "lives")
-                            self.audio.play("player_life_lost")
-                            ship.player_health = ship.current_max_health
-                            if ship.player_lives >= 0:
-                                self._start_player_respawn_timer(ship)
-                            elif ship.player_lives < 0:
-                                self._player_death(ship)
-                # Kill bullet after processing all ships (NyancatBullet and LaserminionBomb disappear after impact)
-                if (is_nyancat_bullet or is_laserminion_bomb) and bullet.alive():
+                            direction = -1  # Bump left
+                        bump_distance = squadron.rect.width // 2
+                        squadron.rect.x += direction * bump_distance
+                        # Clamp to screen bounds
+                        if squadron.rect.left < 0:
+                            squadron.rect.left = 0
+                        if squadron.rect.right > self.settings.screen_width:
+                            squadron.rect.right = self.settings.screen_width
+                        # Update squadron's internal position if it has one
+                        if hasattr(squadron, 'x'):
+                            squadron.x = float(squadron.rect.x)
+                
+                # Kill bullet after impact (LaserminionBomb disappears)
+                if is_laserminion_bomb:
                     bullet.kill()
-                elif bullet.alive():
-                    bullet.kill()  # Normal bullets also get killed
-        
+                else:
+                    bullet.kill()  # Remove bullet after collision
+        
+        # Alien bullets vs players (NyancatBullets do triple damage in the bonus wave - collision_rules.py)
+        player_is_hit = self.collision_grid.groupcollide(self.alien_bullets, self.players, False, False)
+        for bullet, ships_hit in player_is_hit.items():
+            rule = rules[("kitty_bullet", bullet_kind(bullet))]  # once per bullet, not per ship
+            for ship in ships_hit:
+                # Respawning ships can't be hit
+                if ship.player_state not in ("between_lives", "respawning"):
+                    self._bullet_hits_player(bullet, ship, rule)
+            bullet.kill()  # every kind of bullet disappears after impact
+
         # Enemies vs players (collision) - bonus wave - use bump behavior for all cat sprites
-        # Use custom collision detection for enemies with custom hitboxes
+        # Ninjakitty and nyancat only bump players with their compound hitbox
+        # (this and the lifepod loops below are hand-written, so they report to collision_stats themselves)
+        stats = self.collision_stats
+        started, loop_pairs, loop_hits, loop_rejected = stats.clock(), 0, 0, 0
         for enemy in self.bonus_wave_enemies.sprites():
-            collision_rect = enemy.get_collision_rect() if hasattr(enemy, 'get_collision_rect') else enemy.rect
-            # Check collision with each player using custom hitbox
             for player in self.players.sprites():
-                if not player.rect.colliderect(collision_rect):
+                loop_pairs += 1
+                if not enemy.hitbox_collides(player.rect):
+                    if stats.enabled and enemy.rect.colliderect(player.rect):
+                        loop_rejected += 1
                     continue
+                loop_hits += 1
                 # First check if they are respawning
                 if player.player_state in ("respawning", "between_lives"):
                     continue
@@ -5595,7 +5122,7 @@ class AlienInvasion:
                         player.player_health -= damage
                         self._trigger_hud_flash(player, "hp")
                         player.trigger_hit_animation(450)  # Trigger hit animation (matches HUD flash duration)
-                        self.audio.play("player_collide")
+                        self.events.emit(SOUND, "player_collide")
                         bump_distance = (enemy.rect.width // 2) + (player.rect.width // 2) + 4
                         direction = -1 if player.rect.centerx < enemy.rect.centerx else 1
                         player.rect.x += direction * bump_distance
@@ -5610,37 +5137,45 @@ class AlienInvasion:
                         if player.player_health <= 0:
                             player.player_lives -= 1
                             self._trigger_hud_flash(player, "lives")
-                            self.audio.play("player_life_lost")
+                            self.events.emit(SOUND, "player_life_lost")
                             player.player_health = player.current_max_health
                             if player.player_lives >= 0:
                                 self._start_player_respawn_timer(player)
                             else:
                                 self._player_death(player)
+        stats.record("bonus_wave_enemies x players (loop)", loop_pairs, loop_hits, started, rejected=loop_rejected)
                 # Lifepod-bonus wave enemy collisions (trigger respawn animation)
-        # Use custom collision detection for enemies with custom hitboxes
+        # (ninjakitty and nyancat only with their compound hitbox)
+        started, loop_pairs, loop_hits = stats.clock(), 0, 0
         for lifepod in self.lifepods.sprites():
             if lifepod.state != "normal":  # Skip if already respawning
                 continue
             for enemy in self.bonus_wave_enemies.sprites():
-                collision_rect = enemy.get_collision_rect() if hasattr(enemy, 'get_collision_rect') else enemy.rect
-                if lifepod.rect.colliderect(collision_rect):
+                loop_pairs += 1
+                if enemy.hitbox_collides(lifepod.rect):
                     lifepod.start_respawn()
+                    loop_hits += 1
                     break  # Only trigger once per collision
             if lifepod.state != "normal":  # If respawn was triggered, don't check bullets
                 continue
+        stats.record("lifepods x bonus_wave_enemies (loop)", loop_pairs, loop_hits, started)
 
         # Lifepod-bonus wave enemy bullet collisions (trigger respawn animation)
-        # Filter for bonus wave enemy bullets (those with owner_ref in bonus_wave_enemies)
+        # Filter for bonus wave enemy bullets (kitty_shot, tagged when they're fired)
+        started, loop_pairs, loop_hits = stats.clock(), 0, 0
         for lifepod in self.lifepods.sprites():
             if lifepod.state != "normal":  # Skip if already respawning
                 continue
             for bullet in self.alien_bullets.sprites():
+                loop_pairs += 1
                 # Check if this is a bonus wave enemy bullet
-                if hasattr(bullet, 'owner_ref') and bullet.owner_ref and bullet.owner_ref in self.bonus_wave_enemies:
+                if bullet.kitty_shot:
                     if lifepod.rect.colliderect(bullet.rect):
                         lifepod.start_respawn()
                         bullet.kill()  # Remove bullet after collision
+                        loop_hits += 1
                         break  # Only trigger once per collision
+        stats.record("lifepods x alien_bullets (loop)", loop_pairs, loop_hits, started)
         # Enemies that breach bottom
         for enemy in self.bonus_wave_enemies:
             if enemy.rect.top > self.settings.play_height:
@@ -5667,7 +5202,7 @@ class AlienInvasion:
             self.audio.nyancat_music_channel = None
         
         # Set defeat screen start time for delayed music
-        self.defeat_screen_start_time = pygame.time.get_ticks()
+        self.defeat_screen_start_time = game_clock.get_ticks()
         
         # Store player data before they're removed from sprite group
         self._store_final_player_data()
@@ -5714,7 +5249,7 @@ class AlienInvasion:
             self.audio.nyancat_music_channel = None
         
         # Set victory screen start time for delayed music
-        self.victory_screen_start_time = pygame.time.get_ticks()
+        self.victory_screen_start_time = game_clock.get_ticks()
         
         # Store player data before they're removed from sprite group
         self._store_final_player_data()
@@ -5774,6 +5309,17 @@ class AlienInvasion:
         #return getattr(self.settings, f"player{player_id}_keys")
 
 if __name__ == "__main__":
+    import argparse
+    from wave_profiler import FORMATS
+
+    parser = argparse.ArgumentParser(description="Alien Invasion")
+    parser.add_argument("--profile-waves", nargs="?", const="profiles", default=None, metavar="DIR",
+                        help="cProfile every wave (and every minute of the bonus wave) into DIR (default: profiles)")
+    parser.add_argument("--profile-format", choices=FORMATS, default="pstats",
+                        help="pstats (.prof), collapsed (.collapsed, for flame graphs) or both")
+    args = parser.parse_args()
 
     gameinstance = AlienInvasion()
+    if args.profile_waves is not None:
+        gameinstance.wave_profiler = WaveProfiler(args.profile_waves, args.profile_format)
     gameinstance.Main_Game_Loop()
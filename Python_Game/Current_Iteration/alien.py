@@ -2,14 +2,18 @@
 
 import pygame
 import math #I decided I wanted the three different levels of aliens to have different movement patterns, so imported math to calculate zigzags, etc.
-import random #since aliens at level 3 need a random movement pattern (though always forward), I imported random.
+from game_rng import rng #since aliens at level 3 need a random movement pattern (though always forward), I use the game's shared seedable RNG.
+import game_clock
+from hitbox import HitboxMixin #shared hitbox API (compound hitboxes for destroyers and cruisers)
+from sprite_pool import Pooled #level 1 fleet aliens and laserminion bombs are recycled (see sprite_pool.py)
+from entity import Entity #laserminion bombs are slotted entities rather than full sprites (see entity.py)
 
 #INTERCEPTOR_PATH = "img/interceptor_dmg0.png"
 
 
 
 
-class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
+class Alien(Pooled, HitboxMixin, pygame.sprite.Sprite): #Create a class for aliens level 1-3
     def __init__(self, settings, screen, level=1):
         """CLASS PARAMETER DESCRIPTION:
         SETTINGS: import settings for motion speed, etc from base_settings.py
@@ -17,6 +21,11 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
         LEVEL: For aliens at different levels to have different motion & firing patterns"""
 
         super().__init__() #run the super init to get attributes from sprite class; then assign Alien class attribs.
+        self.reset(settings, screen, level)
+
+    def reset(self, settings, screen, level=1):
+        """Set the alien up from scratch (same parameters as __init__). Runs from __init__, and again when sprite_pool.py
+        hands a dead level 1 fleet alien back out through Alien.acquire()."""
         self.settings = settings
         self.screen = screen
         self.level = level #assign the input received for level parameter to a self.level attribute.
@@ -60,8 +69,12 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
         if base_image is None:
             base_image = pygame.Surface(self.spritesize, pygame.SRCALPHA)
 
-        self.image = base_image.copy()
+        if getattr(self, "_image_source", None) is not base_image: #a recycled level 1 alien already has its copy (they never get damage frames)
+            self.image = base_image.copy()
+            self._image_source = base_image
         self.rect = self.image.get_rect() # get rect of sprite
+        # destroyers and cruisers have empty space around their wings, so they get compound hitboxes (see hitbox.py)
+        self.hitbox_shape = {5: "destroyer", 6: "cruiser"}.get(level)
         self.x = float(self.rect.x) # convert coordinates to float for smooth movement.
         self.y = float(self.rect.y)
         self.warping_in = False
@@ -73,14 +86,14 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
        
         if self.level ==2: # level 2 aliens, Stealth Fighters, to zigzag down the screen independently of each other. 
           
-             self.zig_amplitude = random.randint(20,65)            
+             self.zig_amplitude = rng.randint(20,65)            
              self.zig_frequency = 0.06 #amplitude and frequency to use for a sine wave function - I'm slightly hazy on the math here.
-             self.zig_phase = random.random() * 2 * math.pi
+             self.zig_phase = rng.random() * 2 * math.pi
              self.base_x = 0.0 #0.0 is a placeholder - the real value wil be set below in alien_spawn_pos()
              
         if self.level == 3: #level 3 aliens will have random movement, changing direction every random
             self.drift_speed = self.speed + 0.4
-            self.drift_change_interval = random.randint(60, 400) #ships will change direction erratically, but within certain limits.
+            self.drift_change_interval = rng.randint(60, 400) #ships will change direction erratically, but within certain limits.
             self.drift_timer = 0
             self.vx, self.vy = self._alien3_vector_changer() #helper function to determine direction changes for lvl 3 aliens
     
@@ -88,8 +101,8 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
         if self.level ==1:
              self.min_fire_interval = settings.alien1_min_fire_interval
              self.max_fire_interval = settings.alien1_max_fire_interval
-             now = pygame.time.get_ticks()
-             self.next_fire_time = now + random.randint(10, self.max_fire_interval)
+             now = game_clock.get_ticks()
+             self.next_fire_time = now + rng.randint(10, self.max_fire_interval)
         elif self.level ==2:
              self.min_fire_interval = settings.alien2_min_fire_interval
              self.max_fire_interval = settings.alien2_max_fire_interval
@@ -112,8 +125,8 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
              self.damage_stage = 0 #set damage stage to 0
              self.max_damage = len(self.settings.cruiser_hitframes)
              # Wing firing timer (independent of main gun)
-             now = pygame.time.get_ticks()
-             self.next_wing_fire_time = now + random.randint(settings.cruiser_wing_min_fire_interval, settings.cruiser_wing_max_fire_interval)
+             now = game_clock.get_ticks()
+             self.next_wing_fire_time = now + rng.randint(settings.cruiser_wing_min_fire_interval, settings.cruiser_wing_max_fire_interval)
              self.next_wing_second_shot_time = None  # Timer for second wing shot (1 second after first)
         elif self.level == 7: #laser tankers
              self.min_fire_interval = settings.laztanker_min_fire_interval
@@ -132,7 +145,7 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
          #-->I requested a formula to exclude certain ranges of angles, to force this class into more horizontal movement. 
     def _alien3_vector_changer(self): 
         while True:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = rng.uniform(0, 2 * math.pi)
 
             # Convert to degrees in [0, 180) to measure "steepness"
             deg = math.degrees(angle) % 180
@@ -192,7 +205,7 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
          
          if current_time_ms >= self.next_fire_time: #check if we've reached the end of the firing timer yet
             #if timer has been completed, then reset it, but at a random length that is within min and max limits for its level, found in base_settings.
-            interval = random.randint(self.min_fire_interval, self.max_fire_interval)
+            interval = rng.randint(self.min_fire_interval, self.max_fire_interval)
             self.next_fire_time = current_time_ms + interval #set the firing timer again
             return True #then try to fire
          return False #otherwise, don't try to fire
@@ -234,12 +247,13 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
 
     def update(self):
         """The method belonging to the Alien class that determines alien movement"""
+        dt = game_clock.frame_scale #speeds below are in pixels per 60fps frame; dt scales them to the length of the simulation step (1.0 at 60Hz)
         
         #movement of lvl 1 alien fleets: 
         if self.level == 1:
               if self.warping_in:
                     entry_speed = self.warp_entry_speed or self.settings.fleet_warp_entry_speed
-                    self.y += entry_speed
+                    self.y += entry_speed * dt
                     target_y = self.warp_target_y if self.warp_target_y is not None else self.y
                     if self.y >= target_y:
                          self.y = float(target_y)
@@ -247,22 +261,22 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
                     self.rect.x = int(self.x)
                     self.rect.y = int(self.y)
               elif self.rect.top <= 10: #first, the row slides in at a quicker speed. 
-                    self.y += self.settings.fleet_entry_speed
+                    self.y += self.settings.fleet_entry_speed * dt
                     self.rect.x = int(self.x)
                     self.rect.y = int(self.y)
               
               #subsequently, back-forth plus steady advance
               elif self.level == 1 and self.rect.top > 10:
-                    self.x += self.speed * self.settings.fleet_direction
-                    self.y += self.settings.fleet_advance_speed #gradually slide forward, instead of jolting forward.
+                    self.x += self.speed * self.settings.fleet_direction * dt
+                    self.y += self.settings.fleet_advance_speed * dt #gradually slide forward, instead of jolting forward.
                     self.rect.x = int(self.x)#convert the rect location back to integer for placement.
                     self.rect.y = int(self.y) 
         
 
         #movement of lvl 2 aliens: measured zigzag
         elif self.level ==2:
-            self.y += self.speed
-            self.zig_phase += self.zig_frequency #increment the phase of the zigzagging forward by one increment of frequency
+            self.y += self.speed * dt
+            self.zig_phase += self.zig_frequency * dt #increment the phase of the zigzagging forward by one increment of frequency
 
             self.x = self.base_x + self.zig_amplitude * math.sin(self.zig_phase) #the new x of the sprite is its base_x plus the amplitude times where it is now in the zig phase
 
@@ -279,14 +293,14 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
 
         #movement of lvl 3 aliens:random horizontal motion
         elif self.level == 3: 
-            self.drift_timer += 1 #there is a "drift timer" that determines how long they continue in a direction before changing; here we increment it
+            self.drift_timer += dt #there is a "drift timer" that determines how long they continue in a direction before changing; here we increment it
             if self.drift_timer >= self.drift_change_interval: #if timer has reached the drift interval, it's time to change direction: 
                  self.vx, self.vy = self._alien3_vector_changer() #activate vector_changer to change direction
-                 self.drift_change_interval = random.randint(40, 85) #set a new random change interval.
+                 self.drift_change_interval = rng.randint(40, 85) #set a new random change interval.
                  self.drift_timer = 0 #then reset the timer to zero, and it will now begin incrementing toward the interval chosen in prev. line.
 
-            self.x += self.vx #increment x movement
-            self.y += self.vy #increment y movement
+            self.x += self.vx * dt #increment x movement
+            self.y += self.vy * dt #increment y movement
 
             self.rect.x = int(self.x)#match x and y coordinates to enable placement. 
             self.rect.y = int(self.y)
@@ -295,18 +309,18 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
                 self.rect.left = 0
                 self.x = float(self.rect.x)
                 self.vx = abs(self.vx)  # bounce leftward
-                self.drift_change_interval = random.randint(40, 80) #set a new random change interval.
+                self.drift_change_interval = rng.randint(40, 80) #set a new random change interval.
                 self.drift_timer = 0 #then reset the timer to zero, and it will now begin incrementing toward the interval chosen in prev. line.
             if self.rect.right > self.settings.screen_width:
                 self.rect.right = self.settings.screen_width
                 self.x = float(self.rect.x)
                 self.vx = -abs(self.vx)  # bounce rightward
-                self.drift_change_interval = random.randint(40, 80) #set a new random change interval.
+                self.drift_change_interval = rng.randint(40, 80) #set a new random change interval.
                 self.drift_timer = 0 #then reset the timer to zero, and it will now begin incrementing toward the interval chosen in prev. line.
         
         #movement for level 4 aliens is a quick straight line.
         elif self.level == 4:
-            self.y += self.speed
+            self.y += self.speed * dt
             self.rect.y = int(self.y)
 
         elif self.level == 5: #destroyers are level 5. Their movement and bullets both are slower and larger. They slowly list to track a human player, with tight tracking. 
@@ -315,11 +329,11 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
                     target_center = self.target_player.rect.centerx #because it tracks on centerx, and not just checking .rect.right and .rect.left edges, it will track tighter.
 
                     if self.rect.centerx < target_center:  #check target's current let and right rect edges; if either of these is outside the alien's rect, it will adjust to align. Looser, slower tracking than a cruiser.  
-                        self.x += self.listing_speed
+                        self.x += self.listing_speed * dt
                     elif self.rect.centerx > target_center:
-                        self.x -= self.listing_speed
+                        self.x -= self.listing_speed * dt
             #advance speed is unaffected.        
-            self.y += self.speed
+            self.y += self.speed * dt
             self.rect.y = int(self.y)
             self.rect.x = int(self.x)
 
@@ -329,15 +343,15 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
                 target_right = self.target_player.rect.right
 
                 if self.rect.centerx < target_left: #check target's current let and right rect edges; if either of these is outside the alien's rect, it will adjust to align.
-                    self.x += self.listing_speed
+                    self.x += self.listing_speed * dt
                 elif self.rect.centerx > target_right: #this and the previous if create a 'loose' tracking.
-                    self.x -= self.listing_speed
+                    self.x -= self.listing_speed * dt
             #advancement speed is unaffected.
-            self.y += self.speed
+            self.y += self.speed * dt
             self.rect.y = int(self.y)
             self.rect.x = int(self.x)
         elif self.level == 7: #laser tankers are level 7. They move even slower, and their bullets are a constant stream of red.
-            self.y += self.speed
+            self.y += self.speed * dt
             self.rect.y = int(self.y)
         #TODO: ADD gunship ALIEN MOVEMENT HERE
 
@@ -366,7 +380,7 @@ class Alien(pygame.sprite.Sprite): #Create a class for aliens level 1-3
             return False
 
 
-class Minion(pygame.sprite.Sprite):
+class Minion(HitboxMixin, pygame.sprite.Sprite):
     """Parent class for all minion types. Provides essential game integration without interfering with alien systems."""
     def __init__(self, settings, screen, minion_type, owner, level=1):
         super().__init__()
@@ -394,10 +408,6 @@ class Minion(pygame.sprite.Sprite):
         if hasattr(self, 'image') and hasattr(self, 'rect'):
             self.screen.blit(self.image, self.rect)
 
-    def get_collision_rect(self):
-        """Return collision rectangle"""
-        return self.rect if hasattr(self, 'rect') else None
-
     def take_hit(self, dmg=1):
         """Handle taking damage - override in subclasses"""
         self.kill()
@@ -423,7 +433,7 @@ class Laserminion(Minion):
 
         # Level 3 style movement setup (restricted to tanker boundaries)
         self.drift_speed = settings.laserminion_drift_speed  # Base movement speed
-        self.drift_change_interval = random.randint(60, 400)
+        self.drift_change_interval = rng.randint(60, 400)
         self.drift_timer = 0
         self.vx, self.vy = self._generate_drift_vector()
 
@@ -439,7 +449,7 @@ class Laserminion(Minion):
     def _generate_drift_vector(self):
         """Generate movement vector like level 3 aliens"""
         while True:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = rng.uniform(0, 2 * math.pi)
             deg = math.degrees(angle) % 180
             if 11.25 <= deg <= 168.75:  # Avoid moving too horizontally - these angles are steeper than class 3 aliens; to keep minions nearer their tankers.
                 continue
@@ -460,16 +470,18 @@ class Laserminion(Minion):
             self.kill()
             return
 
+        dt = game_clock.frame_scale  # per-60fps-frame speeds scaled to the simulation step
+
         # Update drift timer
-        self.drift_timer += 1
+        self.drift_timer += dt
         if self.drift_timer >= self.drift_change_interval:
             self.vx, self.vy = self._generate_drift_vector()
-            self.drift_change_interval = random.randint(40, 85)
+            self.drift_change_interval = rng.randint(40, 85)
             self.drift_timer = 0
 
         # Apply movement
-        self.x += self.vx
-        self.y += self.vy
+        self.x += self.vx * dt
+        self.y += self.vy * dt
 
         # Boundary checking - bounce off the edges of the owner tanker
         tanker_left = self.owner.rect.left
@@ -509,15 +521,21 @@ class Laserminion(Minion):
         return True
 
 
-class LaserminionBomb(pygame.sprite.Sprite):
+class LaserminionBomb(Pooled, Entity):
     """Projectile fired by laserminions - accelerating red/white square."""
+    __slots__ = ("settings", "screen", "image", "rect", "y", "speed", "acceleration", "colors", "color_index",
+                 "last_color_change", "kitty_shot")
     def __init__(self, settings, screen, x, y):
         super().__init__()
+        # Create 6x6 square (once - a recycled bomb keeps its surface)
+        self.image = pygame.Surface((6, 6), pygame.SRCALPHA)
+        self.reset(settings, screen, x, y)
+
+    def reset(self, settings, screen, x, y):
+        """Set up a fresh or recycled (sprite_pool.py) bomb."""
         self.settings = settings
         self.screen = screen
-
-        # Create 6x6 square
-        self.image = pygame.Surface((6, 6), pygame.SRCALPHA)
+        self.kitty_shot = False  # (same tag as Bullet's) bombs don't count as kitty shots, even in the bonus wave
         self.rect = self.image.get_rect(centerx=x, centery=y)
 
         # Movement
@@ -528,22 +546,24 @@ class LaserminionBomb(pygame.sprite.Sprite):
         # Color cycling
         self.colors = settings.laserminion_bomb_colors  # Configured colors
         self.color_index = 0
-        self.last_color_change = pygame.time.get_ticks()
+        self.last_color_change = game_clock.get_ticks()
 
         # Initial color fill
         self.image.fill(self.colors[0])
 
     def update(self):
         """Update position, speed, and color"""
+        dt = game_clock.frame_scale  # per-60fps-frame speed/acceleration scaled to the simulation step
+
         # Accelerate
-        self.speed *= (1.0 + self.acceleration)  # 1% acceleration
+        self.speed *= (1.0 + self.acceleration) ** dt  # 1% acceleration per 60fps frame
 
         # Move downward
-        self.y += self.speed
+        self.y += self.speed * dt
         self.rect.centery = int(self.y)
 
         # Color cycling every 4 milliseconds
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         if current_time - self.last_color_change >= 4:
             self.color_index = (self.color_index + 1) % len(self.colors)
             self.image.fill(self.colors[self.color_index])
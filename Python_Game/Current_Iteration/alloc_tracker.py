@@ -0,0 +1,205 @@
+#alloc_tracker.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       alloc_tracker.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# Debug mode: per-phase allocation tracking, mainly to find pygame Surface churn (surfaces created every frame in hot
+# loops, like the firework sparks/shells, the nanite beam and the pause screen overlay).
+#
+# It hangs off the frame profiler's phase markers (FrameProfiler forwards start()/stop() to it), and for every tracked
+# phase (settings.alloc_tracker_phases, "update" and "draw" by default) on every Nth frame it records two things:
+#   1) tracemalloc snapshots before and after the phase -> which source lines left new memory behind (caches that
+#      keep growing, leaks, per-frame lists...), as blocks and KB.
+#   2) every Surface CREATED during the phase and the line that created it: pygame.Surface(...) itself, plus the
+#      C functions that hand back new surfaces (font render, copy, convert, subsurface, pygame.transform.*,
+#      pygame.image.load). Those temporary surfaces are usually freed again right away, so a snapshot diff can't
+#      see them - this count is the "Surface churn" number, tracked per frame over the whole session.
+#
+# This slows the game down a lot (tracemalloc + a profile hook on every call), so timings taken while it is on are
+# not meaningful - use it to find WHERE the churn is, and the frame profiler / benchmarks to see what it costs.
+#
+#       python headless_sim.py --wave 5 --players 4 --seconds 30 --render --autofire --alloc
+# or set settings.alloc_tracker_enabled = True for the real game (reports are written when the game exits).
+import sys
+import csv
+import time
+import tracemalloc
+from collections import defaultdict
+
+import pygame
+
+# C methods/functions that return a brand new Surface: (owner type name or module name, function name)
+_SURFACE_METHODS = {("Font", "render"), ("Surface", "copy"), ("Surface", "convert"), ("Surface", "convert_alpha"),
+                    ("Surface", "subsurface")}
+_SURFACE_MODULES = {"pygame.transform", "pygame.image"}
+_IGNORED_FILES = ("tracemalloc.py", "alloc_tracker.py", "frame_profiler.py", "<frozen", "linecache.py")
+
+
+def _site(frame):
+    code = frame.f_code
+    return f"{code.co_filename.replace(chr(92), '/').rsplit('/', 1)[-1]}:{frame.f_lineno} ({code.co_name})"
+
+
+class AllocationTracker:
+    """Per-phase tracemalloc diffs + Surface creation counts, reported as top sites and a per-frame time series."""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.enabled = False
+        self.phases = tuple(getattr(settings, "alloc_tracker_phases", ("update", "draw")))
+        self.every_n_frames = max(1, int(getattr(settings, "alloc_tracker_every_n_frames", 10)))
+        self.top_n = int(getattr(settings, "alloc_tracker_top_n", 15))
+
+        self._frame_no = 0
+        self._sampling = False  # is this frame one of the tracked ones?
+        self._stack = []  # tracked phases currently open (innermost last)
+        self._snapshots = {}  # phase -> tracemalloc snapshot at start()
+        self._frame_rows = {}  # phase -> [new_blocks, new_kb, surfaces] for the current frame
+        self._original_surface = None
+
+        self.frames_sampled = 0
+        self.timeline = []  # (frame number, phase, new blocks, new KB, surfaces created)
+        self.mem_sites = defaultdict(lambda: [0, 0.0])  # (phase, site) -> [blocks, KB] left behind, summed
+        self.surface_sites = defaultdict(int)  # (phase, site) -> surfaces created, summed
+
+    # ---------- on/off ----------
+    def enable(self):
+        if self.enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(int(getattr(self.settings, "alloc_tracker_traceback_frames", 1)))
+        # pygame.Surface(...) is a type, not a C function, so the profile hook can't see it being called.
+        # While tracking, the name pygame.Surface points at a subclass that reports where it was created.
+        tracker = self
+        original = pygame.Surface
+
+        class TrackedSurface(original):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                if tracker._stack:
+                    tracker._count_surface(sys._getframe(1))
+
+        self._original_surface = original
+        pygame.Surface = TrackedSurface
+        self.enabled = True
+
+    def disable(self):
+        if not self.enabled:
+            return
+        sys.setprofile(None)
+        pygame.Surface = self._original_surface
+        tracemalloc.stop()
+        self._stack.clear()
+        self.enabled = False
+
+    # ---------- hooks (called through FrameProfiler) ----------
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_no += 1
+        self._sampling = (self._frame_no % self.every_n_frames) == 0
+        self._frame_rows = {}
+
+    def start(self, phase):
+        if not (self.enabled and self._sampling and phase in self.phases):
+            return
+        if not self._stack:
+            sys.setprofile(self._profile_hook)
+        self._stack.append(phase)
+        self._frame_rows.setdefault(phase, [0, 0.0, 0])
+        self._snapshots[phase] = tracemalloc.take_snapshot()
+
+    def stop(self, phase):
+        if not (self.enabled and phase in self._snapshots):
+            return
+        after = tracemalloc.take_snapshot()
+        before = self._snapshots.pop(phase)
+        if phase in self._stack:
+            self._stack.remove(phase)
+        if not self._stack:
+            sys.setprofile(None)
+
+        row = self._frame_rows[phase]
+        for stat in after.filter_traces(self._trace_filters()).compare_to(before.filter_traces(self._trace_filters()), "lineno"):
+            if stat.count_diff <= 0 and stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            site = f"{frame.filename.replace(chr(92), '/').rsplit('/', 1)[-1]}:{frame.lineno}"
+            kb = max(0, stat.size_diff) / 1024.0
+            entry = self.mem_sites[(phase, site)]
+            entry[0] += max(0, stat.count_diff)
+            entry[1] += kb
+            row[0] += max(0, stat.count_diff)
+            row[1] += kb
+
+    def end_frame(self):
+        if not (self.enabled and self._sampling):
+            return
+        self.frames_sampled += 1
+        for phase, (blocks, kb, surfaces) in self._frame_rows.items():
+            self.timeline.append((self._frame_no, phase, blocks, round(kb, 2), surfaces))
+
+    # ---------- internals ----------
+    @staticmethod
+    def _trace_filters():
+        return [tracemalloc.Filter(False, f"*{name}*") for name in _IGNORED_FILES]
+
+    def _count_surface(self, frame):
+        phase = self._stack[-1]
+        self.surface_sites[(phase, _site(frame))] += 1
+        self._frame_rows[phase][2] += 1
+
+    def _profile_hook(self, frame, event, arg):
+        if event != "c_call" or not self._stack:
+            return
+        name = getattr(arg, "__name__", "")
+        owner = getattr(arg, "__self__", None)
+        owner_type = "Surface" if isinstance(owner, pygame.surface.Surface) else type(owner).__name__  # incl. TrackedSurface
+        if owner is not None and (owner_type, name) in _SURFACE_METHODS:
+            self._count_surface(frame)
+        elif getattr(arg, "__module__", None) in _SURFACE_MODULES or getattr(owner, "__name__", None) in _SURFACE_MODULES:
+            self._count_surface(frame)
+
+    # ---------- results ----------
+    def surfaces_per_frame(self, phase=None):
+        """Average Surfaces created per sampled frame (all tracked phases, or one)."""
+        if not self.frames_sampled:
+            return 0.0
+        total = sum(count for (p, _), count in self.surface_sites.items() if phase is None or p == phase)
+        return total / self.frames_sampled
+
+    def report(self):
+        """Human-readable summary: Surface churn and leftover allocations per phase, top sites first."""
+        n = max(1, self.frames_sampled)
+        lines = [f"allocation report: {self.frames_sampled} sampled frames (every {self.every_n_frames}th frame)",
+                 f"surfaces created per frame: {self.surfaces_per_frame():.1f}"]
+        for phase in self.phases:
+            lines.append("")
+            lines.append(f"[{phase}] surfaces created per frame: {self.surfaces_per_frame(phase):.1f}")
+            sites = sorted(((c, s) for (p, s), c in self.surface_sites.items() if p == phase), reverse=True)
+            for count, site in sites[:self.top_n]:
+                lines.append(f"  {count / n:8.2f} /frame {count:7d} total  {site}")
+            lines.append(f"[{phase}] memory left behind per frame (tracemalloc):")
+            mem = sorted(((kb, blocks, s) for (p, s), (blocks, kb) in self.mem_sites.items() if p == phase), reverse=True)
+            for kb, blocks, site in mem[:self.top_n]:
+                lines.append(f"  {kb / n:8.2f} KB {blocks / n:7.1f} blocks /frame  {site}")
+        return "\n".join(lines)
+
+    def write_reports(self, base_path=None):
+        """Write <base>.txt (report) and <base>_timeline.csv (per-frame numbers). Returns the .txt path or None."""
+        if not self.frames_sampled:
+            return None
+        if base_path is None:
+            pattern = getattr(self.settings, "alloc_tracker_report_path", "alloc_report_{timestamp}")
+            base_path = pattern.format(timestamp=time.strftime("%Y%m%d_%H%M%S"))
+        with open(base_path + ".txt", "w") as f:
+            f.write(self.report() + "\n")
+        with open(base_path + "_timeline.csv", "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "phase", "new_blocks", "new_kb", "surfaces_created"])
+            writer.writerows(self.timeline)
+        return base_path + ".txt"
@@ -710,3 +710,79 @@ class Settings:
         self.bonus_wave_defeat_bg_path = resource_path("img/victory_special.png")
         self.bonus_wave_victory_bg_path = resource_path("img/victory_perfect.png")
 
+        # ---------- Performance / debug tools ----------
+        # Frame profiler (frame_profiler.py): per-phase timings with rolling p50/p95/p99 + sprite group counts
+        self.profiler_enabled = False  # record from the first frame (otherwise recording starts at the first hotkey press)
+        self.profiler_hotkey = pygame.K_F3  # toggles the profiler overlay
+        self.profiler_window_frames = 300  # rolling window for the overlay percentiles (~5 sec at 60fps)
+        self.profiler_overlay_refresh_ms = 250  # overlay text is re-rendered this often, not every frame
+        self.profiler_csv_path = "frame_profile_{timestamp}.csv"  # written on exit if the profiler was switched on
+
+        # Fixed-timestep simulation (Main_Game_Loop): gameplay always advances in steps of 1000/sim_hz ms, no matter
+        # how fast frames are drawn. Movement speeds are "pixels per 60fps frame" scaled by game_clock.frame_scale.
+        self.fixed_timestep = True  # False = old behavior, one update per drawn frame
+        self.sim_hz = 60  # simulation steps per second
+        self.max_sim_steps_per_frame = 5  # after a long hitch, drop the backlog instead of fast-forwarding through it
+        self.render_interpolation = True  # draw moving sprites between their last two simulated positions
+        self.render_interp_max_jump = 64  # px; sprites that moved further than this in one step (teleports/respawns) snap
+        self.render_fps_cap = 60  # frame limiter for drawing; raise to 120/144 on high-refresh displays
+
+        # Deterministic runs (game_rng.py / replay.py)
+        self.rng_seed = None  # None = new random seed every game; set a number to replay the same spawns/drops every time
+        self.record_replays = False  # write a replay file (seed + key presses per simulation step) for every game played
+        self.replay_path = "replay_{timestamp}.json.gz"
+        self.replay_checksum_interval = 60  # steps between state checksums stored in the replay (desync detection)
+
+        # Adaptive quality governor (quality_governor.py): sheds cosmetic work only, never gameplay
+        self.quality_governor_enabled = True
+        self.quality_frame_budget_ms = 14.0  # frame work time (update + draw) above which cosmetics get scaled down
+        self.quality_recover_ratio = 0.7  # step back up once the average is under 70% of the budget...
+        self.quality_downgrade_frames = 20  # ...after this many frames over budget we drop a quality level
+        self.quality_upgrade_frames = 180  # ...and after this many comfortable frames we restore one
+
+        # Allocation tracker (alloc_tracker.py): tracemalloc diffs + Surface creation counts per phase. Debug only - slow!
+        self.alloc_tracker_enabled = False
+        self.alloc_tracker_phases = ("update", "draw")  # any profiler phase names, e.g. "draw_effects", "collisions"
+        self.alloc_tracker_every_n_frames = 10  # sample every Nth frame (tracemalloc snapshots are expensive)
+        self.alloc_tracker_top_n = 15  # sites listed per phase in the report
+        self.alloc_tracker_traceback_frames = 1  # tracemalloc traceback depth (1 = just the allocating line)
+        self.alloc_tracker_report_path = "alloc_report_{timestamp}"  # .txt report + _timeline.csv, written on exit
+
+        # Per-wave cProfile sessions (wave_profiler.py), also switched on by --profile-waves on the command line
+        self.wave_profiler_enabled = False
+        self.wave_profile_dir = "profiles"  # one file per wave / bonus-wave minute / end screen goes in here
+        self.wave_profile_format = "pstats"  # "pstats" (.prof), "collapsed" (flame graph stacks) or "both"
+
+        # Gameplay event bus (game_events.py): collision side effects are batched and handled once at the end of each tick
+        self.event_bus_capacity = 1024  # events buffered per tick before an early flush (a busy Hard-mode tick is ~100)
+        self.event_bus_merge_sounds = True  # play each sound once per tick, however many hits asked for it
+        self.event_log_enabled = False  # keep every tick's events and write them out as CSV when the game ends (analytics)
+        self.event_log_path = "events_{timestamp}.csv"
+
+        # Collision broad phase (spatial_hash.py): uniform grid instead of every-sprite-vs-every-sprite groupcollide
+        self.spatial_hash_enabled = True  # False = plain pygame groupcollide (same results, for comparing timings)
+        self.spatial_hash_cell_size = 64  # px; around the size of a big bullet stream segment / a level 1-3 alien
+        self.spatial_hash_pad = 8  # px of slack around each bucketed rect (damage frames can be a bit bigger)
+        self.spatial_hash_min_group = 12  # smaller groups (players, shields, squadrons) skip the grid
+
+        # Collision backend: "grid" (spatial_hash.py), "numpy" (numpy_collide.py - optional, needs numpy installed) or
+        # "sweep" (sweep_prune.py). numpy packs both groups into arrays and checks every bullet/target pair at once; best
+        # with hundreds of bullets. sweep keeps each group sorted by x from frame to frame and only checks a bullet
+        # against the targets in its column - same results as the grid, and quicker in every wave measured, so it's the default
+        self.collision_backend = "sweep"
+        self.numpy_collide_min_pairs = 1024  # groupcollides with fewer bullet/target pairs than this go through the grid
+
+        # Swept collisions (swept_collision.py): bullets, bombs and shockwaves are checked over the whole distance they moved
+        # in a step, not just where they ended up. Not needed at 60 Hz; turn it on when simulating at 30 Hz or lower
+        # (headless_sim.py --frame-ms 33.3 --swept), where fast projectiles would otherwise fly through thin targets like shields
+        self.swept_collisions = False
+        self.swept_max_step_px = 256  # a sprite that moved further than this in one step was teleported, not swept
+
+        # Collision query counters (collision_stats.py): pairs tested, hits, hitbox rejections and time per groupcollide /
+        # spritecollide / hand-written loop, per tick and per session. Also headless_sim.py / benchmark.py --collision-stats
+        self.collision_stats_enabled = False
+        self.collision_stats_csv_path = "collision_stats_{timestamp}.csv"  # session summary, written when the game ends
+
+        # Sprite pools (sprite_pool.py): dead bullets, bombs, sparks, mom bullets, pickups and fleet aliens are re-used
+        self.sprite_pools_enabled = True  # False = every spawn constructs a new sprite (same game either way)
+        self.sprite_pool_max_free = 512  # dead sprites kept per class for re-use
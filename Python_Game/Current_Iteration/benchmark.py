@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       benchmark.py (this file)
+#       headless_sim.py
+#       frame_profiler.py
+#       Visintainer_A_AlienGame.py (main file) and everything it needs
+#
+# Author: Anthony Visintainer
+#
+# Scenario benchmarks. Each named scenario sets up a known-heavy situation through the game's own entry points
+# (apply_start_config via HeadlessSimulation, _new_alien_wave, _start_bonus_wave, _init_victory_screen, ...),
+# then runs a fixed number of headless ticks with drawing on and reports per-frame update ms and draw ms
+# (mean/p50/p95/p99/max from the frame profiler), peak sprite counts and peak memory.
+#
+# Every scenario runs in its own child process, so peak memory (max RSS) belongs to that scenario alone and
+# one scenario's leftovers (sounds, clock, RNG) can't leak into the next. Runs are seeded, so the same scenario
+# plays out the same way every time and only the timings change.
+#
+#       python benchmark.py                                    (all scenarios, results to benchmark_results.json)
+#       python benchmark.py wave10_hard_4p --ticks 600
+#       python benchmark.py --save-baseline                    (store these results as benchmark_baseline.json)
+#       python benchmark.py --baseline benchmark_baseline.json --threshold 0.10
+# With --baseline, any metric more than threshold (10%) worse than the baseline is reported and the exit code is 1.
+# Baselines are per machine - record one on the machine you compare on.
+#       python benchmark.py wave10_hard_4p --collision-stats   (adds per-query pair/hit counts, see collision_stats.py)
+# --collision-stats adds a "collision_queries" entry to each scenario's results (pairs tested, hits, hitbox rejections
+# and ms per query over the measured ticks) and prints the most expensive queries. Counting costs a little time, so
+# don't compare those timings against a baseline recorded without it.
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+
+try:
+    import resource  # not available on Windows
+except ImportError:
+    resource = None
+
+DEFAULT_TICKS = 1800  # 30 simulated seconds at 60 Hz
+WARMUP_TICKS = 60  # not measured (first-frame image scaling, font loads etc.)
+DEFAULT_SEED = 1234
+
+# Metrics compared against the baseline: (path into the scenario result, absolute slack)
+# The slack keeps tiny numbers (e.g. 0.02ms -> 0.03ms) from counting as a 50% regression.
+COMPARED_METRICS = (
+    (("update_ms", "mean"), 0.05),
+    (("update_ms", "p95"), 0.10),
+    (("draw_ms", "mean"), 0.05),
+    (("draw_ms", "p95"), 0.10),
+    (("peak_rss_mb",), 2.0),
+)
+
+
+# ---------- scenarios ----------
+# Each scenario: name -> (description, start config, difficulty, setup function). The setup function gets the
+# HeadlessSimulation right after the game was initialized and puts the game into the state being measured.
+
+def _setup_wave10(sim):
+    sim.jump_to_wave(9)  # wave 10 (0-based index)
+
+
+def _setup_bonus_minute15(sim):
+    import game_clock
+    game = sim.game
+    now = game_clock.get_ticks()
+    # Pretend the bonus wave started 15 minutes ago: spawn rates and speeds scale with elapsed time
+    game.bonus_wave_start_time = now - 15 * 60 * 1000
+    # Every kitty type is due right away, then 20 seconds (not drawn) to let the field fill up like it would by then
+    for name in list(vars(game)):
+        if name.startswith("bonus_") and name.endswith("_next_spawn"):
+            setattr(game, name, now)
+    render, sim.render = sim.render, False
+    sim.run_for(20)
+    sim.render = render
+
+
+def _setup_victory_fireworks(sim):
+    game = sim.game
+    game.settings.powerup_enable_squadron = True
+    for ship in game.players:
+        ship.powerups["squadron"] = 4
+        for _ in range(4):  # Hard mode allows 4 squadrons per ship
+            game._use_powerup(ship, "squadron")
+    game.game_state = "victory"
+    game._init_victory_screen()
+
+
+def _setup_lasertanker_swarm(sim):
+    game = sim.game
+    sim.jump_to_wave(7)  # laserminions escort lasertankers from wave 8 on
+    for _ in range(6):
+        game._spawn_single_alien(level=7)
+
+
+SCENARIOS = {
+    "wave10_hard_4p": ("wave 10, Hard, 4 players firing",
+                       {"starting_wave": 1, "num_players": 4}, "hard", _setup_wave10),
+    "bonus_minute15_4p": ("bonus wave at minute 15, 4 players firing",
+                          {"secret_wave": True, "num_players": 4}, "hard", _setup_bonus_minute15),
+    "victory_fireworks_hard": ("Hard-mode victory fireworks, 4 players with all squadrons firing",
+                               {"starting_wave": 5, "num_players": 4}, "hard", _setup_victory_fireworks),
+    "lasertanker_swarm": ("6 lasertankers with laserminion escorts on wave 8, Hard, 2 players",
+                          {"starting_wave": 1, "num_players": 2}, "hard", _setup_lasertanker_swarm),
+}
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return round(peak / (1024 * 1024), 1)  # bytes on macOS
+    return round(peak / 1024, 1)  # KB on Linux
+
+
+def run_scenario(name, ticks=DEFAULT_TICKS, seed=DEFAULT_SEED, collision_stats=False):
+    """Run one scenario in this process and return its result dict."""
+    from headless_sim import HeadlessSimulation
+    import sprite_pool
+
+    description, config, difficulty, setup = SCENARIOS[name]
+    sim = HeadlessSimulation(config, difficulty=difficulty, render=True, autofire=True, seed=seed)
+    try:
+        setup(sim)
+        sim.step(WARMUP_TICKS)
+        profiler = sim.game.profiler
+        profiler.enabled = True
+        if collision_stats:
+            sim.use_collision_stats()  # after the warmup, so the counts cover the measured ticks only
+        wall_start = time.perf_counter()
+        ran = 0
+        while ran < ticks and sim.step():
+            ran += 1
+        wall = time.perf_counter() - wall_start
+        result = {
+            "description": description,
+            "ticks": ran,
+            "seed": seed,
+            "wall_s": round(wall, 3),
+            "frame_ms": profiler.session_stats("frame"),
+            "update_ms": profiler.session_stats("update"),
+            "draw_ms": profiler.session_stats("draw"),
+            "peak_entities": profiler.group_peaks(),
+            "peak_rss_mb": _peak_rss_mb(),
+            "final_state": sim.game.game_state,
+            "sprite_pools": sprite_pool.summary(),  # hits/misses since the game started (warmup included)
+        }
+        if collision_stats:
+            result["collision_queries"] = sim.game.collision_stats.summary()
+        return result
+    finally:
+        sim.close()
+
+
+def run_in_subprocess(name, ticks, seed, collision_stats=False):
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", name, "--ticks", str(ticks), "--seed", str(seed)]
+    if collision_stats:
+        cmd.append("--collision-stats")
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"scenario {name} failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])  # last line is the result; the game prints chatter above it
+
+
+def compare(results, baseline, threshold):
+    """List of (scenario, metric, baseline value, current value) that got worse than threshold allows."""
+    regressions = []
+    for name, result in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        for path, slack in COMPARED_METRICS:
+            old, new = base, result
+            for key in path:
+                old = old.get(key) if isinstance(old, dict) else None
+                new = new.get(key) if isinstance(new, dict) else None
+            if old is None or new is None:
+                continue
+            if new > old * (1.0 + threshold) and new - old > slack:
+                regressions.append((name, ".".join(path), old, new))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Alien Invasion scenario benchmarks.")
+    parser.add_argument("scenarios", nargs="*", help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS, help="measured ticks per scenario")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=None, help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown vs baseline (0.10 = 10%%)")
+    parser.add_argument("--save-baseline", nargs="?", const="benchmark_baseline.json", default=None,
+                        help="also write the results as the new baseline")
+    parser.add_argument("--collision-stats", action="store_true",
+                        help="also count pairs tested / hits / time per collision query (collision_stats.py)")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)  # internal: run one scenario, print JSON
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_scenario(args.worker, args.ticks, args.seed, args.collision_stats)))
+        return 0
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "ticks": args.ticks,
+            "seed": args.seed,
+        },
+        "scenarios": {},
+    }
+    for name in names:
+        result = run_in_subprocess(name, args.ticks, args.seed, args.collision_stats)
+        results["scenarios"][name] = result
+        print(f"{name:<24} update {result['update_ms']['mean']:7.3f} ms (p95 {result['update_ms']['p95']:7.3f})  "
+              f"draw {result['draw_ms']['mean']:7.3f} ms (p95 {result['draw_ms']['p95']:7.3f})  "
+              f"peak rss {result['peak_rss_mb']} MB")
+        for label, row in list(result.get("collision_queries", {}).items())[:5]:  # the five most expensive queries
+            print(f"    {label:<40} {row['ms_per_tick']:7.4f} ms/tick  tested {row['tested_per_tick']:8.1f} "
+                  f"of {row['all_pairs_per_tick']:9.1f} pairs/tick  hits {row['hits']}")
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print("results written to", args.output)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print("baseline written to", args.save_baseline)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"REGRESSIONS (more than {args.threshold:.0%} worse than {args.baseline}):")
+            for name, metric, old, new in regressions:
+                print(f"  {name:<24} {metric:<16} {old} -> {new}")
+            return 1
+        print(f"no regressions vs {args.baseline} (threshold {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,10 +4,12 @@
 
 import pygame
 import math
-import random
+from game_rng import rng
 from base_settings import resource_path
+import game_clock
+from hitbox import HitboxMixin
 
-class BonusWaveEnemy(pygame.sprite.Sprite):
+class BonusWaveEnemy(HitboxMixin, pygame.sprite.Sprite):
     """Base class for bonus wave enemies"""
     def __init__(self, settings, screen, enemy_type):
         super().__init__()
@@ -45,36 +47,8 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
         self.original_image = self.image.copy()  # For flipping
         self.rect = self.image.get_rect()
         
-        # Ninjakitty has a custom hitbox that excludes bottom-right corner (right 24% × lower 34%)
-        if enemy_type == "ninja":
-            # Calculate excluded area: right 24% × lower 34%
-            exclude_right = int(size[0] * 0.24)  # Right 24% of width
-            exclude_bottom_start = int(size[1] * 0.66)  # Lower 34% starts at 66% from top
-            # Create hitbox rect that excludes bottom-right corner
-            # Hitbox covers: left 76% of width, and top 66% of height
-            self.hitbox_rect = pygame.Rect(
-                self.rect.left,  # Start at left
-                self.rect.top,  # Start at top
-                size[0] - exclude_right,  # Width minus excluded right portion
-                exclude_bottom_start  # Height up to excluded bottom portion
-            )
-        # Nyancat has a custom hitbox that excludes bottom 12% and left 65%
-        elif enemy_type == "nyancat":
-            # Nyancat hitbox: excludes bottom 12% and left 65% when not flipped
-            # When flipped, excludes bottom 12% and right 65%
-            exclude_side = int(size[0] * 0.65)  # 65% of width
-            exclude_bottom = int(size[1] * 0.12)  # Bottom 12% of height
-            # Create base hitbox rect (will be positioned correctly during updates)
-            self.hitbox_rect = pygame.Rect(
-                0, 0,  # Position will be set in update
-                size[0] - exclude_side,  # Width minus excluded side portion
-                size[1] - exclude_bottom  # Height minus excluded bottom portion
-            )
-            # Store hitbox parameters for dynamic positioning
-            self.hitbox_exclude_side = exclude_side
-            self.hitbox_exclude_bottom = exclude_bottom
-        else:
-            self.hitbox_rect = None  # Use default rect for other enemies
+        # Ninjakitty's hitbox leaves out the bottom-right corner, nyancat's leaves out the rainbow (see hitbox.py)
+        self.hitbox_shape = enemy_type if enemy_type in ("ninja", "nyancat") else None
         
         # Set max damage based on type
         max_hits = {"loaf": 6, "centurion": 3, "emperor": 12, "bluewhale": 21, "ninja": 5, "nyancat": 42}
@@ -112,7 +86,7 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
         self.target_player = None  # For tracking enemies
         
         # Spawn timing
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = game_clock.get_ticks()
         
     def spawn_pos(self, x, y):
         """Set spawn position"""
@@ -120,10 +94,6 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
         self.y = float(y)
         self.rect.x = int(self.x)
         self.rect.y = int(self.y)
-        # Update hitbox position for ninjakitty
-        if self.hitbox_rect is not None:
-            self.hitbox_rect.x = self.rect.x
-            self.hitbox_rect.y = self.rect.y
         
     def ready_to_fire(self, current_time_ms: int, alien_bullets_group=None) -> bool:
         """Check if ready to fire"""
@@ -140,11 +110,7 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
         
         # Emperorkitty: check bullet cap - stop firing if at cap of 3
         if self.enemy_type == "emperor" and alien_bullets_group is not None:
-            bullet_count = 0
-            for b in alien_bullets_group:
-                if hasattr(b, 'owner_ref') and b.owner_ref == self:
-                    bullet_count += 1
-            if bullet_count >= 3:  # Cap of 3 bullets
+            if alien_bullets_group.count_owned(self) >= 3:  # Cap of 3 bullets
                 return False  # Don't fire until bullets are off screen
         
         # Check if this enemy type fires bullets (some like ninjakitty don't fire)
@@ -152,7 +118,7 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
             return False
 
         if current_time_ms >= self.next_fire_time:
-            interval = random.randint(self.min_fire_interval, self.max_fire_interval)
+            interval = rng.randint(self.min_fire_interval, self.max_fire_interval)
             self.next_fire_time = current_time_ms + interval
             return True
         return False
@@ -164,29 +130,30 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
     
     def update(self, time_elapsed_ms, speed_scale, player_group):
         """Update enemy position and behavior"""
+        dt = game_clock.frame_scale  # speeds below are per 60fps frame; dt scales them to the simulation step
         # Movement depends on type
         if self.enemy_type == "loaf":
             # Slow downward movement
             base_speed = 0.3 * speed_scale
-            self.y += base_speed
+            self.y += base_speed * dt
             self.rect.y = int(self.y)
             
         elif self.enemy_type == "centurion":
             # Level 3 alien movement pattern
             if not hasattr(self, 'drift_timer'):
                 self.drift_timer = 0
-                self.drift_change_interval = random.randint(60, 400)
+                self.drift_change_interval = rng.randint(60, 400)
                 self.drift_speed = 2.3 * speed_scale
                 self.vx, self.vy = self._get_random_vector()
             
-            self.drift_timer += 1
+            self.drift_timer += dt
             if self.drift_timer >= self.drift_change_interval:
                 self.vx, self.vy = self._get_random_vector()
-                self.drift_change_interval = random.randint(40, 85)
+                self.drift_change_interval = rng.randint(40, 85)
                 self.drift_timer = 0
             
-            self.x += self.vx
-            self.y += self.vy
+            self.x += self.vx * dt
+            self.y += self.vy * dt
             self.rect.x = int(self.x)
             self.rect.y = int(self.y)
             
@@ -217,16 +184,11 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
                 self.vx = 4.0 * speed_scale  # Constant horizontal speed
                 self.vy = 0.5 * speed_scale  # Slight downward drift
 
-            self.x += self.vx
-            self.y += self.vy
+            self.x += self.vx * dt
+            self.y += self.vy * dt
             self.rect.x = int(self.x)
             self.rect.y = int(self.y)
 
-            # Update hitbox position
-            if self.hitbox_rect is not None:
-                self.hitbox_rect.x = self.rect.x
-                self.hitbox_rect.y = self.rect.y
-
             # Flip sprite based on direction and bounce off edges
             if self.rect.left < 0:
                 self.rect.left = 0
@@ -250,15 +212,15 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
                 if self_centerx < target_centerx:
                     # Move right to align centers
                     list_speed = (0.25 if self.enemy_type == "emperor" else 0.15) * speed_scale
-                    self.x += list_speed
+                    self.x += list_speed * dt
                 elif self_centerx > target_centerx:
                     # Move left to align centers
                     list_speed = (0.25 if self.enemy_type == "emperor" else 0.15) * speed_scale
-                    self.x -= list_speed
+                    self.x -= list_speed * dt
             
             # Downward movement
             advance_speed = (0.5 if self.enemy_type == "emperor" else 0.25) * speed_scale
-            self.y += advance_speed
+            self.y += advance_speed * dt
             self.rect.y = int(self.y)
             self.rect.x = int(self.x)
 
@@ -272,7 +234,7 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
                 # Start with normal (unflipped) sprite
                 self.image = self.original_image.copy()
 
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
 
             # If off-screen and waiting, check if ready to re-enter
             if self.exit_time > 0:
@@ -294,12 +256,12 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
 
             # Vertical zigzag movement (gentle sine wave)
             vertical_speed = 0.68 * speed_scale  # 15% slower
-            self.vertical_phase += 0.05
+            self.vertical_phase += 0.05 * dt
             vertical_offset = math.sin(self.vertical_phase) * 30  # 30 pixel amplitude
 
             # Horizontal movement
-            self.x += self.speed * self.direction
-            self.y += vertical_offset * 0.1  # Small vertical movement
+            self.x += self.speed * self.direction * dt
+            self.y += vertical_offset * 0.1 * dt  # Small vertical movement
 
             # Keep within reasonable vertical bounds
             if self.y < 50:
@@ -312,14 +274,6 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
             self.rect.x = int(self.x)
             self.rect.y = int(self.y)
 
-            # Update hitbox position (flips horizontally with sprite)
-            if self.hitbox_rect is not None:
-                if self.direction == 1:  # Moving right (normal orientation)
-                    self.hitbox_rect.x = self.rect.x + self.hitbox_exclude_side
-                else:  # Moving left (flipped orientation)
-                    self.hitbox_rect.x = self.rect.x
-                self.hitbox_rect.y = self.rect.y
-
             # Check if reached edge and should exit
             if self.direction == 1 and self.rect.left > self.settings.screen_width:
                 # Exited right side, prepare to come back from left
@@ -331,7 +285,7 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
     def _get_random_vector(self):
         """Get random movement vector for centurionkitty (similar to level 3 alien)"""
         while True:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = rng.uniform(0, 2 * math.pi)
             deg = math.degrees(angle) % 180
             if 22.5 <= deg <= 157.5:
                 continue
@@ -343,11 +297,11 @@ class BonusWaveEnemy(pygame.sprite.Sprite):
         """Set target player for tracking"""
         self.target_player = player
     
-    def get_collision_rect(self):
-        """Get the rect to use for collision detection (uses hitbox_rect if available)"""
-        if self.hitbox_rect is not None:
-            return self.hitbox_rect
-        return self.rect
+    def hitbox_variant(self):
+        """Nyancat's hitbox flips with the sprite: True while it flies left"""
+        if self.enemy_type == "nyancat":
+            return getattr(self, "direction", 1) == -1
+        return None
     
     def draw(self):
         """Draw the enemy"""
@@ -408,18 +362,18 @@ class BonusWaveFirework(pygame.sprite.Sprite):
         self.vy = math.sin(angle) * bullet_speed
         self.x = float(center_x)
         self.y = float(center_y)
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = game_clock.get_ticks()
         self.lifetime = 2000  # 2 seconds
         
     def update(self):
         """Update firework bullet position"""
-        self.x += self.vx
-        self.y += self.vy
+        self.x += self.vx * game_clock.frame_scale
+        self.y += self.vy * game_clock.frame_scale
         self.rect.centerx = int(self.x)
         self.rect.centery = int(self.y)
         
         # Kill if lifetime expired or off screen
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if (now - self.spawn_time >= self.lifetime or 
             self.rect.bottom < 0 or self.rect.top > self.settings.screen_height_total or
             self.rect.right < 0 or self.rect.left > self.settings.screen_width):
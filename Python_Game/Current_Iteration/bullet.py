@@ -6,23 +6,47 @@
 #       bullet.py (this file)
 #       Visintainer_A_AlienGame.py (main file)
 #       base_settings.py 
+#       bullet_specs.py (per-game table of bullet sizes/colors/speeds)
+#       entity.py (slotted sprite base the bullets and firework particles are built on)
 #      
 # Author: Anthony Visintainer
 # Date: 8 December 2025
 # 
 # This module contains the code to determine bullet logic, and assign different features to different types of bullet.
 #
-# Note to self: for universal bullet settings (speed, colors, width, height, etc) see base_settings.py.
+# Note to self: for universal bullet settings (speed, colors, width, height, etc) see base_settings.py; which of them a
+# bullet gets is worked out once per game in bullet_specs.py.
+# Everything in here is an Entity (entity.py), not a pygame Sprite: the attributes each class uses are listed in its
+# __slots__, so a new self.something needs adding there too.
+# BulletGroup (bottom of the file) is the group the player and alien bullets live in: it counts shots per shooter.
 import math
-import random
+from game_rng import rng, fx_rng
 import pygame
+import game_clock
+import quality_governor
+import sprite_pool
+from sprite_pool import Pooled
+from entity import Entity, EntityGroup
+from bullet_specs import spec_for
 
-class Bullet(pygame.sprite.Sprite): 
+
+def owner_bit(owner):
+    """Collision-layer bit of a player: 1 << player_id for a ship (or its lifepod), 0 for anything that isn't a player.
+    Bullets carry their owner's bit and mom's mobile shields carry their player's (Shield.pass_mask), so "does this
+    bullet fly through this shield?" is one & instead of probing owner_ref/tracked_player/player_id per pair."""
+    player_id = getattr(owner, "player_id", None)
+    return 1 << player_id if player_id else 0
+
+
+class Bullet(Pooled, Entity): 
     """The Bullet Sprite. I chose to create enough parameters to have just one class, 
         that can be passed different attributes to create different bullets."""
+    __slots__ = ("settings", "screen", "owner_type", "owner_ref", "owner_level", "owner_id", "owner_bit", "kitty_shot",
+                 "squadron_ref", "firework", "direction", "spec", "speed", "color", "rect", "y",
+                 "blink_colors", "blink_rate_ms", "blink_index", "last_blink_change", "original_color")
     def __init__(self, settings, screen, 
                  x, y, direction, 
-                 owner_type, owner_level=1, owner_ref=None, squadron_ref=None, firework = None):
+                 owner_type, owner_level=1, owner_ref=None, squadron_ref=None, firework = None, spec=None):
         """BULLET PARAMETER DESCRIPTIONS:
         *settings*: movement speed, dimensions, color, etc will be called as attributes of this parameter, from variables in base_settings.py
         *screen*: the display surface the bullets will be mapped onto
@@ -30,133 +54,52 @@ class Bullet(pygame.sprite.Sprite):
         *direction*: whether the bullet moves up (-1) or down (+1)
         *owner_type*: who owns the bullet - player or some class of alien?
         *owner_level*: allow for multiple levels of aliens, and allow player bullets to level up.
-        *owner_ref*: reference to the player/alien that fired the bullet. None means it's no set to anyone. used for bullet # limits, tracking points, and owner-based attributes"""
+        *owner_ref*: reference to the player/alien that fired the bullet. None means it's no set to anyone. used for bullet # limits, tracking points, and owner-based attributes
+        *spec*: the BulletSpec (bullet_specs.py) to use; None = look it up from the owner parameters above"""
 
-        super().__init__() #call the super class - pygame sprite - and init for the bullet subclass. give the function variables to --->
+        super().__init__() #call the super class - Entity, our slimmed down pygame sprite - and init for the bullet subclass. give the function variables to --->
                             #--->pass the parameters to.
+        self.reset(settings, screen, x, y, direction, owner_type, owner_level, owner_ref, squadron_ref, firework, spec)
+
+    def reset(self, settings, screen, x, y, direction, owner_type, owner_level=1, owner_ref=None, squadron_ref=None, firework=None,
+              spec=None):
+        """Set the bullet up for a shot (same parameters as above). Runs from __init__, and again whenever
+        sprite_pool.py hands a dead bullet back out through Bullet.acquire()."""
         self.settings = settings
         self.screen = screen
         self.owner_type = owner_type
         self.owner_ref = owner_ref
         self.owner_level = owner_level
+        # Tagged once here so the collision passes don't have to dig through owner_ref: the player's id (0 = not a player's
+        # bullet) for stats, their collision-layer bit for shields that let their own bullets through, and whether a
+        # bonus wave kitty fired it (kitty shots also hurt squadrons and knock lifepods back)
+        self.owner_id = getattr(owner_ref, "player_id", None) or 0
+        self.owner_bit = owner_bit(owner_ref)
+        self.kitty_shot = owner_type == "kitty"
         self.squadron_ref = squadron_ref  # Track if bullet was fired by a squadron
         self.firework = firework  # Track if bullet is a firework
         self.direction = direction
+        self.blink_colors = None  # only kitty bullets blink (a recycled bullet may have been a kitty bullet before)
         
-        #Use if statements to distinguish size differences in types of bullets depending on who fired them:
-        if owner_type == "boss":
-            width = settings.boss_bullet_width
-            height = settings.boss_bullet_height
-            self.color = settings.boss_bullet_color
-            self.speed = settings.boss_bullet_speed
-
-        #use if and elif statements to distinguish bullet colors and speeds:
-        elif owner_type == "player":
-            # Check if this is a lifepod bullet (lifepods have 'state' attribute) or squadron bullet (has squadron_ref)
-            if owner_ref and hasattr(owner_ref, 'state'):
-                # Lifepod bullets: 1/2 size of normal player bullets
-                width = settings.bullet_width // 2  # 2 pixels wide
-                height = settings.bullet_height // 2  # 8 pixels tall
-            elif squadron_ref is not None:
-                # Squadron bullets: 1/2 size of normal player bullets
-                width = settings.bullet_width // 2  # 2 pixels wide
-                height = settings.bullet_height // 2  # 8 pixels tall
-            elif firework is not None:
-                # Firework bullets: celebratory firework bullets
-                width = settings.player_firework_width  # 4 pixels wide
-                height = settings.player_firework_height  # 4 pixels tall
-                color_choice = random.randint(0, len(settings.player_firework_colors) - 1)
-                self.color = settings.player_firework_colors[color_choice]
-                self.speed = settings.player_firework_speed
-            else:
-                # Normal player bullets
-                width = settings.bullet_width  # 4 pixels wide
-                height = settings.bullet_height  # 16 pixels tall
-            
-            # Firework bullets should not inherit normal/level-11 bullet visuals/speeds
-            if firework is None:
-                if owner_level == 11: #bullets will look special and fly faster if players are level 11.
-                    self.speed = settings.lvl11_bullet_speed
-                    self.color = settings.lvl11_bullet_color
-                else: # if not level 11, bullets will look normal.
-                    self.color = settings.player_bullet_color
-                    self.speed = settings.bullet_speed
-            
-        elif owner_type == "alien" and owner_level == 5: # destroyer bullets are slightly thicker, slower, and whitish purple
-            width = settings.destroyer_bullet_width
-            height = settings.destroyer_bullet_height
-            self.color = settings.destroyerandcruiser_bullet_color
-            self.speed = settings.alien_bullet_speed - 0.1
-        elif owner_type == "alien" and owner_level == 6: # cruiser bullets are much thicker and much slower
-            width = settings.cruiser_bullet_width
-            height = settings.cruiser_bullet_height
-            self.color = settings.destroyerandcruiser_bullet_color
-            self.speed = settings.alien_bullet_speed - 0.25
-        elif owner_type == "alien" and owner_level == 7: # lazer tankers fire a stream of, thin, red, fast laser. dangerous.
-            width = settings.laztanker_bullet_width
-            height = settings.laztanker_bullet_height
-            self.color = settings.laztanker_bullet_color
-            self.speed = settings.alien_bullet_speed + 0.25
-            #TODO: drop interceptors here with firing the double-tiny bullet, 4 pixels up and 4 pixels down from their center-(frontside) coordinate
-        elif owner_type == "alien":
-            width = settings.alien_bullet_width
-            height = settings.alien_bullet_height
-            self.color = settings.alien_bullet_color
-            self.speed = settings.alien_bullet_speed
-        elif owner_type == "kitty":
-            # Bonus wave enemy bullets
-            kitty_type_map = {
-                10: "loaf",      # Loafkitty
-                11: "centurion", # Centurionkitty
-                12: "emperor",  # Emperorkitty
-                13: "bluewhale", # Bluewhalekitty
-                14: "ninja"     # Ninjakitty (if it fires)
-            }
-            kitty_type = kitty_type_map.get(owner_level, "loaf")
-            
-            # Set size based on kitty type
-            if kitty_type == "loaf":
-                width = settings.loafkitty_bullet_width
-                height = settings.loafkitty_bullet_height
-            elif kitty_type == "bluewhale":
-                width = settings.bluewhalekitty_bullet_width
-                height = settings.bluewhalekitty_bullet_height
-            else:  # centurion, emperor, ninja
-                width = settings.centurionkitty_bullet_width
-                height = settings.centurionkitty_bullet_height
-            
-            # Set speed
-            if kitty_type == "loaf":
-                self.speed = settings.loafkitty_bullet_speed
-            elif kitty_type == "bluewhale":
-                self.speed = settings.bluewhalekitty_bullet_speed
-            else:
-                self.speed = settings.centurionkitty_bullet_speed
-            
-            # Set initial color and blink colors
-            if kitty_type == "loaf":
-                self.color = settings.loafkitty_bullet_color
-                self.blink_colors = [settings.loafkitty_bullet_color, (255, 255, 255)]  # Yellow and white
-                self.blink_rate_ms = settings.loafkitty_bullet_blink_rate_ms
-            elif kitty_type == "centurion":
-                self.color = settings.centurionkitty_bullet_color
-                self.blink_colors = [(255, 255, 255), settings.centurionkitty_bullet_color]  # White and red
-                self.blink_rate_ms = settings.centurionkitty_bullet_blink_rate_ms
-            elif kitty_type == "emperor":
-                self.color = settings.emperorkitty_bullet_color
-                self.blink_colors = [(255, 255, 255), settings.emperorkitty_bullet_color]  # White and purple
-                self.blink_rate_ms = settings.emperorkitty_bullet_blink_rate_ms
-            elif kitty_type == "bluewhale":
-                self.color = settings.bluewhalekitty_bullet_colors[0]  # First blue color
-                self.blink_colors = settings.bluewhalekitty_bullet_colors  # Two blue colors
-                self.blink_rate_ms = settings.bluewhalekitty_bullet_blink_rate_ms
-            
-            # Initialize blinking state
+        # Size, color, speed and blink palette come from the game's precompiled table (bullet_specs.py)
+        if spec is None:
+            spec = spec_for(settings, owner_type, owner_level, owner_ref, squadron_ref, firework)
+        self.spec = spec
+        width = spec.width
+        height = spec.height
+        self.speed = spec.speed
+        if spec.random_colors is not None: # firework bullets get a random celebratory color per shot
+            self.color = spec.random_colors[rng.randint(0, len(spec.random_colors) - 1)]
+        else:
+            self.color = spec.color
+        if spec.blink_colors: # kitty bullets blink between their colors
+            self.blink_colors = spec.blink_colors
+            self.blink_rate_ms = spec.blink_rate_ms
             self.blink_index = 0
-            self.last_blink_change = pygame.time.get_ticks()
+            self.last_blink_change = game_clock.get_ticks()
             self.original_color = self.color
 
-        #returning to attributes of the bullet class, we make good on width and height in those if statements.
+        #returning to attributes of the bullet class, we make good on width and height from the spec.
         self.rect = pygame.Rect(0, 0, width, height) #says: create the bullet rect in the top corner, and --->
                                                     #--->match whatever width and height parameters are set above.
         self.rect.centerx = x #the bullet rects will be placed at the x and y center of their rect.
@@ -166,13 +109,13 @@ class Bullet(pygame.sprite.Sprite):
         self.y = (float(self.rect.y))
 
     def update(self): #an update function, to allow the class to move as part of the game loop.
-        self.y += self.speed * self.direction #take the direction (which will be either 1 or -1) and multiply by speed for bullet mvmt\
+        self.y += self.speed * self.direction * game_clock.frame_scale #take the direction (which will be either 1 or -1) and multiply by speed for bullet mvmt\
 
         self.rect.y= int(self.y) #sync the bullet's rect to the new location calculated in the prev line
         
-        # Handle blinking for kitty bullets (and any other bullets with blink_colors)
-        if hasattr(self, 'blink_colors') and self.blink_colors:
-            current_time = pygame.time.get_ticks()
+        # Handle blinking for kitty bullets (and any other bullets with blink_colors) - cosmetic, frozen under heavy load
+        if hasattr(self, 'blink_colors') and self.blink_colors and quality_governor.bullet_blink_enabled():
+            current_time = game_clock.get_ticks()
             blink_rate = getattr(self, 'blink_rate_ms', 40)
             if current_time - self.last_blink_change >= blink_rate:
                 self.blink_index = (self.blink_index + 1) % len(self.blink_colors)
@@ -188,13 +131,20 @@ class Bullet(pygame.sprite.Sprite):
         """>>>EVENTUALLY REPLACE WITH PNG SPRITES THAT GET BLITTED ON TO SCREEN"""
 
 
-class NyancatBullet(pygame.sprite.Sprite):
+class NyancatBullet(Pooled, Entity):
     """Special rainbow-flashing square bullet for nyancat"""
+    __slots__ = ("settings", "screen", "owner_ref", "kitty_shot", "direction", "rect", "y", "speed",
+                 "rainbow_colors", "color_index", "last_color_change", "color")
     def __init__(self, settings, screen, x, y, direction, owner_ref=None):
         super().__init__()
+        self.reset(settings, screen, x, y, direction, owner_ref)
+
+    def reset(self, settings, screen, x, y, direction, owner_ref=None):
+        """Set up a fresh or recycled (sprite_pool.py) nyancat bullet."""
         self.settings = settings
         self.screen = screen
         self.owner_ref = owner_ref
+        self.kitty_shot = True  # only the nyancat fires these (same tag as a kitty Bullet)
         self.direction = direction
 
         # Create square bullet (same width/height)
@@ -214,7 +164,7 @@ class NyancatBullet(pygame.sprite.Sprite):
             (255, 0, 255)   # Violet/Purple
         ]
         self.color_index = 0
-        self.last_color_change = pygame.time.get_ticks()
+        self.last_color_change = game_clock.get_ticks()
         self.color = self.rainbow_colors[0]
 
         # Slow descent
@@ -224,12 +174,12 @@ class NyancatBullet(pygame.sprite.Sprite):
     def update(self):
         """Update bullet position and color"""
         # Update position (slow descent)
-        self.y += self.speed * self.direction
+        self.y += self.speed * self.direction * game_clock.frame_scale
         self.rect.y = int(self.y)
 
-        # Cycle through rainbow colors every millisecond
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_color_change >= 1:  # 1ms = very fast cycling
+        # Cycle through rainbow colors every millisecond (cosmetic, frozen under heavy load)
+        current_time = game_clock.get_ticks()
+        if current_time - self.last_color_change >= 1 and quality_governor.bullet_blink_enabled():  # 1ms = very fast cycling
             self.color_index = (self.color_index + 1) % len(self.rainbow_colors)
             self.color = self.rainbow_colors[self.color_index]
             self.last_color_change = current_time
@@ -243,11 +193,18 @@ class NyancatBullet(pygame.sprite.Sprite):
         pygame.draw.rect(self.screen, self.color, self.rect)
 
 
-class VictoryFireworkSpark(pygame.sprite.Sprite):
+class VictoryFireworkSpark(Pooled, Entity):
     """Cosmetic victory firework spark: moves outward, then fades out near the end of its lifetime."""
+    __slots__ = ("settings", "screen", "color_rgb", "size", "rect", "x", "y", "speed", "vx", "vy",
+                 "spawn_time", "lifetime_ms", "fade_ms")
     def __init__(self, settings, screen, x, y, color_rgb, angle_rad, size: int = 4, speed: float | None = None,
                  lifetime_ms: int | None = None, fade_ms: int | None = None):
         super().__init__()
+        self.reset(settings, screen, x, y, color_rgb, angle_rad, size, speed, lifetime_ms, fade_ms)
+
+    def reset(self, settings, screen, x, y, color_rgb, angle_rad, size: int = 4, speed: float | None = None,
+              lifetime_ms: int | None = None, fade_ms: int | None = None):
+        """Set up a fresh or recycled (sprite_pool.py) spark."""
         self.settings = settings
         self.screen = screen
         self.color_rgb = tuple(color_rgb)
@@ -261,11 +218,11 @@ class VictoryFireworkSpark(pygame.sprite.Sprite):
         self.vx = math.cos(angle_rad) * self.speed
         self.vy = math.sin(angle_rad) * self.speed
 
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = game_clock.get_ticks()
         if lifetime_ms is None:
             min_ms = int(getattr(settings, "victory_firework_spark_lifetime_min_ms", 2000))
             max_ms = int(getattr(settings, "victory_firework_spark_lifetime_max_ms", 3000))
-            lifetime_ms = random.randint(min_ms, max_ms)
+            lifetime_ms = fx_rng.randint(min_ms, max_ms)  # fx_rng: spark counts change with quality_governor
         self.lifetime_ms = int(lifetime_ms)
 
         if fade_ms is None:
@@ -273,17 +230,18 @@ class VictoryFireworkSpark(pygame.sprite.Sprite):
         self.fade_ms = int(max(1, fade_ms))
 
     def update(self):
-        self.x += self.vx
-        self.y += self.vy
+        dt = game_clock.frame_scale  # velocities are per 60fps frame
+        self.x += self.vx * dt
+        self.y += self.vy * dt
         self.rect.x = int(self.x)
         self.rect.y = int(self.y)
 
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if now - self.spawn_time >= self.lifetime_ms:
             self.kill()
 
     def draw(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         age = now - self.spawn_time
         remaining = self.lifetime_ms - age
 
@@ -297,14 +255,19 @@ class VictoryFireworkSpark(pygame.sprite.Sprite):
         self.screen.blit(surf, self.rect.topleft)
 
 
-class VictoryFireworkShell(pygame.sprite.Sprite):
+class VictoryFireworkShell(Entity):
     """Cosmetic victory firework shell (player): blinks and explodes into 8-way sparks before leaving the top."""
+    __slots__ = ("settings", "screen", "owner_ref", "owner_id", "owner_bit", "squadron_ref", "fireworks_group",
+                 "shell_size", "spark_size", "rect", "y", "base_speed", "current_speed", "target_dist", "start_top",
+                 "decel_zone", "visible", "blink_rate_ms", "last_blink_change", "color_rgb")
     def __init__(self, settings, screen, x, y, fireworks_group, owner_ref=None, squadron_ref=None,
                  shell_size: int = 6, spark_size: int = 4):
         super().__init__()
         self.settings = settings
         self.screen = screen
         self.owner_ref = owner_ref
+        self.owner_id = getattr(owner_ref, "player_id", None) or 0  # same tags as Bullet - shells fly in player_bullets
+        self.owner_bit = owner_bit(owner_ref)
         self.squadron_ref = squadron_ref
         self.fireworks_group = fireworks_group
 
@@ -321,7 +284,7 @@ class VictoryFireworkShell(pygame.sprite.Sprite):
         # Compute target distance so explosion happens at least 100px before the shell exits the top.
         start_top = int(self.rect.top)
         max_dist = max(100, start_top - 100)
-        self.target_dist = random.randint(100, max_dist) if max_dist > 100 else 100
+        self.target_dist = rng.randint(100, max_dist) if max_dist > 100 else 100
         self.start_top = float(start_top)
         # How far (in px) before detonation we begin slowing down
         self.decel_zone = float(getattr(settings, "victory_firework_shell_decel_zone_px", 55.0))
@@ -329,14 +292,16 @@ class VictoryFireworkShell(pygame.sprite.Sprite):
         # Alpha blinking (implemented as visible/invisible toggling)
         self.visible = True
         self.blink_rate_ms = int(getattr(settings, "victory_firework_shell_blink_rate_ms", 40))
-        self.last_blink_change = pygame.time.get_ticks()
+        self.last_blink_change = game_clock.get_ticks()
 
         self.color_rgb = (255, 255, 255)
 
     def update(self):
-        # Blink toggle
-        now = pygame.time.get_ticks()
-        if now - self.last_blink_change >= self.blink_rate_ms:
+        # Blink toggle (cosmetic - under heavy load the shell just stays visible)
+        now = game_clock.get_ticks()
+        if not quality_governor.bullet_blink_enabled():
+            self.visible = True
+        elif now - self.last_blink_change >= self.blink_rate_ms:
             self.visible = not self.visible
             self.last_blink_change = now
 
@@ -355,7 +320,7 @@ class VictoryFireworkShell(pygame.sprite.Sprite):
             self.current_speed = self.base_speed
 
         # Move up
-        self.y -= self.current_speed
+        self.y -= self.current_speed * game_clock.frame_scale
         self.rect.y = int(self.y)
 
         # Explode on reaching target travel distance
@@ -372,7 +337,7 @@ class VictoryFireworkShell(pygame.sprite.Sprite):
     def _explode(self):
         # One random bloom color per explosion
         colors = getattr(self.settings, "player_firework_colors", [(255, 255, 255)])
-        bloom_color = random.choice(list(colors)) if colors else (255, 255, 255)
+        bloom_color = rng.choice(list(colors)) if colors else (255, 255, 255)
 
         difficulty = getattr(self.settings, "difficulty_mode", "normal").lower()
         if difficulty == "hard":
@@ -381,8 +346,9 @@ class VictoryFireworkShell(pygame.sprite.Sprite):
         else:
             sets = int(getattr(self.settings, "victory_firework_spark_sets_normal", 1))
             sparks_per_set = int(getattr(self.settings, "victory_firework_sparks_per_set_normal", 8))
-        sets = max(1, sets)
-        sparks_per_set = max(1, sparks_per_set)
+        # Cosmetic only: quality_governor thins the bursts out when frames run over budget
+        sets = max(1, quality_governor.firework_sets(sets))
+        sparks_per_set = max(1, round(sparks_per_set * quality_governor.firework_density()))
 
         cx, cy = self.rect.centerx, self.rect.centery
         if sets <= 1:
@@ -393,7 +359,7 @@ class VictoryFireworkShell(pygame.sprite.Sprite):
                 base_speed = float(getattr(self.settings, "player_firework_bloom_speed", 9))
                 slowdown = float(getattr(self.settings, "victory_firework_spark_speed_slowdown", 1.0))
                 spark_speed = max(0.0, base_speed - slowdown)
-                spark = VictoryFireworkSpark(
+                spark = VictoryFireworkSpark.acquire(
                     self.settings, self.screen,
                     cx, cy,
                     bloom_color,
@@ -432,6 +398,7 @@ class VictoryFireworkShell(pygame.sprite.Sprite):
 
 class VictoryFireworkShellSmall(VictoryFireworkShell):
     """Smaller cosmetic victory firework shell for squadrons/lifepods (3x3 shell, 2x2 sparks)."""
+    __slots__ = ()
     def __init__(self, settings, screen, x, y, fireworks_group, owner_ref=None, squadron_ref=None):
         super().__init__(
             settings, screen, x, y, fireworks_group,
@@ -440,8 +407,10 @@ class VictoryFireworkShellSmall(VictoryFireworkShell):
         )
 
 
-class VictoryFireworkBurst(pygame.sprite.Sprite):
+class VictoryFireworkBurst(Entity):
     """Spawns multiple radial spark sets spaced out in time (used for multi-bloom difficulty effects)."""
+    __slots__ = ("settings", "screen", "fireworks_group", "color_rgb", "spark_size", "sets_total", "set_delay_ms",
+                 "sparks_per_set", "cx", "cy", "spawned_sets", "next_set_time")
     def __init__(self, settings, screen, x, y, fireworks_group, color_rgb, spark_size: int, sets: int, set_delay_ms: int, sparks_per_set: int = 8):
         super().__init__()
         self.settings = settings
@@ -456,7 +425,7 @@ class VictoryFireworkBurst(pygame.sprite.Sprite):
         self.cy = int(y)
 
         self.spawned_sets = 0
-        self.next_set_time = pygame.time.get_ticks()  # spawn first set immediately
+        self.next_set_time = game_clock.get_ticks()  # spawn first set immediately
 
     def _spawn_one_set(self):
         step = (2.0 * math.pi) / float(self.sparks_per_set)
@@ -465,7 +434,7 @@ class VictoryFireworkBurst(pygame.sprite.Sprite):
             base_speed = float(getattr(self.settings, "player_firework_bloom_speed", 9))
             slowdown = float(getattr(self.settings, "victory_firework_spark_speed_slowdown", 1.0))
             spark_speed = max(0.0, base_speed - slowdown)
-            spark = VictoryFireworkSpark(
+            spark = VictoryFireworkSpark.acquire(
                 self.settings, self.screen,
                 self.cx, self.cy,
                 self.color_rgb,
@@ -478,7 +447,7 @@ class VictoryFireworkBurst(pygame.sprite.Sprite):
             self.fireworks_group.add(spark)
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if self.spawned_sets >= self.sets_total:
             self.kill()
             return
@@ -490,4 +459,44 @@ class VictoryFireworkBurst(pygame.sprite.Sprite):
 
     def draw(self):
         # Nothing visible for the controller sprite itself
-        return
\ No newline at end of file
+        return
+
+class BulletGroup(EntityGroup):
+    """The player_bullets / alien_bullets group: an EntityGroup that keeps a live count of projectiles per shooter.
+
+    "How many of mine are still flying?" is count_owned(shooter) instead of a scan of the whole group per shot (or per
+    frame, for the lifepods). A projectile counts for its squadron_ref if it has one (squadron shots), otherwise for its
+    owner_ref (the ship, lifepod, alien or kitty that fired it) - both are set when it's made and never change while
+    it's in the group. The counts are keyed on the shooter object itself, so a pooled shooter (level 1 fleet aliens)
+    is kept off the free lists until its count here is 0 - a recycled alien always starts at count_owned() == 0
+    (sprite_pool.hold_while_counted(), checked by pool_check.py)."""
+
+    def __init__(self, *sprites):
+        self._owned = {}  # shooter -> projectiles of theirs in the group
+        super().__init__(*sprites)
+        sprite_pool.hold_while_counted(self)
+
+    def count_owned(self, shooter):
+        """Projectiles in this group fired by shooter (a squadron counts its own shots, a ship/alien everything else)."""
+        return self._owned.get(shooter, 0)
+
+    @staticmethod
+    def _shooter(sprite):
+        squadron = getattr(sprite, "squadron_ref", None)
+        return squadron if squadron is not None else getattr(sprite, "owner_ref", None)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        shooter = self._shooter(sprite)
+        if shooter is not None:
+            self._owned[shooter] = self._owned.get(shooter, 0) + 1
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        shooter = self._shooter(sprite)
+        if shooter is not None:
+            left = self._owned[shooter] - 1
+            if left:
+                self._owned[shooter] = left
+            else:
+                del self._owned[shooter]  # don't keep dead ships/aliens alive as dict keys
@@ -0,0 +1,141 @@
+#bullet_specs.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       bullet_specs.py (this file)
+#       base_settings.py (values are read from the game's Settings object)
+#
+# Author: Anthony Visintainer
+#
+# What a Bullet looks like and how fast it flies, as one table instead of the if/elif chain Bullet.__init__ used to
+# run on every single shot (owner_type, owner_level, lifepod/squadron/firework, kitty type -> width, height, color,
+# speed, blink palette).
+#
+# build_bullet_specs(settings) works them all out ONCE per game, at the end of _full_game_initialization right after
+# the multiplayer_resizer bullet sizes have been written back to settings, and the game keeps the table on
+# settings.bullet_specs (like settings.alien_images) so every place that fires - the main file, squadron ships in
+# powerups.py - sees the same one. Keys:
+#
+#   ("boss", None)                      boss bullets
+#   ("player", size, style)             size "normal" / "lifepod" / "squadron" / "firework" (halved for lifepods and
+#                                       squadrons), style "normal" / "lvl11" / "firework" (color and speed)
+#   ("alien", 5 / 6 / 7)                destroyer, cruiser, lazertanker bullets
+#   ("alien", None)                     every other alien level
+#   ("kitty", "loaf" ... "ninja")       bonus wave bullets, with their blink palettes
+#
+# spec_for() turns a Bullet's constructor arguments into its spec; callers that fire the same bullet over and over can
+# look the spec up once and pass it in (Bullet(..., spec=...)). Since the table is rebuilt for every game, a bullet
+# never flies with the sizes of an earlier game's player count - it always matches the settings the game started with.
+
+
+class BulletSpec:
+    """One kind of bullet. Read-only once built - every bullet of that kind shares it."""
+    __slots__ = ("width", "height", "color", "speed", "random_colors", "blink_colors", "blink_rate_ms")
+
+    def __init__(self, width, height, color=None, speed=0, random_colors=None, blink_colors=None, blink_rate_ms=40):
+        self.width = width
+        self.height = height
+        self.color = color  # None when random_colors is set
+        self.speed = speed
+        self.random_colors = random_colors  # a color is picked from these per shot (game_rng, firework bullets)
+        self.blink_colors = blink_colors  # colors cycled through while flying (kitty bullets), None = no blinking
+        self.blink_rate_ms = blink_rate_ms
+
+
+# kitty owner_level -> kitty type (anything else fires loaf bullets)
+KITTY_TYPES = {10: "loaf", 11: "centurion", 12: "emperor", 13: "bluewhale", 14: "ninja"}
+
+
+def _player_specs(settings, specs):
+    sizes = {
+        "normal": (settings.bullet_width, settings.bullet_height),
+        "lifepod": (settings.bullet_width // 2, settings.bullet_height // 2),
+        "squadron": (settings.bullet_width // 2, settings.bullet_height // 2),
+        "firework": (settings.player_firework_width, settings.player_firework_height),
+    }
+    for size, (width, height) in sizes.items():
+        specs[("player", size, "normal")] = BulletSpec(width, height, settings.player_bullet_color, settings.bullet_speed)
+        specs[("player", size, "lvl11")] = BulletSpec(width, height, settings.lvl11_bullet_color, settings.lvl11_bullet_speed)
+        specs[("player", size, "firework")] = BulletSpec(width, height, speed=settings.player_firework_speed,
+                                                         random_colors=tuple(settings.player_firework_colors))
+
+
+def _alien_specs(settings, specs):
+    # there's no boss_bullet_speed setting yet (nothing fires "boss" bullets) - until there is, they fly at alien speed
+    specs[("boss", None)] = BulletSpec(settings.boss_bullet_width, settings.boss_bullet_height, settings.boss_bullet_color,
+                                       getattr(settings, "boss_bullet_speed", settings.alien_bullet_speed))
+    # destroyer bullets are slightly thicker and slower, cruiser bullets much thicker and much slower,
+    # lazertankers fire a stream of thin, fast, red laser
+    specs[("alien", 5)] = BulletSpec(settings.destroyer_bullet_width, settings.destroyer_bullet_height,
+                                     settings.destroyerandcruiser_bullet_color, settings.alien_bullet_speed - 0.1)
+    specs[("alien", 6)] = BulletSpec(settings.cruiser_bullet_width, settings.cruiser_bullet_height,
+                                     settings.destroyerandcruiser_bullet_color, settings.alien_bullet_speed - 0.25)
+    specs[("alien", 7)] = BulletSpec(settings.laztanker_bullet_width, settings.laztanker_bullet_height,
+                                     settings.laztanker_bullet_color, settings.alien_bullet_speed + 0.25)
+    specs[("alien", None)] = BulletSpec(settings.alien_bullet_width, settings.alien_bullet_height,
+                                        settings.alien_bullet_color, settings.alien_bullet_speed)
+
+
+def _kitty_specs(settings, specs):
+    white = (255, 255, 255)
+    specs[("kitty", "loaf")] = BulletSpec(
+        settings.loafkitty_bullet_width, settings.loafkitty_bullet_height, settings.loafkitty_bullet_color,
+        settings.loafkitty_bullet_speed, blink_colors=(settings.loafkitty_bullet_color, white),  # yellow and white
+        blink_rate_ms=settings.loafkitty_bullet_blink_rate_ms)
+    specs[("kitty", "centurion")] = BulletSpec(
+        settings.centurionkitty_bullet_width, settings.centurionkitty_bullet_height,
+        settings.centurionkitty_bullet_color, settings.centurionkitty_bullet_speed,
+        blink_colors=(white, settings.centurionkitty_bullet_color),  # white and red
+        blink_rate_ms=settings.centurionkitty_bullet_blink_rate_ms)
+    specs[("kitty", "emperor")] = BulletSpec(
+        settings.centurionkitty_bullet_width, settings.centurionkitty_bullet_height,  # emperors fire centurion-sized bullets
+        settings.emperorkitty_bullet_color, settings.centurionkitty_bullet_speed,
+        blink_colors=(white, settings.emperorkitty_bullet_color),  # white and purple
+        blink_rate_ms=settings.emperorkitty_bullet_blink_rate_ms)
+    specs[("kitty", "bluewhale")] = BulletSpec(
+        settings.bluewhalekitty_bullet_width, settings.bluewhalekitty_bullet_height,
+        settings.bluewhalekitty_bullet_colors[0], settings.bluewhalekitty_bullet_speed,
+        blink_colors=tuple(settings.bluewhalekitty_bullet_colors),  # two blues
+        blink_rate_ms=settings.bluewhalekitty_bullet_blink_rate_ms)
+    # ninja kitties never had a bullet color of their own - centurion-sized, centurion red, no blinking
+    specs[("kitty", "ninja")] = BulletSpec(
+        settings.centurionkitty_bullet_width, settings.centurionkitty_bullet_height,
+        settings.centurionkitty_bullet_color, settings.centurionkitty_bullet_speed)
+
+
+def build_bullet_specs(settings):
+    """The key -> BulletSpec table for this game's settings (see the notes at the top)."""
+    specs = {}
+    _player_specs(settings, specs)
+    _alien_specs(settings, specs)
+    _kitty_specs(settings, specs)
+    return specs
+
+
+def spec_for(settings, owner_type, owner_level=1, owner_ref=None, squadron_ref=None, firework=None):
+    """The BulletSpec for a shot with these Bullet constructor arguments."""
+    specs = getattr(settings, "bullet_specs", None)
+    if specs is None:  # a Bullet made before any game was set up (menus, tools) - build the table now
+        specs = settings.bullet_specs = build_bullet_specs(settings)
+    if owner_type == "alien":
+        return specs.get(("alien", owner_level)) or specs[("alien", None)]
+    if owner_type == "player":
+        if owner_ref is not None and hasattr(owner_ref, "state"):  # lifepods have a 'state' attribute
+            size = "lifepod"
+        elif squadron_ref is not None:
+            size = "squadron"
+        elif firework is not None:
+            size = "firework"
+        else:
+            size = "normal"
+        if firework is not None:
+            style = "firework"  # firework bullets don't take on the normal/level 11 look
+        else:
+            style = "lvl11" if owner_level == 11 else "normal"
+        return specs[("player", size, style)]
+    if owner_type == "kitty":
+        return specs[("kitty", KITTY_TYPES.get(owner_level, "loaf"))]
+    if owner_type == "boss":
+        return specs[("boss", None)]
+    raise ValueError(f"Unknown bullet owner type: {owner_type}")
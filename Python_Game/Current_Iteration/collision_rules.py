@@ -0,0 +1,179 @@
+#collision_rules.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       collision_rules.py (this file)
+#       base_settings.py (values are read from the game's Settings object)
+#       bullet.py, alien.py (bullet classes for bullet_kind())
+#
+# Author: Anthony Visintainer
+#
+# What a hit DOES, as one table instead of if/elif chains. The collision passes (_do_collisions, the shockwave loop in
+# _update_game_state, _player_alien_collision and _do_bonus_wave_collisions) used to each have their own copy of
+# "if alien.level == 5: destroyer frames, destroyer death sound... elif alien.level == 6: ..." and the same for
+# enemy_type in the bonus wave, nyancat bullets and who owns a bullet - a few hundred lines deciding damage, sounds,
+# death animations and score per colliding pair.
+#
+# Now build_collision_rules(settings) works all of that out ONCE per game (at the end of _full_game_initialization,
+# after the damage frames are loaded) into a dict keyed by (source, target kind):
+#
+#   source            target kind         what's in the HitRule
+#   "player_bullet"   alien level 1-7     instakill or 1 damage stage, death sound/animation, score, powerup drop
+#   "shockwave"       alien level         instakill (up to settings.shockwave_kill_max_alien_level) or fixed damage
+#   "shield"          alien level         damage to the shield, collision sound - the alien always dies, no drop/score
+#   "ram"             alien level         damage/knockback to the player, damage stages to the alien
+#   "player_bullet"   kitty enemy_type    firework colors, score, powerup drop
+#   "shockwave"       kitty enemy_type    2 damage, firework colors, score, powerup drop
+#   "dad_shockwave"   kitty enemy_type    1 damage per frame, firework colors (no owner - no score, no drop)
+#   "shield"          kitty enemy_type    damage to the shield (the kitty always dies)
+#   "kitty_shot"      kitty enemy_type    damage its bullets do to shields
+#   "alien_bullet"    bullet kind         damage to players/shields, knockback (normal waves)
+#   "kitty_bullet"    bullet kind         same, in the bonus wave (nyancat bullets hit players harder there)
+#   "shield_sound"    (owner_type, level) sound a bullet makes hitting a shield
+#
+# Bullet kinds are "bullet", "nyancat" (NyancatBullet) and "bomb" (LaserminionBomb) - see bullet_kind().
+# A missing key means "this pair does nothing" (e.g. shockwaves vs. level 8+, or aliens the shockwave settings leave out).
+# Per pair the collision code only does rules.get((source, kind)) and hands the rule to one shared resolver
+# (_resolve_alien_hit / _resolve_kitty_hit in the main file), which applies the damage and, on a kill, the death
+# sound, hum/laser channel stop, death animation, powerup drop and score in one fixed order.
+from alien import LaserminionBomb
+from bullet import NyancatBullet
+
+
+class HitRule:
+    """What one source does to one kind of target. Fields that don't apply to a pair stay at their defaults."""
+    __slots__ = ("instakill", "damage", "frames", "exact_hitbox", "sound", "death_sound", "death_animation",
+                 "stop_laser_fire", "powerup_drop", "points", "shield_damage", "player_damage", "knockback",
+                 "firework_colors", "rainbow")
+
+    def __init__(self, **fields):
+        self.instakill = False  # dies on this hit no matter its damage stage
+        self.damage = 0  # damage stages added to the target (aliens) / hits taken (kitties)
+        self.frames = None  # damage frames of a big alien (damage_stage past the last frame = destroyed)
+        self.exact_hitbox = False  # check the compound hitbox before counting the hit (shockwave vs. big aliens)
+        self.sound = None  # played on every hit
+        self.death_sound = None  # played when the target dies
+        self.death_animation = False  # emit a DEATH_ANIMATION (destroyers, cruisers, lasertankers)
+        self.stop_laser_fire = False  # stop the lasertanker firing sound on death
+        self.powerup_drop = False  # roll for a powerup drop on death
+        self.points = None  # score for whoever gets the kill (None = the kill isn't credited)
+        self.shield_damage = 0  # damage done to a shield
+        self.player_damage = 0  # damage done to a player ship
+        self.knockback = None  # what happens to the player ship: "down", "side" (bomb) or "bump" (big alien ram)
+        self.firework_colors = None  # 8 firework colors for a kitty hit
+        self.rainbow = False  # nyan cat: firework colors rotate by one each hit
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+
+def bullet_kind(bullet):
+    """"nyancat", "bomb" or "bullet" - the part of a bullet's type the rules care about."""
+    if isinstance(bullet, NyancatBullet):
+        return "nyancat"
+    if isinstance(bullet, LaserminionBomb):
+        return "bomb"
+    return "bullet"
+
+
+def _alien_death_sound(level, killed_by_collision=False):
+    # level 4 has its own crash sound when it dies by running into something; levels 1-3 are silent (too many of them)
+    if level == 4:
+        return "alien_lvl4_collision" if killed_by_collision else "alien_lvl1to3_death"
+    return {5: "alien_destroyer_death", 6: "alien_cruiser_death", 7: "alien_laztanker_death"}.get(level)
+
+
+def _alien_rules(settings, rules):
+    frames = {5: settings.destroyer_hitframes, 6: settings.cruiser_hitframes, 7: settings.laztanker_hitframes}
+    shield_damage = {1: 1, 2: 1, 3: 1, 4: 3, 5: 4, 6: 5, 7: 100}  # lazertankers obliterate shields completely
+    kill_max = settings.shockwave_kill_max_alien_level
+    for level in range(1, 8):
+        big = level >= 5
+        death = dict(death_sound=_alien_death_sound(level), death_animation=big, stop_laser_fire=level == 7,
+                     powerup_drop=True)
+        points = level * ((level * 1/2) * 20)  # scoring equation
+
+        # player bullets: levels 1-4 die in one hit, big aliens go through their damage frames
+        rules[("player_bullet", level)] = HitRule(instakill=not big, damage=1, frames=frames.get(level), points=points,
+                                                  **death)
+
+        # shockwaves instakill the small ones and deal fixed damage to destroyers/cruisers/lasertankers
+        if level <= kill_max:
+            rules[("shockwave", level)] = HitRule(instakill=True, points=points, **death)
+        elif big:
+            rules[("shockwave", level)] = HitRule(damage=settings.shockwave_damage_amount, frames=frames[level],
+                                                  exact_hitbox=True, points=points, **death)
+
+        # running into a shield kills every alien; the shield takes damage by alien size
+        rules[("shield", level)] = HitRule(
+            instakill=True, shield_damage=shield_damage[level], death_animation=big, stop_laser_fire=level == 7,
+            sound="shield_collide_small_alien" if level < 4 else _alien_death_sound(level, killed_by_collision=True))
+
+        # ramming a player: level 4 crashes (knockback, 300 points), big aliens bump the player and take 5 damage
+        if level == 4:
+            rules[("ram", level)] = HitRule(instakill=True, player_damage=3, knockback="down", points=300,
+                                            sound="alien_lvl4_collision")
+        elif big:
+            rules[("ram", level)] = HitRule(damage=5, frames=frames[level], player_damage=2 if level == 5 else 4,
+                                            knockback="bump", sound="player_collide", **death)
+        else:
+            rules[("ram", level)] = HitRule(instakill=True, player_damage=1, sound="bullet_hit")
+
+
+def _kitty_rules(settings, rules):
+    scores = {"loaf": 100, "centurion": 200, "emperor": 300, "bluewhale": 500, "ninja": 250, "nyancat": 1000}
+    shot_damage = {"loaf": 4, "centurion": 4, "emperor": 6, "bluewhale": 8, "ninja": 5}
+    settings_colors = {
+        "loaf": settings.loafkitty_firework_color,
+        "centurion": settings.centurionkitty_firework_color,
+        "emperor": settings.emperorkitty_firework_color,
+        "bluewhale": settings.bluewhalekitty_firework_color,
+        "ninja": settings.ninjakitty_firework_color,
+    }
+    # bullet hits have always used their own colors (white sparks on the gray ninja kitty)
+    bullet_colors = dict(settings_colors, ninja=(255, 255, 255))
+    for enemy_type, points in scores.items():
+        rainbow = enemy_type == "nyancat"
+        if rainbow:
+            colors = list(settings.nyancat_rainbow_colors)
+            hit_colors = [(255, 0, 0), (255, 192, 203), (255, 165, 0), (0, 255, 0),
+                          (0, 255, 255), (0, 0, 255), (128, 0, 128), (255, 0, 0)]
+        else:
+            colors = [settings_colors[enemy_type]] * 8
+            hit_colors = [bullet_colors[enemy_type]] * 8
+        rules[("player_bullet", enemy_type)] = HitRule(damage=1, firework_colors=hit_colors, rainbow=rainbow,
+                                                       points=points, powerup_drop=True)
+        rules[("shockwave", enemy_type)] = HitRule(damage=2, firework_colors=colors, rainbow=rainbow, points=points,
+                                                   powerup_drop=True)
+        rules[("dad_shockwave", enemy_type)] = HitRule(damage=1, firework_colors=colors, rainbow=rainbow)
+        # ninja kitties cut straight through a shield - maximum damage
+        body_damage = len(settings.shield_colors) if enemy_type == "ninja" else shot_damage.get(enemy_type, 1)
+        rules[("shield", enemy_type)] = HitRule(instakill=True, shield_damage=body_damage)
+        rules[("kitty_shot", enemy_type)] = HitRule(shield_damage=shot_damage.get(enemy_type, 1))
+
+
+def _bullet_rules(rules):
+    # shield_damage of a bullet kind is also the multiplier on a kitty's own shot damage in the bonus wave
+    rules[("alien_bullet", "bullet")] = HitRule(player_damage=1, shield_damage=1)
+    rules[("alien_bullet", "bomb")] = HitRule(player_damage=1, shield_damage=1, knockback="side")
+    rules[("alien_bullet", "nyancat")] = HitRule(player_damage=2, shield_damage=2, knockback="down")
+    rules[("kitty_bullet", "bullet")] = HitRule(player_damage=1, shield_damage=1)
+    rules[("kitty_bullet", "bomb")] = HitRule(player_damage=1, shield_damage=1, knockback="side")
+    rules[("kitty_bullet", "nyancat")] = HitRule(player_damage=3, shield_damage=2, knockback="down")
+
+    # sound of a bullet hitting a shield, by who fired it: bluewhale kitties (13) and destroyers/cruisers fire big ones
+    for level in range(10, 14):  # kitties are levels 10-13
+        rules[("shield_sound", ("kitty", level))] = "shield_hit_big_bullet" if level == 13 else "shield_hit_small_bullet"
+    for level in (1, 2, 3):
+        rules[("shield_sound", ("alien", level))] = "shield_hit_small_bullet"
+    for level in (5, 6):
+        rules[("shield_sound", ("alien", level))] = "shield_hit_big_bullet"
+
+
+def build_collision_rules(settings):
+    """The (source, target kind) -> HitRule table for this game's settings (see the notes at the top)."""
+    rules = {}
+    _alien_rules(settings, rules)
+    _kitty_rules(settings, rules)
+    _bullet_rules(rules)
+    return rules
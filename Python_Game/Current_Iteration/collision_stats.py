@@ -0,0 +1,202 @@
+#collision_stats.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       collision_stats.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# Per-query collision counters, for choosing a collision backend per pass (grid, sweep, numpy - see
+# settings.collision_backend) from numbers instead of guesses. Switched on with settings.collision_stats_enabled,
+# headless_sim.py --collision-stats or benchmark.py --collision-stats.
+#
+# While it's on, the game's collision_grid is wrapped in an InstrumentedCollider, which times every groupcollide(),
+# spritecollide() and spritecollide_entering() and files the numbers under the two groups' names ("player_bullets x
+# aliens", "Shockwave x aliens" for one sprite against a group). The few collision checks that are still hand-written
+# loops (bonus-wave kitties vs. players, lifepods vs. kitties/bullets) report themselves through record().
+# For each query it keeps:
+#   calls      how many times it ran
+#   all_pairs  len(A) x len(B) - what plain pygame groupcollide would have tested
+#   tested     pairs that got as far as a rect check (what the backend's broad phase let through)
+#   rejected   pairs whose rects touched but the collided= check said no (compound hitboxes of cruisers, destroyers,
+#              ninja kitty and nyan cat; it's what _cruiser_collision_valid/_destroyer_collision_valid used to do)
+#   hits       pairs that collided
+#   ms         time spent in the query
+# per tick (last_tick()) and summed over the session (summary(), report(), write_csv()), with the per-tick average and
+# peak of all_pairs/tested - the number that says whether a pass is worth a fancier backend.
+# Off (the default) the game talks to the backend directly and none of this costs anything.
+import csv
+import time
+
+import pygame
+
+FIELDS = ("calls", "all_pairs", "tested", "rejected", "hits", "ms")
+
+
+class CollisionStats:
+    """Collision counters per query: this tick's and the whole session's (see module notes)."""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.enabled = bool(getattr(settings, "collision_stats_enabled", False))
+        self.ticks = 0  # ticks recorded so far
+        self._tick = {}  # label -> [calls, all_pairs, tested, rejected, hits, ms] for the tick in progress
+        self._last_tick = {}
+        self._session = {}  # label -> the same totals, plus [ticks active, peak all_pairs, peak tested]
+        self._group_names = {}  # id(group) -> attribute name on the game
+        self._owner = None
+
+    def name_groups(self, owner):
+        """Label groups by the name they have on owner (the game): self.player_bullets -> "player_bullets"."""
+        self._owner = owner
+        self._group_names = {id(value): name for name, value in vars(owner).items()
+                             if isinstance(value, pygame.sprite.AbstractGroup)}
+
+    def group_name(self, group):
+        name = self._group_names.get(id(group))
+        if name is None and self._owner is not None:
+            self.name_groups(self._owner)  # groups get replaced now and then (new game, bonus wave) - look again
+            name = self._group_names.setdefault(id(group), type(group).__name__)
+        return name or type(group).__name__
+
+    def clock(self):
+        """Start time for record() - 0 when switched off, so hand-written loops can call it unconditionally."""
+        return time.perf_counter() if self.enabled else 0.0
+
+    def record(self, label, all_pairs, hits, started, tested=None, rejected=0):
+        """Add one query's numbers. tested defaults to all_pairs (a hand-written loop tests every pair)."""
+        if not self.enabled:
+            return
+        ms = (time.perf_counter() - started) * 1000.0
+        entry = self._tick.get(label)
+        if entry is None:
+            entry = self._tick[label] = [0, 0, 0, 0, 0, 0.0]
+        entry[0] += 1
+        entry[1] += all_pairs
+        entry[2] += all_pairs if tested is None else tested
+        entry[3] += rejected
+        entry[4] += hits
+        entry[5] += ms
+
+    def end_tick(self):
+        """Close out the tick (called at the end of _update_game)."""
+        if not self.enabled:
+            return
+        self.ticks += 1
+        for label, entry in self._tick.items():
+            total = self._session.get(label)
+            if total is None:
+                total = self._session[label] = [0, 0, 0, 0, 0, 0.0, 0, 0, 0]
+            for i in range(6):
+                total[i] += entry[i]
+            total[6] += 1
+            total[7] = max(total[7], entry[1])
+            total[8] = max(total[8], entry[2])
+        self._last_tick = self._tick
+        self._tick = {}
+
+    # ---------- debug API ----------
+    def last_tick(self):
+        """{label: {calls, all_pairs, tested, rejected, hits, ms}} for the last finished tick."""
+        return {label: dict(zip(FIELDS, entry)) for label, entry in self._last_tick.items()}
+
+    def summary(self):
+        """{label: session totals + per-tick averages/peaks of all_pairs and tested}, busiest query (by time) first."""
+        ticks = max(1, self.ticks)
+        rows = {}
+        for label, total in sorted(self._session.items(), key=lambda item: -item[1][5]):
+            row = dict(zip(FIELDS, total[:6]))
+            row["ms"] = round(row["ms"], 3)
+            row["ticks_active"] = total[6]
+            row["all_pairs_per_tick"] = round(total[1] / ticks, 1)
+            row["tested_per_tick"] = round(total[2] / ticks, 1)
+            row["peak_all_pairs"] = total[7]
+            row["peak_tested"] = total[8]
+            row["ms_per_tick"] = round(total[5] / ticks, 4)
+            rows[label] = row
+        return rows
+
+    def report(self, top=None):
+        """The summary as a text table (top = only the N most expensive queries)."""
+        rows = list(self.summary().items())[:top]
+        lines = [f"collision queries over {self.ticks} ticks (per tick: average / peak)",
+                 f"{'query':<38}{'ms/tick':>9}{'all pairs':>18}{'tested':>16}{'hits':>9}{'rejected':>9}"]
+        for label, row in rows:
+            lines.append(f"{label[:37]:<38}{row['ms_per_tick']:9.4f}"
+                         f"{row['all_pairs_per_tick']:>10.1f} /{row['peak_all_pairs']:>6}"
+                         f"{row['tested_per_tick']:>8.1f} /{row['peak_tested']:>6}"
+                         f"{row['hits']:>9}{row['rejected']:>9}")
+        return "\n".join(lines)
+
+    def write_csv(self, path=None):
+        """Session summary, one row per query. Returns the path, or None if nothing was recorded."""
+        if not self.ticks:
+            return None
+        if path is None:
+            pattern = getattr(self.settings, "collision_stats_csv_path", "collision_stats_{timestamp}.csv")
+            path = pattern.format(timestamp=time.strftime("%Y%m%d_%H%M%S"))
+        rows = self.summary()
+        columns = ["query"] + list(next(iter(rows.values())).keys()) if rows else ["query"]
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for label, row in rows.items():
+                writer.writerow([label] + list(row.values()))
+        return path
+
+
+class InstrumentedCollider:
+    """Wraps a collision backend (SpatialHash and friends): same answers, but every query is counted and timed."""
+
+    def __init__(self, backend, stats):
+        self.backend = backend
+        self.stats = stats
+
+    def __getattr__(self, name):
+        return getattr(self.backend, name)  # begin_pass(), invalidate(), settings... go straight through
+
+    def _counting(self, collided, counts):
+        """Wrap collided= so pairs whose rects touch but the callback turns down get counted as rejected."""
+        if collided is None:
+            return None
+
+        def check(left, right):
+            if collided(left, right):
+                return True
+            if left.rect.colliderect(right.rect):
+                counts[0] += 1
+            return False
+        return check
+
+    def spritecollide(self, sprite, group, dokill=False, collided=None):
+        stats, backend = self.stats, self.backend
+        rejected = [0]
+        tested = backend.pairs_tested
+        all_pairs = len(group)  # before anything gets killed
+        started = stats.clock()
+        hits = backend.spritecollide(sprite, group, dokill, self._counting(collided, rejected))
+        stats.record(f"{type(sprite).__name__} x {stats.group_name(group)}", all_pairs, len(hits), started,
+                     backend.pairs_tested - tested, rejected[0])
+        return hits
+
+    def spritecollide_entering(self, sprite, group, collided=None):
+        stats, backend = self.stats, self.backend
+        rejected = [0]
+        tested = backend.pairs_tested
+        started = stats.clock()
+        hits = backend.spritecollide_entering(sprite, group, self._counting(collided, rejected))
+        stats.record(f"{type(sprite).__name__} x {stats.group_name(group)} (entering)", len(group), len(hits),
+                     started, backend.pairs_tested - tested, rejected[0])
+        return hits
+
+    def groupcollide(self, groupa, groupb, dokilla, dokillb, collided=None):
+        stats, backend = self.stats, self.backend
+        rejected = [0]
+        tested = backend.pairs_tested
+        all_pairs = len(groupa) * len(groupb)  # before anything gets killed
+        started = stats.clock()
+        crashed = backend.groupcollide(groupa, groupb, dokilla, dokillb, self._counting(collided, rejected))
+        stats.record(f"{stats.group_name(groupa)} x {stats.group_name(groupb)}", all_pairs,
+                     sum(len(hits) for hits in crashed.values()), started, backend.pairs_tested - tested, rejected[0])
+        return crashed
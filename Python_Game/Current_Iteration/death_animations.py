@@ -1,6 +1,8 @@
 import pygame
 
 from base_settings import resource_path
+import game_clock
+import quality_governor
 
 
 # Lasertanker death animation sprite
@@ -30,13 +32,14 @@ class LazertankerDeathAnimation(pygame.sprite.Sprite):
         self.current_frame = 0
         self.image = self.death_images[0]
         self.rect = self.image.get_rect(center=center_pos)
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = game_clock.get_ticks()
         self.frame_duration_ms = 1000  # 1 second per frame
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         elapsed = now - self.start_time
         frame_index = int(elapsed / self.frame_duration_ms)
+        frame_index -= frame_index % quality_governor.death_animation_frame_step()  # under heavy load: fewer, longer frames
 
         if frame_index >= len(self.death_images):
             self.kill()  # Animation complete
@@ -73,13 +76,14 @@ class CruiserDeathAnimation(pygame.sprite.Sprite):
         self.current_frame = 0
         self.image = self.death_images[0]
         self.rect = self.image.get_rect(center=center_pos)
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = game_clock.get_ticks()
         self.frame_duration_ms = 1000  # 1 second per frame
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         elapsed = now - self.start_time
         frame_index = int(elapsed / self.frame_duration_ms)
+        frame_index -= frame_index % quality_governor.death_animation_frame_step()  # under heavy load: fewer, longer frames
 
         if frame_index >= len(self.death_images):
             self.kill()  # Animation complete
@@ -116,13 +120,14 @@ class DestroyerDeathAnimation(pygame.sprite.Sprite):
         self.current_frame = 0
         self.image = self.death_images[0]
         self.rect = self.image.get_rect(center=center_pos)
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = game_clock.get_ticks()
         self.frame_duration_ms = 1000  # 1 second per frame
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         elapsed = now - self.start_time
         frame_index = int(elapsed / self.frame_duration_ms)
+        frame_index -= frame_index % quality_governor.death_animation_frame_step()  # under heavy load: fewer, longer frames
 
         if frame_index >= len(self.death_images):
             self.kill()  # Animation complete
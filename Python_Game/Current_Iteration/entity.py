@@ -0,0 +1,119 @@
+#entity.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       entity.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# A slimmer stand-in for pygame.sprite.Sprite, for the things the game spawns by the hundred and throws away a second
+# later: bullets, nyancat bullets, laserminion bombs, mom bullets, dad shockwaves and the victory firework shells,
+# sparks and bursts.
+#
+# A pygame Sprite is a plain object with a __dict__ for its attributes plus a second dict of the groups it's in, and
+# every add/kill goes through that dict and an isinstance()/try-except dance in Group.add(). An Entity instead:
+#   - declares its attributes in __slots__ (no per-instance __dict__; each subclass lists the attributes it sets),
+#   - keeps its groups in a tuple - projectiles are in exactly one group, so that's one small tuple.
+# It has the same methods the groups and the game use on a sprite (add/remove/kill/alive/groups/update and the
+# add_internal/remove_internal hooks), so pygame.sprite.groupcollide()/spritecollide() and the collision backends
+# work on them unchanged.
+#
+# EntityGroup is the matching container: still a pygame Group (spritedict, copy, len, iteration, draw... and the
+# collision code's isinstance checks all keep working), but add()/remove()/has() take the short path for entities:
+# a dict insert/delete each, O(1), no exception handling. Iteration order is insertion order, same as a Group, so
+# seeded games play out the same. update() and draw_all() run over one snapshot of the members.
+#
+# An Entity subclass can't take attributes it didn't declare: add new ones to its __slots__ when you add them.
+import pygame
+
+
+class Entity:
+    """Slotted sprite for short-lived projectiles and particles (see module notes). Subclasses set __slots__."""
+    __slots__ = ("_groups", "_pool_owned", "_pool_released", "__weakref__")  # the _pool_ flags belong to sprite_pool.py
+
+    def __init__(self, *groups):
+        self._groups = ()
+        self._pool_owned = False
+        self._pool_released = False
+        if groups:
+            self.add(*groups)
+
+    # ---------- group membership (what pygame groups call on a sprite) ----------
+    def add_internal(self, group):
+        self._groups += (group,)
+
+    def remove_internal(self, group):
+        self._groups = tuple(member for member in self._groups if member is not group)
+
+    def add(self, *groups):
+        for group in groups:
+            if not group.has_internal(self):
+                group.add_internal(self)
+                self.add_internal(group)
+
+    def remove(self, *groups):
+        for group in groups:
+            if group.has_internal(self):
+                group.remove_internal(self)
+                self.remove_internal(group)
+
+    def kill(self):
+        """Remove from every group."""
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups = ()
+
+    def groups(self):
+        return list(self._groups)
+
+    def alive(self):
+        return bool(self._groups)
+
+    def update(self, *args, **kwargs):
+        pass
+
+    def __repr__(self):
+        return f"<{type(self).__name__} Entity(in {len(self._groups)} groups)>"
+
+
+class EntityGroup(pygame.sprite.Group):
+    """pygame Group with O(1) add/remove for Entities (ordinary sprites still go through Group.add/remove)."""
+
+    def add(self, *sprites):
+        for sprite in sprites:
+            if isinstance(sprite, Entity):
+                if sprite not in self.spritedict:
+                    self.add_internal(sprite)
+                    sprite.add_internal(self)
+            else:
+                super().add(sprite)
+
+    def remove(self, *sprites):
+        for sprite in sprites:
+            if isinstance(sprite, Entity):
+                if sprite in self.spritedict:
+                    self.remove_internal(sprite)
+                    sprite.remove_internal(self)
+            else:
+                super().remove(sprite)
+
+    def has(self, *sprites):
+        if not sprites:
+            return False
+        for sprite in sprites:
+            if isinstance(sprite, Entity):
+                if sprite not in self.spritedict:
+                    return False
+            elif not super().has(sprite):
+                return False
+        return True
+
+    def update(self, *args, **kwargs):
+        for sprite in list(self.spritedict):  # one snapshot - members may kill themselves (or spawn others) while updating
+            sprite.update(*args, **kwargs)
+
+    def draw_all(self):
+        """Call draw() on every member (they draw themselves onto their own screen)."""
+        for sprite in list(self.spritedict):
+            sprite.draw()
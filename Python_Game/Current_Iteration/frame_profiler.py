@@ -0,0 +1,236 @@
+#frame_profiler.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       frame_profiler.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# Per-phase frame profiler. The main file brackets each phase of a frame (input, the _update_game sub-steps,
+# the _draw_screen sub-steps) with start()/stop() calls, and this module keeps:
+#   - a rolling window of the last few seconds per phase, for the in-game overlay (p50/p95/p99 + sprite group counts)
+#   - a whole-session histogram per phase, written out as a CSV when the game exits
+# Nothing is recorded until the profiler is switched on (hotkey or settings.profiler_enabled), so normal play pays
+# for one boolean check per phase.
+import time
+import csv
+import math
+from collections import deque
+
+import pygame
+
+# Display order for the overlay/CSV. Sub-steps are indented under their parent phase in the overlay.
+PHASES = (
+    ("frame", 0),
+    ("events", 1),
+    ("update", 1),
+    ("spawning", 2),
+    ("sprite_updates", 2),
+    ("shockwaves", 2),
+    ("alien_firing", 2),
+    ("collisions", 2),
+    ("powerup_pickup", 2),
+    ("game_events", 2),
+    ("draw", 1),
+    ("draw_background", 2),
+    ("draw_aliens", 2),
+    ("draw_bullets", 2),
+    ("draw_effects", 2),
+    ("draw_hud", 2),
+)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already-sorted list (0.0 for an empty list)."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+class _Histogram:
+    """Fixed-resolution histogram, so whole-session percentiles don't need every sample kept in memory."""
+
+    def __init__(self, resolution):
+        self.resolution = resolution  # bucket width (0.01ms for timings, 1 for counts)
+        self.buckets = {}
+        self.samples = 0
+        self.total = 0.0
+        self.max_value = 0
+
+    def add(self, value):
+        key = int(value / self.resolution)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        self.samples += 1
+        self.total += value
+        if value > self.max_value:
+            self.max_value = value
+
+    def percentile(self, pct):
+        if not self.samples:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * self.samples))
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= rank:
+                return key * self.resolution
+        return self.max_value
+
+    def mean(self):
+        return self.total / self.samples if self.samples else 0.0
+
+
+class FrameProfiler:
+    """Times frame phases; shows rolling p50/p95/p99 on an overlay and writes whole-session stats to CSV."""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.enabled = bool(getattr(settings, "profiler_enabled", False))  # recording on/off
+        self.overlay_visible = False
+        self.window = int(getattr(settings, "profiler_window_frames", 300))  # rolling window (~5 sec at 60fps)
+
+        self._starts = {}  # phase -> perf_counter() at start()
+        self._frame = {}  # phase -> ms accumulated this frame (a phase can run more than once per frame)
+        self._recent = {name: deque(maxlen=self.window) for name, _ in PHASES}
+        self._session = {name: _Histogram(0.01) for name, _ in PHASES}
+        self._group_recent = {}  # group name -> deque of counts
+        self._group_session = {}  # group name -> _Histogram(1)
+        self.frames_recorded = 0
+
+        # Overlay text is re-rendered a few times per second, not every frame (font rendering is not free)
+        self._overlay_surface = None
+        self._overlay_next_refresh = 0
+        self._overlay_font = None
+
+        # Optional alloc_tracker.AllocationTracker: gets the same phase markers (it has its own on/off switch)
+        self.alloc_tracker = None
+
+    # ---------- recording ----------
+    def toggle_overlay(self):
+        """Hotkey handler: the first press also switches recording on."""
+        self.enabled = True
+        self.overlay_visible = not self.overlay_visible
+        self._overlay_next_refresh = 0
+
+    def begin_frame(self):
+        if self.alloc_tracker is not None:
+            self.alloc_tracker.begin_frame()
+        if not self.enabled:
+            return
+        self._frame.clear()
+        self._starts["frame"] = time.perf_counter()
+
+    def start(self, phase):
+        if self.alloc_tracker is not None:
+            self.alloc_tracker.start(phase)
+        if self.enabled:
+            self._starts[phase] = time.perf_counter()
+
+    def stop(self, phase):
+        if self.alloc_tracker is not None:
+            self.alloc_tracker.stop(phase)
+        if not self.enabled:
+            return
+        started = self._starts.pop(phase, None)
+        if started is not None:
+            self._frame[phase] = self._frame.get(phase, 0.0) + (time.perf_counter() - started) * 1000.0
+
+    def end_frame(self, group_counts=None):
+        """Close out the frame: push every phase's time (0 if it didn't run) into the rolling window + session stats."""
+        if self.alloc_tracker is not None:
+            self.alloc_tracker.end_frame()
+        if not self.enabled:
+            return
+        self.stop("frame")
+        frame = self._frame
+        for name, _ in PHASES:
+            ms = frame.get(name, 0.0)
+            self._recent[name].append(ms)
+            self._session[name].add(ms)
+        if group_counts:
+            for name, count in group_counts.items():
+                recent = self._group_recent.get(name)
+                if recent is None:
+                    recent = self._group_recent[name] = deque(maxlen=self.window)
+                    self._group_session[name] = _Histogram(1)
+                recent.append(count)
+                self._group_session[name].add(count)
+        self.frames_recorded += 1
+
+    def last_frame(self):
+        """Phase timings (ms) of the frame that was just closed out."""
+        return dict(self._frame)
+
+    def rolling_percentiles(self, phase):
+        """(p50, p95, p99) in ms over the rolling window."""
+        values = sorted(self._recent[phase])
+        return percentile(values, 50), percentile(values, 95), percentile(values, 99)
+
+    def session_stats(self, phase):
+        """Whole-session stats for one phase: samples, mean, p50, p95, p99, max (ms)."""
+        hist = self._session[phase]
+        return {"samples": hist.samples, "mean": round(hist.mean(), 4), "p50": round(hist.percentile(50), 4),
+                "p95": round(hist.percentile(95), 4), "p99": round(hist.percentile(99), 4), "max": round(hist.max_value, 4)}
+
+    def group_peaks(self):
+        """Highest count seen per sprite group over the session."""
+        return {name: hist.max_value for name, hist in self._group_session.items()}
+
+    # ---------- overlay ----------
+    def draw_overlay(self, screen):
+        if not (self.enabled and self.overlay_visible):
+            return
+        now = pygame.time.get_ticks()  # real time on purpose: the overlay refresh rate is UI, not gameplay
+        if self._overlay_surface is None or now >= self._overlay_next_refresh:
+            self._overlay_surface = self._render_overlay()
+            self._overlay_next_refresh = now + int(getattr(self.settings, "profiler_overlay_refresh_ms", 250))
+        screen.blit(self._overlay_surface, (8, 8))
+
+    def _render_overlay(self):
+        if self._overlay_font is None:
+            self._overlay_font = pygame.font.SysFont("monospace", 13)
+        lines = [f"{'phase':<20}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name, depth in PHASES:
+            if not any(self._recent[name]):
+                continue  # phase never ran in this window (e.g. bonus-wave only)
+            p50, p95, p99 = self.rolling_percentiles(name)
+            label = ("  " * depth + name)[:20]
+            lines.append(f"{label:<20}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        if self._group_recent:
+            lines.append("")
+            lines.append(f"{'group':<24}{'now':>5}{'max':>6}")
+            for name in sorted(self._group_recent):
+                recent = self._group_recent[name]
+                if recent and max(recent):
+                    lines.append(f"{name[:24]:<24}{recent[-1]:5d}{max(recent):6d}")
+
+        line_h = self._overlay_font.get_linesize()
+        width = max(self._overlay_font.size(line)[0] for line in lines) + 12
+        surface = pygame.Surface((width, line_h * len(lines) + 10), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 180))
+        for i, line in enumerate(lines):
+            surface.blit(self._overlay_font.render(line, True, (0, 255, 0)), (6, 5 + i * line_h))
+        return surface
+
+    # ---------- export ----------
+    def write_csv(self, path=None):
+        """Write whole-session stats (one row per phase and per sprite group). Returns the path, or None if nothing was recorded."""
+        if not self.frames_recorded:
+            return None
+        if path is None:
+            pattern = getattr(self.settings, "profiler_csv_path", "frame_profile_{timestamp}.csv")
+            path = pattern.format(timestamp=time.strftime("%Y%m%d_%H%M%S"))
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["kind", "name", "samples", "mean", "p50", "p95", "p99", "max"])
+            for name, _ in PHASES:
+                stats = self.session_stats(name)
+                writer.writerow(["phase_ms", name, stats["samples"], stats["mean"],
+                                 stats["p50"], stats["p95"], stats["p99"], stats["max"]])
+            for name in sorted(self._group_session):
+                hist = self._group_session[name]
+                writer.writerow(["group_count", name, hist.samples, round(hist.mean(), 2),
+                                 hist.percentile(50), hist.percentile(95), hist.percentile(99), hist.max_value])
+        return path
@@ -0,0 +1,71 @@
+#game_clock.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       game_clock.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# One shared millisecond clock for all gameplay timers (fire intervals, spawn delays, respawn timers,
+# animation frames, etc). Normally it just hands back pygame.time.get_ticks(), so the live game behaves
+# exactly like it always has. The headless simulation (headless_sim.py) switches it over to simulated
+# time and advances it by hand, so a run can go as fast as the CPU allows while every timer in the game
+# still sees the same consistent clock.
+#
+# NOTE: menus keep using pygame.time.get_ticks() directly - they are real-time UI, not gameplay.
+import pygame
+
+_simulated = False  # True while a headless/simulated run owns the clock
+_sim_ms = 0  # current simulated time in milliseconds
+
+
+def get_ticks() -> int:
+    """Drop-in replacement for pygame.time.get_ticks() for all gameplay code."""
+    if _simulated:
+        return int(_sim_ms)
+    return pygame.time.get_ticks()
+
+
+def use_simulated_time(start_ms=None) -> None:
+    """Switch to simulated time. Starts from the current real clock unless start_ms is given."""
+    global _simulated, _sim_ms
+    if start_ms is None:
+        start_ms = pygame.time.get_ticks()
+    _sim_ms = float(start_ms)
+    _simulated = True
+
+
+def use_real_time() -> None:
+    """Hand the clock back to pygame (the normal, interactive game)."""
+    global _simulated
+    _simulated = False
+
+
+def is_simulated() -> bool:
+    return _simulated
+
+
+def advance(ms) -> int:
+    """Move simulated time forward by ms (fractions are kept, so 1000/60 steps don't drift). Returns new time."""
+    global _sim_ms
+    if not _simulated:
+        raise RuntimeError("game_clock.advance() called while using real time - call use_simulated_time() first")
+    _sim_ms += ms
+    return int(_sim_ms)
+
+
+# ---------- Fixed-timestep simulation ----------
+# The game simulates in fixed steps of step_ms (see Main_Game_Loop), decoupled from how often frames get drawn.
+# All movement speeds in the game were tuned as "pixels per frame at 60fps", so sprites multiply their per-step
+# movement by frame_scale: 1.0 at the default 60 Hz step, 2.0 at 30 Hz, 0.5 at 120 Hz.
+BASE_FRAME_MS = 1000.0 / 60.0
+step_ms = BASE_FRAME_MS  # length of one simulation step in ms
+frame_scale = 1.0  # step_ms measured in 60fps frames
+
+
+def set_step_ms(ms) -> None:
+    """Set the simulation step length (e.g. 1000 / settings.sim_hz)."""
+    global step_ms, frame_scale
+    step_ms = float(ms)
+    frame_scale = step_ms / BASE_FRAME_MS
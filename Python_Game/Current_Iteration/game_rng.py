@@ -0,0 +1,38 @@
+#game_rng.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       game_rng.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# One shared, seedable random number generator for all gameplay code (alien movement, spawn timers, drops,
+# fire intervals, firework colors...). Every module does `from game_rng import rng` and calls rng.randint(),
+# rng.choice() etc. exactly like it used to call random.randint(), random.choice().
+# Seeding it once at the start of a game (seed() below) makes the whole session repeatable - that's what the
+# replay files (replay.py) and the headless benchmarks rely on.
+#
+# fx_rng is a second stream for purely cosmetic randomness that can run a varying number of times: at DRAW time
+# (e.g. the nanite beam flicker) or per firework spark (the spark count follows quality_governor.py). Drawing can
+# happen more or less often than the simulation steps, so if that code pulled from rng it would shift every
+# gameplay roll after it and a replay would drift apart.
+#
+# NOTE: sound_manager.py keeps the plain random module on purpose - which sound variant plays never affects gameplay.
+import os
+import random
+
+rng = random.Random()  # gameplay stream
+fx_rng = random.Random()  # cosmetic stream (draw time, firework sparks)
+current_seed = None  # seed of the running game (None until seed() is called)
+
+
+def seed(value=None) -> int:
+    """Seed both streams for a new game. With value=None a fresh seed is picked. Returns the seed used."""
+    global current_seed
+    if value is None:
+        value = int.from_bytes(os.urandom(4), "little")
+    current_seed = int(value)
+    rng.seed(current_seed)
+    fx_rng.seed(current_seed ^ 0x5EED)  # different stream, still fixed by the same seed
+    return current_seed
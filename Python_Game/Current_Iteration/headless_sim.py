@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       headless_sim.py (this file)
+#       game_clock.py
+#       Visintainer_A_AlienGame.py (main file) and everything it needs
+#
+# Author: Anthony Visintainer
+#
+# Headless, faster-than-realtime runs of AlienInvasion. No window (SDL dummy video/audio drivers), no menus,
+# no clock.tick(60) and no display.flip(). It takes the same start config MenuMain.run() hands back, and then
+# steps _update_game() (and optionally _draw_screen() to the off-screen surface) as fast as the CPU allows,
+# with game_clock advanced by a fixed amount per step so every in-game timer behaves like a real 60fps session.
+#
+# Good for soak tests and for measuring e.g. wave 10 or minute 15 of the bonus wave without sitting through it.
+# Run it from this directory (resource_path() looks for img/ and sounds/ relative to the working directory):
+#       python headless_sim.py --wave 5 --players 4 --difficulty hard --seconds 120 --render
+#       python headless_sim.py --secret --players 2 --seconds 900
+#       python headless_sim.py --secret --players 4 --seconds 900 --autofire --profile --collision numpy
+#       python headless_sim.py --jump-to-wave 10 --players 4 --render --autofire --profile-waves   (see wave_profiler.py)
+#       python headless_sim.py --wave 3 --players 4 --autofire --frame-ms 33.3 --swept   (30 Hz, see swept_collision.py)
+#       python headless_sim.py --wave 8 --players 4 --autofire --collision-stats   (pairs/hits per query, see collision_stats.py)
+#       python headless_sim.py --replay replay_20260101_120000.json.gz   (re-run a recorded game, see replay.py)
+import os
+import sys
+import time
+import argparse
+
+import pygame  # importing is fine here - the dummy drivers only have to be set before pygame.init()
+
+import game_clock
+import game_rng
+import replay
+import sprite_pool
+from wave_profiler import WaveProfiler, FORMATS
+from collision_stats import CollisionStats
+
+
+class HeadlessSimulation:
+    """Owns one AlienInvasion instance and steps it without a window or frame limiter."""
+
+    def __init__(self, start_config, difficulty=None, render=False, frame_ms=1000 / 60,
+                 skip_countdown=True, autofire=False, sound=False, seed=None, start_ms=None, settings_snapshot=None):
+        # The dummy drivers have to be in place before pygame.init() runs (inside AlienInvasion.__init__)
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+        from Visintainer_A_AlienGame import AlienInvasion  # imported late so the env vars above win
+        from ship import Ship
+
+        self.render = render  # also run _draw_screen() every step (to the off-screen display surface)
+        self.frame_ms = float(frame_ms)  # simulated length of one frame
+        self.autofire = autofire  # hold down fire for every player (otherwise players just sit there)
+        self.ticks = 0  # frames stepped so far
+        self.replay = None  # replay.Replay being played back (see from_replay())
+        self.desync_tick = None  # first tick whose state checksum didn't match the replay
+
+        game_clock.use_simulated_time(start_ms)
+        game_clock.set_step_ms(self.frame_ms)  # e.g. --frame-ms 33.3 simulates at 30 Hz with the same speeds per second
+        self.game = AlienInvasion()
+        self.game.present_frames = False
+        self.game.frame_time_ms = self.frame_ms
+        if settings_snapshot is not None:
+            replay.apply_settings_snapshot(self.game.settings, settings_snapshot)
+        self.game.settings.sounds_enabled = bool(sound)
+        if difficulty is not None:
+            self.game.settings.difficulty_mode = difficulty
+
+        self.seed = self.game.rng_seed = game_rng.seed(seed)
+        self.game._full_game_initialization(start_config, Ship)
+        if skip_countdown and self.game.game_state == "countdown":
+            self.game._end_countdown(game_clock.get_ticks())
+
+    @classmethod
+    def from_replay(cls, recorded, render=False):
+        """Set up a run that plays back a replay.Replay: same settings, seed, clock and key presses as the original game."""
+        sim = cls(recorded.start_config, render=render, frame_ms=recorded.step_ms, skip_countdown=False,
+                  seed=recorded.seed, start_ms=recorded.start_ms, settings_snapshot=recorded.settings)
+        sim.replay = recorded
+        return sim
+
+    @property
+    def sim_ms(self):
+        """Simulated time elapsed since the run started, in ms."""
+        return self.ticks * self.frame_ms
+
+    def jump_to_wave(self, wave_num):
+        """Clear the field and start wave wave_num (0-based index into wave_master_index), e.g. 9 for wave 10."""
+        game = self.game
+        if game.is_bonus_wave:
+            return
+        for group in (game.aliens, game.minions, game.alien_bullets, game.player_bullets, game.powerups):
+            group.empty()
+        game._new_alien_wave(wave_num)
+        if game.game_state not in ("victory", "defeat"):
+            game.game_state = "playing"
+
+    def use_collision_backend(self, backend):
+        """Switch collision backends for comparisons: "grid", "numpy", "sweep" or "pygame" (plain groupcollide)."""
+        settings = self.game.settings
+        settings.spatial_hash_enabled = backend != "pygame"
+        settings.collision_backend = "grid" if backend == "pygame" else backend
+        self.game.collision_grid = self.game._make_collision_backend()
+
+    def use_collision_stats(self, on=True):
+        """Count pairs tested / hits / hitbox rejections / time for every collision query (collision_stats.py)."""
+        game = self.game
+        game.settings.collision_stats_enabled = bool(on)
+        game.collision_stats = CollisionStats(game.settings)
+        game.collision_stats.name_groups(game)
+        game.collision_grid = game._make_collision_backend()  # wrapped (or unwrapped) to match
+
+    def use_swept_collisions(self, on=True):
+        """Check fast projectiles over the whole distance they moved each step (swept_collision.py) - for --frame-ms 33.3 and up."""
+        self.game.settings.swept_collisions = bool(on)
+
+    def step(self, count=1):
+        """Advance the game by count frames. Returns False once the game has left gameplay (back to the menu)."""
+        game = self.game
+        for _ in range(count):
+            game_clock.advance(self.frame_ms)
+            # Keep SDL's event queue drained (it fills up over long runs); input is ignored
+            pygame.event.pump()
+            pygame.event.clear()
+            if self.replay is not None:
+                # Feed the recorded key presses for this tick through the game's normal input handler
+                events = self.replay.events_for_tick(self.ticks)
+                if events:
+                    for event in events:
+                        pygame.event.post(event)
+                    game._check_keystroke_events()
+            if self.autofire:
+                for player in game.players:
+                    player.firing = True
+            game._wave_profile_tick()
+            profiler = game.profiler
+            profiler.begin_frame()
+            profiler.start("update")
+            game._update_game()
+            profiler.stop("update")
+            if self.render:
+                profiler.start("draw")
+                game._draw_screen()
+                profiler.stop("draw")
+            profiler.end_frame(game._sprite_group_counts() if profiler.enabled else None)
+            self.ticks += 1
+            if self.replay is not None and self.desync_tick is None and self.replay.verify(self.ticks, game):
+                self.desync_tick = self.ticks
+            if game.game_state == "start_menu":
+                return False
+        return True
+
+    def run_for(self, seconds):
+        """Step until `seconds` of simulated time have passed (or the run ends). Returns frames stepped."""
+        start_ticks = self.ticks
+        target = int(round(seconds * 1000.0 / self.frame_ms))
+        while self.ticks - start_ticks < target:
+            if not self.step():
+                break
+        return self.ticks - start_ticks
+
+    def close(self):
+        """Stop sounds, hand the clock back to pygame and shut pygame down."""
+        try:
+            self.game.audio.stop_all()
+        except Exception:
+            pass
+        game_clock.use_real_time()
+        pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Alien Invasion headless and faster than realtime.")
+    parser.add_argument("--wave", type=int, default=1, help="starting wave 1-5 (menu range)")
+    parser.add_argument("--jump-to-wave", type=int, default=None, help="jump straight to any wave (1-based), e.g. 10")
+    parser.add_argument("--players", type=int, default=1, help="number of players 1-4")
+    parser.add_argument("--difficulty", default=None, help="kiddie / easy / normal / hard")
+    parser.add_argument("--secret", action="store_true", help="start the secret bonus wave instead")
+    parser.add_argument("--seconds", type=float, default=60.0, help="simulated seconds to run")
+    parser.add_argument("--render", action="store_true", help="also run _draw_screen() every frame")
+    parser.add_argument("--frame-ms", type=float, default=1000 / 60,
+                        help="simulated length of one step, e.g. 33.3 for 30 Hz (speeds per second stay the same)")
+    parser.add_argument("--swept", action="store_true",
+                        help="swept collisions for bullets/bombs/shockwaves (keeps them from tunnelling at low step rates)")
+    parser.add_argument("--autofire", action="store_true", help="hold fire down for every player")
+    parser.add_argument("--profile", action="store_true", help="record per-phase timings and write the profiler CSV")
+    parser.add_argument("--alloc", action="store_true", help="track per-phase allocations / Surface churn and write the report")
+    parser.add_argument("--profile-waves", nargs="?", const="profiles", default=None, metavar="DIR",
+                        help="cProfile every wave / bonus-wave minute into DIR (see wave_profiler.py)")
+    parser.add_argument("--profile-format", choices=FORMATS, default="pstats")
+    parser.add_argument("--collision", choices=("grid", "numpy", "sweep", "pygame"), default=None,
+                        help="collision backend: sweep (default, sort and sweep along x), grid, numpy (needs numpy) "
+                             "or plain pygame groupcollide")
+    parser.add_argument("--collision-stats", action="store_true",
+                        help="count pairs tested, hits and time per collision query, print the table and write the CSV")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed (same seed + same options = same run)")
+    parser.add_argument("--replay", default=None, help="play back a recorded replay file instead (other options ignored)")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        return run_replay(args.replay, render=args.render, profile=args.profile)
+
+    if args.secret:
+        config = {"secret_wave": True, "num_players": args.players}
+    else:
+        config = {"starting_wave": args.wave, "num_players": args.players}
+
+    sim = HeadlessSimulation(config, difficulty=args.difficulty, render=args.render, frame_ms=args.frame_ms,
+                             autofire=args.autofire, seed=args.seed)
+    sim.game.profiler.enabled = args.profile
+    if args.swept:
+        sim.use_swept_collisions()
+    if args.collision is not None:
+        sim.use_collision_backend(args.collision)
+    if args.collision_stats:
+        sim.use_collision_stats()
+    if args.alloc:
+        sim.game.alloc_tracker.enable()
+    if args.profile_waves is not None:
+        sim.game.wave_profiler = WaveProfiler(args.profile_waves, args.profile_format)
+    if args.jump_to_wave is not None:
+        sim.jump_to_wave(args.jump_to_wave - 1)
+
+    wall_start = time.perf_counter()
+    frames = sim.run_for(args.seconds)
+    wall = time.perf_counter() - wall_start
+    sim_seconds = frames * sim.frame_ms / 1000.0
+
+    print(f"simulated {sim_seconds:.1f}s ({frames} frames) in {wall:.2f}s wall "
+          f"-> {sim_seconds / max(wall, 1e-9):.1f}x realtime, {wall * 1000.0 / max(frames, 1):.3f} ms/frame")
+    print(f"final state: {sim.game.game_state}, wave index: {sim.game.current_wave_num}, seed: {sim.seed}")
+    if args.profile or args.alloc or args.profile_waves is not None or args.collision_stats:
+        sim.game._write_profiler_report()
+    sim.game._finish_event_log()  # only writes anything with settings.event_log_enabled
+    if args.collision_stats:
+        print(sim.game.collision_stats.report())
+    pools = sprite_pool.report()  # recycled vs. newly built bullets/sparks/pickups this run
+    if pools:
+        print(pools)
+    if args.alloc:
+        print(sim.game.alloc_tracker.report())
+        sim.game.alloc_tracker.disable()
+    sim.close()
+    return 0
+
+
+def run_replay(path, render=False, profile=False):
+    """Play a replay file back to its last recorded tick and report whether the state matched all the way."""
+    recorded = replay.Replay.load(path)
+    sim = HeadlessSimulation.from_replay(recorded, render=render)
+    sim.game.profiler.enabled = profile
+
+    wall_start = time.perf_counter()
+    while sim.ticks < recorded.ticks and sim.desync_tick is None:
+        if not sim.step():
+            break
+    wall = time.perf_counter() - wall_start
+
+    print(f"replayed {sim.ticks}/{recorded.ticks} ticks in {wall:.2f}s wall (seed {recorded.seed})")
+    if sim.desync_tick is not None:
+        print(f"DESYNC: state checksum differs from the recording at tick {sim.desync_tick}")
+    else:
+        print("replay matched the recording")
+    if profile:
+        sim.game._write_profiler_report()
+    sim.close()
+    return 1 if sim.desync_tick is not None else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
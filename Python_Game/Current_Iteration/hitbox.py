@@ -0,0 +1,121 @@
+#hitbox.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       hitbox.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# Compound hitboxes: ships whose sprite has empty corners get a hitbox made of a few sub-rects instead of the full
+# sprite rect, so a bullet flying past a cruiser's wing tip doesn't count as a hit.
+#   cruiser (level 6)    top half (full width) + center third (full height) - the bottom of the wings doesn't count
+#   destroyer (level 5)  back half (full width) + center of the front half - the outer 28% of the front doesn't count
+#   ninja kitty          left 76% x top 66% - the bottom-right corner (the tail) doesn't count
+#   nyan cat             the cat itself, not the rainbow: 35% of the width on the side it's flying toward, minus
+#                        the bottom 12%
+# The sub-rects are worked out once per sprite size (HITBOX_SHAPES, cached in _shape_cache) - a new size only happens
+# when a damage frame with a different image size gets swapped in - and each sprite keeps its own positioned copy,
+# rebuilt only when its rect moved, changed size or (nyan cat) turned around. So the several bullets/shields/players
+# checked against the same cruiser in one collision pass all reuse the same rects.
+#
+# Every sprite class that can be hit (Alien, Minion, BonusWaveEnemy) gets the same API from HitboxMixin:
+#   sprite.hitbox_rects()         list of Rects in screen coordinates (just [sprite.rect] for ordinary sprites)
+#   sprite.hitbox_collides(rect)  does rect touch the hitbox?
+#   sprite.get_collision_rect()   bounding box of the hitbox (used e.g. as the firework center for nyan cat)
+# and collide_hitbox(a, b) plugs that into groupcollide()/spritecollide() as the collided= check, so the collision
+# passes get exact hits straight from the broad phase instead of filtering them afterwards.
+import pygame
+
+
+def _cruiser_parts(w, h, variant=None):
+    # The old per-hit check let a rect through if it overlapped the center third (float edges at w/3 and w - w/3) or
+    # the top half (edge at h/2). With integer rects those edges round outward: floor(w/3) and ceil(h/2).
+    third = w // 3
+    return [(third, 0, w - 2 * third, h), (0, 0, w, -(-h // 2))]
+
+
+def _destroyer_parts(w, h, variant=None):
+    half_h = int(h * 0.5)
+    outer_w = int(w * 0.28)
+    return [(0, 0, w, half_h), (outer_w, half_h, max(1, w - 2 * outer_w), max(1, h - half_h))]
+
+
+def _ninja_parts(w, h, variant=None):
+    return [(0, 0, w - int(w * 0.24), int(h * 0.66))]
+
+
+def _nyancat_parts(w, h, variant=None):
+    # variant = True while flying left (sprite flipped, rainbow trail on the right)
+    exclude_side = int(w * 0.65)  # the rainbow trail
+    exclude_bottom = int(h * 0.12)
+    x = 0 if variant else exclude_side
+    return [(x, 0, w - exclude_side, h - exclude_bottom)]
+
+
+# hitbox_shape name -> function(width, height, variant) giving (x, y, w, h) sub-rects relative to the sprite's topleft
+HITBOX_SHAPES = {
+    "cruiser": _cruiser_parts,
+    "destroyer": _destroyer_parts,
+    "ninja": _ninja_parts,
+    "nyancat": _nyancat_parts,
+}
+_shape_cache = {}  # (shape, width, height, variant) -> tuple of relative Rects
+
+
+def hitbox_parts(shape, width, height, variant=None):
+    """Sub-rects of a hitbox shape for a sprite of this size, relative to its top left corner (cached)."""
+    key = (shape, width, height, variant)
+    parts = _shape_cache.get(key)
+    if parts is None:
+        parts = _shape_cache[key] = tuple(pygame.Rect(part) for part in HITBOX_SHAPES[shape](width, height, variant))
+    return parts
+
+
+class HitboxMixin:
+    """Hitbox API for sprites. Set self.hitbox_shape to a HITBOX_SHAPES name for a compound hitbox (None = rect)."""
+    hitbox_shape = None
+    _hitbox_key = None  # (x, y, w, h, variant) the positioned rects below were built for
+    _hitbox_rects = None
+
+    def hitbox_variant(self):
+        """Which version of the shape applies right now (e.g. facing direction). Override if the shape flips."""
+        return None
+
+    def hitbox_rects(self):
+        """The hitbox as a list of Rects in screen coordinates."""
+        rect = self.rect
+        if self.hitbox_shape is None:
+            return [rect]
+        variant = self.hitbox_variant()
+        key = (rect.x, rect.y, rect.w, rect.h, variant)
+        if key != self._hitbox_key:
+            x, y = rect.x, rect.y
+            self._hitbox_rects = [part.move(x, y) for part in hitbox_parts(self.hitbox_shape, rect.w, rect.h, variant)]
+            self._hitbox_key = key
+        return self._hitbox_rects
+
+    def hitbox_collides(self, rect):
+        """Does rect touch this sprite's hitbox?"""
+        if self.hitbox_shape is None:
+            return self.rect.colliderect(rect)
+        return rect.collidelist(self.hitbox_rects()) != -1
+
+    def get_collision_rect(self):
+        """Bounding box of the hitbox."""
+        rects = self.hitbox_rects()
+        if len(rects) == 1:
+            return rects[0]
+        return rects[0].unionall(rects[1:])
+
+
+def collide_hitbox(left, right):
+    """collided= callback for groupcollide()/spritecollide(): rects touch AND each side's compound hitbox (if it
+    has one) touches the other side's rect."""
+    if not left.rect.colliderect(right.rect):
+        return False
+    if getattr(right, "hitbox_shape", None) is not None and not right.hitbox_collides(left.rect):
+        return False
+    if getattr(left, "hitbox_shape", None) is not None and not left.hitbox_collides(right.rect):
+        return False
+    return True
@@ -0,0 +1,147 @@
+#numpy_collide.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       numpy_collide.py (this file)
+#       spatial_hash.py
+#
+# Author: Anthony Visintainer
+#
+# Optional NumPy collision backend (settings.collision_backend = "numpy", or --collision numpy in headless_sim.py).
+# Late in the bonus wave (4 players, bluewhale double streams, nyancat bullets) there are hundreds of bullets on screen,
+# and groupcollide's Python-level colliderect call per bullet/target pair becomes the biggest collision cost.
+#
+# Here both groups of a groupcollide() are packed into int arrays (left, top, right, bottom per sprite) and all the
+# bullet/target overlaps are worked out with a handful of array operations - no Python per pair. A full (A x B) table
+# of comparisons would do it too, but 800 bullets x 300 aliens is 240000 comparisons x 4 edges; instead group B is
+# sorted by left edge once, np.searchsorted() finds for each A sprite the run of B sprites whose left edge is close
+# enough to possibly overlap (within B's widest sprite), and only those candidate pairs get the full AABB test.
+# Python only ever sees the pairs that overlap, and those go through the same checks as always before being handed
+# to the game code:
+#   - the sprite is still in its group (killed earlier in the pass -> skipped)
+#   - colliderect against its CURRENT rect (the arrays are padded by settings.spatial_hash_pad px, like the grid,
+#     so a damage frame that grew the rect a little mid-pass is still caught)
+#   - the collided= callback (compound hitboxes, hitbox.py)
+# so the result is exactly pygame's, in pygame's order (the overlapping pairs are sorted by A's order, then B's).
+#
+# Packed arrays of big groups are kept for the rest of the collision pass (aliens get checked against shields, bullets,
+# players... in one pass). Same rule as the grid: sprites that move mid-pass need invalidate(group). Sprites ADDED to a
+# group mid-pass are noticed on their own (see _still_packed()).
+# Small tables (4 players x 30 bullets) aren't worth the array setup - below settings.numpy_collide_min_pairs pairs
+# the grid (SpatialHash) handles the query, and so does spritecollide() (one sprite against a group).
+#
+# numpy isn't needed for anything else in the game. Without it, available() is False and the game uses the grid.
+from itertools import chain
+
+from spatial_hash import SpatialHash
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency - the grid backend works without it
+    np = None
+
+
+def available():
+    """Can the numpy backend be used here?"""
+    return np is not None
+
+
+class NumpyCollider(SpatialHash):
+    """SpatialHash whose groupcollide() works out all the overlaps of two big groups with one numpy comparison."""
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.min_pairs = int(getattr(settings, "numpy_collide_min_pairs", 1024))
+        self._packed = {}  # id(group) -> (group, sprites, boxes) - see _pack()
+
+    def begin_pass(self):
+        super().begin_pass()
+        self._packed.clear()
+
+    def invalidate(self, group):
+        super().invalidate(group)
+        self._packed.pop(id(group), None)
+
+    @staticmethod
+    def _still_packed(group, sprites):
+        # Added sprites go to the end of the group's spritedict, so if its last sprite is still the last one we packed,
+        # nothing was added since. (Killed sprites are fine - they're skipped when the hits are checked.)
+        return bool(sprites) and next(reversed(group.spritedict), None) is sprites[-1]
+
+    def _pack(self, group):
+        entry = self._packed.get(id(group))
+        if entry is not None and entry[0] is group and self._still_packed(group, entry[1]):
+            return entry[1], entry[2]
+        sprites = group.sprites()
+        count = len(sprites)
+        rects = np.fromiter(chain.from_iterable([sprite.rect for sprite in sprites]), dtype=np.int32,
+                            count=4 * count).reshape(count, 4)  # x, y, w, h per sprite
+        pad = self.pad
+        left = rects[:, 0] - pad
+        top = rects[:, 1] - pad
+        right = rects[:, 0] + rects[:, 2] + pad
+        bottom = rects[:, 1] + rects[:, 3] + pad
+        by_left = np.argsort(left, kind="stable")  # for the sweep when this group is group B
+        widest = int((right - left).max()) if count else 0
+        boxes = (left, top, right, bottom, by_left, left[by_left], widest)
+        if count >= self.min_group_size:  # small groups (players, shields) get knocked around mid-pass - always repack
+            self._packed[id(group)] = (group, sprites, boxes)
+        return sprites, boxes
+
+    def groupcollide(self, groupa, groupb, dokilla, dokillb, collided=None):
+        """Same as pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb, collided) (see module notes)."""
+        if not self.enabled or len(groupa) * len(groupb) < self.min_pairs:
+            return super().groupcollide(groupa, groupb, dokilla, dokillb, collided)
+        sprites_a, (a_left, a_top, a_right, a_bottom, _, _, _) = self._pack(groupa)
+        sprites_b, (b_left, b_top, b_right, b_bottom, by_left, sorted_left, widest) = self._pack(groupb)
+
+        # For each A sprite, the run of B sprites (in left-edge order) with a_left - widest < b_left < a_right
+        start = np.searchsorted(sorted_left, a_left - widest, side="right")
+        stop = np.searchsorted(sorted_left, a_right, side="left")
+        counts = np.maximum(stop - start, 0)
+        total = int(counts.sum())
+        self.pairs_tested += total
+        if not total:
+            return {}
+        # Flatten the runs into candidate pairs (row in A, column in B)
+        rows = np.repeat(np.arange(len(sprites_a)), counts)
+        run_start = np.repeat(start - (np.cumsum(counts) - counts), counts)  # index into sorted_left minus pair number
+        cols = by_left[np.arange(total) + run_start]
+        overlap = ((a_left[rows] < b_right[cols]) & (a_right[rows] > b_left[cols])
+                   & (a_top[rows] < b_bottom[cols]) & (a_bottom[rows] > b_top[cols]))
+        rows = rows[overlap]
+        cols = cols[overlap]
+        in_order = np.lexsort((cols, rows))  # A's order, then B's order within each A sprite - same as pygame
+        rows = rows[in_order]
+        cols = cols[in_order]
+
+        candidates = {}  # row -> [columns], rows in order
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            bucket = candidates.get(row)
+            if bucket is None:
+                candidates[row] = [col]
+            else:
+                bucket.append(col)
+
+        crashed = {}
+        in_a = groupa.has_internal
+        in_b = groupb.has_internal
+        for row, cols_hit in candidates.items():
+            sprite = sprites_a[row]
+            if not in_a(sprite):
+                continue
+            collide = sprite.rect.colliderect
+            hits = []
+            for col in cols_hit:
+                other = sprites_b[col]
+                if in_b(other) and collide(other.rect) and (collided is None or collided(sprite, other)):
+                    hits.append(other)
+            if hits:
+                if dokillb:
+                    for other in hits:
+                        other.kill()  # gone for the rest of groupa, same as pygame
+                crashed[sprite] = hits
+                if dokilla:
+                    sprite.kill()
+        return crashed
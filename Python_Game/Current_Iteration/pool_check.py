@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       pool_check.py (this file)
+#       headless_sim.py
+#       Visintainer_A_AlienGame.py (main file) and everything it needs
+#
+# Author: Anthony Visintainer
+#
+# Does a recycled alien start with a clean bullet count? Level 1 fleet aliens are pooled (sprite_pool.py) and the
+# alien bullet caps count shots per shooter object (BulletGroup.count_owned, bullet.py), so an alien that went
+# back on the free list while its bullets were still flying would come back with those bullets counted against it -
+# and fire less than it should until they were gone.
+#
+# The check: level 1 aliens are acquired one after another at the top of an empty field, each one fires through the
+# game's own fire_alien_bullet() until it hits its bullet cap, and is killed a few ticks later with all of its bullets
+# still in flight. Every alien has to start at count_owned() == 0 and get its whole cap of bullets out, and some of
+# them have to actually be recycled ones (otherwise the check didn't check anything). Exit code 1 if not.
+#       python pool_check.py
+#       python pool_check.py --aliens 200 --gap 10
+import sys
+import argparse
+
+import game_clock
+
+
+def run_check(aliens, gap, seed):
+    """Acquire/fire/kill `aliens` level 1 aliens, `gap` ticks apart. Returns (recycled, dirty, short) counts."""
+    from headless_sim import HeadlessSimulation
+    from alien import Alien
+    import sprite_pool
+
+    sim = HeadlessSimulation({"starting_wave": 1, "num_players": 1}, seed=seed)
+    game = sim.game
+    settings = game.settings
+    for group in (game.aliens, game.minions, game.alien_bullets, game.player_bullets, game.powerups, game.shields,
+                  game.shockwaves, game.players, game.lifepods):
+        group.empty()  # nothing on the field but the aliens and their bullets
+
+    cap = settings.alien1_bullet_max
+    seen = set()  # every alien handed out so far (the pool keeps them alive, so they're never garbage collected)
+    recycled = dirty = short = 0
+    for number in range(aliens):
+        alien = Alien.acquire(settings, game.screen, level=1)
+        if alien in seen:
+            recycled += 1
+        seen.add(alien)
+        if game.alien_bullets.count_owned(alien):
+            dirty += 1  # came back with shots of an earlier life counted against it
+        alien.rect.midtop = (settings.screen_width * (number % 8 + 1) // 9, 40)
+        game.aliens.add(alien)
+
+        before = len(game.alien_bullets)
+        for _ in range(cap + 1):  # one more than the cap - the last one has to be refused
+            game.fire_alien_bullet(alien, 1)
+        if len(game.alien_bullets) - before != cap:
+            short += 1  # got fewer (or more) shots out than its cap allows
+
+        alien.kill()  # its bullets are still on their way down
+        for _ in range(gap):
+            game_clock.advance(sim.frame_ms)
+            sprite_pool.recycle()
+            game.alien_bullets.update()
+    sim.close()
+    return recycled, dirty, short
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that recycled fleet aliens start with no bullets counted.")
+    parser.add_argument("--aliens", type=int, default=120, help="aliens to acquire, fire and kill")
+    parser.add_argument("--gap", type=int, default=20, help="ticks between one alien's death and the next one")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    recycled, dirty, short = run_check(args.aliens, args.gap, args.seed)
+    print(f"{'aliens':>8} {'recycled':>9} {'dirty':>7} {'short':>7}")
+    print(f"{args.aliens:8d} {recycled:9d} {dirty:7d} {short:7d}")
+    if dirty or short:
+        print("recycled aliens came back with bullets of an earlier life counted against them")
+        return 1
+    if not recycled:
+        print("no alien was recycled - nothing was checked (are sprite pools off?)")
+        return 1
+    print("every recycled alien started at count_owned() == 0")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
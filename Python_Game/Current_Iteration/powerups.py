@@ -2,11 +2,15 @@
 #powerup logic and behavior lives here; information on drop probabilities, specs, etc is in base_settings. 
 
 import math
-import random
+from game_rng import rng, fx_rng
 import pygame
+import game_clock
+import quality_governor
 
 from bullet import Bullet, VictoryFireworkShellSmall  # uses your existing Bullet class
 from shield import Shield  # or wherever your Shield class actually lives
+from sprite_pool import Pooled  # pickups and mom bullets are recycled (see sprite_pool.py)
+from entity import Entity  # mom bullets and dad shockwaves are slotted entities, not full sprites (see entity.py)
 
 
 def choose_powerup_type(settings, is_bonus_wave=False) -> str | None:
@@ -17,7 +21,7 @@ def choose_powerup_type(settings, is_bonus_wave=False) -> str | None:
     
     # Bonus wave: only dad and mom powerups
     if is_bonus_wave:
-        return random.choice(["dad", "mom"])
+        return rng.choice(["dad", "mom"])
 
     candidates = []
     for ptype, w in settings.powerup_weights.items():
@@ -34,7 +38,7 @@ def choose_powerup_type(settings, is_bonus_wave=False) -> str | None:
         return None
 
     total = sum(w for _, w in candidates)
-    r = random.random() * total
+    r = rng.random() * total
     acc = 0.0
     for ptype, w in candidates:
         acc += w
@@ -43,13 +47,16 @@ def choose_powerup_type(settings, is_bonus_wave=False) -> str | None:
     return candidates[-1][0]
 
 
-class PowerUpPickup(pygame.sprite.Sprite):
+class PowerUpPickup(Pooled, pygame.sprite.Sprite):
     """A drifting pickup that increments a player's inventory on collision."""
     def __init__(self, settings, screen, ptype: str, centerx: int, centery: int):
         super().__init__()
+        self.reset(settings, screen, ptype, centerx, centery)
+
+    def reset(self, settings, screen, ptype: str, centerx: int, centery: int):
+        """Set up a fresh or recycled (sprite_pool.py) pickup. The png is only loaded and scaled again if the type or size changed."""
         self.settings = settings
         self.screen = screen
-        self.ptype = ptype
 
         path_map = {
             "squadron": settings.powerup_squadron_path,
@@ -62,7 +69,6 @@ class PowerUpPickup(pygame.sprite.Sprite):
         if not path:
             raise ValueError(f"Unknown powerup type: {ptype}")
 
-        self.image = pygame.image.load(path).convert_alpha()
         # Mom and dad powerups are 44% larger (1.44x = 20% larger than current 20%)
         if ptype == "flyby":
             base_size = 55
@@ -71,13 +77,18 @@ class PowerUpPickup(pygame.sprite.Sprite):
             base_size = round(30 * 1.44)  # 44% larger = 43
         else:
             base_size = 30
-        self.image = pygame.transform.smoothscale(self.image, (round(self.settings.multiplayer_resizer*base_size), round(self.settings.multiplayer_resizer*base_size)))
+        size = (round(self.settings.multiplayer_resizer*base_size), round(self.settings.multiplayer_resizer*base_size))
+        if (path, size) != getattr(self, "_image_key", None):
+            self.image = pygame.image.load(path).convert_alpha()
+            self.image = pygame.transform.smoothscale(self.image, size)
+            self._image_key = (path, size)
+        self.ptype = ptype
         self.rect = self.image.get_rect(center=(centerx, centery))
 
         self.spawn_x = float(self.rect.centerx)
         self.y = float(self.rect.y)
-        self.t0 = pygame.time.get_ticks()
-        self.phase = random.random() * math.tau
+        self.t0 = game_clock.get_ticks()
+        self.phase = rng.random() * math.tau
         
         # Mom and dad powerups use slower movement
         if ptype in ("dad", "mom"):
@@ -88,10 +99,10 @@ class PowerUpPickup(pygame.sprite.Sprite):
             self.zigzag_freq = self.settings.powerup_zigzag_freq
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         t = (now - self.t0)
 
-        self.y += self.fall_speed
+        self.y += self.fall_speed * game_clock.frame_scale
         zig = math.sin(self.phase + t * self.zigzag_freq) * self.settings.powerup_zigzag_amp
 
         self.rect.y = int(self.y)
@@ -140,7 +151,10 @@ class SquadronShip(pygame.sprite.Sprite):
 
         self.speed_modifier = 0.0  # Speed reduction from damage
 
-        self.y = float(self.rect.centery)
+        # float position (rect.x/rect.y) - moves are fractions of a pixel per step at high step rates, so they add up here
+        # and rect gets the whole pixels (the bullet-bump code in the main file moves rect.x and syncs self.x)
+        self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
 
     def take_hit(self, dmg=1):
         self.hp -= dmg
@@ -210,28 +224,26 @@ class SquadronShip(pygame.sprite.Sprite):
         tx, ty = self._target_pos()
 
         # Smooth chase (low compute, looks nice)
-        dx = tx - self.rect.centerx
-        dy = ty - self.rect.centery
+        dx = tx - (self.x + self.rect.width / 2)
+        dy = ty - (self.y + self.rect.height / 2)
 
         dist = max(1.0, (dx * dx + dy * dy) ** 0.5)
-        current_speed = self.base_speed - self.speed_modifier
+        current_speed = (self.base_speed - self.speed_modifier) * game_clock.frame_scale
         step = min(current_speed, dist)
 
-        self.rect.centerx += int(dx / dist * step)
-        self.rect.centery += int(dy / dist * step)
+        self.x += dx / dist * step
+        self.y += dy / dist * step
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
 
         # Clamp to playfield (never down into HUD strip)
         if self.rect.bottom > self.settings.play_height:
             self.rect.bottom = self.settings.play_height
+            self.y = float(self.rect.y)
 
     def try_fire(self, bullets_group, fireworks_group=None):
-        # Limit squadron bullets on screen - count bullets fired by this specific squadron
-        active = 0
-        for b in bullets_group.sprites():
-            squadron_ref = getattr(b, "squadron_ref", None)
-            if squadron_ref is self:
-                active += 1
-        if active >= self.max_bullets:
+        # Limit squadron bullets on screen - bullets fired by this specific squadron, counted live by the group (BulletGroup, bullet.py)
+        if bullets_group.count_owned(self) >= self.max_bullets:
             return False  # Return False if didn't fire
 
         if fireworks_group is not None:
@@ -245,7 +257,7 @@ class SquadronShip(pygame.sprite.Sprite):
                 squadron_ref=self
             )
         else:
-            b = Bullet(
+            b = Bullet.acquire(
                 self.settings, self.screen,
                 self.rect.centerx, self.rect.top,
                 direction=-1,
@@ -271,12 +283,12 @@ class Nanite(pygame.sprite.Sprite):
         # Randomize movement speed slightly per nanite: [base-0.1, base, base+0.1]
         base_speed = float(getattr(self.settings, "nanite_speed", 1.0))
         delta = float(getattr(self.settings, "nanite_speed_variation_delta", 0.1))
-        self.move_speed = max(0.1, base_speed + random.choice([-delta, 0.0, delta]))
+        self.move_speed = max(0.1, base_speed + rng.choice([-delta, 0.0, delta]))
 
         # Beam flicker (arc-welder style): per-nanite state so multiple beams don't sync perfectly
         self._beam_on = True
         self._beam_alpha = 255
-        self._beam_next_flicker_ms = pygame.time.get_ticks()
+        self._beam_next_flicker_ms = game_clock.get_ticks()
 
         self.image = pygame.image.load(settings.nanite_path).convert_alpha()
         self.image = pygame.transform.smoothscale(self.image, (round(self.settings.multiplayer_resizer*22), round(self.settings.multiplayer_resizer*22)))
@@ -285,9 +297,11 @@ class Nanite(pygame.sprite.Sprite):
 
         # Start offscreen below, center:
         self.rect.center = (settings.screen_width // 2, settings.screen_height + 40)
+        self.x = float(self.rect.x)  # float position, same as squadrons (rect gets the whole pixels)
+        self.y = float(self.rect.y)
 
         self.pulses_done = 0
-        self.last_pulse_ms = pygame.time.get_ticks()
+        self.last_pulse_ms = game_clock.get_ticks()
 
         self.state = "approach"  # approach -> pulse -> exit
         self.exit_image = None
@@ -317,17 +331,19 @@ class Nanite(pygame.sprite.Sprite):
             self.kill()
             return
 
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         tx, ty = self._target_anchor()
 
         if self.state == "approach":
-            dx = tx - self.rect.centerx
-            dy = ty - self.rect.centery
+            dx = tx - (self.x + self.rect.width / 2)
+            dy = ty - (self.y + self.rect.height / 2)
             dist = max(1.0, (dx * dx + dy * dy) ** 0.5)
-            step = min(self.move_speed, dist)
+            step = min(self.move_speed * game_clock.frame_scale, dist)
 
-            self.rect.centerx += int(dx / dist * step)
-            self.rect.centery += int(dy / dist * step)
+            self.x += dx / dist * step
+            self.y += dy / dist * step
+            self.rect.x = int(self.x)
+            self.rect.y = int(self.y)
 
             # close enough -> start pulsing
             if abs(dx) <= 3 and abs(dy) <= 3:
@@ -337,6 +353,8 @@ class Nanite(pygame.sprite.Sprite):
         elif self.state == "pulse":
             # Stay locked to target
             self.rect.midbottom = (tx, ty)
+            self.x = float(self.rect.x)
+            self.y = float(self.rect.y)
 
             if now - self.last_pulse_ms >= self.settings.nanite_pulse_interval_ms:
                 self.last_pulse_ms = now
@@ -350,7 +368,8 @@ class Nanite(pygame.sprite.Sprite):
                     self.state = "exit"
 
         elif self.state == "exit":
-            self.rect.centery += int(self.move_speed * 2)
+            self.y += self.move_speed * 2 * game_clock.frame_scale
+            self.rect.y = int(self.y)
             if self.rect.top > self.settings.screen_height_total + 40:
                 self.kill()
 
@@ -365,26 +384,32 @@ class Nanite(pygame.sprite.Sprite):
         beam_rect.top = y1
 
         # Arc-welder flicker: very fast, slightly irregular, with randomized brightness/alpha.
-        now = pygame.time.get_ticks()
+        # (fx_rng, not rng: this runs at draw time, so it must not use up gameplay random rolls)
+        now = game_clock.get_ticks()
         if now >= getattr(self, "_beam_next_flicker_ms", 0):
             min_ms = int(getattr(self.settings, "nanite_beam_flicker_min_ms", 10))
             max_ms = int(getattr(self.settings, "nanite_beam_flicker_max_ms", 35))
             if max_ms < min_ms:
                 max_ms = min_ms
-            self._beam_next_flicker_ms = now + random.randint(min_ms, max_ms)
+            self._beam_next_flicker_ms = now + fx_rng.randint(min_ms, max_ms)
 
             on_prob = float(getattr(self.settings, "nanite_beam_on_probability", 0.85))
-            self._beam_on = (random.random() < on_prob)
+            self._beam_on = (fx_rng.random() < on_prob)
 
             a_min = int(getattr(self.settings, "nanite_beam_alpha_min", 30))
             a_max = int(getattr(self.settings, "nanite_beam_alpha_max", 255))
             if a_max < a_min:
                 a_max = a_min
-            self._beam_alpha = random.randint(a_min, a_max)
+            self._beam_alpha = fx_rng.randint(a_min, a_max)
 
         if not getattr(self, "_beam_on", True):
             return
 
+        # Under heavy load (quality_governor) skip the per-frame alpha surface and draw a plain beam
+        if not quality_governor.beam_effects_enabled():
+            pygame.draw.rect(self.screen, (245, 245, 245), beam_rect)
+            return
+
         # Draw as alpha surface (pygame.draw.rect has no alpha on the main surface)
         beam_surf = pygame.Surface((beam_rect.width, beam_rect.height), pygame.SRCALPHA)
         beam_surf.fill((245, 245, 245, int(getattr(self, "_beam_alpha", 255))))
@@ -396,8 +421,7 @@ class Shockwave(pygame.sprite.Sprite):
         super().__init__()
         self.settings = settings
         self.screen = screen
-        self.owner = owner_ship
-        self.hit_aliens = set()  # Track which aliens this shockwave has already hit
+        self.owner = owner_ship  # (each alien is hit once per shockwave - see spritecollide_entering() in spatial_hash.py)
 
         img = pygame.image.load(settings.shockwave_path).convert_alpha()
         self.image = pygame.transform.smoothscale(img, (round(self.settings.multiplayer_resizer*200), round(self.settings.multiplayer_resizer*95)))
@@ -405,9 +429,11 @@ class Shockwave(pygame.sprite.Sprite):
 
         # Spawn "in front" of player (above it)
         self.rect.midbottom = owner_ship.rect.midtop
+        self.y = float(self.rect.y)  # float position - shockwave_speed isn't a whole number of pixels per step
 
     def update(self):
-        self.rect.y -= int(self.settings.shockwave_speed)
+        self.y -= self.settings.shockwave_speed * game_clock.frame_scale
+        self.rect.y = int(self.y)
         if self.rect.bottom < 0:
             self.kill()
 
@@ -471,7 +497,7 @@ class DadShip(pygame.sprite.Sprite):
         
     def update(self):
         # Move ship
-        self.x += self.speed * self.direction
+        self.x += self.speed * self.direction * game_clock.frame_scale
         self.rect.centerx = int(self.x)
         
         # Fire shockwave when left edge passes right edge (for right->left) or right edge passes left edge (for left->right)
@@ -486,7 +512,7 @@ class DadShip(pygame.sprite.Sprite):
         # Check if off-screen - only kill after third run (run_number == 2)
         if self.direction == -1 and self.rect.right < 0:  # Exited left
             if self.run_number < 2:  # Schedule next run (runs 0 and 1)
-                self.next_run_time = pygame.time.get_ticks() + 2000  # 2 seconds
+                self.next_run_time = game_clock.get_ticks() + 2000  # 2 seconds
                 self.is_complete = True  # Mark as complete, don't kill yet
                 # Move way off screen so it's not visible
                 self.rect.right = -1000
@@ -494,7 +520,7 @@ class DadShip(pygame.sprite.Sprite):
                 self.kill()  # Final run, kill the sprite
         elif self.direction == 1 and self.rect.left > self.settings.screen_width:  # Exited right
             if self.run_number < 2:  # Schedule next run (runs 0 and 1)
-                self.next_run_time = pygame.time.get_ticks() + 2000  # 2 seconds
+                self.next_run_time = game_clock.get_ticks() + 2000  # 2 seconds
                 self.is_complete = True  # Mark as complete, don't kill yet
                 # Move way off screen so it's not visible
                 self.rect.left = self.settings.screen_width + 1000
@@ -517,8 +543,9 @@ class DadShip(pygame.sprite.Sprite):
         return shockwave
 
 
-class DadShockwave(pygame.sprite.Sprite):
+class DadShockwave(Entity):
     """Dad shockwave that travels in the same direction as the dad ship and damages kitties."""
+    __slots__ = ("settings", "screen", "image", "rect", "x", "direction", "speed")
     def __init__(self, settings, screen, x, y, direction, flipped=False):
         super().__init__()
         self.settings = settings
@@ -541,9 +568,11 @@ class DadShockwave(pygame.sprite.Sprite):
         else:  # Moving right
             self.rect.left = x  # Anchor left edge at fire position
         self.rect.centery = y
+        self.x = float(self.rect.x)  # float position, same as the dad ship's
         
     def update(self):
-        self.rect.x += int(self.speed * self.direction)
+        self.x += self.speed * self.direction * game_clock.frame_scale
+        self.rect.x = int(self.x)
         # Kill when off-screen based on direction
         if self.direction == -1:  # Moving left
             if self.rect.right < 0:
@@ -582,12 +611,12 @@ class MomShip(pygame.sprite.Sprite):
         shield_count = len(self.shield_slots) if self.shield_slots else 0
         # Fire 14 bullets per player + 14 bullets per shield slot
         self.total_bullets = 14 * (alive_count + shield_count)
-        self.next_fire_time = pygame.time.get_ticks()
+        self.next_fire_time = game_clock.get_ticks()
         self.fire_interval = 200  # 200ms between shots
         
     def update(self):
         if self.state == "ascending":
-            self.y -= self.speed
+            self.y -= self.speed * game_clock.frame_scale
             self.rect.y = int(self.y)
             if self.rect.bottom <= self.target_y:
                 self.state = "firing"
@@ -595,7 +624,7 @@ class MomShip(pygame.sprite.Sprite):
                 self.y = float(self.rect.y)
         
         elif self.state == "firing":
-            now = pygame.time.get_ticks()
+            now = game_clock.get_ticks()
             if now >= self.next_fire_time and self.bullets_fired < self.total_bullets:
                 # Fire bullets at all alive players and shield slots
                 # Store bullets to be added to group
@@ -605,7 +634,7 @@ class MomShip(pygame.sprite.Sprite):
                 # Fire at players
                 alive_players = [p for p in self.players_group if p.player_state == "alive"]
                 for player in alive_players:
-                    bullet = MomBullet(self.settings, self.screen, target_player=player, 
+                    bullet = MomBullet.acquire(self.settings, self.screen, target_player=player, 
                                       start_x=self.rect.centerx, start_y=self.rect.centery)
                     self.bullets_to_fire.append(bullet)
                 
@@ -613,7 +642,7 @@ class MomShip(pygame.sprite.Sprite):
                 if self.shield_slots:
                     for slot_rect in self.shield_slots:
                         # Target the center of the shield slot
-                        bullet = MomBullet(self.settings, self.screen, target_player=None,
+                        bullet = MomBullet.acquire(self.settings, self.screen, target_player=None,
                                           start_x=self.rect.centerx, start_y=self.rect.centery,
                                           target_x=slot_rect.centerx, target_y=slot_rect.centery)
                         self.bullets_to_fire.append(bullet)
@@ -631,29 +660,39 @@ class MomShip(pygame.sprite.Sprite):
                 self.state = "exiting"
         
         elif self.state == "exiting":
-            self.y += self.speed
+            self.y += self.speed * game_clock.frame_scale
             self.rect.y = int(self.y)
             if self.rect.top > self.settings.screen_height:
                 self.kill()
 
 
-class MomBullet(pygame.sprite.Sprite):
+class MomBullet(Pooled, Entity):
     """Mom's white charge shot that targets player midbottom or a fixed position."""
+    __slots__ = ("settings", "screen", "target_player", "is_fixed_target", "image", "rect", "x", "y", "speed",
+                 "target_x", "target_y")
     def __init__(self, settings, screen, target_player=None, start_x=None, start_y=None, target_x=None, target_y=None):
         super().__init__()
+        self.image = None
+        self.reset(settings, screen, target_player, start_x, start_y, target_x, target_y)
+
+    def reset(self, settings, screen, target_player=None, start_x=None, start_y=None, target_x=None, target_y=None):
+        """Set up a fresh or recycled (sprite_pool.py) mom bullet."""
         self.settings = settings
         self.screen = screen
         self.target_player = target_player  # Can be None if targeting fixed position
         self.is_fixed_target = target_player is None
         
-        # Create white square (scaled by multiplayer_resizer)
+        # Create white square (scaled by multiplayer_resizer) - a recycled bullet keeps its square if the size still fits
         resize = settings.multiplayer_resizer
         size = max(1, round(7 * resize))  # Ensure at least 1 pixel
-        self.image = pygame.Surface((size, size))
-        self.image.fill((255, 255, 255))
+        if self.image is None or self.image.get_width() != size:
+            self.image = pygame.Surface((size, size))
+            self.image.fill((255, 255, 255))
         self.rect = self.image.get_rect()
         self.rect.centerx = start_x
         self.rect.centery = start_y
+        self.x = float(self.rect.x)  # float position - the homing steps are fractions of a pixel on each axis
+        self.y = float(self.rect.y)
         
         self.speed = 4.5
         
@@ -679,12 +718,15 @@ class MomBullet(pygame.sprite.Sprite):
                 return
         
         # Move toward target
-        dx = self.target_x - self.rect.centerx
-        dy = self.target_y - self.rect.centery
+        dx = self.target_x - (self.x + self.rect.width / 2)
+        dy = self.target_y - (self.y + self.rect.height / 2)
         dist = max(1.0, (dx * dx + dy * dy) ** 0.5)
         
-        self.rect.centerx += int((dx / dist) * self.speed)
-        self.rect.centery += int((dy / dist) * self.speed)
+        step = self.speed * game_clock.frame_scale
+        self.x += (dx / dist) * step
+        self.y += (dy / dist) * step
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
         
         # Kill if off-screen
         if (self.rect.right < 0 or self.rect.left > self.settings.screen_width or
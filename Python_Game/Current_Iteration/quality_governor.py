@@ -0,0 +1,106 @@
+#quality_governor.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       quality_governor.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# Adaptive quality for COSMETIC work only. The main loop reports how long each frame's work took (input + updates +
+# drawing, not the time spent waiting in clock.tick); when that stays over settings.quality_frame_budget_ms the
+# governor steps the quality level down, and once frames have been comfortably under budget for a while it steps
+# back up. Sprites and draw code ask this module what they're allowed to do:
+#
+#   level 3 (full)   everything on
+#   level 2          victory firework sparks thinned out
+#   level 1          fewer sparks still and one spark ring per burst, nanite beam drawn without the alpha-surface
+#                    flicker, background swaps snap instead of crossfading
+#   level 0          fewest sparks, death animations at half their frame rate, bullet blink effects frozen
+#
+# Gameplay never reads this: hitboxes, speeds, spawns, timers and the gameplay RNG don't change with the level.
+# (Firework spark lifetimes come from game_rng.fx_rng for that reason - fewer sparks must not use up fewer gameplay rolls.)
+# Headless runs never report frames, so they always stay at full quality.
+
+FULL_QUALITY = 3
+level = FULL_QUALITY  # current quality level, 0..FULL_QUALITY
+
+_FIREWORK_DENSITY = (0.25, 0.45, 0.65, 1.0)  # share of firework sparks kept, per level
+
+
+def firework_density() -> float:
+    """Share (0..1) of victory firework sparks to actually spawn."""
+    return _FIREWORK_DENSITY[level]
+
+
+def firework_sets(sets) -> int:
+    """Spark rings per firework burst (multi-ring bursts collapse to one ring from level 1 down)."""
+    return sets if level >= 2 else 1
+
+
+def beam_effects_enabled() -> bool:
+    """Nanite beam alpha/flicker surfaces (otherwise a plain solid beam)."""
+    return level >= 2
+
+
+def background_crossfade_enabled() -> bool:
+    return level >= 2
+
+
+def death_animation_frame_step() -> int:
+    """Show every Nth death-animation frame (each one held N times as long, so the total length never changes)."""
+    return 1 if level >= 1 else 2
+
+
+def bullet_blink_enabled() -> bool:
+    return level >= 1
+
+
+def reset() -> None:
+    """Back to full quality (new game)."""
+    global level
+    level = FULL_QUALITY
+
+
+class QualityGovernor:
+    """Watches frame work time and moves the module-level quality `level` up or down with some hysteresis."""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.enabled = bool(getattr(settings, "quality_governor_enabled", True))
+        self.budget_ms = float(getattr(settings, "quality_frame_budget_ms", 14.0))
+        self.recover_ratio = float(getattr(settings, "quality_recover_ratio", 0.7))
+        self.downgrade_frames = int(getattr(settings, "quality_downgrade_frames", 20))
+        self.upgrade_frames = int(getattr(settings, "quality_upgrade_frames", 180))
+        self.average_ms = 0.0  # smoothed frame work time
+        self._over = 0  # frames in a row with the average over budget
+        self._under = 0  # frames in a row with the average comfortably under budget
+
+    def reset(self):
+        self.average_ms = 0.0
+        self._over = self._under = 0
+        reset()
+
+    def frame(self, work_ms):
+        """Report one frame's work time (ms). Returns the (possibly changed) quality level."""
+        global level
+        if not self.enabled:
+            return level
+        # Exponential moving average, so one slow frame (a sound loading, a GC pause) doesn't trigger anything
+        self.average_ms += (work_ms - self.average_ms) * 0.1
+        if self.average_ms > self.budget_ms:
+            self._over += 1
+            self._under = 0
+        elif self.average_ms < self.budget_ms * self.recover_ratio:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = self._under = 0
+
+        if self._over >= self.downgrade_frames and level > 0:
+            level -= 1
+            self._over = 0
+        elif self._under >= self.upgrade_frames and level < FULL_QUALITY:
+            level += 1
+            self._under = 0
+        return level
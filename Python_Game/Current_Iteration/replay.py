@@ -0,0 +1,143 @@
+#replay.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       replay.py (this file)
+#       game_rng.py
+#
+# Author: Anthony Visintainer
+#
+# Input recording + deterministic replay.
+# With the fixed-timestep loop (Main_Game_Loop), the shared game_clock and the seeded game_rng, a game session is
+# fully decided by: the settings at start, the start config from the menu, the RNG seed, the clock's start time and
+# which keys were pressed/released before which simulation step. A replay file stores exactly that, plus a state
+# checksum every so often so a replay can tell you the first tick where it stopped matching the original session.
+#
+# Recording: set settings.record_replays = True (the main loop writes a file per game, see settings.replay_path).
+# Playback:  python headless_sim.py --replay replay_20260101_120000.json.gz
+#
+# File format (gzipped JSON):
+#   {"version": 1, "seed": ..., "start_ms": ..., "step_ms": ..., "start_config": {...}, "settings": {...},
+#    "events": [[tick, down(1)/up(0), key, mod], ...], "checksums": [[tick, crc32], ...], "ticks": total_steps}
+import gzip
+import json
+import time
+import zlib
+
+import pygame
+
+import game_rng
+
+REPLAY_VERSION = 1
+
+
+def settings_snapshot(settings) -> dict:
+    """Every plain-data setting (numbers, strings, flags, simple lists) - the things the menus can change."""
+    snapshot = {}
+    for name, value in vars(settings).items():
+        try:
+            encoded = json.loads(json.dumps(value))
+        except (TypeError, ValueError):
+            continue  # surfaces, sounds etc. - loaded from disk, not chosen by the player
+        if isinstance(value, tuple):
+            encoded = tuple(encoded)
+        if encoded == value:  # skip anything JSON can't give back as-is (int dict keys, nested tuples)
+            snapshot[name] = encoded
+    return snapshot
+
+
+def apply_settings_snapshot(settings, snapshot) -> None:
+    for name, value in snapshot.items():
+        if isinstance(getattr(settings, name, None), tuple):
+            value = tuple(value)
+        setattr(settings, name, value)
+
+
+def state_checksum(game) -> int:
+    """CRC32 of the bits of game state a desync would show up in first: state, wave, sprite positions, RNG state."""
+    parts = [game.game_state, str(game.current_wave_num)]
+    for group in game._interpolated_groups():
+        parts.append(str(len(group)))
+        parts.extend(f"{sprite.rect.x},{sprite.rect.y}" for sprite in group)
+    parts.append(str(game_rng.rng.getstate()[1]))  # includes the position in the stream, so one extra roll shows up
+    return zlib.crc32("|".join(parts).encode())
+
+
+class ReplayRecorder:
+    """Collects one session's key events per simulation tick; save() writes the replay file."""
+
+    def __init__(self, start_config, settings, seed, start_ms, step_ms, checksum_interval=60):
+        self.data = {
+            "version": REPLAY_VERSION,
+            "seed": seed,
+            "start_ms": start_ms,
+            "step_ms": step_ms,
+            "start_config": start_config,
+            "settings": settings_snapshot(settings),
+            "events": [],
+            "checksums": [],
+            "ticks": 0,
+        }
+        self.checksum_interval = max(1, int(checksum_interval))
+
+    def record_event(self, tick, event):
+        """Call for every event the game handles; only key presses/releases are kept. tick = steps simulated so far."""
+        if event.type == pygame.KEYDOWN:
+            self.data["events"].append([tick, 1, event.key, getattr(event, "mod", 0)])
+        elif event.type == pygame.KEYUP:
+            self.data["events"].append([tick, 0, event.key, getattr(event, "mod", 0)])
+
+    def after_step(self, tick, game):
+        """Call after each simulation step (tick = steps completed, counting this one)."""
+        self.data["ticks"] = tick
+        if tick % self.checksum_interval == 0:
+            self.data["checksums"].append([tick, state_checksum(game)])
+
+    def save(self, path=None):
+        """Write the replay file. Returns the path, or None if the session never got past its first step."""
+        if not self.data["ticks"]:
+            return None
+        if path is None:
+            path = "replay_{timestamp}.json.gz"
+        path = path.format(timestamp=time.strftime("%Y%m%d_%H%M%S"))
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(self.data, f, separators=(",", ":"))
+        return path
+
+
+class Replay:
+    """A loaded replay file: hands back the recorded key events tick by tick and checks the state checksums."""
+
+    def __init__(self, data):
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay version {data.get('version')!r} (expected {REPLAY_VERSION})")
+        self.data = data
+        self.seed = data["seed"]
+        self.start_ms = data["start_ms"]
+        self.step_ms = data["step_ms"]
+        self.start_config = data["start_config"]
+        self.settings = data["settings"]
+        self.ticks = data["ticks"]
+        self._events = {}
+        for tick, down, key, mod in data["events"]:
+            self._events.setdefault(tick, []).append((down, key, mod))
+        self._checksums = dict(data["checksums"])
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def events_for_tick(self, tick):
+        """pygame events to feed to _check_keystroke_events() right before simulation step number `tick`."""
+        return [pygame.event.Event(pygame.KEYDOWN if down else pygame.KEYUP, key=key, mod=mod)
+                for down, key, mod in self._events.get(tick, ())]
+
+    def verify(self, tick, game):
+        """After step `tick`: None if it matches the recording (or there is no checksum for it), else (expected, actual)."""
+        expected = self._checksums.get(tick)
+        if expected is None:
+            return None
+        actual = state_checksum(game)
+        return None if actual == expected else (expected, actual)
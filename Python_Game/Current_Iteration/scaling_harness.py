@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       scaling_harness.py (this file)
+#       headless_sim.py
+#       Visintainer_A_AlienGame.py (main file) and everything it needs
+#
+# Author: Anthony Visintainer
+#
+# Entity-count stress test: how do _do_collisions and _draw_screen scale with the number of aliens and bullets?
+# For every point of an N x M grid it starts a fresh headless game, injects N aliens of EACH level (level 1 rows via
+# _spawn_level1_row, levels 2-7 via _spawn_single_alien, which also brings the laserminion escorts) and M bullets
+# (half alien bullets via fire_alien_bullet, half player bullets via _fire_player_bullet), scatters them over the
+# screen, and times a few ticks. Entities get shot down while it runs, so every tick's actual sprite counts are
+# recorded next to its timings.
+#
+# Output: a CSV with one row per grid point, a PNG chart (drawn with pygame, so no extra packages needed) of
+# collision and draw cost against alien count (one line per M), and a printout of the log-log slope between
+# neighbouring points - a slope near 1 is linear, near 2 is quadratic. Anything over 1.25 is flagged.
+#
+#       python scaling_harness.py
+#       python scaling_harness.py --aliens 0 5 10 20 40 80 --bullets 0 100 400 --ticks 60
+# Note: this is meant to be run before raising wave_master_index counts or bonus_wave_max_spawn_scale.
+import sys
+import csv
+import math
+import argparse
+from statistics import median
+
+import pygame
+
+ALIEN_LEVELS = (1, 2, 3, 4, 5, 6, 7)
+FIRING_LEVELS = (1, 2, 3, 5, 6, 7)  # level 4 aliens don't shoot
+SUPERLINEAR_SLOPE = 1.25
+LINE_COLORS = ((80, 200, 255), (255, 200, 60), (120, 255, 120), (255, 110, 110), (200, 130, 255), (255, 255, 255))
+
+
+class _UncappedBullets:
+    """While active, every *_bullet_max setting is lifted so the harness can put as many bullets on screen as it wants."""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.saved = {}
+
+    def __enter__(self):
+        for name, value in vars(self.settings).items():
+            if name.endswith("_bullet_max"):
+                self.saved[name] = value
+        for name in self.saved:
+            setattr(self.settings, name, 10 ** 6)
+        return self
+
+    def __exit__(self, *exc):
+        for name, value in self.saved.items():
+            setattr(self.settings, name, value)
+
+
+def _scatter(sprite, x, y):
+    """Move an injected sprite somewhere on the battlefield (keeps the float position in sync where there is one)."""
+    if hasattr(sprite, "spawn_pos"):
+        sprite.spawn_pos(x, y)
+    else:
+        sprite.rect.center = (x, y)
+        if hasattr(sprite, "x"):
+            sprite.x = float(sprite.rect.x)
+        if hasattr(sprite, "y"):
+            sprite.y = float(sprite.rect.y)
+
+
+def inject(game, aliens_per_level, bullets, rand):
+    """Put aliens_per_level aliens of every level and `bullets` bullets (half alien, half player) into the game."""
+    settings = game.settings
+    width = settings.screen_width
+    field_bottom = int(settings.screen_height * 0.6)
+
+    for group in (game.aliens, game.minions, game.alien_bullets, game.player_bullets):
+        group.empty()
+    if aliens_per_level:
+        # Level 1: whole fleet rows, then trim the last row down to exactly N
+        row_y = 40
+        while sum(1 for a in game.aliens if a.level == 1) < aliens_per_level:
+            game._spawn_level1_row(row_y)
+            row_y += 70  # same row spacing _new_alien_wave uses
+        extra = [a for a in game.aliens if a.level == 1][aliens_per_level:]
+        for alien in extra:
+            alien.kill()
+        for level in ALIEN_LEVELS[1:]:
+            for _ in range(aliens_per_level):
+                game._spawn_single_alien(level)
+        for sprite in list(game.aliens) + list(game.minions):
+            if getattr(sprite, "level", 0) != 1 or sprite in game.minions:
+                _scatter(sprite, rand.randint(40, width - 40), rand.randint(40, field_bottom))
+
+    shooters = [a for a in game.aliens if a.level in FIRING_LEVELS]
+    ships = [p for p in game.players if p.player_state == "alive"]
+    with _UncappedBullets(settings):
+        for i in range(bullets):
+            if i % 2 == 0 and shooters:
+                alien = rand.choice(shooters)
+                game.fire_alien_bullet(alien, alien.level, level1_3_already_fired=True)
+                group = game.alien_bullets
+            elif ships:
+                game._fire_player_bullet(rand.choice(ships))
+                group = game.player_bullets
+            else:
+                continue
+            newest = group.sprites()[-1] if group else None
+            if newest is not None:
+                _scatter(newest, rand.randint(10, width - 10), rand.randint(10, settings.screen_height - 10))
+
+
+def measure_point(aliens_per_level, bullets, ticks, players, difficulty, seed):
+    """One grid point: fresh game, inject, step `ticks` frames. Returns a result row (medians of per-tick values)."""
+    import random
+    from headless_sim import HeadlessSimulation
+
+    sim = HeadlessSimulation({"starting_wave": 1, "num_players": players}, difficulty=difficulty,
+                             render=True, seed=seed)
+    game = sim.game
+    try:
+        sim.step(5)  # let the first frame's one-off work (image scaling, fonts) happen before measuring
+        inject(game, aliens_per_level, bullets, random.Random(seed))
+        profiler = game.profiler
+        profiler.enabled = True
+        samples = []
+        for _ in range(ticks):
+            alien_count = len(game.aliens) + len(game.minions)
+            bullet_count = len(game.alien_bullets) + len(game.player_bullets)
+            if not sim.step():  # step() brackets the frame for the profiler; last_frame() reads it back
+                break
+            frame = profiler.last_frame()
+            samples.append((alien_count, bullet_count, frame.get("update", 0.0),
+                            frame.get("collisions", 0.0), frame.get("draw", 0.0)))
+    finally:
+        sim.close()
+
+    if not samples:
+        return None
+    return {
+        "aliens_per_level": aliens_per_level,
+        "bullets_injected": bullets,
+        "aliens": round(median(s[0] for s in samples), 1),
+        "bullets": round(median(s[1] for s in samples), 1),
+        "update_ms": round(median(s[2] for s in samples), 4),
+        "collisions_ms": round(median(s[3] for s in samples), 4),
+        "draw_ms": round(median(s[4] for s in samples), 4),
+        "ticks": len(samples),
+    }
+
+
+def _slope(x0, y0, x1, y1):
+    """log-log slope between two points (None if either side is too small to say anything)."""
+    if min(x0, x1) <= 0 or min(y0, y1) <= 0.001 or x0 == x1:
+        return None
+    return math.log(y1 / y0) / math.log(x1 / x0)
+
+
+def report_scaling(rows):
+    """Print log-log slopes along the alien axis (per bullet count) and the bullet axis (per alien count)."""
+    print("\nlog-log slope between neighbouring points (1 = linear, 2 = quadratic); * = superlinear")
+    for axis, fixed, key in (("aliens", "bullets_injected", "aliens"), ("bullets", "aliens_per_level", "bullets")):
+        for fixed_value in sorted({r[fixed] for r in rows}):
+            line = sorted((r for r in rows if r[fixed] == fixed_value), key=lambda r: r[key])
+            for phase in ("collisions_ms", "draw_ms"):
+                parts = []
+                for a, b in zip(line, line[1:]):
+                    slope = _slope(a[key], a[phase], b[key], b[phase])
+                    if slope is None:
+                        continue
+                    flag = "*" if slope > SUPERLINEAR_SLOPE else " "
+                    parts.append(f"{a[key]:.0f}->{b[key]:.0f}: {slope:4.2f}{flag}")
+                if parts:
+                    print(f"  vs {axis:<7} ({fixed}={fixed_value:<4}) {phase:<14} " + "  ".join(parts))
+
+
+def plot(rows, path):
+    """Two line charts side by side (collisions ms and draw ms against alien count, one line per bullet count)."""
+    pygame.init()
+    font = pygame.font.SysFont(None, 20)
+    chart_w, chart_h, pad = 560, 400, 50
+    surface = pygame.Surface((chart_w * 2, chart_h))
+    surface.fill((20, 20, 30))
+    bullet_values = sorted({r["bullets_injected"] for r in rows})
+    max_x = max(r["aliens"] for r in rows) or 1
+
+    for panel, phase in enumerate(("collisions_ms", "draw_ms")):
+        left = panel * chart_w
+        max_y = max(r[phase] for r in rows) or 1
+        plot_rect = pygame.Rect(left + pad, 30, chart_w - pad - 20, chart_h - 30 - pad)
+        pygame.draw.rect(surface, (90, 90, 110), plot_rect, 1)
+        surface.blit(font.render(f"{phase} vs aliens on screen", True, (230, 230, 230)), (left + pad, 8))
+        surface.blit(font.render(f"{max_y:.2f}", True, (180, 180, 180)), (left + 5, plot_rect.top))
+        surface.blit(font.render("0", True, (180, 180, 180)), (left + pad - 15, plot_rect.bottom - 10))
+        surface.blit(font.render(f"{max_x:.0f}", True, (180, 180, 180)), (plot_rect.right - 20, plot_rect.bottom + 5))
+
+        for i, bullets in enumerate(bullet_values):
+            color = LINE_COLORS[i % len(LINE_COLORS)]
+            line = sorted((r for r in rows if r["bullets_injected"] == bullets), key=lambda r: r["aliens"])
+            points = [(plot_rect.left + int(r["aliens"] / max_x * plot_rect.width),
+                       plot_rect.bottom - int(r[phase] / max_y * plot_rect.height)) for r in line]
+            if len(points) > 1:
+                pygame.draw.lines(surface, color, False, points, 2)
+            for point in points:
+                pygame.draw.circle(surface, color, point, 3)
+            if panel == 0:
+                surface.blit(font.render(f"M={bullets} bullets", True, color), (plot_rect.left + 8, plot_rect.top + 8 + i * 18))
+    pygame.image.save(surface, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep alien and bullet counts and time collisions/drawing.")
+    parser.add_argument("--aliens", type=int, nargs="+", default=[0, 5, 10, 20, 40], help="N: aliens of each level")
+    parser.add_argument("--bullets", type=int, nargs="+", default=[0, 50, 100, 200, 400], help="M: bullets injected")
+    parser.add_argument("--ticks", type=int, default=30, help="ticks measured per grid point")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--difficulty", default="hard")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--csv", default="scaling_results.csv")
+    parser.add_argument("--plot", default="scaling_plot.png")
+    args = parser.parse_args(argv)
+
+    rows = []
+    for n in args.aliens:
+        for m in args.bullets:
+            row = measure_point(n, m, args.ticks, args.players, args.difficulty, args.seed)
+            if row is None:
+                continue
+            rows.append(row)
+            print(f"N={n:<4} M={m:<5} aliens {row['aliens']:6.0f} bullets {row['bullets']:6.0f}  "
+                  f"update {row['update_ms']:7.3f}  collisions {row['collisions_ms']:7.3f}  draw {row['draw_ms']:7.3f} ms")
+
+    if not rows:
+        print("no results")
+        return 1
+    with open(args.csv, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    report_scaling(rows)
+    plot(rows, args.plot)
+    print(f"\nresults written to {args.csv}, chart to {args.plot}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,11 @@
 import pygame
+import game_clock
+
+
+def shield_blocks(bullet, shield):
+    """collided= for player bullets vs. shields: rects touch and the bullet isn't on a layer the shield lets through.
+    Owners' bullets drop out of the collision query itself instead of being skipped pair by pair afterwards."""
+    return not (bullet.owner_bit & shield.pass_mask) and bullet.rect.colliderect(shield.rect)
 
 
 class Shield(pygame.sprite.Sprite):
@@ -10,9 +17,12 @@ class Shield(pygame.sprite.Sprite):
 
         # Shield stages use color indices defined on settings.shield_colors
         self.stage_index = self.settings.shield_start_index  # start from settings-defined index
-        self.last_hit_time_ms = pygame.time.get_ticks()
+        self.last_hit_time_ms = game_clock.get_ticks()
         self.recharge_hit_counter = 0
         self.stage_improved = False  # Flag to track if stage improved (for sound)
+        # Collision layer (bullet.owner_bit): bullets whose owner_bit is in here fly straight through. 0 for ordinary
+        # shields; mom's mobile shields get their player's bit, so that player's own bullets pass through.
+        self.pass_mask = 0
 
         self._sync_color()
 
@@ -32,7 +42,7 @@ class Shield(pygame.sprite.Sprite):
             return
 
         self._sync_color()
-        self.last_hit_time_ms = pygame.time.get_ticks()
+        self.last_hit_time_ms = game_clock.get_ticks()
 
     def register_recharge_hit(self):
         """Track recharge hits; improve shield after enough hits per settings.
@@ -52,7 +62,7 @@ class Shield(pygame.sprite.Sprite):
         old_stage = self.stage_index
         self.stage_index = max(0, self.stage_index - amount)
         self._sync_color()
-        self.last_hit_time_ms = pygame.time.get_ticks()
+        self.last_hit_time_ms = game_clock.get_ticks()
         return self.stage_index < old_stage  # Return True if stage improved
 
     def update(self):
@@ -75,7 +85,7 @@ class Shield(pygame.sprite.Sprite):
             self.kill()
             return
         
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if now - self.last_hit_time_ms >= self.settings.shield_regen_delay:
             if self.stage_index > self.settings.shield_regen_cap_index:
                 old_stage = self.stage_index
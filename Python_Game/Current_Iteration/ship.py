@@ -14,6 +14,7 @@
 # For other ship settings (movement speed, firing speed, etc) check the base_settings.py file. 
 import pygame
 from base_settings import resource_path
+import game_clock
 
 ship1_path = resource_path("img/blueship.png")
 ship2_path = resource_path("img/redship.png")
@@ -155,26 +156,27 @@ class Ship(pygame.sprite.Sprite): #create a Ship class, that is a sub-class of t
             self.current_max_health = self.settings.player_starting_health + self.player_level # max health goes up with player level - this number will be useful when respawning or healing players.
         else:
             self.speed = self.settings.base_ship_speed
+        step = self.speed * game_clock.frame_scale # speeds are pixels per 60fps frame; frame_scale stretches them to the length of the simulation step
 
         if self.player_state == "alive": #NORMAL MOVEMENT AND LEVELING UP
             # Horizontal movement
             if self.moving_left and self.rect.left > 0: # if the left side of the ship sprite's rectangle is not past x=0 (the left edge of screen), -->
-                self.x -= self.speed #--> then increment ship position leftward by one unispeed defined in the settings file.
+                self.x -= step #--> then increment ship position leftward by one unispeed defined in the settings file.
             if self.moving_right and self.rect.right < self.settings.screen_width: #if the right side of the ship's sprite's rectangle is not past the maximum screen width (screen right edge)-->
-                self.x += self.speed #-->then increment ship position rightward by one unispeed etc.
+                self.x += step #-->then increment ship position rightward by one unispeed etc.
 
             # Vertical movement : same as above, but with vertical coordinates and motion.
             if self.moving_up and self.rect.top > 0:
-                self.y -= self.speed
+                self.y -= step
             if self.moving_down and self.rect.bottom < self.settings.screen_height:
-                self.y += self.speed
+                self.y += step
        
             self.rect.x = int(self.x) #return float value for x location to an integer value, so that it can be drawn (blit only accepts integers, since you can't draw between pixels)
             self.rect.y = int(self.y) #same as above, but for y location
 
             # Update level up animation line position
             if self.level_up_line_y != -1:
-                self.level_up_line_y -= 2  # Move upward at speed 2
+                self.level_up_line_y -= 2 * game_clock.frame_scale  # Move upward at speed 2
                 if self.level_up_line_y < self.rect.top:
                     self.level_up_animation_count += 1  # Increment completion counter
                     if self.level_up_animation_count < 8:
@@ -230,7 +232,7 @@ class Ship(pygame.sprite.Sprite): #create a Ship class, that is a sub-class of t
                 self.needs_heal = False
         elif self.player_state == "between_lives":
             # Fly down to bottom of screen at a fixed speed, ignore movement flags
-            self.y += self.respawn_fly_speed
+            self.y += self.respawn_fly_speed * game_clock.frame_scale
             if self.rect.bottom < self.respawn_target_y:
                 self.rect.y = int(self.y)
             else:
@@ -243,9 +245,9 @@ class Ship(pygame.sprite.Sprite): #create a Ship class, that is a sub-class of t
             # Park at bottom; allow horizontal movement to avoid enemy fire
             # Horizontal movement (left-right only)
             if self.moving_left and self.rect.left > 0:
-                self.x -= self.speed
+                self.x -= step
             if self.moving_right and self.rect.right < self.settings.screen_width:
-                self.x += self.speed
+                self.x += step
             
             # Update x position but keep y locked at bottom
             self.rect.x = int(self.x)
@@ -263,18 +265,18 @@ class Ship(pygame.sprite.Sprite): #create a Ship class, that is a sub-class of t
     
     def trigger_powerup_flash(self, ptype: str, duration_ms: int = 900) -> None:
             """Flash a specific powerup count in the HUD (ptype is 'squadron'/'nanites'/'shockwave')."""
-            now = pygame.time.get_ticks()
+            now = game_clock.get_ticks()
             if not hasattr(self, "powerup_flash_until_ms"):
                 self.powerup_flash_until_ms = {}
             self.powerup_flash_until_ms[ptype] = now + duration_ms
     
     def trigger_hit_animation(self, duration_ms: int = 450) -> None:
         """Trigger hit animation sprite swap (matches HUD health flash duration)."""
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         self.hit_animation_until_ms = now + duration_ms
         
     def draw(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         
         #Choose which image to display, based on state player is in:
         if self.player_state in ("between_lives", "respawning"):
@@ -376,19 +378,20 @@ class Lifepod_Squadron(pygame.sprite.Sprite):
 
     def update(self):
         """Update escape pod position and state."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
+        step = self.speed * game_clock.frame_scale  # per-60fps-frame speed scaled to the simulation step
 
         if self.state == "normal":
 
             # Normal movement
             if self.moving_left and self.rect.left > 0:
-                self.x -= self.speed
+                self.x -= step
             if self.moving_right and self.rect.right < self.settings.screen_width:
-                self.x += self.speed
+                self.x += step
             if self.moving_up and self.rect.top > 0:
-                self.y -= self.speed
+                self.y -= step
             if self.moving_down and self.rect.bottom < self.settings.screen_height:
-                self.y += self.speed
+                self.y += step
 
             # Update rect
             self.rect.centerx = int(self.x)
@@ -397,7 +400,7 @@ class Lifepod_Squadron(pygame.sprite.Sprite):
         elif self.state == "respawning":
             # Move to bottom at speed 6
             if self.rect.bottom < self.settings.screen_height:
-                self.y += 6
+                self.y += 6 * game_clock.frame_scale
                 self.rect.centery = int(self.y)
 
             # Check if respawn time is up
@@ -408,7 +411,7 @@ class Lifepod_Squadron(pygame.sprite.Sprite):
     def start_respawn(self):
         """Start the respawn animation."""
         self.state = "respawning"
-        self.respawn_start_time = pygame.time.get_ticks()
+        self.respawn_start_time = game_clock.get_ticks()
         self.image = self.respawn_image
 
         # Move to bottom position
@@ -0,0 +1,185 @@
+#spatial_hash.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       spatial_hash.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# Uniform-grid spatial hash for the collision passes. pygame.sprite.groupcollide(A, B) checks every sprite in A
+# against every sprite in B, so 4 players at level 11 (~100 bullets) against a screen full of aliens is thousands
+# of colliderect calls per pass, most of them between things on opposite sides of the screen.
+#
+# Here group B gets bucketed into square cells (settings.spatial_hash_cell_size px) and each sprite of A only gets
+# checked against the B sprites in the cells it touches - the cost follows how crowded that part of the screen is,
+# not how big the groups are. The bucketed version of a group is kept for the rest of the collision pass and shared
+# by every query against it (aliens are checked against shields, player bullets, lifepods... in the same pass).
+#
+# Results are exactly what pygame's groupcollide/spritecollide would return, in the same order (so seeded runs and
+# replays play out identically with the grid on or off):
+#   - dict keys follow group A's order, hit lists follow group B's order
+#   - sprites killed earlier in the pass (dokill, or by the game code in between) are skipped
+#   - the final check is always colliderect against the sprite's CURRENT rect, then the collided= callback if one was
+#     given (hitbox.collide_hitbox for the compound hitboxes of cruisers, destroyers and some kitties)
+# Every sprite is bucketed with a few pixels of padding (settings.spatial_hash_pad), so a rect that grows a little
+# mid-pass (an alien swapping to a bigger damage frame) is still found. Anything that moves further than that, or
+# sprites added to a group mid-pass, need invalidate(group).
+# When group B is small (players, shields, squadrons) it's group A that gets bucketed instead, and each B sprite
+# looks itself up in it; when both are small it's plain pygame - bucketing 4 sprites costs more than it saves.
+#
+# Area effects (shockwaves) hit each target once, when they first reach it, but they sit on top of their targets for
+# dozens of frames. spritecollide_entering() is the query for those: it remembers which targets each area sprite was
+# touching on the previous area pass (begin_area_pass()) and only returns the ones it has started touching since.
+# The memory is just last pass's contacts, so it never grows - a target the shockwave has passed (or killed) drops out.
+import pygame
+
+_KEY_STRIDE = 65536  # cell key = cx * _KEY_STRIDE + cy (one int instead of a tuple)
+
+
+class SpatialHash:
+    """Per-pass grid indexes of sprite groups, with groupcollide()/spritecollide() that work like pygame's."""
+
+    def __init__(self, settings):
+        self.enabled = bool(getattr(settings, "spatial_hash_enabled", True))
+        self.cell_size = max(8, int(getattr(settings, "spatial_hash_cell_size", 64)))
+        self.pad = int(getattr(settings, "spatial_hash_pad", 8))
+        self.min_group_size = int(getattr(settings, "spatial_hash_min_group", 12))
+        self._indexes = {}  # id(group) -> (group, {cell key: [(order in group, sprite), ...]})
+        self._touching = {}  # area sprite -> set of sprites it touched on the previous area pass
+        self._touching_now = {}  # area sprite -> set of sprites it touches on this one
+        self.pairs_tested = 0  # running count of sprite pairs that got as far as a rect check (see collision_stats.py)
+
+    def begin_pass(self):
+        """Start of a collision pass: sprites have moved since the last one, so every index is rebuilt on first use."""
+        self._indexes.clear()
+
+    def begin_area_pass(self):
+        """Start of a round of spritecollide_entering() queries (once per frame): this frame's contacts become the old ones."""
+        self._touching = self._touching_now
+        self._touching_now = {}
+
+    def invalidate(self, group):
+        """Sprites of this group moved (or were added) mid-pass - re-bucket it on the next query."""
+        self._indexes.pop(id(group), None)
+
+    def _index(self, group):
+        entry = self._indexes.get(id(group))
+        if entry is not None and entry[0] is group:
+            return entry[1]
+        cells = {}
+        size = self.cell_size
+        pad = self.pad
+        for order, sprite in enumerate(group.sprites()):
+            rect = sprite.rect
+            item = (order, sprite)
+            x0, x1 = (rect.left - pad) // size, (rect.right + pad) // size
+            y0, y1 = (rect.top - pad) // size, (rect.bottom + pad) // size
+            for cx in range(x0, x1 + 1):
+                base = cx * _KEY_STRIDE
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get(base + cy)
+                    if bucket is None:
+                        cells[base + cy] = [item]
+                    else:
+                        bucket.append(item)
+        self._indexes[id(group)] = (group, cells)
+        return cells
+
+    def _candidates(self, rect, cells):
+        """Sprites bucketed in the cells rect touches, in group order, each once."""
+        size = self.cell_size
+        x0, x1 = rect.left // size, rect.right // size
+        y0, y1 = rect.top // size, rect.bottom // size
+        if x0 == x1 and y0 == y1:
+            bucket = cells.get(x0 * _KEY_STRIDE + y0, ())  # one cell: already in order, no duplicates
+            self.pairs_tested += len(bucket)
+            return bucket
+        found = {}
+        for cx in range(x0, x1 + 1):
+            base = cx * _KEY_STRIDE
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get(base + cy)
+                if bucket:
+                    for order, sprite in bucket:
+                        found[order] = sprite
+        self.pairs_tested += len(found)
+        return [(order, found[order]) for order in sorted(found)]
+
+    def spritecollide(self, sprite, group, dokill=False, collided=None):
+        """Same as pygame.sprite.spritecollide(sprite, group, dokill, collided). collided(sprite, other) is only asked
+        about pairs whose rects touch, so it has to be at least as strict as a rect check."""
+        if not self.enabled or len(group) < self.min_group_size:
+            self.pairs_tested += len(group)
+            return pygame.sprite.spritecollide(sprite, group, dokill, collided)
+        collide = sprite.rect.colliderect
+        still_in_group = group.has_internal
+        hits = [other for _, other in self._candidates(sprite.rect, self._index(group))
+                if still_in_group(other) and collide(other.rect) and (collided is None or collided(sprite, other))]
+        if dokill:
+            for other in hits:
+                other.kill()
+        return hits
+
+    def spritecollide_entering(self, sprite, group, collided=None):
+        """Area effects: the sprites of group that sprite (a shockwave) touches now but didn't on the previous area pass,
+        in group order. Touching means rects overlap and collided(sprite, other), if given - put every condition for a hit
+        in there, a target that's skipped after being returned isn't returned again while it stays in contact."""
+        hits = self.spritecollide(sprite, group, False, collided)
+        self._touching_now[sprite] = set(hits)
+        before = self._touching.get(sprite)
+        if before:
+            hits = [other for other in hits if other not in before]
+        return hits
+
+    def groupcollide(self, groupa, groupb, dokilla, dokillb, collided=None):
+        """Same as pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb, collided) (see spritecollide)."""
+        if not groupa or not groupb:
+            return {}  # pygame would still walk every sprite of the other group to find that out
+        if not self.enabled:
+            self.pairs_tested += len(groupa) * len(groupb)
+            return pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb, collided)
+        if len(groupb) >= self.min_group_size:
+            crashed = {}
+            for sprite in groupa.sprites():
+                hits = self.spritecollide(sprite, groupb, dokillb, collided)
+                if hits:
+                    crashed[sprite] = hits
+                    if dokilla:
+                        sprite.kill()
+            return crashed
+        if len(groupa) >= self.min_group_size:
+            return self._groupcollide_reversed(groupa, groupb, dokilla, dokillb, collided)
+        self.pairs_tested += len(groupa) * len(groupb)
+        return pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb, collided)
+
+    def _groupcollide_reversed(self, groupa, groupb, dokilla, dokillb, collided):
+        """Many A vs few B (300 alien bullets vs 4 players): bucket A instead and look up each B sprite in it."""
+        cells = self._index(groupa)
+        still_in_a = groupa.has_internal
+        pairs = {}  # order of a in groupa -> (a, [b, ...] in groupb order)
+        for other in groupb.sprites():
+            collide = other.rect.colliderect
+            for order, sprite in self._candidates(other.rect, cells):
+                if still_in_a(sprite) and collide(sprite.rect) and (collided is None or collided(sprite, other)):
+                    entry = pairs.get(order)
+                    if entry is None:
+                        pairs[order] = (sprite, [other])
+                    else:
+                        entry[1].append(other)
+        crashed = {}
+        killed = set()
+        for order in sorted(pairs):  # back to group A's order, like pygame
+            sprite, hits = pairs[order]
+            if dokillb:
+                # pygame kills B sprites as it goes, so an A sprite later in the order doesn't see them any more
+                hits = [other for other in hits if other not in killed]
+                if not hits:
+                    continue
+                for other in hits:
+                    killed.add(other)
+                    other.kill()
+            crashed[sprite] = hits
+            if dokilla:
+                sprite.kill()
+        return crashed
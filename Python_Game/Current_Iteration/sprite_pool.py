@@ -0,0 +1,166 @@
+#sprite_pool.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       sprite_pool.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# Free lists for the sprites the game makes and throws away fastest: Bullet, NyancatBullet, LaserminionBomb,
+# VictoryFireworkSpark, MomBullet, PowerUpPickup and the level 1 fleet Aliens. A lasertanker alone fires every
+# ~120 ms and a hard-mode firework shell makes 2 rings of 16 sparks, and every one of those used to be a brand new
+# Sprite (plus its Rect, and for bombs/mom bullets/pickups a Surface - pickups even re-load and re-scale their png)
+# that the garbage collector had to clean up again a second later. That shows up as micro-stutter in heavy fire.
+#
+# The pooled classes inherit Pooled and split their __init__ into the once-only part (Sprite setup, surfaces) and
+# reset(), which takes the same arguments as the constructor and sets up everything else. Spawning code asks for
+#       bullet = Bullet.acquire(settings=..., screen=..., x=..., ...)       instead of Bullet(...)
+# which re-uses a dead bullet if there is one (a hit) and constructs a new one otherwise (a miss). reset() runs the
+# same code in the same order as a fresh constructor, including the game_rng rolls, so seeded games and replays come
+# out the same with the pools on or off.
+#
+# A sprite is given back when it leaves its last group (kill(), groupcollide dokill, Group.remove/empty). It doesn't
+# become reusable straight away though: it waits until the top of the next tick (recycle()). Until then the code
+# that killed it can still read it safely - the event bus reads dead aliens for powerup drops at the end of the tick,
+# and the swept-collision snapshot of this tick still has the old sprite in it. A sprite that was put back into a
+# group in the meantime simply isn't recycled.
+# A dead sprite that still has shots in flight (a fleet alien whose bullets haven't landed yet) stays in limbo too,
+# until the groups that count shots per shooter (BulletGroup.count_owned in bullet.py, registered with
+# hold_while_counted()) count none of its: those bullets' owner_ref still points at it, and a recycled alien would
+# otherwise start its new life with the old one's bullets counted against its bullet cap.
+# Only sprites made by acquire() are recycled, so a plain Alien(...) (the "tailor" aliens used to measure a fleet
+# row, destroyers, cruisers...) is never handed out again.
+#
+# Hit/miss counters per class: summary() / report() (printed by headless_sim.py, part of benchmark.py's results).
+# settings.sprite_pools_enabled = False turns it all off (acquire() then just constructs).
+# Pooled works the same for pygame Sprites (Alien, PowerUpPickup) and for slotted Entities (entity.py - bullets,
+# bombs, mom bullets, firework sparks).
+
+import weakref
+
+enabled = True
+max_free = 512  # dead sprites kept per class; more than that and the extras are left to the garbage collector
+
+_free = {}  # class -> reusable sprites
+_limbo = []  # released since the last recycle() - not handed out until then
+_hits = {}  # class name -> sprites re-used
+_misses = {}  # class name -> sprites constructed
+_holders = weakref.WeakSet()  # groups with count_owned(shooter) - see hold_while_counted()
+
+
+def configure(settings):
+    """New game: read the pool settings and drop everything pooled so far (sprites of the previous game)."""
+    global enabled, max_free
+    enabled = bool(getattr(settings, "sprite_pools_enabled", True))
+    max_free = max(0, int(getattr(settings, "sprite_pool_max_free", 512)))
+    clear()
+
+
+def clear():
+    """Forget all pooled sprites and zero the counters."""
+    _free.clear()
+    _limbo.clear()
+    _hits.clear()
+    _misses.clear()
+
+
+def acquire(cls, *args, **kwargs):
+    """A cls sprite set up with these constructor arguments: a recycled one if the pool has one, else a new one."""
+    name = cls.__name__
+    free = _free.get(cls)
+    if free:
+        sprite = free.pop()
+        sprite._pool_released = False
+        sprite.reset(*args, **kwargs)
+        _hits[name] = _hits.get(name, 0) + 1
+        return sprite
+    sprite = cls(*args, **kwargs)
+    sprite._pool_owned = enabled
+    _misses[name] = _misses.get(name, 0) + 1
+    return sprite
+
+
+def release(sprite):
+    """sprite isn't in any group any more - it can be handed out again from the next recycle() on."""
+    if getattr(sprite, "_pool_owned", False) and not getattr(sprite, "_pool_released", False):
+        sprite._pool_released = True
+        _limbo.append(sprite)
+
+
+def hold_while_counted(group):
+    """Don't recycle a sprite while group.count_owned(sprite) > 0 (its shots are still flying). Held weakly."""
+    _holders.add(group)
+
+
+def recycle():
+    """Top of the tick: sprites released last tick that are still dead go back on their class's free list."""
+    if not _limbo:
+        return
+    held = []
+    for sprite in _limbo:
+        if sprite.alive():
+            sprite._pool_released = False  # somebody added it to a group again - it's in use
+            continue
+        if any(group.count_owned(sprite) for group in _holders):
+            held.append(sprite)  # dead, but bullets it fired are still counted for it - try again next tick
+            continue
+        free = _free.setdefault(type(sprite), [])
+        if len(free) < max_free:
+            free.append(sprite)
+    _limbo[:] = held
+
+
+def summary():
+    """{class name: {"hits", "misses", "hit_rate", "free"}} for every class that has been acquired so far."""
+    free_counts = {cls.__name__: len(sprites) for cls, sprites in _free.items()}
+    result = {}
+    for name in sorted(set(_hits) | set(_misses)):
+        hits = _hits.get(name, 0)
+        misses = _misses.get(name, 0)
+        result[name] = {"hits": hits, "misses": misses, "hit_rate": round(hits / max(1, hits + misses), 3),
+                        "free": free_counts.get(name, 0)}
+    return result
+
+
+def report():
+    """Human-readable hit/miss table (empty string if nothing was acquired)."""
+    rows = summary()
+    if not rows:
+        return ""
+    lines = [f"sprite pools{'' if enabled else ' (disabled)'}:",
+             f"  {'class':<22}{'hits':>9}{'misses':>9}{'hit rate':>10}{'free':>7}"]
+    for name, row in rows.items():
+        lines.append(f"  {name:<22}{row['hits']:>9}{row['misses']:>9}{row['hit_rate']:>10.1%}{row['free']:>7}")
+    return "\n".join(lines)
+
+
+class Pooled:
+    """Mixin for recyclable sprites (list it before pygame.sprite.Sprite / Entity). Subclasses implement reset(*ctor args).
+
+    Two flags live on the sprite: _pool_owned (made by acquire() while pools were on) and _pool_released (waiting in /
+    sitting on a free list). They aren't class attributes here - that would clash with Entity's slots of the same
+    name - so a plain Sprite that was never acquired simply doesn't have them (read with getattr(..., False)).
+    """
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        # every pooled class needs its own reset(*ctor args) - checked when the class is defined, not on the first
+        # recycle in the middle of a game
+        super().__init_subclass__(**kwargs)
+        if not callable(getattr(cls, "reset", None)):
+            raise TypeError(f"{cls.__name__} is Pooled but has no reset() - see sprite_pool.py")
+
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        return acquire(cls, *args, **kwargs)
+
+    def kill(self):
+        super().kill()  # Sprite.kill() clears the groups directly, without going through remove_internal()
+        if getattr(self, "_pool_owned", False):
+            release(self)
+
+    def remove_internal(self, group):
+        super().remove_internal(group)
+        if getattr(self, "_pool_owned", False) and not self.alive():
+            release(self)
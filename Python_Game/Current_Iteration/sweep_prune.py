@@ -0,0 +1,102 @@
+#sweep_prune.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       sweep_prune.py (this file)
+#       spatial_hash.py
+#
+# Author: Anthony Visintainer
+#
+# Sweep-and-prune collision backend (settings.collision_backend = "sweep", or --collision sweep in headless_sim.py).
+# Nearly every projectile in the game only moves up or down: player Bullets, alien bullets, NyancatBullets,
+# LaserminionBombs, the lasertanker streams. Fire comes down the screen in columns, so the useful question is
+# "which targets are in this bullet's column?" - the x axis alone throws out almost every pair.
+#
+# So instead of grid cells, each group gets a list of its sprites sorted by left edge, and a query rect only looks at the
+# run of sprites whose x-span can overlap it (two bisects into the sorted left edges, with the group's widest sprite as
+# the slack), then at their y-span. The sorted lists are kept from one collision pass to the next: bullets never change
+# their x order, and aliens/kitties drift sideways slowly, so at the start of a pass the list is already (nearly)
+# sorted. Dead sprites are dropped, new ones go at the end, and list.sort() - Python's timsort, which finds the sorted
+# runs and insertion-sorts the few sprites that moved - puts it back in order in about one linear pass.
+# (A hand-written insertion sort does the same thing, but one Python-level compare per sprite is slower than timsort
+# doing it in C.)
+#
+# Everything else is SpatialHash: same results as pygame (dict keys in group A's order, hits in group B's order,
+# sprites killed mid-pass skipped, final colliderect on the CURRENT rect, then collided=), same padding
+# (settings.spatial_hash_pad), same invalidate(group) rule for sprites moved mid-pass, same fallback to plain pygame
+# for tiny groups. Only the index is different: one sorted x axis per group instead of a grid.
+from bisect import bisect_left, bisect_right
+
+from spatial_hash import SpatialHash
+
+
+def _left_edge(sprite):
+    return sprite.rect.left
+
+
+class _XAxis:
+    """One group's sprites sorted by left edge, kept between collision passes (see module notes)."""
+    __slots__ = ("group", "sprites", "order", "lefts", "rights", "tops", "bottoms", "widest")
+
+    def __init__(self, group):
+        self.group = group
+        self.sprites = []  # sorted by rect.left as of the last refresh()
+        self.order = {}  # sprite -> position in the group (pygame's order, for the results)
+        self.lefts = self.rights = self.tops = self.bottoms = ()
+        self.widest = 0
+
+    def refresh(self, pad):
+        """Re-sort for this pass: drop dead sprites, add new ones at the end, then sort the (nearly sorted) list."""
+        order = {sprite: position for position, sprite in enumerate(self.group.sprites())}
+        sprites = [sprite for sprite in self.sprites if sprite in order]
+        if len(sprites) < len(order):
+            known = set(sprites)
+            sprites.extend(sprite for sprite in order if sprite not in known)  # new sprites, in group order
+        sprites.sort(key=_left_edge)
+        rects = [sprite.rect for sprite in sprites]
+        self.sprites = sprites
+        self.order = order
+        self.lefts = [rect.left - pad for rect in rects]
+        self.rights = [rect.right + pad for rect in rects]
+        self.tops = [rect.top - pad for rect in rects]
+        self.bottoms = [rect.bottom + pad for rect in rects]
+        self.widest = max(rect.width for rect in rects) + 2 * pad if rects else 0
+
+
+class SweepPruneCollider(SpatialHash):
+    """SpatialHash whose per-group index is one sorted x axis instead of a grid (see module notes)."""
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self._axes = {}  # id(group) -> _XAxis, kept across passes (that's what keeps the re-sort cheap)
+
+    def _index(self, group):
+        entry = self._indexes.get(id(group))
+        if entry is not None and entry[0] is group:
+            return entry[1]
+        axis = self._axes.get(id(group))
+        if axis is None or axis.group is not group:
+            axis = self._axes[id(group)] = _XAxis(group)
+        axis.refresh(self.pad)
+        self._indexes[id(group)] = (group, axis)
+        return axis
+
+    def _candidates(self, rect, axis):
+        """Sprites whose (padded) box overlaps rect, in group order."""
+        lefts = axis.lefts
+        start = bisect_right(lefts, rect.left - axis.widest)  # anything starting further left is too narrow to reach
+        stop = bisect_left(lefts, rect.right)
+        if start >= stop:
+            return ()
+        self.pairs_tested += stop - start
+        x, top, bottom = rect.left, rect.top, rect.bottom
+        rights, tops, bottoms, sprites = axis.rights, axis.tops, axis.bottoms, axis.sprites
+        found = [i for i in range(start, stop) if rights[i] > x and tops[i] < bottom and bottoms[i] > top]
+        if not found:
+            return ()
+        order = axis.order
+        found = [(order[sprites[i]], sprites[i]) for i in found]
+        if len(found) > 1:
+            found.sort(key=lambda item: item[0])
+        return found
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       swept_check.py (this file)
+#       headless_sim.py
+#       Visintainer_A_AlienGame.py (main file) and everything it needs
+#
+# Author: Anthony Visintainer
+#
+# Does the game still hit what it should at a lower simulation rate? A shooting gallery for swept_collision.py:
+# one row of thin shields across the screen, and volleys of the projectiles that move furthest per step for their
+# size, every one of them aimed through the row:
+#       lvl11      level 11 player bullets (4x16, 8 px/frame), fired up from below
+#       squadron   a level 11 player's squadron bullets (2x8, 8 px/frame), fired up
+#       loaf       loaf kitty bullets (3 px tall, 3 px/frame), falling
+#       bomb       laserminion bombs (6x6, speeding up 1% a frame), falling from the top of the screen
+# Every projectile crosses the row exactly once, so every one of them should hit it. The targets count their hits
+# and never die, and each projectile starts a different fraction of a step away from the row, so a rate that
+# lets things tunnel shows up as hits < fired.
+#
+# The same gallery runs at 60 Hz, then at --hz (30 by default) with swept collisions off and on. Swept at the lower
+# rate has to match 60 Hz exactly - the exit code is 1 if it doesn't (so this can go in a script before changing
+# speeds or the step rate).
+#       python swept_check.py
+#       python swept_check.py --hz 20 --target-px 2 --volleys 6
+# The gallery steps the game's own collision pass (_do_collisions, wrapped the same way _update_game_state wraps it),
+# not the whole tick - no aliens, no waves, just the projectiles and the row.
+import sys
+import argparse
+
+import pygame
+
+import game_clock
+
+KINDS = ("lvl11", "squadron", "loaf", "bomb")
+SHIELD_WIDTH = 40  # px per target; the row is as many of these as fit across the screen
+
+
+def _target_class():
+    from shield import Shield
+
+    class _Target(Shield):
+        """A shield that just counts what hits it (never dies, never recharges)."""
+
+        def __init__(self, settings, rect):
+            super().__init__(settings, rect)
+            self.hits = 0
+
+        def take_damage(self, amount):
+            self.hits += 1
+
+        def register_recharge_hit(self):
+            self.hits += 1
+            return False
+
+        def update(self):
+            pass
+
+    return _Target
+
+
+def _make_projectile(game, kind, ship, squadron, x, y):
+    from bullet import Bullet
+    from alien import LaserminionBomb
+
+    settings, screen = game.settings, game.screen
+    if kind == "lvl11":
+        return Bullet(settings, screen, x, y, direction=-1, owner_type="player", owner_level=11, owner_ref=ship)
+    if kind == "squadron":
+        return Bullet(settings, screen, x, y, direction=-1, owner_type="player", owner_level=11, owner_ref=ship,
+                      squadron_ref=squadron)
+    if kind == "loaf":
+        return Bullet(settings, screen, x, y, direction=1, owner_type="kitty", owner_level=10)
+    return LaserminionBomb(settings, screen, x, y)
+
+
+def run_gallery(kind, hz, swept, volleys, target_px, seed):
+    """Fire `volleys` volleys of one projectile kind through the row at hz steps per second. Returns (fired, hits)."""
+    from headless_sim import HeadlessSimulation
+    from powerups import SquadronShip
+
+    frame_ms = 1000.0 / hz
+    sim = HeadlessSimulation({"starting_wave": 1, "num_players": 1}, frame_ms=frame_ms, seed=seed)
+    sim.use_swept_collisions(swept)
+    game = sim.game
+    settings = game.settings
+    settings.orbital_shields_enabled = True
+    ship = game.players.sprites()[0]
+    squadron = SquadronShip(settings, game.screen, ship, "left")
+    for group in (game.aliens, game.minions, game.alien_bullets, game.player_bullets, game.powerups, game.shields,
+                  game.shockwaves, game.players, game.lifepods):
+        group.empty()  # nothing in the gallery but the projectiles and the row
+
+    row_y = int(settings.play_height * 0.8)
+    target_class = _target_class()
+    targets = [target_class(settings, pygame.Rect(x, row_y, SHIELD_WIDTH, target_px))
+               for x in range(0, settings.screen_width - SHIELD_WIDTH + 1, SHIELD_WIDTH)]
+    game.shields.add(targets)
+
+    fired = 0
+    upward = kind in ("lvl11", "squadron")
+    for volley in range(volleys):
+        for column, target in enumerate(targets):
+            # each projectile starts a different distance from the row, so they reach it at every phase of a step
+            offset = (volley * len(targets) + column) * 1.37 % 40
+            if upward:
+                y = row_y + 60 + offset
+            else:
+                y = 10 + offset if kind == "bomb" else row_y - 60 - offset
+            projectile = _make_projectile(game, kind, ship, squadron, target.rect.centerx, y)
+            (game.player_bullets if upward else game.alien_bullets).add(projectile)
+            fired += 1
+        # step until the volley has gone through the row (or off the screen)
+        for _ in range(int(20 * hz)):
+            if not game.player_bullets and not game.alien_bullets:
+                break
+            game_clock.advance(frame_ms)
+            game.swept.snapshot(game._swept_groups())
+            game.player_bullets.update()
+            game.alien_bullets.update()
+            with game.swept(game.player_bullets, game.alien_bullets, game.shockwaves):
+                game._do_collisions()
+            game.events.end_tick()
+    hits = sum(target.hits for target in targets)
+    sim.close()
+    return fired, hits
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare projectile hits at 60 Hz and a lower rate, swept and not.")
+    parser.add_argument("--hz", type=float, default=30.0, help="the lower simulation rate to check")
+    parser.add_argument("--target-px", type=int, default=4, help="thickness of the target row")
+    parser.add_argument("--volleys", type=int, default=4, help="volleys per projectile kind (one shot per target each)")
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=KINDS)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(f"{'kind':10} {'fired':>6} {'60 Hz':>8} {f'{args.hz:g} Hz':>8} {'swept':>8}")
+    mismatches = []
+    for kind in args.kinds:
+        fired, reference = run_gallery(kind, 60.0, False, args.volleys, args.target_px, args.seed)
+        _, plain = run_gallery(kind, args.hz, False, args.volleys, args.target_px, args.seed)
+        _, swept = run_gallery(kind, args.hz, True, args.volleys, args.target_px, args.seed)
+        print(f"{kind:10} {fired:6d} {reference:8d} {plain:8d} {swept:8d}")
+        if swept != reference:
+            mismatches.append(kind)
+    if mismatches:
+        print(f"swept hits at {args.hz:g} Hz differ from 60 Hz for: {', '.join(mismatches)}")
+        return 1
+    print(f"swept hits at {args.hz:g} Hz match 60 Hz")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#swept_collision.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       swept_collision.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# Swept ("continuous") collision for the fast projectiles, so the simulation can run at 30 Hz (or lower) without
+# things flying through each other. Every collision check in the game is rect vs. rect at the END of a step. At 60 Hz
+# that's fine, but a projectile moves speed * frame_scale px per step, and once that's more than its own height plus
+# the target's height it can be above a thin target one step and below it the next - it tunnels straight through.
+# A level 11 bullet moves 16 px per step at 30 Hz, a laserminion bomb that's been falling for a few seconds 40+ px,
+# and a player's bonus-wave shield is only 10 px thick.
+#
+# With settings.swept_collisions on, each projectile's rect is stretched for the length of a collision pass to cover
+# everything it passed through this step: the union of where it was at the start of the tick and where it is now.
+# Projectiles in this game move in straight lines (bullets and bombs straight up or down, shockwaves up, dad
+# shockwaves sideways), so that box is exactly the swept area - nothing it crossed is missed, and nothing it didn't
+# cross is hit. After the pass the real rects go back, so drawing, movement and the next step never see the stretch.
+#
+# Used like this in the main file:
+#       self.swept.snapshot(groups)     at the top of the tick, before anything moves
+#       with self.swept(groups):        around a collision pass (stretched on the way in, restored on the way out)
+#           ...groupcollide()s...
+# Sprites added during the tick (just fired) weren't in the snapshot and keep their normal rect, and a sprite that
+# jumped further than settings.swept_max_step_px in one step (teleported/reset, not moved) isn't stretched either.
+# Off by default: with it off, snapshot() and the with-block do nothing and results are the same as always.
+
+
+class SweptCollisions:
+    """Stretches projectile rects over the distance they moved this tick for the length of a collision pass."""
+
+    def __init__(self, settings):
+        self.settings = settings  # read every tick, so swept collisions can be switched mid-game (and by replay settings)
+        self._start = {}  # sprite -> rect.topleft at the start of the tick
+        self._groups = ()  # groups to stretch on the next __enter__
+        self._stretched = []  # (sprite, its real rect) while a pass is running
+
+    def snapshot(self, groups):
+        """Top of the tick: remember where every projectile starts from."""
+        if not getattr(self.settings, "swept_collisions", False):
+            if self._start:
+                self._start = {}  # switched off - nothing gets stretched any more
+            return
+        self._start = {sprite: sprite.rect.topleft for group in groups for sprite in group}
+
+    def __call__(self, *groups):
+        self._groups = groups
+        return self
+
+    def __enter__(self):
+        if not self._start:
+            return self
+        start = self._start
+        max_step = int(getattr(self.settings, "swept_max_step_px", 256))
+        stretched = self._stretched
+        for group in self._groups:
+            for sprite in group:
+                topleft = start.get(sprite)
+                if topleft is None:
+                    continue  # fired this tick - it hasn't travelled anywhere yet
+                rect = sprite.rect
+                dx = topleft[0] - rect.x
+                dy = topleft[1] - rect.y
+                if (not dx and not dy) or abs(dx) > max_step or abs(dy) > max_step:
+                    continue
+                stretched.append((sprite, rect))
+                sprite.rect = rect.union(rect.move(dx, dy))
+        return self
+
+    def __exit__(self, *exc_info):
+        # The real rect objects go back (not just their values): sprites keep their own rect between frames
+        for sprite, rect in self._stretched:
+            sprite.rect = rect
+        self._stretched.clear()
+        return False
@@ -0,0 +1,147 @@
+#wave_profiler.py
+#
+# Project: Final Project
+#
+# Files needed by this file:
+#       wave_profiler.py (this file)
+#
+# Author: Anthony Visintainer
+#
+# Function-level profiling (cProfile) of real play sessions, one profile per segment of the game:
+#   - every normal wave is its own segment                    -> ..._wave03_hard_2p.prof
+#   - the bonus wave is cut into one-minute slices            -> ..._bonus_min07_hard_4p.prof
+#   - the victory / defeat screens get their own segment too  -> ..._victory_hard_4p.prof (fireworks!)
+# Files are named <timestamp of the game>_<segment>_<difficulty>_<players>p so a folder full of sessions can be
+# sorted and merged by wave, difficulty or player count.
+#
+# Formats (settings.wave_profile_format or --profile-format):
+#   "pstats"     .prof files for pstats / snakeviz / gprof2dot:  python -m pstats profiles/..._wave05_hard_4p.prof
+#   "collapsed"  .collapsed files ("frame;frame;frame <microseconds>" per line) for flamegraph.pl / speedscope.
+#                Files can simply be concatenated to aggregate many sessions:
+#                    cat profiles/*_wave10_hard_*.collapsed | flamegraph.pl > wave10_hard.svg
+#   "both"       both of the above
+#
+# cProfile only keeps caller -> callee edges, not whole stacks, so the collapsed stacks are rebuilt from the call
+# graph by splitting each function's time between its callers in proportion (the same trick flameprof uses). Exact
+# for code that is only reached one way, an estimate for helpers called from many places.
+#
+#       python Visintainer_A_AlienGame.py --profile-waves              (files go into ./profiles)
+#       python Visintainer_A_AlienGame.py --profile-waves my_dir --profile-format both
+#       python headless_sim.py --jump-to-wave 10 --players 4 --render --autofire --profile-waves
+# Note: don't combine with the allocation tracker - both use the interpreter's profile hook (sys.setprofile).
+import os
+import time
+import cProfile
+import pstats
+
+FORMATS = ("pstats", "collapsed", "both")
+_MAX_STACK_DEPTH = 60  # deeper than any real call chain in the game; stops runaway recursion in the stack rebuild
+_MIN_US = 1  # stack lines under 1 microsecond are left out of the collapsed file
+
+
+def _func_name(func):
+    """pstats function key (file, line, name) -> 'file.py:name' (flame graph frame label)."""
+    filename, _, name = func
+    if filename == "~":  # built-ins show up as ('~', 0, "<method 'blit' of 'pygame.surface.Surface' objects>")
+        return name.replace(";", ",")
+    return f"{filename.replace(chr(92), '/').rsplit('/', 1)[-1]}:{name}".replace(";", ",")
+
+
+def collapsed_stacks(stats):
+    """Rebuild 'a;b;c' -> microseconds of self time from a pstats.Stats call graph."""
+    entries = stats.stats  # func -> (primitive calls, total calls, self time, cumulative time, callers)
+    callees = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))  # edge = (cc, nc, tt, ct) for this caller
+    roots = [func for func, entry in entries.items() if not entry[4]]
+
+    result = {}
+
+    def walk(func, stack, share):
+        # share = how much of func's total cumulative time belongs to this particular stack
+        _, _, self_time, cum_time, _ = entries[func]
+        stack = stack + (_func_name(func),)
+        us = int(self_time * share * 1e6)
+        if us >= _MIN_US:
+            key = ";".join(stack)
+            result[key] = result.get(key, 0) + us
+        if len(stack) >= _MAX_STACK_DEPTH or cum_time <= 0:
+            return
+        for child, edge_cum in callees.get(func, ()):
+            child_cum = entries[child][3]
+            if child_cum <= 0 or _func_name(child) in stack:  # recursion: already counted further up this stack
+                continue
+            # our share of the time spent in child through this call edge, as a share of child's total time
+            child_share = edge_cum * share / child_cum
+            if child_share * child_cum * 1e6 >= _MIN_US:
+                walk(child, stack, child_share)
+
+    for root in roots:
+        walk(root, (), 1.0)
+    return result
+
+
+class WaveProfiler:
+    """One cProfile.Profile per game segment (wave / bonus-wave minute), written out when the segment ends."""
+
+    def __init__(self, output_dir="profiles", fmt="pstats"):
+        if fmt not in FORMATS:
+            raise ValueError(f"profile format must be one of {', '.join(FORMATS)}, not {fmt!r}")
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.game_tag = None  # "<timestamp>_{segment}_<difficulty>_<players>p" pattern of the running game
+        self.current = None  # segment being profiled right now
+        self._profiles = {}  # segment -> cProfile.Profile (a segment that comes back keeps adding to its profile)
+        self.files_written = []
+
+    def new_game(self, difficulty, players):
+        """Start naming files for a new game (called on the game's first profiled frame)."""
+        self.finish()
+        self.game_tag = f"{time.strftime('%Y%m%d_%H%M%S')}_{{segment}}_{difficulty}_{players}p"
+
+    def switch_to(self, segment):
+        """Profile from here on under `segment` (e.g. "wave03"). Cheap when the segment didn't change."""
+        if segment == self.current:
+            return
+        self._close_current()
+        profile = self._profiles.get(segment)
+        if profile is None:
+            profile = self._profiles[segment] = cProfile.Profile()
+        self.current = segment
+        profile.enable()
+
+    def finish(self):
+        """End of the game (back to the menu or quitting): write out the last segment and forget this game."""
+        self._close_current()
+        self._profiles.clear()
+        self.game_tag = None
+
+    def _close_current(self):
+        if self.current is None:
+            return
+        profile = self._profiles[self.current]
+        profile.disable()
+        self._write(self.current, profile)
+        self.current = None
+
+    def _write(self, segment, profile):
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, (self.game_tag or "{segment}").format(segment=segment))
+        try:
+            stats = pstats.Stats(profile)
+        except TypeError:  # nothing was recorded (segment lasted no time at all)
+            return
+        if self.fmt in ("pstats", "both"):
+            stats.dump_stats(base + ".prof")
+            self._note(base + ".prof")
+        if self.fmt in ("collapsed", "both"):
+            with open(base + ".collapsed", "w") as f:
+                for stack, us in sorted(collapsed_stacks(stats).items()):
+                    f.write(f"{stack} {us}\n")
+            self._note(base + ".collapsed")
+
+    def _note(self, path):
+        if path not in self.files_written:
+            self.files_written.append(path)
+            print("wave profile written to", path)